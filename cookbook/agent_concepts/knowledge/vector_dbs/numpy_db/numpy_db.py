@@ -0,0 +1,24 @@
+# install numpy - `pip install numpy`
+
+from agno.agent import Agent
+from agno.knowledge.pdf_url import PDFUrlKnowledgeBase
+from agno.vectordb.numpydb import NumpyDb
+
+# NumpyDb runs in-process and stores the embeddings in a memory-mapped file under tmp/numpydb/recipes
+vector_db = NumpyDb(
+    collection="recipes",
+    path="tmp/numpydb",
+    dtype="float16",  # Halves the size of the index, use float32 for full precision
+)
+
+# Create knowledge base
+knowledge_base = PDFUrlKnowledgeBase(
+    urls=["https://agno-public.s3.amazonaws.com/recipes/ThaiRecipes.pdf"],
+    vector_db=vector_db,
+)
+
+knowledge_base.load(recreate=False)  # Comment out after first run
+
+# Create and use the agent
+agent = Agent(knowledge=knowledge_base, show_tool_calls=True)
+agent.print_response("How to make Tom Kha Gai", markdown=True)
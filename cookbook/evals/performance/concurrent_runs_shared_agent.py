@@ -0,0 +1,88 @@
+"""Compare requests/sec of one shared Agent serving concurrent runs against a deep copy of the Agent per request.
+
+Run scopes isolate the state of each run, so a shared Agent is safe to use from concurrent requests.
+A model with a fixed latency is used, so the numbers show the overhead of the framework and not of the provider.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Iterator
+
+from agno.agent import Agent
+from agno.models.base import Model
+from agno.models.response import ModelResponse
+from agno.tools.calculator import CalculatorTools
+
+NUM_REQUESTS = 500
+CONCURRENCY = 50
+MODEL_LATENCY = 0.01
+
+
+@dataclass
+class FixedLatencyModel(Model):
+    id: str = "fixed-latency"
+    name: str = "FixedLatency"
+    provider: str = "FixedLatency"
+
+    def invoke(self, *args, **kwargs) -> Any:
+        time.sleep(MODEL_LATENCY)
+        return "Paris"
+
+    async def ainvoke(self, *args, **kwargs) -> Any:
+        await asyncio.sleep(MODEL_LATENCY)
+        return "Paris"
+
+    def invoke_stream(self, *args, **kwargs) -> Iterator[Any]:
+        yield self.invoke()
+
+    async def ainvoke_stream(self, *args, **kwargs) -> AsyncIterator[Any]:  # type: ignore
+        yield await self.ainvoke()
+
+    def parse_provider_response(self, response: Any, **kwargs) -> ModelResponse:
+        return ModelResponse(role="assistant", content=response)
+
+    def parse_provider_response_delta(self, response: Any) -> ModelResponse:
+        return ModelResponse(role="assistant", content=response)
+
+
+agent = Agent(
+    model=FixedLatencyModel(),
+    tools=[CalculatorTools(add=True, subtract=True, multiply=True, divide=True)],
+    instructions=["Be concise, reply with one sentence."],
+    telemetry=False,
+)
+
+
+async def shared_agent_request(i: int) -> None:
+    response = await agent.arun("What is the capital of France?", session_id=f"session-{i}", user_id=f"user-{i}")
+    assert response.session_id == f"session-{i}"
+
+
+async def deep_copy_request(i: int) -> None:
+    agent_copy = agent.deep_copy()
+    response = await agent_copy.arun("What is the capital of France?", session_id=f"session-{i}", user_id=f"user-{i}")
+    assert response.session_id == f"session-{i}"
+
+
+async def benchmark(name: str, request) -> None:
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+
+    async def limited(i: int) -> None:
+        async with semaphore:
+            await request(i)
+
+    start = time.perf_counter()
+    await asyncio.gather(*[limited(i) for i in range(NUM_REQUESTS)])
+    elapsed = time.perf_counter() - start
+    print(f"{name:<24} {NUM_REQUESTS / elapsed:>10.1f} requests/sec ({elapsed:.2f}s for {NUM_REQUESTS} requests)")
+
+
+async def main() -> None:
+    print(f"{NUM_REQUESTS} requests, {CONCURRENCY} concurrent, {MODEL_LATENCY * 1000:.0f}ms model latency")
+    await benchmark("deep_copy per request", deep_copy_request)
+    await benchmark("shared agent", shared_agent_request)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
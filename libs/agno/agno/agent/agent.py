@@ -46,6 +46,7 @@ from agno.run.response import (
     RunResponseEvent,
     RunResponsePausedEvent,
 )
+from agno.run.scope import run_scoped, run_scoped_attributes, share_for_run
 from agno.run.team import TeamRunResponse, TeamRunResponseEvent
 from agno.storage.base import Storage
 from agno.storage.session.agent import AgentSession
@@ -78,7 +79,7 @@ from agno.utils.log import (
     set_log_level_to_debug,
     set_log_level_to_info,
 )
-from agno.utils.message import get_text_from_message
+from agno.utils.message import get_history_messages, get_text_from_message
 from agno.utils.prompts import get_json_output_prompt, get_response_model_format_prompt
 from agno.utils.response import (
     async_generator_wrapper,
@@ -92,8 +93,42 @@ from agno.utils.response import (
 from agno.utils.safe_formatter import SafeFormatter
 from agno.utils.string import parse_response_model_str
 from agno.utils.timer import Timer
-
-
+from agno.utils.tokens import Tokenizer
+
+
+# State of the current run, isolated per run so one instance can serve concurrent runs
+@run_scoped_attributes(
+    "run_id",
+    "run_input",
+    "run_messages",
+    "run_response",
+    "session_id",
+    "session_name",
+    "session_state",
+    "session_metrics",
+    "user_id",
+    "extra_data",
+    "images",
+    "videos",
+    "audio",
+    "files",
+    "agent_session",
+    "memory",
+    "stream",
+    "stream_intermediate_steps",
+    "team_session_id",
+    "team_session_state",
+    "workflow_session_state",
+)
+# The tools are rebuilt into new containers and never changed in place. Runs share them, so the model's
+# formatted tools cache, keyed on the identity of the tools list, is reused across runs
+@run_scoped_attributes(
+    "_tool_instructions",
+    "_tools_for_model",
+    "_functions_for_model",
+    "_rebuild_tools",
+    copy_value=share_for_run,
+)
 @dataclass(init=False)
 class Agent:
     # --- Agent settings ---
@@ -121,6 +156,9 @@ class Agent:
     num_history_sessions: Optional[int] = None
     # If True, cache the session in memory
     cache_session: bool = True
+    # If True, only deserialize the runs needed for the history when loading a session from storage.
+    # Older runs are loaded on demand.
+    lazy_session_loading: bool = False
 
     # --- Agent Context ---
     # Context available for tools and prompt functions
@@ -150,6 +188,12 @@ class Agent:
     num_history_responses: Optional[int] = None
     # Number of historical runs to include in the messages
     num_history_runs: int = 3
+    # If set, the history is the most recent runs that fit in this many tokens, instead of the last num_history_runs
+    max_history_tokens: Optional[int] = None
+    # If set, tool results in the history are truncated to this many tokens
+    max_history_tool_result_tokens: Optional[int] = None
+    # Tokenizer used to count history tokens. Defaults to tiktoken if installed, otherwise a character based estimate
+    tokenizer: Optional[Tokenizer] = None
 
     # --- Agent Knowledge ---
     knowledge: Optional[AgentKnowledge] = None
@@ -354,6 +398,7 @@ class Agent:
         search_previous_sessions_history: Optional[bool] = False,
         num_history_sessions: Optional[int] = None,
         cache_session: bool = True,
+        lazy_session_loading: bool = False,
         context: Optional[Dict[str, Any]] = None,
         add_context: bool = False,
         resolve_context: bool = True,
@@ -366,6 +411,9 @@ class Agent:
         add_history_to_messages: bool = False,
         num_history_responses: Optional[int] = None,
         num_history_runs: int = 3,
+        max_history_tokens: Optional[int] = None,
+        max_history_tool_result_tokens: Optional[int] = None,
+        tokenizer: Optional[Tokenizer] = None,
         knowledge: Optional[AgentKnowledge] = None,
         knowledge_filters: Optional[Dict[str, Any]] = None,
         enable_agentic_knowledge_filters: Optional[bool] = None,
@@ -445,6 +493,7 @@ class Agent:
         self.num_history_sessions = num_history_sessions
 
         self.cache_session = cache_session
+        self.lazy_session_loading = lazy_session_loading
 
         self.context = context
         self.add_context = add_context
@@ -460,6 +509,9 @@ class Agent:
         self.add_history_to_messages = add_history_to_messages
         self.num_history_responses = num_history_responses
         self.num_history_runs = num_history_runs
+        self.max_history_tokens = max_history_tokens
+        self.max_history_tool_result_tokens = max_history_tool_result_tokens
+        self.tokenizer = tokenizer
 
         self.knowledge = knowledge
         self.knowledge_filters = knowledge_filters
@@ -978,6 +1030,7 @@ class Agent:
         **kwargs: Any,
     ) -> Iterator[RunResponseEvent]: ...
 
+    @run_scoped
     def run(
         self,
         message: Optional[Union[str, List, Dict, Message, BaseModel]] = None,
@@ -1253,7 +1306,9 @@ class Agent:
         self._convert_response_to_structured_format(run_response)
 
         # 6. Save session to storage
-        self.write_to_storage(user_id=user_id, session_id=session_id, refresh_session=refresh_session_before_write)
+        await self.awrite_to_storage(
+            user_id=user_id, session_id=session_id, refresh_session=refresh_session_before_write
+        )
 
         # 7. Save output to file if save_response_to_file is set
         self.save_run_response_to_file(message=run_messages.user_message, session_id=session_id)
@@ -1349,13 +1404,16 @@ class Agent:
             yield self._handle_event(create_run_response_completed_event(from_run_response=run_response), run_response)
 
         # 7. Save session to storage
-        self.write_to_storage(user_id=user_id, session_id=session_id, refresh_session=refresh_session_before_write)
+        await self.awrite_to_storage(
+            user_id=user_id, session_id=session_id, refresh_session=refresh_session_before_write
+        )
 
         # Log Agent Run
         await self._alog_agent_run(user_id=user_id, session_id=session_id)
 
         log_debug(f"Agent Run End: {run_response.run_id}", center=True, symbol="*")
 
+    @run_scoped
     async def arun(
         self,
         message: Optional[Union[str, List, Dict, Message, BaseModel]] = None,
@@ -1387,7 +1445,7 @@ class Agent:
         self.initialize_agent()
 
         # Read existing session from storage
-        self.read_from_storage(session_id=session_id)
+        await self.aread_from_storage(session_id=session_id)
 
         effective_filters = knowledge_filters
         # When filters are passed manually
@@ -1587,6 +1645,7 @@ class Agent:
         knowledge_filters: Optional[Dict[str, Any]] = None,
     ) -> Iterator[RunResponseEvent]: ...
 
+    @run_scoped
     def continue_run(
         self,
         run_response: Optional[RunResponse] = None,
@@ -1977,6 +2036,7 @@ class Agent:
 
         log_debug(f"Agent Run End: {run_response.run_id}", center=True, symbol="*")
 
+    @run_scoped
     async def acontinue_run(
         self,
         run_response: Optional[RunResponse] = None,
@@ -2071,7 +2131,7 @@ class Agent:
         self.stream_intermediate_steps = self.stream_intermediate_steps or (stream_intermediate_steps and self.stream)
 
         # Read existing session from storage
-        self.read_from_storage(session_id=session_id)
+        await self.aread_from_storage(session_id=session_id)
 
         # Run can be continued from previous run response or from passed run_response context
         if run_response is not None:
@@ -2282,7 +2342,7 @@ class Agent:
         self._convert_response_to_structured_format(run_response)
 
         # 6. Save session to storage
-        self.write_to_storage(user_id=user_id, session_id=session_id)
+        await self.awrite_to_storage(user_id=user_id, session_id=session_id)
 
         # 7. Save output to file if save_response_to_file is set
         self.save_run_response_to_file(message=run_messages.user_message, session_id=session_id)
@@ -2372,7 +2432,7 @@ class Agent:
             yield self._handle_event(create_run_response_completed_event(run_response), run_response)
 
         # 7. Save session to storage
-        self.write_to_storage(user_id=user_id, session_id=session_id)
+        await self.awrite_to_storage(user_id=user_id, session_id=session_id)
 
         # Log Agent Run
         await self._alog_agent_run(user_id=user_id, session_id=session_id)
@@ -3916,8 +3976,16 @@ class Agent:
                 self.memory = cast(Memory, self.memory)
                 # We fake the structure on storage, to maintain the interface with the legacy implementation
                 run_responses = self.memory.runs.get(session_id, [])  # type: ignore
-                memory_dict = self.memory.to_dict()
+                if self.storage is not None and self.storage.stores_runs_separately:
+                    # Runs already in the storage's runs table are not serialized again. The last run can still change.
+                    run_responses = [
+                        rr for rr in run_responses[:-1] if not self.storage.is_run_saved(session_id, rr.run_id)
+                    ] + run_responses[-1:]
+                memory_dict = self.memory.to_dict(include_runs=False)
                 memory_dict["runs"] = [rr.to_dict() for rr in run_responses]
+                if self.storage is None or not self.storage.stores_runs_separately:
+                    # Runs that were never loaded are written back as they were read
+                    memory_dict["runs"] = self.memory.get_deferred_run_dicts(session_id) + memory_dict["runs"]
         else:
             memory_dict = None
 
@@ -4117,7 +4185,10 @@ class Agent:
                         if self.memory.runs is None:
                             self.memory.runs = {}
                         self.memory.runs[session.session_id] = []
-                        for run in session.memory["runs"]:
+                        runs = session.memory["runs"]
+                        if self.lazy_session_loading:
+                            runs = self._defer_older_runs(session.session_id, runs)
+                        for run in runs:
                             run_session_id = run["session_id"]
 
                             if "team_id" in run:
@@ -4159,6 +4230,38 @@ class Agent:
                         log_warning(f"Failed to load session summaries: {e}")
         log_debug(f"-*- AgentSession loaded: {session.session_id}")
 
+    def _get_num_runs_to_load(self) -> int:
+        """Number of runs to deserialize when lazily loading a session"""
+        return max(1, self.num_history_runs) if self.add_history_to_messages else 1
+
+    def _defer_older_runs(self, session_id: str, runs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Return the last runs needed for the history and defer deserializing the older ones until they are needed"""
+        self.memory = cast(Memory, self.memory)
+        self.memory.deferred_runs.pop(session_id, None)  # type: ignore
+        num_runs = self._get_num_runs_to_load()
+        older_runs, runs = runs[:-num_runs], runs[-num_runs:]
+        if older_runs:
+            self.memory.defer_runs(session_id, lambda: older_runs)
+        elif self.storage is not None and self.storage.stores_runs_separately and len(runs) == num_runs:
+            # The storage only read the last runs, the rest are read from its runs table when needed
+            storage = self.storage
+            self.memory.defer_runs(session_id, lambda: storage.read_runs(session_id))
+        return runs
+
+    def _read_session(self, session_id: str) -> Optional[AgentSession]:
+        if self.lazy_session_loading:
+            return self.storage.read_projected(  # type: ignore
+                session_id=session_id, last_n_runs=self._get_num_runs_to_load()
+            )
+        return self.storage.read(session_id=session_id)  # type: ignore
+
+    async def _aread_session(self, session_id: str) -> Optional[AgentSession]:
+        if self.lazy_session_loading:
+            return await self.storage.aread_projected(  # type: ignore
+                session_id=session_id, last_n_runs=self._get_num_runs_to_load()
+            )
+        return await self.storage.aread(session_id=session_id)  # type: ignore
+
     def read_from_storage(
         self,
         session_id: str,
@@ -4173,7 +4276,27 @@ class Agent:
         """
         if self.storage is not None:
             # Get a single session from storage
-            self.agent_session = cast(AgentSession, self.storage.read(session_id=session_id))
+            self.agent_session = cast(AgentSession, self._read_session(session_id=session_id))
+            if self.agent_session is not None:
+                # Load the agent session
+                self.load_agent_session(session=self.agent_session)
+        return self.agent_session
+
+    async def aread_from_storage(
+        self,
+        session_id: str,
+    ) -> Optional[AgentSession]:
+        """Load the AgentSession from storage without blocking the event loop
+
+        Args:
+            session_id: The session_id to load from storage.
+
+        Returns:
+            Optional[AgentSession]: The loaded AgentSession or None if not found.
+        """
+        if self.storage is not None:
+            # Get a single session from storage
+            self.agent_session = cast(AgentSession, await self._aread_session(session_id=session_id))
             if self.agent_session is not None:
                 # Load the agent session
                 self.load_agent_session(session=self.agent_session)
@@ -4188,7 +4311,21 @@ class Agent:
         if not self.storage:
             return
 
-        agent_session_from_db = self.storage.read(session_id=session_id)  # type: ignore
+        self._merge_runs_from_db(session_id, self.storage.read(session_id=session_id))  # type: ignore
+
+    async def arefresh_from_storage(self, session_id: str) -> None:
+        """Refresh the AgentSession from storage without blocking the event loop
+
+        Args:
+            session_id: The session_id to refresh from storage.
+        """
+        if not self.storage:
+            return
+
+        self._merge_runs_from_db(session_id, await self.storage.aread(session_id=session_id))  # type: ignore
+
+    def _merge_runs_from_db(self, session_id: str, agent_session_from_db: Optional[AgentSession]) -> None:
+        """Add the runs of the stored session that are missing from memory"""
         if (
             agent_session_from_db is not None
             and agent_session_from_db.memory is not None  # type: ignore
@@ -4197,6 +4334,8 @@ class Agent:
             if isinstance(self.memory, AgentMemory):
                 return
             try:
+                # The stored session can have runs from other members, merge them into the complete history
+                self.memory.load_deferred_runs(session_id)  # type: ignore
                 if self.memory.runs is None:  # type: ignore
                     self.memory.runs = {}  # type: ignore
                 if session_id not in self.memory.runs:  # type: ignore
@@ -4240,6 +4379,29 @@ class Agent:
 
         return self.agent_session
 
+    async def awrite_to_storage(
+        self, session_id: str, user_id: Optional[str] = None, refresh_session: Optional[bool] = False
+    ) -> Optional[AgentSession]:
+        """Save the AgentSession to storage without blocking the event loop
+
+        Returns:
+            Optional[AgentSession]: The saved AgentSession or None if not saved.
+        """
+        if self.storage is not None:
+            if refresh_session:
+                await self.arefresh_from_storage(session_id=session_id)
+
+            self.agent_session = cast(
+                AgentSession,
+                await self.storage.aupsert(session=self.get_agent_session(session_id=session_id, user_id=user_id)),
+            )
+
+        if not self.cache_session:
+            if self.memory is not None and self.memory.runs is not None and session_id in self.memory.runs:
+                self.memory.runs.pop(session_id)  # type: ignore
+
+        return self.agent_session
+
     def add_introduction(self, introduction: str) -> None:
         """Add an introduction to the chat history"""
 
@@ -4898,25 +5060,40 @@ class Agent:
 
         # 3. Add history to run_messages
         if self.add_history_to_messages:
-            from copy import deepcopy
-
             history: List[Message] = []
+            # With a token budget, the budget decides how many runs are added
+            num_history_runs = self.num_history_runs if self.max_history_tokens is None else None
             if isinstance(self.memory, AgentMemory):
                 history = self.memory.get_messages_from_last_n_runs(
-                    last_n=self.num_history_runs, skip_role=self.system_message_role
+                    last_n=num_history_runs, skip_role=self.system_message_role
+                )
+            elif isinstance(self.memory, Memory) and self.max_history_tokens is not None:
+                # Deferred runs are only loaded until the token budget is spent
+                history = self.memory.get_messages_within_tokens(
+                    session_id=session_id,
+                    max_tokens=self.max_history_tokens,
+                    max_tool_result_tokens=self.max_history_tool_result_tokens,
+                    tokenizer=self.tokenizer,
+                    skip_role=self.system_message_role,
+                    agent_id=self.agent_id if self.team_session_id is not None else None,
                 )
             elif isinstance(self.memory, Memory):
                 history = self.memory.get_messages_from_last_n_runs(
                     session_id=session_id,
-                    last_n=self.num_history_runs,
+                    last_n=num_history_runs,
                     skip_role=self.system_message_role,
                     # Only filter by agent_id if this is part of a team
                     agent_id=self.agent_id if self.team_session_id is not None else None,
                 )
 
             if len(history) > 0:
-                # Create a deep copy of the history messages to avoid modifying the original messages
-                history_copy = [deepcopy(msg) for msg in history]
+                # Copy the history messages to avoid modifying the original messages
+                history_copy = get_history_messages(
+                    history,
+                    max_tokens=self.max_history_tokens,
+                    max_tool_result_tokens=self.max_history_tool_result_tokens,
+                    tokenizer=self.tokenizer,
+                )
 
                 # Tag each message as coming from history
                 for _msg in history_copy:
@@ -1,10 +1,12 @@
-from typing import Any, List, Optional, Union, cast
+from typing import Any, Dict, List, Optional, Union, cast
 
 from agno.agent.agent import Agent, AgentRun, Function, Toolkit
 from agno.run.response import RunResponse
 from agno.run.team import TeamRunResponse
+from agno.storage.base import FIRST_RUN_FIELD, Storage
 from agno.storage.session.agent import AgentSession
 from agno.storage.session.team import TeamSession
+from agno.storage.session.v2.workflow import WorkflowSession as WorkflowSessionV2
 from agno.storage.session.workflow import WorkflowSession
 from agno.team.team import Team
 from agno.utils.log import logger
@@ -181,3 +183,48 @@ def get_session_title_from_team_session(team_session: TeamSession) -> str:
             except Exception as e:
                 logger.error(f"Error parsing chat: {e}")
     return "Unnamed session"
+
+
+# Fields the session list endpoints read with `Storage.list_sessions`
+SESSION_LIST_FIELDS = ["session_id", "session_data", "created_at", FIRST_RUN_FIELD]
+# Default and maximum number of sessions returned per page, the next page is fetched with the X-Next-Cursor header
+SESSION_LIST_PAGE_SIZE = 100
+SESSION_LIST_MAX_PAGE_SIZE = 1000
+
+
+def get_session_title_from_list_item(session: Dict[str, Any], mode: str) -> str:
+    """Title of a session returned by `Storage.list_sessions`. Only the first run is listed, so unnamed sessions
+    are titled after their first run."""
+    first_run = session.get(FIRST_RUN_FIELD)
+    runs = [first_run] if first_run is not None else []
+    data = {"session_id": session.get("session_id"), "session_data": session.get("session_data")}
+    if mode == "agent":
+        return get_session_title(AgentSession.from_dict({**data, "memory": {"runs": runs}}))  # type: ignore
+    elif mode == "team":
+        return get_session_title_from_team_session(TeamSession.from_dict({**data, "memory": {"runs": runs}}))  # type: ignore
+    elif mode == "workflow_v2":
+        return get_session_title_from_workflow_session(WorkflowSessionV2.from_dict({**data, "runs": runs}))  # type: ignore
+    return get_session_title_from_workflow_session(WorkflowSession.from_dict({**data, "memory": {"runs": runs}}))  # type: ignore
+
+
+def session_exists(
+    storage: Storage, session_id: str, user_id: Optional[str] = None, entity_id: Optional[str] = None
+) -> bool:
+    """True if the session is in storage and belongs to the user and entity, if given"""
+    session = storage.read(session_id)
+    if session is None:
+        return False
+    if user_id is not None and session.user_id != user_id:
+        return False
+    return entity_id is None or getattr(session, storage.entity_id_field, None) == entity_id
+
+
+async def asession_exists(
+    storage: Storage, session_id: str, user_id: Optional[str] = None, entity_id: Optional[str] = None
+) -> bool:
+    session = await storage.aread(session_id)
+    if session is None:
+        return False
+    if user_id is not None and session.user_id != user_id:
+        return False
+    return entity_id is None or getattr(session, storage.entity_id_field, None) == entity_id
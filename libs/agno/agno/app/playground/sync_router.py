@@ -3,18 +3,20 @@ from io import BytesIO
 from typing import Any, Dict, Generator, List, Optional, cast
 from uuid import uuid4
 
-from fastapi import APIRouter, File, Form, HTTPException, Query, UploadFile
+from fastapi import APIRouter, File, Form, HTTPException, Query, Response, UploadFile
 from fastapi.responses import JSONResponse, StreamingResponse
 
 from agno.agent.agent import Agent, RunResponse
 from agno.app.playground.operator import (
+    SESSION_LIST_FIELDS,
+    SESSION_LIST_MAX_PAGE_SIZE,
+    SESSION_LIST_PAGE_SIZE,
     format_tools,
     get_agent_by_id,
-    get_session_title,
-    get_session_title_from_team_session,
-    get_session_title_from_workflow_session,
+    get_session_title_from_list_item,
     get_team_by_id,
     get_workflow_by_id,
+    session_exists,
 )
 from agno.app.playground.schemas import (
     AgentGetResponse,
@@ -509,7 +511,13 @@ def get_sync_playground_router(
             return run_response_obj.to_dict()
 
     @playground_router.get("/agents/{agent_id}/sessions")
-    def get_agent_sessions(agent_id: str, user_id: Optional[str] = Query(None, min_length=1)):
+    def get_agent_sessions(
+        agent_id: str,
+        response: Response,
+        user_id: Optional[str] = Query(None, min_length=1),
+        limit: int = Query(SESSION_LIST_PAGE_SIZE, ge=1, le=SESSION_LIST_MAX_PAGE_SIZE),
+        cursor: Optional[str] = Query(None),
+    ):
         logger.debug(f"AgentSessionsRequest: {agent_id} {user_id}")
         agent = get_agent_by_id(agent_id, agents)
         if agent is None:
@@ -518,16 +526,24 @@ def get_sync_playground_router(
         if agent.storage is None:
             return JSONResponse(status_code=404, content="Agent does not have storage enabled.")
 
+        try:
+            page = agent.storage.list_sessions(
+                user_id=user_id, entity_id=agent_id, limit=limit, cursor=cursor, fields=SESSION_LIST_FIELDS
+            )
+        except ValueError as e:
+            return JSONResponse(status_code=400, content=str(e))
+        if page.next_cursor is not None:
+            response.headers["X-Next-Cursor"] = page.next_cursor
+
         agent_sessions: List[AgentSessionsResponse] = []
-        all_agent_sessions: List[AgentSession] = agent.storage.get_all_sessions(user_id=user_id, entity_id=agent_id)  # type: ignore
-        for session in all_agent_sessions:
-            title = get_session_title(session)
+        for session in page.sessions:
+            title = get_session_title_from_list_item(session, agent.storage.mode)
             agent_sessions.append(
                 AgentSessionsResponse(
                     title=title,
-                    session_id=session.session_id,
-                    session_name=session.session_data.get("session_name") if session.session_data else None,
-                    created_at=session.created_at,
+                    session_id=session["session_id"],
+                    session_name=(session.get("session_data") or {}).get("session_name"),
+                    created_at=session.get("created_at"),
                 )
             )
         return agent_sessions
@@ -579,11 +595,9 @@ def get_sync_playground_router(
         if agent.storage is None:
             return JSONResponse(status_code=404, content="Agent does not have storage enabled.")
 
-        all_agent_sessions: List[AgentSession] = agent.storage.get_all_sessions(user_id=body.user_id)  # type: ignore
-        for session in all_agent_sessions:
-            if session.session_id == session_id:
-                agent.rename_session(body.name, session_id=session_id)
-                return JSONResponse(content={"message": f"successfully renamed agent {agent.name}"})
+        if session_exists(agent.storage, session_id, user_id=body.user_id):
+            agent.rename_session(body.name, session_id=session_id)
+            return JSONResponse(content={"message": f"successfully renamed agent {agent.name}"})
 
         return JSONResponse(status_code=404, content="Session not found.")
 
@@ -596,11 +610,9 @@ def get_sync_playground_router(
         if agent.storage is None:
             return JSONResponse(status_code=404, content="Agent does not have storage enabled.")
 
-        all_agent_sessions: List[AgentSession] = agent.storage.get_all_sessions(user_id=user_id, entity_id=agent_id)  # type: ignore
-        for session in all_agent_sessions:
-            if session.session_id == session_id:
-                agent.delete_session(session_id)
-                return JSONResponse(content={"message": f"successfully deleted agent {agent.name}"})
+        if session_exists(agent.storage, session_id, user_id=user_id, entity_id=agent_id):
+            agent.delete_session(session_id)
+            return JSONResponse(content={"message": f"successfully deleted agent {agent.name}"})
 
         return JSONResponse(status_code=404, content="Session not found.")
 
@@ -715,7 +727,13 @@ def get_sync_playground_router(
                 raise HTTPException(status_code=500, detail=f"Error running workflow: {str(e)}")
 
     @playground_router.get("/workflows/{workflow_id}/sessions")
-    def get_all_workflow_sessions(workflow_id: str, user_id: Optional[str] = Query(None, min_length=1)):
+    def get_all_workflow_sessions(
+        workflow_id: str,
+        response: Response,
+        user_id: Optional[str] = Query(None, min_length=1),
+        limit: int = Query(SESSION_LIST_PAGE_SIZE, ge=1, le=SESSION_LIST_MAX_PAGE_SIZE),
+        cursor: Optional[str] = Query(None),
+    ):
         # Retrieve the workflow by ID
         workflow = get_workflow_by_id(workflow_id, workflows)
         if not workflow:
@@ -725,24 +743,28 @@ def get_sync_playground_router(
         if not workflow.storage:
             raise HTTPException(status_code=404, detail="Workflow does not have storage enabled")
 
-        # Retrieve all sessions for the given workflow and user
+        # Retrieve a page of sessions for the given workflow and user
         try:
-            all_workflow_sessions: List[WorkflowSession] = workflow.storage.get_all_sessions(
-                user_id=user_id, entity_id=workflow_id
-            )  # type: ignore
+            page = workflow.storage.list_sessions(
+                user_id=user_id, entity_id=workflow_id, limit=limit, cursor=cursor, fields=SESSION_LIST_FIELDS
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Error retrieving sessions: {str(e)}")
+        if page.next_cursor is not None:
+            response.headers["X-Next-Cursor"] = page.next_cursor
 
         # Return the sessions
         workflow_sessions: List[WorkflowSessionResponse] = []
-        for session in all_workflow_sessions:
-            title = get_session_title_from_workflow_session(session)
+        for session in page.sessions:
+            title = get_session_title_from_list_item(session, workflow.storage.mode)
             workflow_sessions.append(
                 {
                     "title": title,
-                    "session_id": session.session_id,
-                    "session_name": session.session_data.get("session_name") if session.session_data else None,
-                    "created_at": session.created_at,
+                    "session_id": session["session_id"],
+                    "session_name": (session.get("session_data") or {}).get("session_name"),
+                    "created_at": session.get("created_at"),
                 }  # type: ignore
             )
         return workflow_sessions
@@ -918,7 +940,13 @@ def get_sync_playground_router(
             return run_response.to_dict()
 
     @playground_router.get("/teams/{team_id}/sessions", response_model=List[TeamSessionResponse])
-    def get_all_team_sessions(team_id: str, user_id: Optional[str] = Query(None, min_length=1)):
+    def get_all_team_sessions(
+        team_id: str,
+        response: Response,
+        user_id: Optional[str] = Query(None, min_length=1),
+        limit: int = Query(SESSION_LIST_PAGE_SIZE, ge=1, le=SESSION_LIST_MAX_PAGE_SIZE),
+        cursor: Optional[str] = Query(None),
+    ):
         team = get_team_by_id(team_id, teams)
         if team is None:
             raise HTTPException(status_code=404, detail="Team not found")
@@ -927,19 +955,25 @@ def get_sync_playground_router(
             raise HTTPException(status_code=404, detail="Team does not have storage enabled")
 
         try:
-            all_team_sessions: List[TeamSession] = team.storage.get_all_sessions(user_id=user_id, entity_id=team_id)  # type: ignore
+            page = team.storage.list_sessions(
+                user_id=user_id, entity_id=team_id, limit=limit, cursor=cursor, fields=SESSION_LIST_FIELDS
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Error retrieving sessions: {str(e)}")
+        if page.next_cursor is not None:
+            response.headers["X-Next-Cursor"] = page.next_cursor
 
         team_sessions: List[TeamSessionResponse] = []
-        for session in all_team_sessions:
-            title = get_session_title_from_team_session(session)
+        for session in page.sessions:
+            title = get_session_title_from_list_item(session, team.storage.mode)
             team_sessions.append(
                 TeamSessionResponse(
                     title=title,
-                    session_id=session.session_id,
-                    session_name=session.session_data.get("session_name") if session.session_data else None,
-                    created_at=session.created_at,
+                    session_id=session["session_id"],
+                    session_name=(session.get("session_data") or {}).get("session_name"),
+                    created_at=session.get("created_at"),
                 )
             )
         return team_sessions
@@ -996,11 +1030,9 @@ def get_sync_playground_router(
         if team.storage is None:
             raise HTTPException(status_code=404, detail="Team does not have storage enabled")
 
-        all_team_sessions: List[TeamSession] = team.storage.get_all_sessions(user_id=body.user_id, entity_id=team_id)  # type: ignore
-        for session in all_team_sessions:
-            if session.session_id == session_id:
-                team.rename_session(body.name, session_id=session_id)
-                return JSONResponse(content={"message": f"successfully renamed team session {body.name}"})
+        if session_exists(team.storage, session_id, user_id=body.user_id, entity_id=team_id):
+            team.rename_session(body.name, session_id=session_id)
+            return JSONResponse(content={"message": f"successfully renamed team session {body.name}"})
 
         raise HTTPException(status_code=404, detail="Session not found")
 
@@ -1013,11 +1045,9 @@ def get_sync_playground_router(
         if team.storage is None:
             raise HTTPException(status_code=404, detail="Team does not have storage enabled")
 
-        all_team_sessions: List[TeamSession] = team.storage.get_all_sessions(user_id=user_id, entity_id=team_id)  # type: ignore
-        for session in all_team_sessions:
-            if session.session_id == session_id:
-                team.delete_session(session_id)
-                return JSONResponse(content={"message": f"successfully deleted team session {session_id}"})
+        if session_exists(team.storage, session_id, user_id=user_id, entity_id=team_id):
+            team.delete_session(session_id)
+            return JSONResponse(content={"message": f"successfully deleted team session {session_id}"})
 
         raise HTTPException(status_code=404, detail="Session not found")
 
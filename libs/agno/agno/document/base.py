@@ -1,7 +1,9 @@
+import asyncio
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
 from agno.embedder import Embedder
+from agno.utils.log import log_debug, logger
 
 
 @dataclass
@@ -26,6 +28,73 @@ class Document:
 
         self.embedding, self.usage = _embedder.get_embedding_and_usage(self.content)
 
+    @staticmethod
+    def _set_batch_embeddings(
+        documents: List["Document"], embeddings: List[List[float]], usages: List[Optional[Dict]]
+    ) -> List["Document"]:
+        """Set the embeddings of a batch on its documents and return the documents that were not embedded"""
+        if len(embeddings) != len(documents):
+            logger.warning(f"Expected {len(documents)} embeddings, got {len(embeddings)}")
+            return documents
+        failed: List["Document"] = []
+        for i, (doc, embedding) in enumerate(zip(documents, embeddings)):
+            # An empty embedding is a failed embedding, it must not be written to the vector db
+            if not embedding:
+                failed.append(doc)
+                continue
+            doc.embedding, doc.usage = embedding, usages[i] if i < len(usages) else None
+        if failed:
+            logger.warning(f"{len(failed)} documents were not embedded in the batch")
+        return failed
+
+    @staticmethod
+    def embed_batch(documents: List["Document"], embedder: Embedder) -> None:
+        """Embed a list of documents using the embedder's multi-input API.
+
+        Documents that already have an embedding are skipped, so pre-embedded documents are not embedded twice.
+        Falls back to embedding the documents one by one if the batch request fails or returns empty embeddings.
+        """
+        documents = [doc for doc in documents if doc.embedding is None]
+        if not documents:
+            return
+        try:
+            embeddings, usages = embedder.get_embeddings_batch_and_usage([doc.content for doc in documents])
+            failed = Document._set_batch_embeddings(documents, embeddings, usages)
+        except Exception as e:
+            logger.warning(f"Batch embedding failed: {e}")
+            failed = documents
+
+        if failed:
+            logger.warning(f"Embedding {len(failed)} documents individually")
+        for doc in failed:
+            try:
+                doc.embed(embedder=embedder)
+            except Exception as e:
+                logger.error(f"Error embedding document '{doc.name}': {e}")
+        log_debug(f"Embedded {len(documents)} documents")
+
+    @staticmethod
+    async def async_embed_batch(documents: List["Document"], embedder: Embedder) -> None:
+        """Async variant of embed_batch, embedding the documents of a failed batch in a thread"""
+        documents = [doc for doc in documents if doc.embedding is None]
+        if not documents:
+            return
+        try:
+            embeddings, usages = await embedder.async_get_embeddings_batch_and_usage([doc.content for doc in documents])
+            failed = Document._set_batch_embeddings(documents, embeddings, usages)
+        except Exception as e:
+            logger.warning(f"Batch embedding failed: {e}")
+            failed = documents
+
+        if failed:
+            logger.warning(f"Embedding {len(failed)} documents individually")
+        for doc in failed:
+            try:
+                await asyncio.to_thread(doc.embed, embedder)
+            except Exception as e:
+                logger.error(f"Error embedding document '{doc.name}': {e}")
+        log_debug(f"Embedded {len(documents)} documents")
+
     def to_dict(self) -> Dict[str, Any]:
         """Returns a dictionary representation of the document"""
         fields = {"name", "meta_data", "content"}
@@ -1,10 +1,11 @@
 import asyncio
 from dataclasses import dataclass, field
-from typing import Any, List, Optional
+from typing import Any, AsyncIterator, Iterator, List, Optional
 
 from agno.document.base import Document
 from agno.document.chunking.fixed import FixedSizeChunking
 from agno.document.chunking.strategy import ChunkingStrategy
+from agno.document.reader.parsing import aparse_in_processes, chunk_in_process
 
 
 @dataclass
@@ -15,13 +16,20 @@ class Reader:
     chunk_size: int = 5000
     separators: List[str] = field(default_factory=lambda: ["\n", "\n\n", "\r", "\r\n", "\n\r", "\t", " ", "  "])
     chunking_strategy: Optional[ChunkingStrategy] = None
+    # Number of worker processes parsing and chunking documents, None parses in the calling process
+    parsing_workers: Optional[int] = None
 
     def __init__(
-        self, chunk: bool = True, chunk_size: int = 5000, chunking_strategy: Optional[ChunkingStrategy] = None
+        self,
+        chunk: bool = True,
+        chunk_size: int = 5000,
+        chunking_strategy: Optional[ChunkingStrategy] = None,
+        parsing_workers: Optional[int] = None,
     ) -> None:
         self.chunk = chunk
         self.chunk_size = chunk_size
         self.chunking_strategy = chunking_strategy
+        self.parsing_workers = parsing_workers
 
     def read(self, obj: Any) -> List[Document]:
         raise NotImplementedError
@@ -29,6 +37,28 @@ class Reader:
     async def async_read(self, obj: Any) -> List[Document]:
         raise NotImplementedError
 
+    def iter_read(self, obj: Any, **kwargs: Any) -> Iterator[Document]:
+        """Yield the documents of obj one by one.
+
+        Readers that can parse their input incrementally (CSV rows, JSON records, PDF pages, text blocks) override
+        this so only a part of the input is held in memory, other readers yield the documents returned by read.
+        """
+        yield from self.read(obj, **kwargs)
+
+    async def aiter_read(self, obj: Any, **kwargs: Any) -> AsyncIterator[Document]:
+        """Asynchronously yield the documents of obj one by one, see iter_read"""
+        for document in await self.async_read(obj, **kwargs):
+            yield document
+
+    async def _aiter_in_thread(self, documents: Iterator[Document]) -> AsyncIterator[Document]:
+        """Advance a blocking document iterator in a thread, so parsing doesn't block the event loop"""
+        done = object()
+        while True:
+            document = await asyncio.to_thread(next, documents, done)
+            if document is done:
+                return
+            yield document  # type: ignore[misc]
+
     def chunk_document(self, document: Document) -> List[Document]:
         if self.chunking_strategy is None:
             self.chunking_strategy = FixedSizeChunking(chunk_size=self.chunk_size)
@@ -37,6 +67,7 @@ class Reader:
     async def chunk_documents_async(self, documents: List[Document]) -> List[Document]:
         """
         Asynchronously chunk a list of documents using the instance's chunk_document method.
+        With parsing_workers set, the documents are chunked in worker processes.
 
         Args:
             documents: List of documents to be chunked.
@@ -45,6 +76,15 @@ class Reader:
             A flattened list of chunked documents.
         """
 
+        if self.parsing_workers and len(documents) > 1:
+            if self.chunking_strategy is None:
+                self.chunking_strategy = FixedSizeChunking(chunk_size=self.chunk_size)
+            chunked: List[List[Document]] = [[] for _ in documents]
+            tasks = ((self.chunking_strategy, index, doc) for index, doc in enumerate(documents))
+            async for index, chunks in aparse_in_processes(chunk_in_process, tasks, workers=self.parsing_workers):
+                chunked[index] = chunks
+            return [chunk for chunks in chunked for chunk in chunks]
+
         async def _chunk_document_async(doc: Document) -> List[Document]:
             return await asyncio.to_thread(self.chunk_document, doc)
 
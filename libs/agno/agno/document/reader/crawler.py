@@ -0,0 +1,415 @@
+"""Concurrent crawling of websites for the WebsiteReader.
+
+- Pages are fetched by `max_concurrency` workers sharing one pooled HTTP client, with at most
+  `max_concurrency_per_host` requests per host in flight and at least `host_delay` seconds (or the robots.txt
+  Crawl-delay) between the requests to a host.
+- robots.txt is fetched once per host and its rules are respected. The sitemaps it lists (or /sitemap.xml) seed the
+  frontier, so pages are found without walking every link.
+- The frontier, the visited pages, their content and their ETag/Last-Modified validators are kept in a CrawlStore.
+  With a store path the store is a SQLite file: an interrupted crawl resumes where it stopped, and a new crawl of the
+  same site sends conditional requests, reusing the stored content of pages that did not change (HTTP 304).
+"""
+
+import asyncio
+import json
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from threading import Lock
+from typing import Any, Callable, Coroutine, Dict, List, Optional, Set, Tuple, TypeVar
+from urllib.parse import urldefrag, urljoin, urlparse
+from urllib.robotparser import RobotFileParser
+from xml.etree import ElementTree
+
+import httpx
+
+from agno.utils.log import log_debug, logger
+
+try:
+    from bs4 import BeautifulSoup, Tag
+except ImportError:
+    raise ImportError("The `bs4` package is not installed. Please install it via `pip install beautifulsoup4`.")
+
+T = TypeVar("T")
+
+SKIPPED_EXTENSIONS = (".pdf", ".jpg", ".png")
+
+
+class CrawlStore:
+    """Frontier, visited pages and validators of crawls, kept in SQLite (in memory when no path is given)"""
+
+    def __init__(self, path: Optional[str] = None):
+        if path is not None:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = Lock()
+        self._connection = sqlite3.connect(path or ":memory:", check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS pages (
+                    root TEXT NOT NULL,
+                    url TEXT NOT NULL,
+                    depth INTEGER NOT NULL,
+                    -- queued: in the frontier, done/failed: visited by this crawl, stale: visited by a previous crawl
+                    status TEXT NOT NULL,
+                    etag TEXT,
+                    last_modified TEXT,
+                    content TEXT,
+                    links TEXT,
+                    PRIMARY KEY (root, url)
+                )
+                """
+            )
+
+    def start(self, root: str) -> bool:
+        """Prepare a crawl from root, returning True if an interrupted crawl is resumed.
+
+        When the previous crawl finished, its pages are marked stale: they are crawled again, with their validators.
+        """
+        with self._lock, self._connection:
+            queued = self._connection.execute(
+                "SELECT COUNT(*) FROM pages WHERE root = ? AND status = 'queued'", (root,)
+            ).fetchone()[0]
+            if queued:
+                return True
+            self._connection.execute("UPDATE pages SET status = 'stale' WHERE root = ?", (root,))
+            return False
+
+    def enqueue(self, root: str, url: str, depth: int) -> bool:
+        """Add a page to the frontier, returning False if this crawl already queued or visited it"""
+        with self._lock, self._connection:
+            cursor = self._connection.execute(
+                """
+                INSERT INTO pages (root, url, depth, status) VALUES (?, ?, ?, 'queued')
+                ON CONFLICT (root, url) DO UPDATE SET status = 'queued', depth = excluded.depth
+                WHERE pages.status = 'stale'
+                """,
+                (root, url, depth),
+            )
+            return cursor.rowcount > 0
+
+    def get_queued(self, root: str) -> List[Tuple[str, int]]:
+        with self._lock:
+            return self._connection.execute(
+                "SELECT url, depth FROM pages WHERE root = ? AND status = 'queued' ORDER BY depth", (root,)
+            ).fetchall()
+
+    def get_visited(self, root: str) -> Set[str]:
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT url FROM pages WHERE root = ? AND status IN ('done', 'failed')", (root,)
+            ).fetchall()
+        return {url for (url,) in rows}
+
+    def get_page(self, root: str, url: str) -> Optional[Dict[str, Any]]:
+        """Return the validators, content and links stored for a page by a previous crawl"""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT etag, last_modified, content, links FROM pages WHERE root = ? AND url = ?", (root, url)
+            ).fetchone()
+        if row is None or row[2] is None:
+            return None
+        return {"etag": row[0], "last_modified": row[1], "content": row[2], "links": json.loads(row[3] or "[]")}
+
+    def save_page(
+        self,
+        root: str,
+        url: str,
+        content: Optional[str],
+        links: Optional[List[str]] = None,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        """Mark a page visited, storing its content (None if it failed) and validators"""
+        with self._lock, self._connection:
+            if content is None:
+                self._connection.execute("UPDATE pages SET status = 'failed' WHERE root = ? AND url = ?", (root, url))
+                return
+            self._connection.execute(
+                """
+                UPDATE pages SET status = 'done', content = ?, links = ?, etag = ?, last_modified = ?
+                WHERE root = ? AND url = ?
+                """,
+                (content, json.dumps(links or []), etag, last_modified, root, url),
+            )
+
+    def get_results(self, root: str) -> Dict[str, str]:
+        """Return the content of the pages visited by the current crawl"""
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT url, content FROM pages WHERE root = ? AND status = 'done' AND content != ''", (root,)
+            ).fetchall()
+        return dict(rows)
+
+    def finish(self, root: str) -> None:
+        """Mark the crawl finished, pages left in the frontier are crawled by the next crawl"""
+        with self._lock, self._connection:
+            self._connection.execute("UPDATE pages SET status = 'stale' WHERE root = ? AND status = 'queued'", (root,))
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+class _Host:
+    """Politeness state of a host: concurrent requests, time of the next request and robots.txt rules"""
+
+    def __init__(self, max_concurrency: int, delay: float):
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.lock = asyncio.Lock()
+        self.delay = delay
+        self.next_request_time = 0.0
+        self.robots: Optional[RobotFileParser] = None
+
+
+class WebsiteCrawler:
+    """Crawls the pages of a website concurrently, politely and resumably, see the module docstring"""
+
+    def __init__(
+        self,
+        extract_content: Callable[[BeautifulSoup], str],
+        max_depth: int = 3,
+        max_links: int = 10,
+        timeout: int = 10,
+        proxy: Optional[str] = None,
+        max_concurrency: int = 10,
+        max_concurrency_per_host: int = 2,
+        host_delay: float = 0.25,
+        respect_robots: bool = True,
+        use_sitemaps: bool = True,
+        user_agent: str = "agno",
+        store: Optional[CrawlStore] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.extract_content = extract_content
+        self.max_depth = max_depth
+        self.max_links = max_links
+        self.timeout = timeout
+        self.proxy = proxy
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_concurrency_per_host = max(1, max_concurrency_per_host)
+        self.host_delay = host_delay
+        self.respect_robots = respect_robots
+        self.use_sitemaps = use_sitemaps
+        self.user_agent = user_agent
+        self.store = store or CrawlStore()
+        self.transport = transport
+
+    @staticmethod
+    def get_primary_domain(url: str) -> str:
+        # Primary domain (excluding subdomains)
+        return ".".join(urlparse(url).netloc.split(".")[-2:])
+
+    def _is_crawlable(self, url: str, primary_domain: str) -> bool:
+        parsed_url = urlparse(url)
+        return (
+            parsed_url.scheme in ("http", "https")
+            and parsed_url.netloc.endswith(primary_domain)
+            and not any(parsed_url.path.endswith(ext) for ext in SKIPPED_EXTENSIONS)
+        )
+
+    async def _get_host(self, client: httpx.AsyncClient, hosts: Dict[str, _Host], url: str) -> _Host:
+        """Return the politeness state of the host of the URL, fetching its robots.txt the first time"""
+        parsed_url = urlparse(url)
+        origin = f"{parsed_url.scheme}://{parsed_url.netloc}"
+        host = hosts.get(origin)
+        if host is None:
+            host = hosts[origin] = _Host(self.max_concurrency_per_host, self.host_delay)
+        if self.respect_robots and host.robots is None:
+            async with host.lock:
+                if host.robots is None:
+                    host.robots = await self._fetch_robots(client, origin)
+                    crawl_delay = host.robots.crawl_delay(self.user_agent)
+                    if crawl_delay is not None:
+                        host.delay = max(host.delay, float(crawl_delay))
+        return host
+
+    async def _fetch_robots(self, client: httpx.AsyncClient, origin: str) -> RobotFileParser:
+        robots = RobotFileParser(f"{origin}/robots.txt")
+        try:
+            response = await client.get(f"{origin}/robots.txt")
+        except httpx.HTTPError as e:
+            log_debug(f"Could not fetch robots.txt of {origin}: {e}")
+            robots.allow_all = True  # type: ignore[attr-defined]
+            return robots
+        if response.status_code in (401, 403):
+            robots.disallow_all = True  # type: ignore[attr-defined]
+        elif response.status_code >= 400:
+            robots.allow_all = True  # type: ignore[attr-defined]
+        else:
+            robots.parse(response.text.splitlines())
+        return robots
+
+    def _is_allowed(self, host: _Host, url: str) -> bool:
+        return host.robots is None or host.robots.can_fetch(self.user_agent, url)
+
+    async def _get(self, client: httpx.AsyncClient, host: _Host, url: str, headers: Dict[str, str]) -> httpx.Response:
+        """Send a request once the host has a free slot and its politeness delay has passed"""
+        async with host.semaphore:
+            async with host.lock:
+                now = time.monotonic()
+                wait_time = host.next_request_time - now
+                host.next_request_time = max(now, host.next_request_time) + host.delay
+            if wait_time > 0:
+                await asyncio.sleep(wait_time)
+            return await client.get(url, headers=headers)
+
+    async def _get_sitemap_urls(self, client: httpx.AsyncClient, host: _Host, url: str) -> List[str]:
+        """Return the page URLs listed by the sitemaps of the site, following sitemap indexes"""
+        parsed_url = urlparse(url)
+        sitemaps = list(host.robots.site_maps() or []) if host.robots is not None else []
+        if not sitemaps:
+            sitemaps = [f"{parsed_url.scheme}://{parsed_url.netloc}/sitemap.xml"]
+
+        urls: List[str] = []
+        fetched: Set[str] = set()
+        while sitemaps and len(fetched) < 50:
+            sitemap = sitemaps.pop(0)
+            if sitemap in fetched:
+                continue
+            fetched.add(sitemap)
+            try:
+                response = await self._get(client, host, sitemap, {})
+                if response.status_code != 200:
+                    continue
+                root = ElementTree.fromstring(response.content)
+            except (httpx.HTTPError, ElementTree.ParseError) as e:
+                log_debug(f"Could not read sitemap {sitemap}: {e}")
+                continue
+            locations = [
+                element.text.strip() for element in root.iter() if element.tag.endswith("loc") and element.text
+            ]
+            if root.tag.endswith("sitemapindex"):
+                sitemaps.extend(locations)
+            else:
+                urls.extend(locations)
+        return urls
+
+    def _parse_page(self, url: str, content: bytes) -> Tuple[str, List[str]]:
+        """Extract the main content and the links of a page"""
+        soup = BeautifulSoup(content, "html.parser")
+        links = []
+        for link in soup.find_all("a", href=True):
+            if isinstance(link, Tag):
+                links.append(urldefrag(urljoin(url, str(link["href"])))[0])
+        return self.extract_content(soup), links
+
+    async def crawl(self, url: str, starting_depth: int = 1) -> Dict[str, str]:
+        """
+        Crawl the website from the URL and return a dictionary of URLs and the main content of their page.
+
+        Raises:
+        - httpx.HTTPStatusError: If the starting URL returns an HTTP error status and no page was crawled.
+        - httpx.RequestError: If no content could be extracted from the website.
+        """
+        root = url
+        primary_domain = self.get_primary_domain(url)
+        resumed = self.store.start(root)
+        results = self.store.get_results(root) if resumed else {}
+        if resumed:
+            log_debug(f"Resuming crawl of {url}, {len(results)} pages already crawled")
+
+        queue: asyncio.Queue = asyncio.Queue()
+        start_error: List[Exception] = []
+
+        def enqueue(page_url: str, depth: int) -> None:
+            if depth <= self.max_depth and self._is_crawlable(page_url, primary_domain):
+                if self.store.enqueue(root, page_url, depth):
+                    queue.put_nowait((page_url, depth))
+
+        async def fetch(client: httpx.AsyncClient, page_url: str, depth: int) -> None:
+            host = await self._get_host(client, hosts, page_url)
+            if not self._is_allowed(host, page_url):
+                log_debug(f"Skipping {page_url}, disallowed by robots.txt")
+                self.store.save_page(root, page_url, None)
+                return
+
+            previous = self.store.get_page(root, page_url)
+            headers = {}
+            if previous is not None and previous["etag"]:
+                headers["If-None-Match"] = previous["etag"]
+            if previous is not None and previous["last_modified"]:
+                headers["If-Modified-Since"] = previous["last_modified"]
+
+            try:
+                log_debug(f"Crawling: {page_url}")
+                response = await self._get(client, host, page_url, headers)
+                if response.status_code == 304 and previous is not None:
+                    content, links = previous["content"], previous["links"]
+                    etag, last_modified = previous["etag"], previous["last_modified"]
+                else:
+                    response.raise_for_status()
+                    content, links = await asyncio.to_thread(self._parse_page, str(response.url), response.content)
+                    etag, last_modified = response.headers.get("etag"), response.headers.get("last-modified")
+            except Exception as e:
+                logger.warning(f"Failed to crawl {page_url}: {e}")
+                self.store.save_page(root, page_url, None)
+                if page_url == url:
+                    start_error.append(e)
+                return
+
+            self.store.save_page(root, page_url, content, links, etag, last_modified)
+            if content and len(results) < self.max_links:
+                results[page_url] = content
+            for link in links:
+                enqueue(link, depth + 1)
+
+        async def worker(client: httpx.AsyncClient) -> None:
+            while True:
+                page_url, depth = await queue.get()
+                try:
+                    if len(results) < self.max_links:
+                        await fetch(client, page_url, depth)
+                finally:
+                    queue.task_done()
+
+        hosts: Dict[str, _Host] = {}
+        client_args: Dict[str, Any] = {"proxy": self.proxy} if self.proxy else {}
+        if self.transport is not None:
+            client_args["transport"] = self.transport
+        limits = httpx.Limits(max_connections=self.max_concurrency, max_keepalive_connections=self.max_concurrency)
+        async with httpx.AsyncClient(
+            limits=limits,
+            timeout=self.timeout,
+            follow_redirects=True,
+            headers={"User-Agent": self.user_agent},
+            **client_args,
+        ) as client:
+            if resumed:
+                for page_url, depth in self.store.get_queued(root):
+                    queue.put_nowait((page_url, depth))
+            else:
+                enqueue(url, starting_depth)
+                if self.use_sitemaps:
+                    host = await self._get_host(client, hosts, url)
+                    for page_url in await self._get_sitemap_urls(client, host, url):
+                        enqueue(urldefrag(page_url)[0], starting_depth + 1)
+
+            workers = [asyncio.create_task(worker(client)) for _ in range(self.max_concurrency)]
+            try:
+                await queue.join()
+            finally:
+                for task in workers:
+                    task.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+
+        self.store.finish(root)
+        if not results:
+            if start_error:
+                error = start_error[0]
+                if isinstance(error, httpx.HTTPError):
+                    raise error
+                raise httpx.RequestError(f"Failed to crawl starting URL {url}: {str(error)}", request=None) from error
+            raise httpx.RequestError(f"Failed to extract any content from {url}", request=None)
+        return results
+
+
+def run_coroutine(coroutine: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion from synchronous code, in a separate thread if an event loop is running"""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coroutine).result()
@@ -2,8 +2,9 @@ import asyncio
 import csv
 import io
 import os
+from itertools import islice
 from pathlib import Path
-from typing import IO, Any, List, Optional, Union
+from typing import IO, Any, AsyncIterator, Iterator, List, Optional, Union
 from urllib.parse import urlparse
 from uuid import uuid4
 
@@ -58,6 +59,63 @@ class CSVReader(Reader):
             logger.error(f"Error reading: {file.name if isinstance(file, IO) else file}: {e}")
             return []
 
+    def iter_read(
+        self, file: Union[Path, IO[Any]], delimiter: str = ",", quotechar: str = '"', page_size: int = 1000
+    ) -> Iterator[Document]:
+        """
+        Stream a CSV file, yielding a document (or its chunks) per page of page_size rows.
+
+        Only one page of rows is held in memory, whatever the size of the file.
+
+        Args:
+            file: Path or file-like object
+            delimiter: CSV delimiter
+            quotechar: CSV quote character
+            page_size: Number of rows per page
+        """
+        csv_name = Path(file.name).stem if isinstance(file, Path) else file.name.split(".")[0]
+        if isinstance(file, Path):
+            if not file.exists():
+                raise FileNotFoundError(f"Could not find file: {file}")
+            logger.info(f"Streaming: {file}")
+            with file.open(newline="", mode="r", encoding="utf-8") as csvfile:
+                yield from self._iter_pages(csvfile, csv_name, delimiter, quotechar, page_size)
+        else:
+            logger.info(f"Streaming retrieved file: {file.name}")
+            file.seek(0)
+            csvfile = io.TextIOWrapper(file, encoding="utf-8", newline="")  # type: ignore
+            try:
+                yield from self._iter_pages(csvfile, csv_name, delimiter, quotechar, page_size)
+            finally:
+                # Leave the file of the caller open
+                csvfile.detach()
+
+    def _iter_pages(
+        self, csvfile: IO[str], csv_name: str, delimiter: str, quotechar: str, page_size: int
+    ) -> Iterator[Document]:
+        csv_reader = csv.reader(csvfile, delimiter=delimiter, quotechar=quotechar)
+        page_number = 0
+        while True:
+            page_rows = list(islice(csv_reader, page_size))
+            if not page_rows:
+                return
+            page_number += 1
+            document = Document(
+                name=csv_name,
+                id=str(uuid4()),
+                meta_data={"page": page_number, "start_row": (page_number - 1) * page_size + 1, "rows": len(page_rows)},
+                content=" ".join(", ".join(row) for row in page_rows),
+            )
+            yield from self.chunk_document(document) if self.chunk else [document]
+
+    def aiter_read(
+        self, file: Union[Path, IO[Any]], delimiter: str = ",", quotechar: str = '"', page_size: int = 1000
+    ) -> AsyncIterator[Document]:
+        """Asynchronous version of iter_read, parsing the file in a thread"""
+        return self._aiter_in_thread(
+            self.iter_read(file, delimiter=delimiter, quotechar=quotechar, page_size=page_size)
+        )
+
     async def async_read(
         self, file: Union[Path, IO[Any]], delimiter: str = ",", quotechar: str = '"', page_size: int = 1000
     ) -> List[Document]:
@@ -1,14 +1,77 @@
 import asyncio
 import json
-from io import BytesIO
+from io import BytesIO, TextIOWrapper
 from pathlib import Path
-from typing import IO, Any, List, Union
+from typing import IO, Any, AsyncIterator, Iterator, List, Union
 from uuid import uuid4
 
 from agno.document.base import Document
 from agno.document.reader.base import Reader
 from agno.utils.log import log_info
 
+# Characters that can continue a number that a block boundary cut short, e.g. "1." or "1.5e"
+NUMBER_CONTINUATION_CHARS = frozenset("0123456789.eE+-")
+
+
+def _may_continue(value: Any, buffer: str, end: int) -> bool:
+    """Return True if a value decoded at the end of the buffer may be the prefix of a longer value"""
+    if end >= len(buffer):
+        return True
+    is_number = isinstance(value, (int, float)) and not isinstance(value, bool)
+    return is_number and buffer[end] in NUMBER_CONTINUATION_CHARS
+
+
+def _iter_json_values(json_file: IO[str], block_size: int) -> Iterator[Any]:
+    """Decode the records of a JSON document incrementally.
+
+    Yields the elements of a top-level array one by one, every value of a JSON Lines (or concatenated JSON) file,
+    and a top-level object as a single record. Top-level arrays that follow each other, e.g. the lines of a JSON Lines
+    file whose records are arrays, are all yielded element by element.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    position = 0
+    eof = False
+    in_array = False
+    started = False
+
+    while True:
+        # Skip whitespace, and the brackets and commas of a top-level array
+        while position < len(buffer) and (buffer[position].isspace() or (in_array and buffer[position] == ",")):
+            position += 1
+        if position < len(buffer) and not started:
+            started = True
+            if buffer[position] == "[":
+                in_array = True
+                position += 1
+                continue
+        if in_array and position < len(buffer) and buffer[position] == "]":
+            # More top-level values may follow the array, they are read as from the start of a document
+            in_array = False
+            started = False
+            position += 1
+            continue
+
+        if position < len(buffer):
+            try:
+                value, end = decoder.raw_decode(buffer, position)
+                # A number at the end of the buffer, or cut after a "." or an exponent, may continue in the next block
+                if eof or not _may_continue(value, buffer, end):
+                    yield value
+                    position = end
+                    continue
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+
+        if eof:
+            return
+        block = json_file.read(block_size)
+        eof = not block
+        # Drop the decoded part of the buffer before appending the next block
+        buffer = buffer[position:] + block
+        position = 0
+
 
 class JSONReader(Reader):
     """Reader for JSON files"""
@@ -54,6 +117,48 @@ class JSONReader(Reader):
         except Exception:
             raise
 
+    def iter_read(self, path: Union[Path, IO[Any]], block_size: int = 1 << 20) -> Iterator[Document]:
+        """Stream the records of a JSON file, yielding a document (or its chunks) per record.
+
+        The elements of a top-level array and the lines of a JSON Lines file are decoded one at a time, reading
+        block_size characters at a time, so large files are never loaded at once.
+
+        Args:
+            path (Union[Path, IO[Any]]): Path to a JSON file or a file-like object
+            block_size (int): Number of characters read from the file at a time
+        """
+        if isinstance(path, Path):
+            if not path.exists():
+                raise FileNotFoundError(f"Could not find file: {path}")
+            log_info(f"Streaming: {path}")
+            with path.open("r", encoding="utf-8") as json_file:
+                yield from self._iter_records(json_file, path.name.split(".")[0], block_size)
+        elif isinstance(path, BytesIO):
+            log_info(f"Streaming uploaded file: {path.name}")
+            path.seek(0)
+            json_file = TextIOWrapper(path, encoding="utf-8")
+            try:
+                yield from self._iter_records(json_file, path.name.split(".")[0], block_size)
+            finally:
+                # Leave the file of the caller open
+                json_file.detach()
+        else:
+            raise ValueError("Unsupported file type. Must be Path or BytesIO.")
+
+    def _iter_records(self, json_file: IO[str], json_name: str, block_size: int) -> Iterator[Document]:
+        for page_number, record in enumerate(_iter_json_values(json_file, block_size), start=1):
+            document = Document(
+                name=json_name,
+                id=str(uuid4()),
+                meta_data={"page": page_number},
+                content=json.dumps(record),
+            )
+            yield from self.chunk_document(document) if self.chunk else [document]
+
+    def aiter_read(self, path: Union[Path, IO[Any]], block_size: int = 1 << 20) -> AsyncIterator[Document]:
+        """Asynchronous version of iter_read, parsing the file in a thread"""
+        return self._aiter_in_thread(self.iter_read(path, block_size=block_size))
+
     async def async_read(self, path: Union[Path, IO[Any]]) -> List[Document]:
         """Asynchronously read JSON files.
 
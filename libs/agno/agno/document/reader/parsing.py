@@ -0,0 +1,106 @@
+"""Parsing of documents in worker processes.
+
+Text extraction (pypdf, python-docx, csv, json) is CPU-bound and holds the GIL, so threads and asyncio.gather don't
+make it faster. Readers and knowledge bases with `parsing_workers` set shard their pages or files across a
+ProcessPoolExecutor shared by the process. Results are yielded as soon as they complete and at most `max_pending`
+shards are in flight at a time, so the parsed documents held in memory stay bounded however large the corpus is.
+
+Work sent to the workers is pickled: the reader, its chunking strategy and the files (paths or bytes) must be
+picklable.
+"""
+
+import asyncio
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from threading import Lock
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, TypeVar
+
+from agno.document.base import Document
+from agno.document.chunking.strategy import ChunkingStrategy
+
+T = TypeVar("T")
+
+_pools: Dict[int, ProcessPoolExecutor] = {}
+_pools_lock = Lock()
+
+
+def get_parsing_pool(workers: int) -> ProcessPoolExecutor:
+    """Return the process pool with the given number of workers, shared by all readers and knowledge bases"""
+    with _pools_lock:
+        pool = _pools.get(workers)
+        if pool is None:
+            pool = ProcessPoolExecutor(max_workers=workers)
+            _pools[workers] = pool
+        return pool
+
+
+def shutdown_parsing_pools(wait: bool = True) -> None:
+    """Stop the worker processes, they are started again on the next parse"""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.shutdown(wait=wait)
+
+
+def parse_in_processes(
+    fn: Callable[..., T], tasks: Iterable[Tuple[Any, ...]], workers: int, max_pending: Optional[int] = None
+) -> Iterator[T]:
+    """Run fn(*args) for the args of each task in worker processes and yield the results as they complete.
+
+    Tasks are consumed lazily, at most max_pending (default 2 * workers) are submitted at a time.
+    """
+    pool = get_parsing_pool(workers)
+    max_pending = max_pending or 2 * workers
+    pending: Set[Future] = set()
+    try:
+        for args in tasks:
+            pending.add(pool.submit(fn, *args))
+            if len(pending) >= max_pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+async def aparse_in_processes(
+    fn: Callable[..., T], tasks: Iterable[Tuple[Any, ...]], workers: int, max_pending: Optional[int] = None
+) -> AsyncIterator[T]:
+    """Asynchronous version of parse_in_processes, waiting for the workers without blocking the event loop"""
+    pool = get_parsing_pool(workers)
+    max_pending = max_pending or 2 * workers
+    pending: Set[asyncio.Future] = set()
+    try:
+        for args in tasks:
+            pending.add(asyncio.wrap_future(pool.submit(fn, *args)))
+            if len(pending) >= max_pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def read_in_process(reader: Any, read_kwargs: Dict[str, Any], metadata: Optional[Dict[str, Any]]) -> List[Document]:
+    """Read one file with a copy of the reader in a worker process, adding the metadata to its documents"""
+    # The worker is already one of the parsing processes, don't shard the file again
+    reader.parsing_workers = None
+    documents = reader.read(**read_kwargs)
+    if metadata:
+        for doc in documents:
+            doc.meta_data.update(metadata)
+    return documents
+
+
+def chunk_in_process(chunking_strategy: ChunkingStrategy, index: int, document: Document) -> Tuple[int, List[Document]]:
+    return index, chunking_strategy.chunk(document)
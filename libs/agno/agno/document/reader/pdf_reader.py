@@ -1,10 +1,16 @@
 import asyncio
+from contextlib import contextmanager
+from io import BytesIO
 from pathlib import Path
-from typing import IO, Any, List, Optional, Union
+from tempfile import NamedTemporaryFile
+from typing import IO, Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple, Union
 from uuid import uuid4
 
 from agno.document.base import Document
+from agno.document.chunking.fixed import FixedSizeChunking
+from agno.document.chunking.strategy import ChunkingStrategy
 from agno.document.reader.base import Reader
+from agno.document.reader.parsing import aparse_in_processes, parse_in_processes
 from agno.utils.http import async_fetch_with_retry, fetch_with_retry
 from agno.utils.log import log_info, logger
 
@@ -83,13 +89,114 @@ async def async_process_image_page(doc_name: str, page_number: int, page: Any) -
     )
 
 
+def extract_pages(
+    pdf: Union[str, Path, bytes],
+    doc_name: str,
+    first_page: int,
+    last_page: int,
+    page_ids: bool = False,
+    chunking_strategy: Optional[ChunkingStrategy] = None,
+) -> Tuple[int, List[Document]]:
+    """Extract the text of a range of pages (1-based, inclusive) in a worker process"""
+    doc_reader = DocumentReader(BytesIO(pdf) if isinstance(pdf, bytes) else pdf)
+    documents = []
+    for page_number in range(first_page, last_page + 1):
+        document = Document(
+            name=doc_name,
+            id=f"{doc_name}_{page_number}" if page_ids else str(uuid4()),
+            meta_data={"page": page_number},
+            content=doc_reader.pages[page_number - 1].extract_text(),
+        )
+        documents.extend(chunking_strategy.chunk(document) if chunking_strategy else [document])
+    return first_page, documents
+
+
+@contextmanager
+def pdf_file_path(pdf: Union[str, Path, IO[Any], bytes]) -> Iterator[Union[str, Path]]:
+    """Yield a path of the PDF. PDF content is written once to a temporary file, removed afterwards, so worker
+    processes receive a path instead of a copy of the whole PDF per shard."""
+    if isinstance(pdf, (str, Path)):
+        yield pdf
+        return
+    if isinstance(pdf, bytes):
+        content = pdf
+    else:
+        pdf.seek(0)
+        content = pdf.read()
+    with NamedTemporaryFile(suffix=".pdf", delete=False) as pdf_file:
+        pdf_file.write(content)
+    try:
+        yield pdf_file.name
+    finally:
+        Path(pdf_file.name).unlink(missing_ok=True)
+
+
 class BasePDFReader(Reader):
+    def __init__(self, pages_per_shard: int = 20, **kwargs):
+        super().__init__(**kwargs)
+        # Number of pages extracted by a worker process at a time when parsing_workers is set
+        self.pages_per_shard = pages_per_shard
+
     def _build_chunked_documents(self, documents: List[Document]) -> List[Document]:
         chunked_documents: List[Document] = []
         for document in documents:
             chunked_documents.extend(self.chunk_document(document))
         return chunked_documents
 
+    def _get_page_shards(
+        self, pdf_path: Union[str, Path], doc_name: str, page_ids: bool = False
+    ) -> Iterator[Tuple[Any, ...]]:
+        """Split the pages of the PDF in ranges of pages_per_shard pages, as arguments of extract_pages"""
+        num_pages = len(DocumentReader(pdf_path).pages)
+        chunking_strategy = None
+        if self.chunk:
+            chunking_strategy = self.chunking_strategy or FixedSizeChunking(chunk_size=self.chunk_size)
+        shard_size = max(1, self.pages_per_shard)
+        for first_page in range(1, num_pages + 1, shard_size):
+            last_page = min(first_page + shard_size - 1, num_pages)
+            yield pdf_path, doc_name, first_page, last_page, page_ids, chunking_strategy
+
+    def _iter_in_processes(
+        self, pdf: Union[str, Path, IO[Any], bytes], doc_name: str, page_ids: bool = False
+    ) -> Iterator[Document]:
+        """Extract and chunk the pages in parsing_workers processes, yielding the documents in page order"""
+        shards: Dict[int, List[Document]] = {}
+        next_page = 1
+        with pdf_file_path(pdf) as pdf_path:
+            for first_page, documents in parse_in_processes(
+                extract_pages, self._get_page_shards(pdf_path, doc_name, page_ids), workers=self.parsing_workers or 1
+            ):
+                shards[first_page] = documents
+                # Shards complete out of order, yield the ones that follow the pages already yielded
+                while next_page in shards:
+                    yield from shards.pop(next_page)
+                    next_page += max(1, self.pages_per_shard)
+
+    async def _aiter_in_processes(
+        self, pdf: Union[str, Path, IO[Any], bytes], doc_name: str, page_ids: bool = False
+    ) -> AsyncIterator[Document]:
+        shards: Dict[int, List[Document]] = {}
+        next_page = 1
+        with pdf_file_path(pdf) as pdf_path:
+            async for first_page, documents in aparse_in_processes(
+                extract_pages, self._get_page_shards(pdf_path, doc_name, page_ids), workers=self.parsing_workers or 1
+            ):
+                shards[first_page] = documents
+                while next_page in shards:
+                    for document in shards.pop(next_page):
+                        yield document
+                    next_page += max(1, self.pages_per_shard)
+
+    def _read_in_processes(
+        self, pdf: Union[str, Path, IO[Any], bytes], doc_name: str, page_ids: bool = False
+    ) -> List[Document]:
+        return list(self._iter_in_processes(pdf, doc_name, page_ids))
+
+    async def _aread_in_processes(
+        self, pdf: Union[str, Path, IO[Any], bytes], doc_name: str, page_ids: bool = False
+    ) -> List[Document]:
+        return [document async for document in self._aiter_in_processes(pdf, doc_name, page_ids)]
+
 
 class PDFReader(BasePDFReader):
     """Reader for PDF files"""
@@ -105,6 +212,13 @@ class PDFReader(BasePDFReader):
 
         log_info(f"Reading: {doc_name}")
 
+        if self.parsing_workers:
+            try:
+                return self._read_in_processes(pdf, doc_name)
+            except PdfStreamError as e:
+                logger.error(f"Error reading PDF: {e}")
+                return []
+
         try:
             doc_reader = DocumentReader(pdf)
         except PdfStreamError as e:
@@ -125,6 +239,43 @@ class PDFReader(BasePDFReader):
             return self._build_chunked_documents(documents)
         return documents
 
+    def _get_doc_name(self, pdf: Union[str, Path, IO[Any]]) -> str:
+        try:
+            if isinstance(pdf, str):
+                return pdf.split("/")[-1].split(".")[0].replace(" ", "_")
+            return pdf.name.split(".")[0]
+        except Exception:
+            return "pdf"
+
+    def iter_read(self, pdf: Union[str, Path, IO[Any]]) -> Iterator[Document]:
+        """Stream the pages of a PDF, extracting and chunking one page at a time"""
+        doc_name = self._get_doc_name(pdf)
+        log_info(f"Streaming: {doc_name}")
+
+        if self.parsing_workers:
+            yield from self._iter_in_processes(pdf, doc_name)
+            return
+
+        doc_reader = DocumentReader(pdf)
+        for page_number, page in enumerate(doc_reader.pages, start=1):
+            document = Document(
+                name=doc_name,
+                id=str(uuid4()),
+                meta_data={"page": page_number},
+                content=page.extract_text(),
+            )
+            yield from self.chunk_document(document) if self.chunk else [document]
+
+    async def aiter_read(self, pdf: Union[str, Path, IO[Any]]) -> AsyncIterator[Document]:
+        """Asynchronous version of iter_read, extracting the pages in a thread or in the parsing workers"""
+        if self.parsing_workers:
+            async for document in self._aiter_in_processes(pdf, self._get_doc_name(pdf)):
+                yield document
+            return
+
+        async for document in self._aiter_in_thread(self.iter_read(pdf)):
+            yield document
+
     async def async_read(self, pdf: Union[str, Path, IO[Any]]) -> List[Document]:
         try:
             if isinstance(pdf, str):
@@ -137,26 +288,26 @@ class PDFReader(BasePDFReader):
         log_info(f"Reading: {doc_name}")
 
         try:
+            if self.parsing_workers:
+                return await self._aread_in_processes(pdf, doc_name)
             doc_reader = DocumentReader(pdf)
         except PdfStreamError as e:
             logger.error(f"Error reading PDF: {e}")
             return []
 
-        async def _process_document(doc_name: str, page_number: int, page: Any) -> Document:
-            return Document(
-                name=doc_name,
-                id=str(uuid4()),
-                meta_data={"page": page_number},
-                content=page.extract_text(),
-            )
-
-        # Process pages in parallel using asyncio.gather
-        documents = await asyncio.gather(
-            *[
-                _process_document(doc_name, page_number, page)
+        def _process_pages() -> List[Document]:
+            return [
+                Document(
+                    name=doc_name,
+                    id=str(uuid4()),
+                    meta_data={"page": page_number},
+                    content=page.extract_text(),
+                )
                 for page_number, page in enumerate(doc_reader.pages, start=1)
             ]
-        )
+
+        # Text extraction is CPU-bound, keep it off the event loop
+        documents = await asyncio.to_thread(_process_pages)
 
         if self.chunk:
             return self._build_chunked_documents(documents)
@@ -174,14 +325,14 @@ class PDFUrlReader(BasePDFReader):
         if not url:
             raise ValueError("No url provided")
 
-        from io import BytesIO
-
         log_info(f"Reading: {url}")
 
         # Retry the request up to 3 times with exponential backoff
         response = fetch_with_retry(url, proxy=self.proxy)
 
         doc_name = url.split("/")[-1].split(".")[0].replace("/", "_").replace(" ", "_")
+        if self.parsing_workers:
+            return self._read_in_processes(response.content, doc_name, page_ids=True)
         doc_reader = DocumentReader(BytesIO(response.content))
 
         documents = []
@@ -202,8 +353,6 @@ class PDFUrlReader(BasePDFReader):
         if not url:
             raise ValueError("No url provided")
 
-        from io import BytesIO
-
         import httpx
 
         log_info(f"Reading: {url}")
@@ -213,23 +362,23 @@ class PDFUrlReader(BasePDFReader):
             response = await async_fetch_with_retry(url, client=client)
 
         doc_name = url.split("/")[-1].split(".")[0].replace("/", "_").replace(" ", "_")
+        if self.parsing_workers:
+            return await self._aread_in_processes(response.content, doc_name, page_ids=True)
         doc_reader = DocumentReader(BytesIO(response.content))
 
-        async def _process_document(doc_name: str, page_number: int, page: Any) -> Document:
-            return Document(
-                name=doc_name,
-                id=f"{doc_name}_{page_number}",
-                meta_data={"page": page_number},
-                content=page.extract_text(),
-            )
-
-        # Process pages in parallel using asyncio.gather
-        documents = await asyncio.gather(
-            *[
-                _process_document(doc_name, page_number, page)
+        def _process_pages() -> List[Document]:
+            return [
+                Document(
+                    name=doc_name,
+                    id=f"{doc_name}_{page_number}",
+                    meta_data={"page": page_number},
+                    content=page.extract_text(),
+                )
                 for page_number, page in enumerate(doc_reader.pages, start=1)
             ]
-        )
+
+        # Text extraction is CPU-bound, keep it off the event loop
+        documents = await asyncio.to_thread(_process_pages)
 
         if self.chunk:
             return self._build_chunked_documents(documents)
@@ -301,8 +450,6 @@ class PDFUrlImageReader(BasePDFReader):
         if not url:
             raise ValueError("No url provided")
 
-        from io import BytesIO
-
         import httpx
 
         # Read the PDF from the URL
@@ -326,8 +473,6 @@ class PDFUrlImageReader(BasePDFReader):
         if not url:
             raise ValueError("No url provided")
 
-        from io import BytesIO
-
         import httpx
 
         log_info(f"Reading: {url}")
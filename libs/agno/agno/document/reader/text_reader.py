@@ -1,7 +1,8 @@
 import asyncio
 import uuid
+from io import TextIOWrapper
 from pathlib import Path
-from typing import IO, Any, List, Union
+from typing import IO, Any, AsyncIterator, Iterator, List, Union
 
 from agno.document.base import Document
 from agno.document.reader.base import Reader
@@ -42,6 +43,52 @@ class TextReader(Reader):
             logger.error(f"Error reading: {file}: {e}")
             return []
 
+    def iter_read(self, file: Union[Path, IO[Any]], block_size: int = 1 << 20) -> Iterator[Document]:
+        """Stream a text file in blocks of about block_size characters ending on a line break, yielding a document
+        (or its chunks) per block"""
+        if isinstance(file, Path):
+            if not file.exists():
+                raise FileNotFoundError(f"Could not find file: {file}")
+            log_info(f"Streaming: {file}")
+            with file.open("r", encoding="utf-8") as text_file:
+                yield from self._iter_blocks(text_file, file.stem, block_size)
+        else:
+            log_info(f"Streaming uploaded file: {file.name}")
+            file.seek(0)
+            text_file = TextIOWrapper(file, encoding="utf-8")  # type: ignore
+            try:
+                yield from self._iter_blocks(text_file, file.name.split(".")[0], block_size)
+            finally:
+                # Leave the file of the caller open
+                text_file.detach()
+
+    def _iter_blocks(self, text_file: IO[str], file_name: str, block_size: int) -> Iterator[Document]:
+        remainder = ""
+        block_number = 0
+        while True:
+            data = text_file.read(block_size)
+            content = remainder + data
+            if data:
+                # Keep the last partial line for the next block, unless the block has no line break at all
+                cut = content.rfind("\n") + 1
+                if cut > 0:
+                    content, remainder = content[:cut], content[cut:]
+                else:
+                    remainder = ""
+            if not content:
+                return
+            block_number += 1
+            document = Document(
+                name=file_name, id=str(uuid.uuid4()), meta_data={"block": block_number}, content=content
+            )
+            yield from self.chunk_document(document) if self.chunk else [document]
+            if not data:
+                return
+
+    def aiter_read(self, file: Union[Path, IO[Any]], block_size: int = 1 << 20) -> AsyncIterator[Document]:
+        """Asynchronous version of iter_read, reading the file in a thread"""
+        return self._aiter_in_thread(self.iter_read(file, block_size=block_size))
+
     async def async_read(self, file: Union[Path, IO[Any]]) -> List[Document]:
         try:
             if isinstance(file, Path):
@@ -2,13 +2,13 @@ import asyncio
 import random
 import time
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Set, Tuple
-from urllib.parse import urljoin, urlparse
+from typing import Dict, List, Optional, Set
 
 import httpx
 
 from agno.document.base import Document
 from agno.document.reader.base import Reader
+from agno.document.reader.crawler import CrawlStore, WebsiteCrawler, run_coroutine
 from agno.utils.log import log_debug, logger
 
 try:
@@ -25,19 +25,53 @@ class WebsiteReader(Reader):
     max_links: int = 10
 
     _visited: Set[str] = field(default_factory=set)
-    _urls_to_crawl: List[Tuple[str, int]] = field(default_factory=list)
+    _crawl_store: Optional[CrawlStore] = None
 
     def __init__(
-        self, max_depth: int = 3, max_links: int = 10, timeout: int = 10, proxy: Optional[str] = None, **kwargs
+        self,
+        max_depth: int = 3,
+        max_links: int = 10,
+        timeout: int = 10,
+        proxy: Optional[str] = None,
+        max_concurrency: int = 10,
+        max_concurrency_per_host: int = 2,
+        host_delay: float = 0.25,
+        respect_robots: bool = True,
+        use_sitemaps: bool = True,
+        user_agent: str = "agno",
+        crawl_store_path: Optional[str] = None,
+        **kwargs,
     ):
+        """
+        Args:
+            max_depth: Maximum depth of links followed from the starting URL.
+            max_links: Maximum number of pages with content returned by a crawl.
+            timeout: Timeout of each request in seconds.
+            proxy: Proxy to send the requests through.
+            max_concurrency: Number of pages fetched at the same time.
+            max_concurrency_per_host: Number of pages fetched at the same time from one host.
+            host_delay: Minimum seconds between two requests to a host, raised to the robots.txt Crawl-delay.
+            respect_robots: Skip the pages disallowed by the robots.txt of their host.
+            use_sitemaps: Seed the crawl with the pages listed in the sitemaps of the site.
+            user_agent: User agent sent with the requests and matched against robots.txt rules.
+            crawl_store_path: SQLite file keeping the frontier, visited pages and validators of crawls, so
+                interrupted crawls resume and re-crawls send conditional requests. Kept in memory when None.
+        """
         super().__init__(**kwargs)
         self.max_depth = max_depth
         self.max_links = max_links
         self.proxy = proxy
         self.timeout = timeout
+        self.max_concurrency = max_concurrency
+        self.max_concurrency_per_host = max_concurrency_per_host
+        self.host_delay = host_delay
+        self.respect_robots = respect_robots
+        self.use_sitemaps = use_sitemaps
+        self.user_agent = user_agent
+        self.crawl_store_path = crawl_store_path
 
         self._visited = set()
-        self._urls_to_crawl = []
+        self._crawl_store = None
 
     def delay(self, min_seconds=1, max_seconds=3):
         """
@@ -66,9 +100,7 @@ class WebsiteReader(Reader):
         :param url: The URL to extract the primary domain from.
         :return: The primary domain.
         """
-        domain_parts = urlparse(url).netloc.split(".")
-        # Return primary domain (excluding subdomains)
-        return ".".join(domain_parts[-2:])
+        return WebsiteCrawler.get_primary_domain(url)
 
     def _extract_main_content(self, soup: BeautifulSoup) -> str:
         """
@@ -101,6 +133,24 @@ class WebsiteReader(Reader):
 
         return soup.get_text(strip=True, separator=" ")
 
+    def _get_crawler(self) -> WebsiteCrawler:
+        if self._crawl_store is None:
+            self._crawl_store = CrawlStore(self.crawl_store_path)
+        return WebsiteCrawler(
+            extract_content=self._extract_main_content,
+            max_depth=self.max_depth,
+            max_links=self.max_links,
+            timeout=self.timeout,
+            proxy=self.proxy,
+            max_concurrency=self.max_concurrency,
+            max_concurrency_per_host=self.max_concurrency_per_host,
+            host_delay=self.host_delay,
+            respect_robots=self.respect_robots,
+            use_sitemaps=self.use_sitemaps,
+            user_agent=self.user_agent,
+            store=self._crawl_store,
+        )
+
     def crawl(self, url: str, starting_depth: int = 1) -> Dict[str, str]:
         """
         Crawls a website and returns a dictionary of URLs and their corresponding content.
@@ -120,98 +170,10 @@ class WebsiteReader(Reader):
         Note:
         The function focuses on extracting the main content by prioritizing content inside common HTML tags
         like `<article>`, `<main>`, and `<div>` with class names such as "content", "main-content", etc.
-        The crawler will also respect the `max_depth` attribute of the WebCrawler class, ensuring it does not
-        crawl deeper than the specified depth.
+        Pages are fetched concurrently by the crawler described in `agno.document.reader.crawler`, which respects
+        the `max_depth` and `max_links` attributes, robots.txt and per-host politeness limits.
         """
-        num_links = 0
-        crawler_result: Dict[str, str] = {}
-        primary_domain = self._get_primary_domain(url)
-        # Add starting URL with its depth to the global list
-        self._urls_to_crawl.append((url, starting_depth))
-        while self._urls_to_crawl:
-            # Unpack URL and depth from the global list
-            current_url, current_depth = self._urls_to_crawl.pop(0)
-
-            # Skip if
-            # - URL is already visited
-            # - does not end with the primary domain,
-            # - exceeds max depth
-            # - exceeds max links
-            if (
-                current_url in self._visited
-                or not urlparse(current_url).netloc.endswith(primary_domain)
-                or current_depth > self.max_depth
-                or num_links >= self.max_links
-            ):
-                continue
-
-            self._visited.add(current_url)
-            self.delay()
-
-            try:
-                log_debug(f"Crawling: {current_url}")
-                response = (
-                    httpx.get(current_url, timeout=self.timeout, proxy=self.proxy)
-                    if self.proxy
-                    else httpx.get(current_url, timeout=self.timeout)
-                )
-
-                response.raise_for_status()
-                soup = BeautifulSoup(response.content, "html.parser")
-
-                # Extract main content
-                main_content = self._extract_main_content(soup)
-                if main_content:
-                    crawler_result[current_url] = main_content
-                    num_links += 1
-
-                # Add found URLs to the global list, with incremented depth
-                for link in soup.find_all("a", href=True):
-                    if not isinstance(link, Tag):
-                        continue
-
-                    href_str = str(link["href"])
-                    full_url = urljoin(current_url, href_str)
-
-                    if not isinstance(full_url, str):
-                        continue
-
-                    parsed_url = urlparse(full_url)
-                    if parsed_url.netloc.endswith(primary_domain) and not any(
-                        parsed_url.path.endswith(ext) for ext in [".pdf", ".jpg", ".png"]
-                    ):
-                        full_url_str = str(full_url)
-                        if (
-                            full_url_str not in self._visited
-                            and (full_url_str, current_depth + 1) not in self._urls_to_crawl
-                        ):
-                            self._urls_to_crawl.append((full_url_str, current_depth + 1))
-
-            except httpx.HTTPStatusError as e:
-                # Log HTTP status errors but continue crawling other pages
-                logger.warning(f"HTTP status error while crawling {current_url}: {e}")
-                # For the initial URL, we should raise the error
-                if current_url == url and not crawler_result:
-                    raise
-            except httpx.RequestError as e:
-                # Log request errors but continue crawling other pages
-                logger.warning(f"Request error while crawling {current_url}: {e}")
-                # For the initial URL, we should raise the error
-                if current_url == url and not crawler_result:
-                    raise
-            except Exception as e:
-                # Log other exceptions but continue crawling other pages
-                logger.warning(f"Failed to crawl {current_url}: {e}")
-                # For the initial URL, we should raise the error
-                if current_url == url and not crawler_result:
-                    # Wrap non-HTTP exceptions in a RequestError
-                    raise httpx.RequestError(f"Failed to crawl starting URL {url}: {str(e)}", request=None) from e
-
-        # If we couldn't crawl any pages, raise an error
-        if not crawler_result:
-            raise httpx.RequestError(f"Failed to extract any content from {url}", request=None)
-
-        return crawler_result
+        return run_coroutine(self.async_crawl(url, starting_depth))
 
     async def async_crawl(self, url: str, starting_depth: int = 1) -> Dict[str, str]:
         """
@@ -229,91 +191,9 @@ class WebsiteReader(Reader):
         - httpx.HTTPStatusError: If there's an HTTP status error.
         - httpx.RequestError: If there's a request-related error (connection, timeout, etc).
         """
-        num_links = 0
-        crawler_result: Dict[str, str] = {}
-        primary_domain = self._get_primary_domain(url)
-
-        # Clear previously visited URLs and URLs to crawl
-        self._visited = set()
-        self._urls_to_crawl = [(url, starting_depth)]
-
-        client_args = {"proxy": self.proxy} if self.proxy else {}
-        async with httpx.AsyncClient(**client_args) as client:  # type: ignore
-            while self._urls_to_crawl and num_links < self.max_links:
-                current_url, current_depth = self._urls_to_crawl.pop(0)
-
-                if (
-                    current_url in self._visited
-                    or not urlparse(current_url).netloc.endswith(primary_domain)
-                    or current_depth > self.max_depth
-                    or num_links >= self.max_links
-                ):
-                    continue
-
-                self._visited.add(current_url)
-                await self.async_delay()
-
-                try:
-                    log_debug(f"Crawling asynchronously: {current_url}")
-                    response = await client.get(current_url, timeout=self.timeout, follow_redirects=True)
-                    response.raise_for_status()
-
-                    soup = BeautifulSoup(response.content, "html.parser")
-
-                    # Extract main content
-                    main_content = self._extract_main_content(soup)
-                    if main_content:
-                        crawler_result[current_url] = main_content
-                        num_links += 1
-
-                    # Add found URLs to the list, with incremented depth
-                    for link in soup.find_all("a", href=True):
-                        if not isinstance(link, Tag):
-                            continue
-
-                        href_str = str(link["href"])
-                        full_url = urljoin(current_url, href_str)
-
-                        if not isinstance(full_url, str):
-                            continue
-
-                        parsed_url = urlparse(full_url)
-                        if parsed_url.netloc.endswith(primary_domain) and not any(
-                            parsed_url.path.endswith(ext) for ext in [".pdf", ".jpg", ".png"]
-                        ):
-                            full_url_str = str(full_url)
-                            if (
-                                full_url_str not in self._visited
-                                and (full_url_str, current_depth + 1) not in self._urls_to_crawl
-                            ):
-                                self._urls_to_crawl.append((full_url_str, current_depth + 1))
-
-                except httpx.HTTPStatusError as e:
-                    # Log HTTP status errors but continue crawling other pages
-                    logger.warning(f"HTTP status error while crawling asynchronously {current_url}: {e}")
-                    # For the initial URL, we should raise the error
-                    if current_url == url and not crawler_result:
-                        raise
-                except httpx.RequestError as e:
-                    # Log request errors but continue crawling other pages
-                    logger.warning(f"Request error while crawling asynchronously {current_url}: {e}")
-                    # For the initial URL, we should raise the error
-                    if current_url == url and not crawler_result:
-                        raise
-                except Exception as e:
-                    # Log other exceptions but continue crawling other pages
-                    logger.warning(f"Failed to crawl asynchronously {current_url}: {e}")
-                    # For the initial URL, we should raise the error
-                    if current_url == url and not crawler_result:
-                        # Wrap non-HTTP exceptions in a RequestError
-                        raise httpx.RequestError(
-                            f"Failed to crawl starting URL {url} asynchronously: {str(e)}", request=None
-                        ) from e
-
-        # If we couldn't crawl any pages, raise an error
-        if not crawler_result:
-            raise httpx.RequestError(f"Failed to extract any content from {url} asynchronously", request=None)
-
+        crawler = self._get_crawler()
+        crawler_result = await crawler.crawl(url, starting_depth)
+        self._visited = crawler.store.get_visited(url)
         return crawler_result
 
     def read(self, url: str) -> List[Document]:
@@ -1,3 +1,4 @@
+import asyncio
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple
 
@@ -7,9 +8,83 @@ class Embedder:
     """Base class for managing embedders"""
 
     dimensions: Optional[int] = 1536
+    # Maximum number of texts to send in a single embedding request
+    batch_size: int = 100
+    # Maximum number of (estimated) tokens to send in a single embedding request
+    max_batch_tokens: Optional[int] = None
 
     def get_embedding(self, text: str) -> List[float]:
         raise NotImplementedError
 
     def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
         raise NotImplementedError
+
+    @staticmethod
+    def estimate_tokens(text: str) -> int:
+        """Cheap token estimate (~4 characters per token) used to size batches"""
+        return len(text) // 4 + 1
+
+    def split_batches(self, texts: List[str]) -> List[List[str]]:
+        """Split texts into batches that respect both batch_size and max_batch_tokens"""
+        batches: List[List[str]] = []
+        current: List[str] = []
+        current_tokens = 0
+        batch_size = max(1, self.batch_size)
+        for text in texts:
+            text_tokens = self.estimate_tokens(text)
+            over_tokens = self.max_batch_tokens is not None and current_tokens + text_tokens > self.max_batch_tokens
+            if current and (len(current) >= batch_size or over_tokens):
+                batches.append(current)
+                current, current_tokens = [], 0
+            current.append(text)
+            current_tokens += text_tokens
+        if current:
+            batches.append(current)
+        return batches
+
+    @staticmethod
+    def _get_batch_usages(usage: Optional[Dict], num_texts: int) -> List[Optional[Dict]]:
+        """Attach the usage of a batch request to its first text, so summing the usage of the documents counts it once"""
+        return [usage] + [None] * (num_texts - 1) if num_texts > 0 else []
+
+    def _get_batch_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        """Embed a single batch. Providers with a multi-input endpoint override this with one request."""
+        embeddings: List[List[float]] = []
+        usages: List[Optional[Dict]] = []
+        for text in texts:
+            embedding, usage = self.get_embedding_and_usage(text)
+            embeddings.append(embedding)
+            usages.append(usage)
+        return embeddings, usages
+
+    async def _async_get_batch_embeddings_and_usage(
+        self, texts: List[str]
+    ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        return await asyncio.to_thread(self._get_batch_embeddings_and_usage, texts)
+
+    def get_embeddings_batch_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        """Embed a list of texts, returning one embedding and one usage entry per text, in input order"""
+        embeddings: List[List[float]] = []
+        usages: List[Optional[Dict]] = []
+        for batch in self.split_batches(texts):
+            batch_embeddings, batch_usages = self._get_batch_embeddings_and_usage(batch)
+            embeddings.extend(batch_embeddings)
+            usages.extend(batch_usages)
+        return embeddings, usages
+
+    def get_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
+        return self.get_embeddings_batch_and_usage(texts)[0]
+
+    async def async_get_embeddings_batch_and_usage(
+        self, texts: List[str]
+    ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        embeddings: List[List[float]] = []
+        usages: List[Optional[Dict]] = []
+        for batch in self.split_batches(texts):
+            batch_embeddings, batch_usages = await self._async_get_batch_embeddings_and_usage(batch)
+            embeddings.extend(batch_embeddings)
+            usages.extend(batch_usages)
+        return embeddings, usages
+
+    async def async_get_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
+        return (await self.async_get_embeddings_batch_and_usage(texts))[0]
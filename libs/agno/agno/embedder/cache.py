@@ -0,0 +1,208 @@
+import sqlite3
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from agno.embedder.base import Embedder
+from agno.utils.log import log_debug, logger
+from agno.utils.string import safe_content_hash
+
+
+@dataclass
+class EmbeddingCache(Embedder):
+    """Content-addressed cache around any Embedder.
+
+    Embeddings are keyed by (embedder class, embedder id, dimensions, content hash) and kept in an in-process
+    LRU tier, plus an optional on-disk SQLite tier that survives restarts and can be shared between processes.
+
+    Example:
+        embedder = EmbeddingCache(embedder=OpenAIEmbedder(), db_file="tmp/embeddings.db")
+        vector_db = PgVector(table_name="docs", db_url=db_url, embedder=embedder)
+    """
+
+    embedder: Optional[Embedder] = None
+    # Maximum number of embeddings kept in memory
+    max_size: int = 10_000
+    # Number of seconds an embedding stays valid. None means embeddings never expire.
+    ttl: Optional[float] = None
+    # SQLite file for the on-disk tier. If None, only the in-memory tier is used.
+    db_file: Optional[Union[str, Path]] = None
+    # Maximum number of embeddings kept on disk. None means unbounded.
+    max_disk_size: Optional[int] = None
+
+    hits: int = field(default=0, init=False)
+    misses: int = field(default=0, init=False)
+
+    def __post_init__(self):
+        if self.embedder is None:
+            raise ValueError("EmbeddingCache requires an embedder to wrap")
+        self.dimensions = self.embedder.dimensions
+        self.batch_size = self.embedder.batch_size
+        self.max_batch_tokens = self.embedder.max_batch_tokens
+
+        self._memory: "OrderedDict[str, Tuple[float, List[float]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+        if self.db_file is not None:
+            db_path = Path(self.db_file).resolve()
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(str(db_path), check_same_thread=False)
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, embedding BLOB, created_at REAL)"
+            )
+            self._connection.execute("CREATE INDEX IF NOT EXISTS idx_embeddings_created_at ON embeddings (created_at)")
+            self._connection.commit()
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "EmbeddingCache":
+        # The cache is shared between copies of the agents and knowledge bases that use it
+        return self
+
+    @property
+    def id(self) -> Optional[str]:
+        return getattr(self.embedder, "id", None)
+
+    def get_cache_key(self, text: str) -> str:
+        return f"{self.embedder.__class__.__name__}:{self.id}:{self.dimensions}:{safe_content_hash(text)}"
+
+    def _is_expired(self, created_at: float) -> bool:
+        return self.ttl is not None and time.time() - created_at > self.ttl
+
+    def _get(self, key: str) -> Optional[List[float]]:
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                created_at, embedding = entry
+                if not self._is_expired(created_at):
+                    self._memory.move_to_end(key)
+                    return embedding
+                del self._memory[key]
+
+            if self._connection is None:
+                return None
+
+            row = self._connection.execute(
+                "SELECT embedding, created_at FROM embeddings WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if self._is_expired(row[1]):
+                self._connection.execute("DELETE FROM embeddings WHERE key = ?", (key,))
+                self._connection.commit()
+                return None
+
+            embedding = array("f", row[0]).tolist()
+            self._set_memory(key, embedding, row[1])
+            return embedding
+
+    def _set_memory(self, key: str, embedding: List[float], created_at: float) -> None:
+        self._memory[key] = (created_at, embedding)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_size:
+            self._memory.popitem(last=False)
+
+    def _set_many(self, entries: List[Tuple[str, List[float]]]) -> None:
+        now = time.time()
+        with self._lock:
+            for key, embedding in entries:
+                self._set_memory(key, embedding, now)
+
+            if self._connection is None or not entries:
+                return
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, embedding, created_at) VALUES (?, ?, ?)",
+                [(key, array("f", embedding).tobytes(), now) for key, embedding in entries],
+            )
+            if self.ttl is not None:
+                self._connection.execute("DELETE FROM embeddings WHERE created_at < ?", (now - self.ttl,))
+            if self.max_disk_size is not None:
+                self._connection.execute(
+                    "DELETE FROM embeddings WHERE key IN "
+                    "(SELECT key FROM embeddings ORDER BY created_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_disk_size,),
+                )
+            self._connection.commit()
+
+    def clear(self) -> None:
+        """Remove all cached embeddings from both tiers"""
+        with self._lock:
+            self._memory.clear()
+            if self._connection is not None:
+                self._connection.execute("DELETE FROM embeddings")
+                self._connection.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def get_embedding(self, text: str) -> List[float]:
+        return self.get_embedding_and_usage(text)[0]
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        key = self.get_cache_key(text)
+        cached = self._get(key)
+        if cached is not None:
+            self.hits += 1
+            return cached, None
+
+        self.misses += 1
+        embedding, usage = self.embedder.get_embedding_and_usage(text)  # type: ignore
+        if embedding:
+            self._set_many([(key, embedding)])
+        return embedding, usage
+
+    def _lookup(self, texts: List[str]) -> Tuple[List[str], List[Optional[List[float]]], List[int]]:
+        keys = [self.get_cache_key(text) for text in texts]
+        embeddings: List[Optional[List[float]]] = [self._get(key) for key in keys]
+        missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+        self.hits += len(texts) - len(missing)
+        self.misses += len(missing)
+        log_debug(f"Embedding cache: {len(texts) - len(missing)} hits, {len(missing)} misses")
+        return keys, embeddings, missing
+
+    def _merge(
+        self,
+        keys: List[str],
+        embeddings: List[Optional[List[float]]],
+        missing: List[int],
+        new_embeddings: List[List[float]],
+        new_usages: List[Optional[Dict]],
+    ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        if len(new_embeddings) != len(missing):
+            logger.warning(f"Expected {len(missing)} embeddings, got {len(new_embeddings)}")
+        usages: List[Optional[Dict]] = [None] * len(keys)
+        to_store: List[Tuple[str, List[float]]] = []
+        for i, embedding, usage in zip(missing, new_embeddings, new_usages):
+            embeddings[i] = embedding
+            usages[i] = usage
+            if embedding:
+                to_store.append((keys[i], embedding))
+        self._set_many(to_store)
+        return [embedding or [] for embedding in embeddings], usages
+
+    def get_embeddings_batch_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        keys, embeddings, missing = self._lookup(texts)
+        new_embeddings: List[List[float]] = []
+        new_usages: List[Optional[Dict]] = []
+        if missing:
+            new_embeddings, new_usages = self.embedder.get_embeddings_batch_and_usage(  # type: ignore
+                [texts[i] for i in missing]
+            )
+        return self._merge(keys, embeddings, missing, new_embeddings, new_usages)
+
+    async def async_get_embeddings_batch_and_usage(
+        self, texts: List[str]
+    ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        keys, embeddings, missing = self._lookup(texts)
+        new_embeddings: List[List[float]] = []
+        new_usages: List[Optional[Dict]] = []
+        if missing:
+            new_embeddings, new_usages = await self.embedder.async_get_embeddings_batch_and_usage(  # type: ignore
+                [texts[i] for i in missing]
+            )
+        return self._merge(keys, embeddings, missing, new_embeddings, new_usages)
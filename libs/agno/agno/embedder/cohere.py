@@ -5,6 +5,7 @@ from agno.embedder.base import Embedder
 from agno.utils.log import logger
 
 try:
+    from cohere import AsyncClient as AsyncCohereClient
     from cohere import Client as CohereClient
     from cohere.types.embed_response import EmbeddingsByTypeEmbedResponse, EmbeddingsFloatsEmbedResponse
 except ImportError:
@@ -14,24 +15,38 @@ except ImportError:
 @dataclass
 class CohereEmbedder(Embedder):
     id: str = "embed-english-v3.0"
+    # The embed endpoint accepts at most 96 texts per request
+    batch_size: int = 96
     input_type: str = "search_query"
     embedding_types: Optional[List[str]] = None
     api_key: Optional[str] = None
     request_params: Optional[Dict[str, Any]] = None
     client_params: Optional[Dict[str, Any]] = None
     cohere_client: Optional[CohereClient] = None
+    async_client: Optional[AsyncCohereClient] = None
+
+    def _get_client_params(self) -> Dict[str, Any]:
+        client_params: Dict[str, Any] = {}
+        if self.api_key:
+            client_params["api_key"] = self.api_key
+        if self.client_params:
+            client_params.update(self.client_params)
+        return client_params
 
     @property
     def client(self) -> CohereClient:
         if self.cohere_client:
             return self.cohere_client
-        client_params: Dict[str, Any] = {}
-        if self.api_key:
-            client_params["api_key"] = self.api_key
-        self.cohere_client = CohereClient(**client_params)
+        self.cohere_client = CohereClient(**self._get_client_params())
         return self.cohere_client
 
-    def response(self, text: str) -> Union[EmbeddingsFloatsEmbedResponse, EmbeddingsByTypeEmbedResponse]:
+    def get_async_client(self) -> AsyncCohereClient:
+        if self.async_client:
+            return self.async_client
+        self.async_client = AsyncCohereClient(**self._get_client_params())
+        return self.async_client
+
+    def _get_request_params(self) -> Dict[str, Any]:
         request_params: Dict[str, Any] = {}
 
         if self.id:
@@ -42,7 +57,10 @@ class CohereEmbedder(Embedder):
             request_params["embedding_types"] = self.embedding_types
         if self.request_params:
             request_params.update(self.request_params)
-        return self.client.embed(texts=[text], **request_params)
+        return request_params
+
+    def response(self, text: str) -> Union[EmbeddingsFloatsEmbedResponse, EmbeddingsByTypeEmbedResponse]:
+        return self.client.embed(texts=[text], **self._get_request_params())
 
     def get_embedding(self, text: str) -> List[float]:
         response: Union[EmbeddingsFloatsEmbedResponse, EmbeddingsByTypeEmbedResponse] = self.response(text=text)
@@ -71,3 +89,28 @@ class CohereEmbedder(Embedder):
         if usage:
             return embedding, usage.model_dump()
         return embedding, None
+
+    def _parse_batch_response(
+        self, response: Union[EmbeddingsFloatsEmbedResponse, EmbeddingsByTypeEmbedResponse], num_texts: int
+    ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        embeddings: List[List[float]] = []
+        if isinstance(response, EmbeddingsFloatsEmbedResponse):
+            embeddings = list(response.embeddings)
+        elif isinstance(response, EmbeddingsByTypeEmbedResponse):
+            embeddings = list(response.embeddings.float_) if response.embeddings.float_ else []
+        if len(embeddings) != num_texts:
+            raise ValueError(f"Expected {num_texts} embeddings, got {len(embeddings)}")
+
+        usage = response.meta.billed_units if response.meta else None
+        usage_dict = usage.model_dump() if usage else None
+        return embeddings, self._get_batch_usages(usage_dict, num_texts)
+
+    def _get_batch_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        response = self.client.embed(texts=texts, **self._get_request_params())
+        return self._parse_batch_response(response, len(texts))
+
+    async def _async_get_batch_embeddings_and_usage(
+        self, texts: List[str]
+    ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        response = await self.get_async_client().embed(texts=texts, **self._get_request_params())
+        return self._parse_batch_response(response, len(texts))
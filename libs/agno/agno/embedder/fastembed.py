@@ -3,6 +3,7 @@ from typing import Dict, List, Optional, Tuple
 
 from agno.embedder.base import Embedder
 from agno.utils.log import logger
+from agno.utils.model_registry import get_or_load_model, make_model_key, unload_model
 
 try:
     import numpy as np
@@ -25,8 +26,20 @@ class FastEmbedEmbedder(Embedder):
     id: str = "BAAI/bge-small-en-v1.5"
     dimensions: int = 384
 
+    def _get_model(self) -> TextEmbedding:
+        # Load the model once per process and share it between embedder instances
+        return get_or_load_model(make_model_key("fastembed", self.id), lambda: TextEmbedding(model_name=self.id))
+
+    def warm_up(self) -> None:
+        """Load the model ahead of the first request"""
+        self._get_model()
+
+    def unload(self) -> bool:
+        """Release the shared model loaded for this embedder"""
+        return unload_model(make_model_key("fastembed", self.id))
+
     def get_embedding(self, text: str) -> List[float]:
-        model = TextEmbedding(model_name=self.id)
+        model = self._get_model()
         embeddings = model.embed(text)
         embedding_list = list(embeddings)[0]
         if isinstance(embedding_list, np.ndarray):
@@ -44,3 +57,12 @@ class FastEmbedEmbedder(Embedder):
         usage = None
 
         return embedding, usage
+
+    def _get_batch_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        model = self._get_model()
+        embeddings = [
+            embedding.tolist() if isinstance(embedding, np.ndarray) else list(embedding)
+            for embedding in model.embed(texts, batch_size=self.batch_size)
+        ]
+        # Currently, FastEmbed does not provide usage information
+        return embeddings, [None] * len(texts)
@@ -37,23 +37,45 @@ class JinaEmbedder(Embedder):
             headers.update(self.headers)
         return headers
 
-    def _response(self, text: str) -> Dict[str, Any]:
+    def _get_request_data(self, texts: List[str]) -> Dict[str, Any]:
         data = {
             "model": self.id,
             "late_chunking": self.late_chunking,
             "dimensions": self.dimensions,
             "embedding_type": self.embedding_type,
-            "input": [text],  # Jina API expects a list
+            "input": texts,  # Jina API expects a list
         }
         if self.user is not None:
             data["user"] = self.user
         if self.request_params:
             data.update(self.request_params)
+        return data
+
+    def _response(self, text: str) -> Dict[str, Any]:
+        return self._batch_response([text])
 
-        response = requests.post(self.base_url, headers=self._get_headers(), json=data, timeout=self.timeout)
+    def _batch_response(self, texts: List[str]) -> Dict[str, Any]:
+        response = requests.post(
+            self.base_url, headers=self._get_headers(), json=self._get_request_data(texts), timeout=self.timeout
+        )
         response.raise_for_status()
         return response.json()
 
+    async def _async_batch_response(self, texts: List[str]) -> Dict[str, Any]:
+        import httpx
+
+        async with httpx.AsyncClient(timeout=self.timeout) as client:
+            response = await client.post(self.base_url, headers=self._get_headers(), json=self._get_request_data(texts))
+            response.raise_for_status()
+            return response.json()
+
+    def _parse_batch_result(
+        self, result: Dict[str, Any], num_texts: int
+    ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        data = sorted(result["data"], key=lambda item: item.get("index", 0))
+        embeddings = [item["embedding"] for item in data]
+        return embeddings, self._get_batch_usages(result.get("usage"), num_texts)
+
     def get_embedding(self, text: str) -> List[float]:
         try:
             result = self._response(text)
@@ -71,3 +93,11 @@ class JinaEmbedder(Embedder):
         except Exception as e:
             logger.warning(f"Failed to get embedding and usage: {e}")
             return [], None
+
+    def _get_batch_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        return self._parse_batch_result(self._batch_response(texts), len(texts))
+
+    async def _async_get_batch_embeddings_and_usage(
+        self, texts: List[str]
+    ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        return self._parse_batch_result(await self._async_batch_response(texts), len(texts))
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from os import getenv
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from agno.embedder.base import Embedder
 from agno.utils.log import logger
@@ -16,6 +16,8 @@ except ImportError:
 class MistralEmbedder(Embedder):
     id: str = "mistral-embed"
     dimensions: int = 1024
+    # The embeddings endpoint accepts at most 16384 tokens per request
+    max_batch_tokens: Optional[int] = 16_000
     # -*- Request parameters
     request_params: Optional[Dict[str, Any]] = None
     # -*- Client parameters
@@ -47,14 +49,17 @@ class MistralEmbedder(Embedder):
 
         return self.mistral_client
 
-    def _response(self, text: str) -> EmbeddingResponse:
+    def _get_request_params(self, inputs: Union[str, List[str]]) -> Dict[str, Any]:
         _request_params: Dict[str, Any] = {
-            "inputs": text,
+            "inputs": inputs,
             "model": self.id,
         }
         if self.request_params:
             _request_params.update(self.request_params)
-        response = self.client.embeddings.create(**_request_params)
+        return _request_params
+
+    def _response(self, text: str) -> EmbeddingResponse:
+        response = self.client.embeddings.create(**self._get_request_params(text))
         if response is None:
             raise ValueError("Failed to get embedding response")
         return response
@@ -80,3 +85,24 @@ class MistralEmbedder(Embedder):
         except Exception as e:
             logger.warning(f"Error getting embedding and usage: {e}")
             return [], {}
+
+    def _parse_batch_response(
+        self, response: Optional[EmbeddingResponse], num_texts: int
+    ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        if response is None or not response.data:
+            raise ValueError("Failed to get embedding response")
+        embeddings: List[List[float]] = [
+            item.embedding or [] for item in sorted(response.data, key=lambda item: item.index or 0)
+        ]
+        usage: Optional[Dict[str, Any]] = response.usage.model_dump() if response.usage else None
+        return embeddings, self._get_batch_usages(usage, num_texts)
+
+    def _get_batch_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        response = self.client.embeddings.create(**self._get_request_params(texts))
+        return self._parse_batch_response(response, len(texts))
+
+    async def _async_get_batch_embeddings_and_usage(
+        self, texts: List[str]
+    ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        response = await self.client.embeddings.create_async(**self._get_request_params(texts))
+        return self._parse_batch_response(response, len(texts))
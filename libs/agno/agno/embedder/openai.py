@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from typing_extensions import Literal
 
@@ -7,6 +7,7 @@ from agno.embedder.base import Embedder
 from agno.utils.log import logger
 
 try:
+    from openai import AsyncOpenAI as AsyncOpenAIClient
     from openai import OpenAI as OpenAIClient
     from openai.types.create_embedding_response import CreateEmbeddingResponse
 except ImportError:
@@ -17,6 +18,8 @@ except ImportError:
 class OpenAIEmbedder(Embedder):
     id: str = "text-embedding-3-small"
     dimensions: int = 1536
+    # The embeddings endpoint accepts up to 2048 inputs and 300k tokens per request
+    max_batch_tokens: Optional[int] = 300_000
     encoding_format: Literal["float", "base64"] = "float"
     user: Optional[str] = None
     api_key: Optional[str] = None
@@ -25,12 +28,9 @@ class OpenAIEmbedder(Embedder):
     request_params: Optional[Dict[str, Any]] = None
     client_params: Optional[Dict[str, Any]] = None
     openai_client: Optional[OpenAIClient] = None
+    async_client: Optional[AsyncOpenAIClient] = None
 
-    @property
-    def client(self) -> OpenAIClient:
-        if self.openai_client:
-            return self.openai_client
-
+    def _get_client_params(self) -> Dict[str, Any]:
         _client_params: Dict[str, Any] = {
             "api_key": self.api_key,
             "organization": self.organization,
@@ -39,12 +39,26 @@ class OpenAIEmbedder(Embedder):
         _client_params = {k: v for k, v in _client_params.items() if v is not None}
         if self.client_params:
             _client_params.update(self.client_params)
-        self.openai_client = OpenAIClient(**_client_params)
+        return _client_params
+
+    @property
+    def client(self) -> OpenAIClient:
+        if self.openai_client:
+            return self.openai_client
+
+        self.openai_client = OpenAIClient(**self._get_client_params())
         return self.openai_client
 
-    def response(self, text: str) -> CreateEmbeddingResponse:
+    def get_async_client(self) -> AsyncOpenAIClient:
+        if self.async_client:
+            return self.async_client
+
+        self.async_client = AsyncOpenAIClient(**self._get_client_params())
+        return self.async_client
+
+    def _get_request_params(self, input: Union[str, List[str]]) -> Dict[str, Any]:
         _request_params: Dict[str, Any] = {
-            "input": text,
+            "input": input,
             "model": self.id,
             "encoding_format": self.encoding_format,
         }
@@ -54,7 +68,10 @@ class OpenAIEmbedder(Embedder):
             _request_params["dimensions"] = self.dimensions
         if self.request_params:
             _request_params.update(self.request_params)
-        return self.client.embeddings.create(**_request_params)
+        return _request_params
+
+    def response(self, text: str) -> CreateEmbeddingResponse:
+        return self.client.embeddings.create(**self._get_request_params(text))
 
     def get_embedding(self, text: str) -> List[float]:
         response: CreateEmbeddingResponse = self.response(text=text)
@@ -72,3 +89,22 @@ class OpenAIEmbedder(Embedder):
         if usage:
             return embedding, usage.model_dump()
         return embedding, None
+
+    def _parse_batch_response(
+        self, response: CreateEmbeddingResponse
+    ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        embeddings = [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+        usage = response.usage.model_dump() if response.usage else None
+        return embeddings, self._get_batch_usages(usage, len(embeddings))
+
+    def _get_batch_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        response: CreateEmbeddingResponse = self.client.embeddings.create(**self._get_request_params(texts))
+        return self._parse_batch_response(response)
+
+    async def _async_get_batch_embeddings_and_usage(
+        self, texts: List[str]
+    ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        response: CreateEmbeddingResponse = await self.get_async_client().embeddings.create(
+            **self._get_request_params(texts)
+        )
+        return self._parse_batch_response(response)
@@ -3,6 +3,7 @@ from typing import Dict, List, Optional, Tuple, Union
 
 from agno.embedder.base import Embedder
 from agno.utils.log import logger
+from agno.utils.model_registry import get_or_load_model, make_model_key, unload_model
 
 try:
     from sentence_transformers import SentenceTransformer
@@ -25,11 +26,25 @@ class SentenceTransformerEmbedder(Embedder):
     prompt: Optional[str] = None
     normalize_embeddings: bool = False
 
+    def _get_model(self) -> SentenceTransformer:
+        if self.sentence_transformer_client:
+            return self.sentence_transformer_client
+        # Load the model once per process and share it between embedder instances
+        return get_or_load_model(
+            make_model_key("sentence_transformer", self.id),
+            lambda: SentenceTransformer(model_name_or_path=self.id),
+        )
+
+    def warm_up(self) -> None:
+        """Load the model ahead of the first request"""
+        self._get_model()
+
+    def unload(self) -> bool:
+        """Release the shared model loaded for this embedder"""
+        return unload_model(make_model_key("sentence_transformer", self.id))
+
     def get_embedding(self, text: Union[str, List[str]]) -> List[float]:
-        if not self.sentence_transformer_client:
-            model = SentenceTransformer(model_name_or_path=self.id)
-        else:
-            model = self.sentence_transformer_client
+        model = self._get_model()
         embedding = model.encode(text, prompt=self.prompt, normalize_embeddings=self.normalize_embeddings)
         try:
             if isinstance(embedding, np.ndarray):
@@ -42,3 +57,15 @@ class SentenceTransformerEmbedder(Embedder):
 
     def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
         return self.get_embedding(text=text), None
+
+    def _get_batch_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        model = self._get_model()
+        embeddings = model.encode(
+            texts,
+            prompt=self.prompt,
+            normalize_embeddings=self.normalize_embeddings,
+            batch_size=self.batch_size,
+        )
+        if isinstance(embeddings, np.ndarray):
+            return embeddings.tolist(), [None] * len(texts)
+        return [list(embedding) for embedding in embeddings], [None] * len(texts)
@@ -5,6 +5,7 @@ from agno.embedder.base import Embedder
 from agno.utils.log import logger
 
 try:
+    from voyageai import AsyncClient as AsyncVoyageClient
     from voyageai import Client as VoyageClient
     from voyageai.object import EmbeddingsObject
 except ImportError:
@@ -15,6 +16,9 @@ except ImportError:
 class VoyageAIEmbedder(Embedder):
     id: str = "voyage-2"
     dimensions: int = 1024
+    # The embed endpoint accepts at most 128 texts and 120k tokens per request (voyage-2)
+    batch_size: int = 128
+    max_batch_tokens: Optional[int] = 120_000
     request_params: Optional[Dict[str, Any]] = None
     api_key: Optional[str] = None
     base_url: str = "https://api.voyageai.com/v1/embeddings"
@@ -22,12 +26,9 @@ class VoyageAIEmbedder(Embedder):
     timeout: Optional[float] = None
     client_params: Optional[Dict[str, Any]] = None
     voyage_client: Optional[VoyageClient] = None
+    async_client: Optional[AsyncVoyageClient] = None
 
-    @property
-    def client(self) -> VoyageClient:
-        if self.voyage_client:
-            return self.voyage_client
-
+    def _get_client_params(self) -> Dict[str, Any]:
         _client_params = {
             "api_key": self.api_key,
             "max_retries": self.max_retries,
@@ -36,17 +37,34 @@ class VoyageAIEmbedder(Embedder):
         _client_params = {k: v for k, v in _client_params.items() if v is not None}
         if self.client_params:
             _client_params.update(self.client_params)
-        self.voyage_client = VoyageClient(**_client_params)
+        return _client_params
+
+    @property
+    def client(self) -> VoyageClient:
+        if self.voyage_client:
+            return self.voyage_client
+
+        self.voyage_client = VoyageClient(**self._get_client_params())
         return self.voyage_client
 
-    def _response(self, text: str) -> EmbeddingsObject:
+    def get_async_client(self) -> AsyncVoyageClient:
+        if self.async_client:
+            return self.async_client
+
+        self.async_client = AsyncVoyageClient(**self._get_client_params())
+        return self.async_client
+
+    def _get_request_params(self, texts: List[str]) -> Dict[str, Any]:
         _request_params: Dict[str, Any] = {
-            "texts": [text],
+            "texts": texts,
             "model": self.id,
         }
         if self.request_params:
             _request_params.update(self.request_params)
-        return self.client.embed(**_request_params)
+        return _request_params
+
+    def _response(self, text: str) -> EmbeddingsObject:
+        return self.client.embed(**self._get_request_params([text]))
 
     def get_embedding(self, text: str) -> List[float]:
         response: EmbeddingsObject = self._response(text=text)
@@ -62,3 +80,15 @@ class VoyageAIEmbedder(Embedder):
         embedding = response.embeddings[0]
         usage = {"total_tokens": response.total_tokens}
         return embedding, usage
+
+    def _get_batch_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        response: EmbeddingsObject = self.client.embed(**self._get_request_params(texts))
+        usage = {"total_tokens": response.total_tokens}
+        return list(response.embeddings), self._get_batch_usages(usage, len(texts))
+
+    async def _async_get_batch_embeddings_and_usage(
+        self, texts: List[str]
+    ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        response: EmbeddingsObject = await self.get_async_client().embed(**self._get_request_params(texts))
+        usage = {"total_tokens": response.total_tokens}
+        return list(response.embeddings), self._get_batch_usages(usage, len(texts))
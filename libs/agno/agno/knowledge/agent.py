@@ -1,6 +1,8 @@
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Set, Tuple
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Set, Tuple
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
@@ -8,7 +10,20 @@ from agno.document import Document
 from agno.document.chunking.fixed import FixedSizeChunking
 from agno.document.chunking.strategy import ChunkingStrategy
 from agno.document.reader.base import Reader
+from agno.document.reader.parsing import aparse_in_processes, parse_in_processes, read_in_process
+from agno.knowledge.pipeline import IngestionMetrics, IngestionPipeline
+from agno.knowledge.sync import (
+    KnowledgeSource,
+    KnowledgeSyncResult,
+    KnowledgeSyncState,
+    get_chunk_id,
+    get_config_hash,
+    get_content_hash,
+    get_file_fingerprint,
+    get_url_fingerprint,
+)
 from agno.utils.log import log_debug, log_info, logger
+from agno.utils.string import safe_content_hash
 from agno.vectordb import VectorDb
 
 
@@ -24,6 +39,27 @@ class AgentKnowledge(BaseModel):
     # Number of documents to optimize the vector db on
     optimize_on: Optional[int] = 1000
 
+    # Load documents in bulk: dedupe by content hash, check existence once per batch and write whole batches
+    bulk_load: bool = False
+    # Number of documents embedded and written per batch when bulk loading
+    load_batch_size: int = 100
+    # Number of batches written to the vector db concurrently when bulk loading
+    load_concurrency: int = 1
+    # Number of batches embedded concurrently when bulk loading asynchronously
+    load_embedding_concurrency: int = 4
+    # Maximum number of batches waiting between ingestion stages when bulk loading asynchronously
+    load_queue_size: int = 4
+    # Stream documents from the readers and load them in batches of load_batch_size, so only a bounded number of
+    # documents is held in memory however large the sources are
+    stream_load: bool = False
+
+    # Number of worker processes reading files in parallel, None reads them one by one in the calling process
+    parsing_workers: Optional[int] = None
+
+    # File storing the source fingerprints and chunk ids of the last sync,
+    # defaults to tmp/knowledge_sync/<knowledge base>_<collection>.json
+    sync_state_path: Optional[str] = None
+
     chunking_strategy: ChunkingStrategy = Field(default_factory=FixedSizeChunking)
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
@@ -112,6 +148,13 @@ class AgentKnowledge(BaseModel):
             self.vector_db.create()
 
         log_info("Loading knowledge base")
+        if self.stream_load:
+            self._stream_load(upsert=upsert, skip_existing=skip_existing)
+            return
+        if self.bulk_load:
+            self._bulk_load(upsert=upsert, skip_existing=skip_existing)
+            return
+
         num_documents = 0
         for document_list in self.document_lists:
             documents_to_load = document_list
@@ -166,6 +209,13 @@ class AgentKnowledge(BaseModel):
             await self.vector_db.async_create()
 
         log_info("Loading knowledge base")
+        if self.stream_load:
+            await self._astream_load(upsert=upsert, skip_existing=skip_existing)
+            return
+        if self.bulk_load:
+            await self._abulk_load(upsert=upsert, skip_existing=skip_existing)
+            return
+
         num_documents = 0
         document_iterator = self.async_document_lists
         async for document_list in document_iterator:  # type: ignore
@@ -193,6 +243,533 @@ class AgentKnowledge(BaseModel):
             num_documents += len(documents_to_load)
             log_info(f"Added {len(documents_to_load)} documents to knowledge base")
 
+    def _dedupe_documents(self, documents: List[Document]) -> List[Tuple[str, Document]]:
+        """Drop documents with duplicate content, returning (content_hash, document) pairs"""
+        unique_documents: Dict[str, Document] = {}
+        for doc in documents:
+            unique_documents.setdefault(safe_content_hash(doc.content), doc)
+        if len(unique_documents) < len(documents):
+            log_debug(f"Skipped {len(documents) - len(unique_documents)} duplicate documents")
+        return list(unique_documents.items())
+
+    def _write_batch(self, batch: List[Tuple[str, Document]], upsert: bool, skip_existing: bool) -> int:
+        """Write one batch of (content_hash, document) pairs, checking existence with one query"""
+        vector_db: VectorDb = self.vector_db  # type: ignore
+        documents = [doc for _, doc in batch]
+        if upsert:
+            vector_db.upsert(documents=documents)
+            return len(documents)
+
+        if skip_existing:
+            try:
+                existing = vector_db.existing_ids([content_hash for content_hash, _ in batch])
+                documents = [doc for content_hash, doc in batch if content_hash not in existing]
+            except NotImplementedError:
+                documents = [doc for doc in documents if not vector_db.doc_exists(doc)]
+
+        if documents:
+            vector_db.insert(documents=documents)
+        return len(documents)
+
+    def _bulk_write(self, documents: List[Document], upsert: bool, skip_existing: bool) -> int:
+        """Dedupe documents and write them in batches of load_batch_size, load_concurrency batches at a time.
+
+        The metadata of each document is stored with it, so no per-document filters are passed to the vector db.
+        """
+        pairs = self._dedupe_documents(documents)
+        batch_size = max(1, self.load_batch_size)
+        batches = [pairs[i : i + batch_size] for i in range(0, len(pairs), batch_size)]
+        if self.load_concurrency > 1 and len(batches) > 1:
+            with ThreadPoolExecutor(max_workers=min(self.load_concurrency, len(batches))) as executor:
+                return sum(executor.map(lambda batch: self._write_batch(batch, upsert, skip_existing), batches))
+        return sum(self._write_batch(batch, upsert, skip_existing) for batch in batches)
+
+    def _bulk_load(self, upsert: bool, skip_existing: bool) -> None:
+        """Load the knowledge base in bulk, buffering documents across sources into full batches"""
+        use_upsert = upsert and self.vector_db.upsert_available()  # type: ignore
+        flush_size = max(1, self.load_batch_size) * max(1, self.load_concurrency)
+        buffer: List[Document] = []
+        num_documents = 0
+        for document_list in self.document_lists:
+            for doc in document_list:
+                if doc.meta_data:
+                    self._track_metadata_structure(doc.meta_data)
+            buffer.extend(document_list)
+            if len(buffer) >= flush_size:
+                num_documents += self._bulk_write(buffer, upsert=use_upsert, skip_existing=skip_existing)
+                buffer = []
+        if buffer:
+            num_documents += self._bulk_write(buffer, upsert=use_upsert, skip_existing=skip_existing)
+        log_info(f"Added {num_documents} documents to knowledge base")
+
+    async def _abulk_load(self, upsert: bool, skip_existing: bool) -> IngestionMetrics:
+        """Load the knowledge base through the staged ingestion pipeline.
+
+        Reading, embedding and writing overlap: load_embedding_concurrency batches are embedded and
+        load_concurrency batches are written at the same time, with at most load_queue_size batches
+        waiting between stages.
+        """
+        pipeline = IngestionPipeline(
+            vector_db=self.vector_db,  # type: ignore
+            batch_size=self.load_batch_size,
+            embedding_concurrency=self.load_embedding_concurrency,
+            write_concurrency=self.load_concurrency,
+            queue_size=self.load_queue_size,
+            upsert=upsert and self.vector_db.upsert_available(),  # type: ignore
+            skip_existing=skip_existing,
+            on_document_list=self._track_document_list_metadata,
+        )
+        metrics = await pipeline.run(self.async_document_lists)  # type: ignore
+        log_info(f"Added {metrics.documents_written} documents to knowledge base")
+        return metrics
+
+    def iter_documents(self) -> Iterator[Document]:
+        """Iterator that yields the documents of the knowledge base one by one.
+
+        Knowledge bases over files stream them with `reader.iter_read`, by default the document lists are flattened.
+        """
+        for document_list in self.document_lists:
+            yield from document_list
+
+    async def aiter_documents(self) -> AsyncIterator[Document]:
+        """Async iterator that yields the documents of the knowledge base one by one"""
+        async for document_list in self.async_document_lists:  # type: ignore
+            for document in document_list:
+                yield document
+
+    def _iter_file_documents(self, read_argument: str, is_valid: Callable[[Path], bool]) -> Iterator[Document]:
+        """Stream the documents of the valid files of `self.path` with reader.iter_read.
+
+        Like reader.read, a file that fails to read is logged and skipped, the documents it yielded are kept.
+        """
+        for file_path, metadata in self._get_files():
+            if not is_valid(file_path):
+                continue
+            try:
+                for document in self.reader.iter_read(**{read_argument: file_path}):  # type: ignore
+                    if metadata:
+                        document.meta_data.update(metadata)
+                    yield document
+            except Exception as e:
+                logger.error(f"Error reading: {file_path}: {e}")
+
+    async def _aiter_file_documents(
+        self, read_argument: str, is_valid: Callable[[Path], bool]
+    ) -> AsyncIterator[Document]:
+        for file_path, metadata in self._get_files():
+            if not is_valid(file_path):
+                continue
+            try:
+                async for document in self.reader.aiter_read(**{read_argument: file_path}):  # type: ignore
+                    if metadata:
+                        document.meta_data.update(metadata)
+                    yield document
+            except Exception as e:
+                logger.error(f"Error reading asynchronously: {file_path}: {e}")
+
+    def _stream_load(self, upsert: bool, skip_existing: bool) -> None:
+        """Load the documents as they are read, writing load_concurrency batches of load_batch_size at a time"""
+        use_upsert = upsert and self.vector_db.upsert_available()  # type: ignore
+        flush_size = max(1, self.load_batch_size) * max(1, self.load_concurrency)
+        buffer: List[Document] = []
+        num_documents = 0
+        for doc in self.iter_documents():
+            if doc.meta_data:
+                self._track_metadata_structure(doc.meta_data)
+            buffer.append(doc)
+            if len(buffer) >= flush_size:
+                num_documents += self._bulk_write(buffer, upsert=use_upsert, skip_existing=skip_existing)
+                buffer = []
+        if buffer:
+            num_documents += self._bulk_write(buffer, upsert=use_upsert, skip_existing=skip_existing)
+        log_info(f"Added {num_documents} documents to knowledge base")
+
+    async def _abatch_documents(self) -> AsyncIterator[List[Document]]:
+        batch: List[Document] = []
+        async for doc in self.aiter_documents():
+            batch.append(doc)
+            if len(batch) >= max(1, self.load_batch_size):
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    async def _astream_load(self, upsert: bool, skip_existing: bool) -> IngestionMetrics:
+        """Load the documents through the ingestion pipeline as they are read, in batches of load_batch_size.
+
+        The pipeline queues hold at most load_queue_size batches, so reading waits for embedding and writing.
+        """
+        pipeline = IngestionPipeline(
+            vector_db=self.vector_db,  # type: ignore
+            batch_size=self.load_batch_size,
+            embedding_concurrency=self.load_embedding_concurrency,
+            write_concurrency=self.load_concurrency,
+            queue_size=self.load_queue_size,
+            upsert=upsert and self.vector_db.upsert_available(),  # type: ignore
+            skip_existing=skip_existing,
+            on_document_list=self._track_document_list_metadata,
+        )
+        metrics = await pipeline.run(self._abatch_documents())
+        log_info(f"Added {metrics.documents_written} documents to knowledge base")
+        return metrics
+
+    def _track_document_list_metadata(self, document_list: List[Document]) -> None:
+        for doc in document_list:
+            if doc.meta_data:
+                self._track_metadata_structure(doc.meta_data)
+
+    def get_sources(self) -> Iterator[KnowledgeSource]:
+        """Yield the sources of the knowledge base, read by sync only when they changed.
+
+        Knowledge bases reading files or URLs override this to fingerprint their sources without reading them.
+        By default every document list is a source identified by its document names, read on every sync.
+        """
+        source_ids: Set[str] = set()
+        for i, document_list in enumerate(self.document_lists):
+            names = sorted({doc.name for doc in document_list if doc.name})
+            source_id = ",".join(names) or f"documents_{i}"
+            if source_id in source_ids:
+                source_id = f"{source_id}_{i}"
+            source_ids.add(source_id)
+            yield KnowledgeSource(id=source_id, fingerprint=None, read=partial(list, document_list))
+
+    def _read_source(self, read_kwargs: Dict[str, Any], metadata: Dict[str, Any]) -> List[Document]:
+        documents = self.reader.read(**read_kwargs)  # type: ignore
+        if metadata:
+            for doc in documents:
+                doc.meta_data.update(metadata)
+        return documents
+
+    async def _aread_source(self, read_kwargs: Dict[str, Any], metadata: Dict[str, Any]) -> List[Document]:
+        documents = await self.reader.async_read(**read_kwargs)  # type: ignore
+        if metadata:
+            for doc in documents:
+                doc.meta_data.update(metadata)
+        return documents
+
+    def _get_files(self) -> List[Tuple[Path, Dict[str, Any]]]:
+        """Return the files of `self.path` with the metadata to add to their documents"""
+        path = getattr(self, "path", None)
+        if path is None:
+            raise ValueError("Path is not set")
+
+        if isinstance(path, list):
+            return [
+                (Path(item["path"]), item.get("metadata") or {})
+                for item in path
+                if isinstance(item, dict) and "path" in item
+            ]
+        _path = Path(path)
+        return [(_file, {}) for _file in sorted(_path.glob("**/*"))] if _path.is_dir() else [(_path, {})]
+
+    def _get_file_sources(self, read_argument: str, is_valid: Callable[[Path], bool]) -> Iterator[KnowledgeSource]:
+        """Yield a source per valid file of `self.path`, read by passing the file as `read_argument` to the reader"""
+        for file_path, metadata in self._get_files():
+            if is_valid(file_path):
+                read_kwargs = {read_argument: file_path}
+                yield KnowledgeSource(
+                    id=str(file_path.resolve()),
+                    fingerprint=get_file_fingerprint(file_path, metadata),
+                    read=partial(self._read_source, read_kwargs, metadata),
+                    async_read=partial(self._aread_source, read_kwargs, metadata),
+                )
+
+    def _parse_files(self, read_argument: str, is_valid: Callable[[Path], bool]) -> Iterator[List[Document]]:
+        """Read the valid files of `self.path` in parsing_workers processes, yielding their documents as they are read"""
+        tasks = (
+            (self.reader, {read_argument: file_path}, metadata)
+            for file_path, metadata in self._get_files()
+            if is_valid(file_path)
+        )
+        yield from parse_in_processes(read_in_process, tasks, workers=self.parsing_workers or 1)
+
+    async def _aparse_files(
+        self, read_argument: str, is_valid: Callable[[Path], bool]
+    ) -> AsyncIterator[List[Document]]:
+        tasks = (
+            (self.reader, {read_argument: file_path}, metadata)
+            for file_path, metadata in self._get_files()
+            if is_valid(file_path)
+        )
+        async for documents in aparse_in_processes(read_in_process, tasks, workers=self.parsing_workers or 1):
+            yield documents
+
+    def _get_url_sources(self, is_valid: Optional[Callable[[str], bool]] = None) -> Iterator[KnowledgeSource]:
+        """Yield a source per valid URL of `self.urls`, fingerprinted by its ETag or Last-Modified header"""
+        urls = getattr(self, "urls", None)
+        if urls is None:
+            raise ValueError("URLs are not set")
+
+        for item in urls:
+            if isinstance(item, dict) and "url" in item:
+                url, metadata = item["url"], item.get("metadata") or {}
+            else:
+                url, metadata = item, {}
+            if is_valid is None or is_valid(url):
+                yield KnowledgeSource(
+                    id=url,
+                    fingerprint=get_url_fingerprint(url, metadata),
+                    read=partial(self._read_source, {"url": url}, metadata),
+                    async_read=partial(self._aread_source, {"url": url}, metadata),
+                )
+
+    def _get_sync_state(self) -> KnowledgeSyncState:
+        path = self.sync_state_path
+        if path is None:
+            collection = getattr(self.vector_db, "collection", None) or getattr(self.vector_db, "table_name", None)
+            path = f"tmp/knowledge_sync/{type(self).__name__.lower()}_{collection or 'default'}.json"
+        return KnowledgeSyncState(path)
+
+    def _get_sampled_chunk_ids(self, state: KnowledgeSyncState) -> List[str]:
+        """A batch of the synced chunk ids, to check the vector db still holds the chunks of the sync state"""
+        return list(state.get_chunk_references())[: max(1, self.load_batch_size)]
+
+    def _discard_sync_state(self, state: KnowledgeSyncState) -> None:
+        log_info("The vector db does not hold the synced chunks, re-syncing all sources")
+        state.sources = {}
+
+    def _check_sync_state(self, state: KnowledgeSyncState, collection_exists: bool) -> None:
+        """Forget the synced sources when their chunks are not in the vector db, e.g. the collection was dropped"""
+        if not state.sources:
+            return
+        if collection_exists:
+            chunk_ids = self._get_sampled_chunk_ids(state)
+            try:
+                if set(chunk_ids) <= self.vector_db.existing_ids(chunk_ids):  # type: ignore
+                    return
+            except NotImplementedError:
+                return
+        self._discard_sync_state(state)
+
+    async def _async_check_sync_state(self, state: KnowledgeSyncState, collection_exists: bool) -> None:
+        if not state.sources:
+            return
+        if collection_exists:
+            chunk_ids = self._get_sampled_chunk_ids(state)
+            try:
+                if set(chunk_ids) <= await self.vector_db.async_existing_ids(chunk_ids):  # type: ignore
+                    return
+            except NotImplementedError:
+                return
+        self._discard_sync_state(state)
+
+    def _start_sync(self, state: KnowledgeSyncState) -> Tuple[Dict[str, int], List[str]]:
+        """Return the chunk references of the synced sources, and the chunks to delete if the sync config changed"""
+        chunking_strategy = (self.reader.chunking_strategy if self.reader else None) or self.chunking_strategy
+        config = get_config_hash(self.reader, chunking_strategy, self.vector_db)
+        if state.config == config:
+            return state.get_chunk_references(), []
+        if state.sources:
+            log_info("Reader, chunking strategy or embedder changed, re-syncing all sources")
+        outdated_chunk_ids = list(state.get_chunk_references())
+        state.config = config
+        state.sources = {}
+        return {}, outdated_chunk_ids
+
+    def _get_source_chunks(self, documents: List[Document]) -> Dict[str, Document]:
+        """Give the documents of a source their chunk ids, dropping duplicates"""
+        chunks: Dict[str, Document] = {}
+        for doc in documents:
+            doc.id = get_chunk_id(doc)
+            chunks.setdefault(doc.id, doc)
+            if doc.meta_data:
+                self._track_metadata_structure(doc.meta_data)
+        return chunks
+
+    def _update_source(
+        self,
+        state: KnowledgeSyncState,
+        references: Dict[str, int],
+        source: KnowledgeSource,
+        chunks: Dict[str, Document],
+    ) -> Tuple[List[Document], List[str]]:
+        """Record the new chunks of a source, returning the chunks to write and the chunk ids to delete"""
+        previous_chunk_ids = set(state.sources.get(source.id, {}).get("chunk_ids", []))
+        for chunk_id in previous_chunk_ids:
+            references[chunk_id] -= 1
+        documents = []
+        for chunk_id, doc in chunks.items():
+            references[chunk_id] = references.get(chunk_id, 0) + 1
+            if references[chunk_id] == 1 and chunk_id not in previous_chunk_ids:
+                documents.append(doc)
+        deleted_chunk_ids = [chunk_id for chunk_id in previous_chunk_ids if references[chunk_id] == 0]
+        for chunk_id in deleted_chunk_ids:
+            del references[chunk_id]
+        state.sources[source.id] = {
+            "fingerprint": source.fingerprint,
+            "content_hash": get_content_hash(list(chunks)),
+            "chunk_ids": list(chunks),
+        }
+        return documents, deleted_chunk_ids
+
+    def _remove_sources(self, state: KnowledgeSyncState, references: Dict[str, int], source_ids: Set[str]) -> List[str]:
+        """Forget the sources that are gone, returning the chunk ids no source references anymore"""
+        deleted_chunk_ids = []
+        for source_id in list(state.sources):
+            if source_id in source_ids:
+                continue
+            for chunk_id in state.sources.pop(source_id)["chunk_ids"]:
+                references[chunk_id] -= 1
+                if references[chunk_id] == 0:
+                    del references[chunk_id]
+                    deleted_chunk_ids.append(chunk_id)
+        return deleted_chunk_ids
+
+    def _is_source_unchanged(self, state: KnowledgeSyncState, source: KnowledgeSource) -> bool:
+        previous = state.sources.get(source.id)
+        return previous is not None and source.fingerprint is not None and previous["fingerprint"] == source.fingerprint
+
+    def _write_chunks(self, documents: List[Document]) -> int:
+        """Insert the chunks in batches of load_batch_size, skipping chunks left by an interrupted sync"""
+        vector_db: VectorDb = self.vector_db  # type: ignore
+        batch_size = max(1, self.load_batch_size)
+        written = 0
+        for i in range(0, len(documents), batch_size):
+            batch = documents[i : i + batch_size]
+            try:
+                existing = vector_db.existing_ids([doc.id for doc in batch])  # type: ignore
+                batch = [doc for doc in batch if doc.id not in existing]
+            except NotImplementedError:
+                pass
+            if batch:
+                vector_db.insert(documents=batch)
+                written += len(batch)
+        return written
+
+    async def _async_write_chunks(self, documents: List[Document]) -> int:
+        vector_db: VectorDb = self.vector_db  # type: ignore
+        batch_size = max(1, self.load_batch_size)
+        written = 0
+        for i in range(0, len(documents), batch_size):
+            batch = documents[i : i + batch_size]
+            try:
+                existing = await vector_db.async_existing_ids([doc.id for doc in batch])  # type: ignore
+                batch = [doc for doc in batch if doc.id not in existing]
+            except NotImplementedError:
+                pass
+            if batch:
+                await vector_db.async_insert(documents=batch)
+                written += len(batch)
+        return written
+
+    def _delete_chunks(self, chunk_ids: List[str]) -> int:
+        if not chunk_ids:
+            return 0
+        try:
+            self.vector_db.delete_by_ids(chunk_ids)  # type: ignore
+        except NotImplementedError:
+            logger.warning(f"{type(self.vector_db).__name__} does not support deleting by id, outdated chunks are kept")
+            return 0
+        return len(chunk_ids)
+
+    async def _async_delete_chunks(self, chunk_ids: List[str]) -> int:
+        if not chunk_ids:
+            return 0
+        try:
+            await self.vector_db.async_delete_by_ids(chunk_ids)  # type: ignore
+        except NotImplementedError:
+            logger.warning(f"{type(self.vector_db).__name__} does not support deleting by id, outdated chunks are kept")
+            return 0
+        return len(chunk_ids)
+
+    def sync(self) -> KnowledgeSyncResult:
+        """Bring the vector db in line with the sources of the knowledge base, doing only the work that changed.
+
+        Sources whose fingerprint is unchanged since the last sync are skipped without being read. Changed sources
+        are re-read and only their new chunks are embedded and written, chunks they no longer have are deleted, as
+        are the chunks of sources that were removed. The state of the last sync is stored at sync_state_path, it is
+        discarded when the vector db does not hold its chunks anymore (e.g. the collection was dropped).
+
+        Returns:
+            KnowledgeSyncResult: The number of sources and chunks that changed.
+        """
+        result = KnowledgeSyncResult()
+        if self.vector_db is None:
+            logger.warning("No vector db provided")
+            return result
+
+        collection_exists = self.vector_db.exists()
+        if not collection_exists:
+            log_info("Creating collection")
+            self.vector_db.create()
+
+        state = self._get_sync_state()
+        self._check_sync_state(state, collection_exists)
+        references, outdated_chunk_ids = self._start_sync(state)
+        result.chunks_deleted += self._delete_chunks(outdated_chunk_ids)
+
+        log_info("Syncing knowledge base")
+        source_ids: Set[str] = set()
+        for source in self.get_sources():
+            source_ids.add(source.id)
+            if self._is_source_unchanged(state, source):
+                result.sources_unchanged += 1
+                continue
+
+            chunks = self._get_source_chunks(source.read())
+            documents, deleted_chunk_ids = self._update_source(state, references, source, chunks)
+            if not documents and not deleted_chunk_ids:
+                result.sources_unchanged += 1
+            else:
+                result.sources_updated += 1
+                result.chunks_written += self._write_chunks(documents)
+                result.chunks_deleted += self._delete_chunks(deleted_chunk_ids)
+            state.save()
+
+        removed = len(set(state.sources) - source_ids)
+        result.chunks_deleted += self._delete_chunks(self._remove_sources(state, references, source_ids))
+        result.sources_removed = removed
+        state.save()
+        log_info(f"Synced knowledge base: {result.to_dict()}")
+        return result
+
+    async def async_sync(self) -> KnowledgeSyncResult:
+        """Asynchronous version of sync"""
+        result = KnowledgeSyncResult()
+        if self.vector_db is None:
+            logger.warning("No vector db provided")
+            return result
+
+        collection_exists = await self.vector_db.async_exists()
+        if not collection_exists:
+            log_info("Creating collection")
+            await self.vector_db.async_create()
+
+        state = self._get_sync_state()
+        await self._async_check_sync_state(state, collection_exists)
+        references, outdated_chunk_ids = self._start_sync(state)
+        result.chunks_deleted += await self._async_delete_chunks(outdated_chunk_ids)
+
+        log_info("Syncing knowledge base")
+        source_ids: Set[str] = set()
+        # Fingerprinting may stat files or send HEAD requests, keep it off the event loop
+        for source in await asyncio.to_thread(list, self.get_sources()):
+            source_ids.add(source.id)
+            if self._is_source_unchanged(state, source):
+                result.sources_unchanged += 1
+                continue
+
+            if source.async_read is not None:
+                documents = await source.async_read()
+            else:
+                documents = await asyncio.to_thread(source.read)
+            chunks = self._get_source_chunks(documents)
+            new_documents, deleted_chunk_ids = self._update_source(state, references, source, chunks)
+            if not new_documents and not deleted_chunk_ids:
+                result.sources_unchanged += 1
+            else:
+                result.sources_updated += 1
+                result.chunks_written += await self._async_write_chunks(new_documents)
+                result.chunks_deleted += await self._async_delete_chunks(deleted_chunk_ids)
+            state.save()
+
+        removed = len(set(state.sources) - source_ids)
+        result.chunks_deleted += await self._async_delete_chunks(self._remove_sources(state, references, source_ids))
+        result.sources_removed = removed
+        state.save()
+        log_info(f"Synced knowledge base: {result.to_dict()}")
+        return result
+
     def load_documents(
         self,
         documents: List[Document],
@@ -6,6 +6,7 @@ from pydantic import Field
 from agno.document import Document
 from agno.document.reader.csv_reader import CSVReader
 from agno.knowledge.agent import AgentKnowledge
+from agno.knowledge.sync import KnowledgeSource
 from agno.utils.log import log_info, logger
 
 
@@ -21,6 +22,10 @@ class CSVKnowledgeBase(AgentKnowledge):
         if self.path is None:
             raise ValueError("Path is not set")
 
+        if self.parsing_workers:
+            yield from self._parse_files("file", self._is_valid_csv)
+            return
+
         if isinstance(self.path, list):
             for item in self.path:
                 if isinstance(item, dict) and "path" in item:
@@ -49,12 +54,29 @@ class CSVKnowledgeBase(AgentKnowledge):
         """Helper to check if path is a valid CSV file."""
         return path.exists() and path.is_file() and path.suffix == ".csv" and path.name not in self.exclude_files
 
+    def get_sources(self) -> Iterator[KnowledgeSource]:
+        """Yield a source per CSV file, fingerprinted by its path, modification time and size."""
+        return self._get_file_sources("file", self._is_valid_csv)
+
+    def iter_documents(self) -> Iterator[Document]:
+        """Stream the documents of the CSV files one by one."""
+        return self._iter_file_documents("file", self._is_valid_csv)
+
+    def aiter_documents(self) -> AsyncIterator[Document]:
+        """Asynchronously stream the documents of the CSV files one by one."""
+        return self._aiter_file_documents("file", self._is_valid_csv)
+
     @property
     async def async_document_lists(self) -> AsyncIterator[List[Document]]:
         """Iterate over CSV files and yield lists of documents asynchronously."""
         if self.path is None:
             raise ValueError("Path is not set")
 
+        if self.parsing_workers:
+            async for documents in self._aparse_files("file", self._is_valid_csv):
+                yield documents
+            return
+
         if isinstance(self.path, list):
             for item in self.path:
                 if isinstance(item, dict) and "path" in item:
@@ -3,6 +3,7 @@ from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Union
 from agno.document import Document
 from agno.document.reader.csv_reader import CSVUrlReader
 from agno.knowledge.agent import AgentKnowledge
+from agno.knowledge.sync import KnowledgeSource
 from agno.utils.log import log_info, logger
 
 
@@ -39,6 +40,10 @@ class CSVUrlKnowledgeBase(AgentKnowledge):
         """Helper to check if URL is a valid CSV URL."""
         return url.endswith(".csv")
 
+    def get_sources(self) -> Iterator[KnowledgeSource]:
+        """Yield a source per CSV URL, fingerprinted by its ETag or Last-Modified header."""
+        return self._get_url_sources(self._is_valid_csv_url)
+
     @property
     async def async_document_lists(self) -> AsyncIterator[List[Document]]:
         """Iterate over CSV URLs and yield lists of documents asynchronously."""
@@ -4,6 +4,7 @@ from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Union
 from agno.document import Document
 from agno.document.reader.docx_reader import DocxReader
 from agno.knowledge.agent import AgentKnowledge
+from agno.knowledge.sync import KnowledgeSource
 from agno.utils.log import log_info, logger
 
 
@@ -18,6 +19,10 @@ class DocxKnowledgeBase(AgentKnowledge):
         if self.path is None:
             raise ValueError("Path is not set")
 
+        if self.parsing_workers:
+            yield from self._parse_files("file", self._is_valid_docx)
+            return
+
         if isinstance(self.path, list):
             for item in self.path:
                 if isinstance(item, dict) and "path" in item:
@@ -46,12 +51,21 @@ class DocxKnowledgeBase(AgentKnowledge):
         """Helper to check if path is a valid doc/docx file."""
         return path.exists() and path.is_file() and path.suffix in self.formats
 
+    def get_sources(self) -> Iterator[KnowledgeSource]:
+        """Yield a source per Word file, fingerprinted by its path, modification time and size."""
+        return self._get_file_sources("file", self._is_valid_docx)
+
     @property
     async def async_document_lists(self) -> AsyncIterator[List[Document]]:
         """Iterate over doc/docx files and yield lists of documents asynchronously."""
         if self.path is None:
             raise ValueError("Path is not set")
 
+        if self.parsing_workers:
+            async for documents in self._aparse_files("file", self._is_valid_docx):
+                yield documents
+            return
+
         if isinstance(self.path, list):
             for item in self.path:
                 if isinstance(item, dict) and "path" in item:
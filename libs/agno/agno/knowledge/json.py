@@ -4,6 +4,7 @@ from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Union
 from agno.document import Document
 from agno.document.reader.json_reader import JSONReader
 from agno.knowledge.agent import AgentKnowledge
+from agno.knowledge.sync import KnowledgeSource
 from agno.utils.log import log_info, logger
 
 
@@ -18,6 +19,10 @@ class JSONKnowledgeBase(AgentKnowledge):
         if self.path is None:
             raise ValueError("Path is not set")
 
+        if self.parsing_workers:
+            yield from self._parse_files("path", self._is_valid_json)
+            return
+
         if isinstance(self.path, list):
             for item in self.path:
                 if isinstance(item, dict) and "path" in item:
@@ -46,12 +51,29 @@ class JSONKnowledgeBase(AgentKnowledge):
         """Helper to check if path is a valid JSON file."""
         return path.exists() and path.is_file() and path.suffix in self.formats
 
+    def get_sources(self) -> Iterator[KnowledgeSource]:
+        """Yield a source per JSON file, fingerprinted by its path, modification time and size."""
+        return self._get_file_sources("path", self._is_valid_json)
+
+    def iter_documents(self) -> Iterator[Document]:
+        """Stream the documents of the JSON files one by one."""
+        return self._iter_file_documents("path", self._is_valid_json)
+
+    def aiter_documents(self) -> AsyncIterator[Document]:
+        """Asynchronously stream the documents of the JSON files one by one."""
+        return self._aiter_file_documents("path", self._is_valid_json)
+
     @property
     async def async_document_lists(self) -> AsyncIterator[List[Document]]:
         """Iterate over JSON files and yield lists of documents asynchronously."""
         if self.path is None:
             raise ValueError("Path is not set")
 
+        if self.parsing_workers:
+            async for documents in self._aparse_files("path", self._is_valid_json):
+                yield documents
+            return
+
         if isinstance(self.path, list):
             for item in self.path:
                 if isinstance(item, dict) and "path" in item:
@@ -4,6 +4,7 @@ from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Union
 from agno.document import Document
 from agno.document.reader.markdown_reader import MarkdownReader
 from agno.knowledge.agent import AgentKnowledge
+from agno.knowledge.sync import KnowledgeSource
 from agno.utils.log import log_info, logger
 
 
@@ -46,6 +47,10 @@ class MarkdownKnowledgeBase(AgentKnowledge):
         """Helper to check if path is a valid text file."""
         return path.exists() and path.is_file() and path.suffix in self.formats
 
+    def get_sources(self) -> Iterator[KnowledgeSource]:
+        """Yield a source per markdown file, fingerprinted by its path, modification time and size."""
+        return self._get_file_sources("file", self._is_valid_text)
+
     @property
     async def async_document_lists(self) -> AsyncIterator[List[Document]]:
         """Iterate over text files and yield lists of documents asynchronously."""
@@ -6,6 +6,7 @@ from pydantic import Field
 from agno.document import Document
 from agno.document.reader.pdf_reader import PDFImageReader, PDFReader
 from agno.knowledge.agent import AgentKnowledge
+from agno.knowledge.sync import KnowledgeSource
 from agno.utils.log import log_info, logger
 
 
@@ -21,6 +22,10 @@ class PDFKnowledgeBase(AgentKnowledge):
         if self.path is None:
             raise ValueError("Path is not set")
 
+        if self.parsing_workers:
+            yield from self._parse_files("pdf", self._is_valid_pdf)
+            return
+
         if isinstance(self.path, list):
             for item in self.path:
                 if isinstance(item, dict) and "path" in item:
@@ -49,12 +54,29 @@ class PDFKnowledgeBase(AgentKnowledge):
         """Helper to check if path is a valid PDF file."""
         return path.exists() and path.is_file() and path.suffix == ".pdf" and path.name not in self.exclude_files
 
+    def get_sources(self) -> Iterator[KnowledgeSource]:
+        """Yield a source per PDF file, fingerprinted by its path, modification time and size."""
+        return self._get_file_sources("pdf", self._is_valid_pdf)
+
+    def iter_documents(self) -> Iterator[Document]:
+        """Stream the documents of the PDF files one by one."""
+        return self._iter_file_documents("pdf", self._is_valid_pdf)
+
+    def aiter_documents(self) -> AsyncIterator[Document]:
+        """Asynchronously stream the documents of the PDF files one by one."""
+        return self._aiter_file_documents("pdf", self._is_valid_pdf)
+
     @property
     async def async_document_lists(self) -> AsyncIterator[List[Document]]:
         """Iterate over PDFs and yield lists of documents asynchronously."""
         if self.path is None:
             raise ValueError("Path is not set")
 
+        if self.parsing_workers:
+            async for documents in self._aparse_files("pdf", self._is_valid_pdf):
+                yield documents
+            return
+
         if isinstance(self.path, list):
             for item in self.path:
                 if isinstance(item, dict) and "path" in item:
@@ -3,6 +3,7 @@ from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Union
 from agno.document import Document
 from agno.document.reader.pdf_reader import PDFUrlImageReader, PDFUrlReader
 from agno.knowledge.agent import AgentKnowledge
+from agno.knowledge.sync import KnowledgeSource
 from agno.utils.log import log_info, logger
 
 
@@ -41,6 +42,10 @@ class PDFUrlKnowledgeBase(AgentKnowledge):
             return False
         return True
 
+    def get_sources(self) -> Iterator[KnowledgeSource]:
+        """Yield a source per PDF URL, fingerprinted by its ETag or Last-Modified header."""
+        return self._get_url_sources(self._is_valid_url)
+
     @property
     async def async_document_lists(self) -> AsyncIterator[List[Document]]:
         """Iterate over PDF URLs and yield lists of documents asynchronously."""
@@ -0,0 +1,254 @@
+import asyncio
+import random
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import AsyncIterator, Callable, List, Optional, Set
+
+from agno.document import Document
+from agno.embedder.base import Embedder
+from agno.utils.log import log_debug, log_info, logger
+from agno.utils.string import safe_content_hash
+from agno.vectordb import VectorDb
+
+# Sentinel put on a queue to tell the next stage that the previous stage is done
+_DONE = object()
+
+
+@dataclass
+class IngestionMetrics:
+    """Progress and throughput metrics for an ingestion run"""
+
+    documents_read: int = 0
+    documents_skipped: int = 0
+    documents_embedded: int = 0
+    documents_written: int = 0
+    batches_written: int = 0
+    embedding_retries: int = 0
+    failed_batches: int = 0
+    started_at: float = field(default_factory=perf_counter)
+    finished_at: Optional[float] = None
+
+    @property
+    def elapsed(self) -> float:
+        return (self.finished_at or perf_counter()) - self.started_at
+
+    @property
+    def documents_per_second(self) -> float:
+        return self.documents_written / self.elapsed if self.elapsed > 0 else 0.0
+
+    def to_dict(self):
+        return {
+            "documents_read": self.documents_read,
+            "documents_skipped": self.documents_skipped,
+            "documents_embedded": self.documents_embedded,
+            "documents_written": self.documents_written,
+            "batches_written": self.batches_written,
+            "embedding_retries": self.embedding_retries,
+            "failed_batches": self.failed_batches,
+            "elapsed": round(self.elapsed, 4),
+            "documents_per_second": round(self.documents_per_second, 2),
+        }
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """Best-effort detection of provider rate limit errors across SDKs"""
+    if getattr(error, "status_code", None) == 429:
+        return True
+    response = getattr(error, "response", None)
+    if getattr(response, "status_code", None) == 429:
+        return True
+    return "ratelimit" in type(error).__name__.lower() or "429" in str(error)
+
+
+def get_retry_after(error: Exception) -> Optional[float]:
+    """Return the Retry-After delay in seconds if the provider sent one"""
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        value = headers.get("retry-after")
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+class IngestionPipeline:
+    """Staged asyncio pipeline that loads documents into a vector db.
+
+    Stages are connected by bounded queues, so a slow stage applies backpressure to the ones before it
+    and memory stays bounded regardless of the size of the source:
+
+        read (document lists) -> batch (dedupe + existence check) -> embed (N workers) -> write (M workers)
+    """
+
+    def __init__(
+        self,
+        vector_db: VectorDb,
+        embedder: Optional[Embedder] = None,
+        batch_size: int = 100,
+        embedding_concurrency: int = 4,
+        write_concurrency: int = 2,
+        queue_size: int = 4,
+        upsert: bool = False,
+        skip_existing: bool = True,
+        max_retries: int = 5,
+        retry_delay: float = 1.0,
+        max_retry_delay: float = 60.0,
+        on_document_list: Optional[Callable[[List[Document]], None]] = None,
+        on_progress: Optional[Callable[[IngestionMetrics], None]] = None,
+    ):
+        self.vector_db = vector_db
+        # Documents are embedded by the pipeline when the embedder is known, otherwise by the vector db on write
+        self.embedder: Optional[Embedder] = embedder or getattr(vector_db, "embedder", None)
+        self.batch_size = max(1, batch_size)
+        self.embedding_concurrency = max(1, embedding_concurrency)
+        self.write_concurrency = max(1, write_concurrency)
+        self.queue_size = max(1, queue_size)
+        self.upsert = upsert
+        self.skip_existing = skip_existing
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        self.on_document_list = on_document_list
+        self.on_progress = on_progress
+        self.metrics = IngestionMetrics()
+
+    async def run(self, document_lists: AsyncIterator[List[Document]]) -> IngestionMetrics:
+        """Run the pipeline over an async iterator of document lists and return the metrics"""
+        self.metrics = IngestionMetrics()
+        read_queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        embed_queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        write_queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+
+        embed_workers = [
+            asyncio.create_task(self._embed_worker(embed_queue, write_queue)) for _ in range(self.embedding_concurrency)
+        ]
+        write_workers = [asyncio.create_task(self._write_worker(write_queue)) for _ in range(self.write_concurrency)]
+        stages = [
+            asyncio.create_task(self._read_stage(document_lists, read_queue)),
+            asyncio.create_task(self._batch_stage(read_queue, embed_queue)),
+        ]
+        try:
+            await asyncio.gather(*stages)
+            await asyncio.gather(*embed_workers)
+            for _ in write_workers:
+                await write_queue.put(_DONE)
+            await asyncio.gather(*write_workers)
+        except BaseException:
+            for task in stages + embed_workers + write_workers:
+                task.cancel()
+            raise
+
+        self.metrics.finished_at = perf_counter()
+        log_info(
+            f"Ingested {self.metrics.documents_written} documents in {self.metrics.elapsed:.2f}s "
+            f"({self.metrics.documents_per_second:.1f} docs/s, {self.metrics.documents_skipped} skipped)"
+        )
+        return self.metrics
+
+    async def _read_stage(self, document_lists: AsyncIterator[List[Document]], read_queue: asyncio.Queue) -> None:
+        try:
+            async for document_list in document_lists:
+                self.metrics.documents_read += len(document_list)
+                if self.on_document_list is not None:
+                    self.on_document_list(document_list)
+                await read_queue.put(document_list)
+        finally:
+            await read_queue.put(_DONE)
+
+    async def _batch_stage(self, read_queue: asyncio.Queue, embed_queue: asyncio.Queue) -> None:
+        seen: Set[str] = set()
+        batch: List[Document] = []
+        try:
+            while True:
+                document_list = await read_queue.get()
+                if document_list is _DONE:
+                    break
+                for doc in document_list:
+                    content_hash = safe_content_hash(doc.content)
+                    if content_hash in seen:
+                        self.metrics.documents_skipped += 1
+                        continue
+                    seen.add(content_hash)
+                    batch.append(doc)
+                    if len(batch) >= self.batch_size:
+                        await self._emit_batch(batch, embed_queue)
+                        batch = []
+            if batch:
+                await self._emit_batch(batch, embed_queue)
+        finally:
+            for _ in range(self.embedding_concurrency):
+                await embed_queue.put(_DONE)
+
+    async def _emit_batch(self, batch: List[Document], embed_queue: asyncio.Queue) -> None:
+        if self.skip_existing and not self.upsert:
+            batch = await self._filter_existing(batch)
+        if batch:
+            await embed_queue.put(batch)
+
+    async def _filter_existing(self, batch: List[Document]) -> List[Document]:
+        hashes = [safe_content_hash(doc.content) for doc in batch]
+        try:
+            existing = await self.vector_db.async_existing_ids(hashes)
+            remaining = [doc for doc, content_hash in zip(batch, hashes) if content_hash not in existing]
+        except NotImplementedError:
+            exists = await asyncio.gather(*[self.vector_db.async_doc_exists(doc) for doc in batch])
+            remaining = [doc for doc, doc_exists in zip(batch, exists) if not doc_exists]
+        self.metrics.documents_skipped += len(batch) - len(remaining)
+        return remaining
+
+    async def _embed_worker(self, embed_queue: asyncio.Queue, write_queue: asyncio.Queue) -> None:
+        while True:
+            batch = await embed_queue.get()
+            if batch is _DONE:
+                return
+            if self.embedder is not None:
+                await self._embed_with_retry(batch)
+            await write_queue.put(batch)
+
+    async def _embed_with_retry(self, batch: List[Document]) -> None:
+        embedder: Embedder = self.embedder  # type: ignore
+        for attempt in range(self.max_retries + 1):
+            try:
+                embeddings, usages = await embedder.async_get_embeddings_batch_and_usage([doc.content for doc in batch])
+                if len(embeddings) != len(batch):
+                    raise ValueError(f"Expected {len(batch)} embeddings, got {len(embeddings)}")
+                for doc, embedding, usage in zip(batch, embeddings, usages):
+                    # Empty embeddings are left unset so the vector db retries them on write
+                    if embedding:
+                        doc.embedding, doc.usage = embedding, usage
+                self.metrics.documents_embedded += len(batch)
+                return
+            except Exception as e:
+                if not is_rate_limit_error(e) or attempt == self.max_retries:
+                    logger.warning(f"Embedding batch failed: {e}")
+                    break
+                delay = get_retry_after(e) or min(self.max_retry_delay, self.retry_delay * 2**attempt)
+                # Jitter keeps concurrent workers from retrying in lockstep
+                delay *= 1 + random.random() * 0.1
+                self.metrics.embedding_retries += 1
+                log_debug(f"Rate limited while embedding, retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+        # Leave the documents un-embedded so the vector db embeds them (one by one if needed) on write
+
+    async def _write_worker(self, write_queue: asyncio.Queue) -> None:
+        while True:
+            batch = await write_queue.get()
+            if batch is _DONE:
+                return
+            try:
+                if self.upsert:
+                    await self.vector_db.async_upsert(documents=batch)
+                else:
+                    await self.vector_db.async_insert(documents=batch)
+                self.metrics.documents_written += len(batch)
+                self.metrics.batches_written += 1
+            except Exception as e:
+                self.metrics.failed_batches += 1
+                logger.error(f"Error writing batch of {len(batch)} documents: {e}")
+            if self.on_progress is not None:
+                self.on_progress(self.metrics)
+            log_debug(
+                f"Ingestion progress: {self.metrics.documents_written} written, "
+                f"{self.metrics.documents_per_second:.1f} docs/s"
+            )
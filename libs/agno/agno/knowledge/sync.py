@@ -0,0 +1,143 @@
+"""Incremental sync of a knowledge base with its sources.
+
+A sync records, per source (a file or URL), a cheap fingerprint (path, mtime and size, or the ETag/Last-Modified
+headers of a URL), the hash of the source content and the ids of its chunks. The next sync:
+- skips sources whose fingerprint did not change, without reading them,
+- reads sources whose fingerprint changed, and skips them if their content hash did not change,
+- writes only the chunks of changed sources that are not stored yet, and deletes the chunks they no longer have,
+- deletes the chunks of sources that were removed.
+
+Chunks are stored with an id derived from their content and metadata, so a chunk shared by several sources is stored
+once and only deleted when no source references it anymore.
+"""
+
+import json
+import os
+from dataclasses import dataclass
+from hashlib import md5
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from agno.document import Document
+from agno.utils.log import log_debug
+from agno.utils.string import safe_content_hash
+
+
+@dataclass
+class KnowledgeSource:
+    """A source of documents of a knowledge base, read only when it changed"""
+
+    # Identifies the source across syncs, e.g. the resolved file path or the URL
+    id: str
+    # Cheap fingerprint of the source, None if it can't be computed without reading the source
+    fingerprint: Optional[str]
+    read: Callable[[], List[Document]]
+    async_read: Optional[Callable[[], Awaitable[List[Document]]]] = None
+
+
+@dataclass
+class KnowledgeSyncResult:
+    """What a sync changed in the vector db"""
+
+    sources_unchanged: int = 0
+    sources_updated: int = 0
+    sources_removed: int = 0
+    chunks_written: int = 0
+    chunks_deleted: int = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        return {
+            "sources_unchanged": self.sources_unchanged,
+            "sources_updated": self.sources_updated,
+            "sources_removed": self.sources_removed,
+            "chunks_written": self.chunks_written,
+            "chunks_deleted": self.chunks_deleted,
+        }
+
+
+def _hash(data: Any) -> str:
+    return md5(json.dumps(data, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def get_file_fingerprint(path: Path, metadata: Optional[Dict[str, Any]] = None) -> Optional[str]:
+    """Fingerprint a file by its path, modification time and size (and the metadata added to its documents)"""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return _hash([str(path.resolve()), stat.st_mtime_ns, stat.st_size, metadata])
+
+
+def get_url_fingerprint(url: str, metadata: Optional[Dict[str, Any]] = None, timeout: float = 10.0) -> Optional[str]:
+    """Fingerprint a URL by the ETag or Last-Modified header of a HEAD request, None if the server sends neither"""
+    import httpx
+
+    try:
+        response = httpx.head(url, follow_redirects=True, timeout=timeout)
+        response.raise_for_status()
+    except Exception as e:
+        log_debug(f"Could not fingerprint {url}: {e}")
+        return None
+    etag = response.headers.get("etag")
+    last_modified = response.headers.get("last-modified")
+    if etag is None and last_modified is None:
+        return None
+    return _hash([url, etag, last_modified, response.headers.get("content-length"), metadata])
+
+
+def get_chunk_id(document: Document) -> str:
+    """Id of a chunk, changes when its content or metadata changes"""
+    return _hash([safe_content_hash(document.content), document.meta_data])
+
+
+def get_config_hash(reader: Any, chunking_strategy: Any, vector_db: Any) -> str:
+    """Hash of the reader, chunking strategy, vector db and embedder, a change re-syncs all sources"""
+
+    chunking_settings = {
+        key: value
+        for key, value in vars(chunking_strategy).items()
+        if not key.startswith("_") and isinstance(value, (str, int, float, bool, type(None)))
+    }
+    embedder = getattr(vector_db, "embedder", None)
+    return _hash(
+        [
+            type(reader).__name__ if reader is not None else None,
+            [type(chunking_strategy).__name__, chunking_settings],
+            type(vector_db).__name__,
+            [type(embedder).__name__, getattr(embedder, "id", None), getattr(embedder, "dimensions", None)],
+        ]
+    )
+
+
+def get_content_hash(chunk_ids: List[str]) -> str:
+    """Hash of the content of a source, from the content hashes of its chunks"""
+    return _hash(chunk_ids)
+
+
+class KnowledgeSyncState:
+    """Fingerprints and chunk ids of the synced sources of a knowledge base, stored in a JSON file"""
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.config: Optional[str] = None
+        # source id -> {"fingerprint": ..., "content_hash": ..., "chunk_ids": [...]}
+        self.sources: Dict[str, Dict[str, Any]] = {}
+        if self.path.exists():
+            data = json.loads(self.path.read_text())
+            self.config = data.get("config")
+            self.sources = data.get("sources", {})
+
+    def get_chunk_references(self) -> Dict[str, int]:
+        """Return the number of sources referencing each chunk id"""
+        references: Dict[str, int] = {}
+        for source in self.sources.values():
+            for chunk_id in source["chunk_ids"]:
+                references[chunk_id] = references.get(chunk_id, 0) + 1
+        return references
+
+    def save(self) -> None:
+        """Write the state to a temporary file and move it in place, so an interrupted sync keeps the last state"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp_path.write_text(json.dumps({"config": self.config, "sources": self.sources}))
+        os.replace(tmp_path, self.path)
@@ -4,6 +4,7 @@ from typing import AsyncIterator, Iterator, List
 from agno.document import Document
 from agno.document.reader.url_reader import URLReader
 from agno.knowledge.agent import AgentKnowledge
+from agno.knowledge.sync import KnowledgeSource
 from agno.utils.log import logger
 
 
@@ -25,6 +26,10 @@ class UrlKnowledge(AgentKnowledge):
             except Exception as e:
                 logger.error(f"Error reading URL {url}: {str(e)}")
 
+    def get_sources(self) -> Iterator[KnowledgeSource]:
+        """Yield a source per URL, fingerprinted by its ETag or Last-Modified header."""
+        return self._get_url_sources()
+
     @property
     async def async_document_lists(self) -> AsyncIterator[List[Document]]:
         """Async version of document_lists"""
@@ -3,7 +3,7 @@ from copy import deepcopy
 from dataclasses import dataclass, field
 from datetime import datetime
 from os import getenv
-from typing import Any, Dict, List, Literal, Optional, Type, Union
+from typing import Any, Callable, Dict, List, Literal, Optional, Type, Union
 
 from pydantic import BaseModel, Field
 
@@ -19,8 +19,10 @@ from agno.run.base import RunStatus
 from agno.run.response import RunResponse
 from agno.run.team import TeamRunResponse
 from agno.utils.log import log_debug, log_warning, logger, set_log_level_to_debug, set_log_level_to_info
+from agno.utils.message import count_history_tokens
 from agno.utils.prompts import get_json_output_prompt
 from agno.utils.string import parse_response_model_str
+from agno.utils.tokens import Tokenizer
 
 
 class MemorySearchResponse(BaseModel):
@@ -97,6 +99,8 @@ class Memory:
 
     # runs per session
     runs: Optional[Dict[str, List[Union[RunResponse, TeamRunResponse]]]] = None
+    # Loaders for the older runs of a session that were not deserialized when the session was loaded
+    deferred_runs: Optional[Dict[str, Callable[[], List[Dict[str, Any]]]]] = None
 
     # Team context per session
     team_context: Optional[Dict[str, TeamContext]] = None
@@ -125,6 +129,7 @@ class Memory:
         self.memories = memories or {}
         self.summaries = summaries or {}
         self.runs = runs or {}
+        self.deferred_runs = {}
 
         self.debug_mode = debug_mode
 
@@ -208,7 +213,7 @@ class Memory:
         self.set_log_level()
         self.refresh_from_db(user_id=user_id)
 
-    def to_dict(self) -> Dict[str, Any]:
+    def to_dict(self, include_runs: bool = True) -> Dict[str, Any]:
         _memory_dict = {}
         # Add summary if it exists
         if self.summaries is not None:
@@ -223,7 +228,9 @@ class Memory:
                 for user_id, user_memories in self.memories.items()
             }
         # Add runs if they exist
-        if self.runs is not None:
+        if include_runs and self.runs is not None:
+            for session_id in list(self.deferred_runs or {}):
+                self.load_deferred_runs(session_id)
             _memory_dict["runs"] = {}
             for session_id, runs in self.runs.items():
                 if session_id is not None:
@@ -398,8 +405,47 @@ class Memory:
         """Get all runs for a given session id"""
         if self.runs is None:
             return []
+        self.load_deferred_runs(session_id)
         return self.runs.get(session_id, [])
 
+    def defer_runs(self, session_id: str, loader: Callable[[], List[Dict[str, Any]]]) -> None:
+        """Register a loader for older runs of a session, they are only deserialized when they are needed"""
+        if self.deferred_runs is None:
+            self.deferred_runs = {}
+        self.deferred_runs[session_id] = loader
+
+    def has_deferred_runs(self, session_id: str) -> bool:
+        return self.deferred_runs is not None and session_id in self.deferred_runs
+
+    def get_deferred_run_dicts(self, session_id: str) -> List[Dict[str, Any]]:
+        """Return the deferred runs of a session as they were read, without deserializing them"""
+        if not self.has_deferred_runs(session_id):
+            return []
+        loaded_run_ids = {run.run_id for run in (self.runs or {}).get(session_id, [])}
+        return [run for run in self.deferred_runs[session_id]() if run.get("run_id") not in loaded_run_ids]  # type: ignore
+
+    def load_deferred_runs(self, session_id: str, last_n: Optional[int] = None) -> None:
+        """Deserialize the deferred runs of a session and put them before the runs that are already loaded.
+        With last_n, only the newest last_n deferred runs are deserialized and the older ones stay deferred."""
+        if not self.has_deferred_runs(session_id):
+            return
+        run_dicts = self.get_deferred_run_dicts(session_id)
+        self.deferred_runs.pop(session_id)  # type: ignore
+        if last_n is not None and len(run_dicts) > last_n:
+            remaining_run_dicts = run_dicts[: -max(1, last_n)]
+            self.defer_runs(session_id, lambda: remaining_run_dicts)
+            run_dicts = run_dicts[-max(1, last_n) :]
+        older_runs: List[Union[RunResponse, TeamRunResponse]] = []
+        for run in run_dicts:
+            try:
+                older_runs.append(TeamRunResponse.from_dict(run) if "team_id" in run else RunResponse.from_dict(run))
+            except Exception as e:
+                log_warning(f"Failed to load run from memory: {e}")
+        if self.runs is None:
+            self.runs = {}
+        self.runs[session_id] = older_runs + self.runs.get(session_id, [])
+        log_debug(f"Loaded {len(older_runs)} deferred runs for session: {session_id}")
+
     # -*- Agent Functions
     def create_session_summary(self, session_id: str, user_id: Optional[str] = None) -> Optional[SessionSummary]:
         """Creates a summary of the session"""
@@ -645,6 +691,7 @@ class Memory:
             assistant_role = ["assistant", "model", "CHATBOT"]
 
         final_messages: List[Message] = []
+        self.load_deferred_runs(session_id)
         session_runs = self.runs.get(session_id, []) if self.runs else []
         for run_response in session_runs:
             if run_response and run_response.messages:
@@ -716,13 +763,13 @@ class Memory:
         Returns:
             A list of Messages from the specified runs, excluding history messages.
         """
-        if not self.runs:
+        if not self.runs and not self.has_deferred_runs(session_id):
             return []
 
         if skip_status is None:
             skip_status = [RunStatus.paused, RunStatus.cancelled, RunStatus.error]
 
-        session_runs = self.runs.get(session_id, [])
+        session_runs = (self.runs or {}).get(session_id, [])
         # Filter by agent_id and team_id
         if agent_id:
             session_runs = [run for run in session_runs if hasattr(run, "agent_id") and run.agent_id == agent_id]  # type: ignore
@@ -732,6 +779,19 @@ class Memory:
         # Filter by status
         session_runs = [run for run in session_runs if hasattr(run, "status") and run.status not in skip_status]  # type: ignore
 
+        # Deferred runs are only loaded when the runs that are already loaded don't cover last_n
+        if self.has_deferred_runs(session_id) and (last_n is None or len(session_runs) < last_n):
+            self.load_deferred_runs(session_id, last_n=None if last_n is None else last_n - len(session_runs))
+            return self.get_messages_from_last_n_runs(
+                session_id=session_id,
+                agent_id=agent_id,
+                team_id=team_id,
+                last_n=last_n,
+                skip_role=skip_role,
+                skip_status=skip_status,
+                skip_history_messages=skip_history_messages,
+            )
+
         # Filter by last_n
         runs_to_process = session_runs[-last_n:] if last_n is not None else session_runs
         messages_from_history = []
@@ -758,10 +818,36 @@ class Memory:
         log_debug(f"Getting messages from previous runs: {len(messages_from_history)}")
         return messages_from_history
 
+    def get_messages_within_tokens(
+        self,
+        session_id: str,
+        max_tokens: int,
+        max_tool_result_tokens: Optional[int] = None,
+        tokenizer: Optional[Tokenizer] = None,
+        agent_id: Optional[str] = None,
+        team_id: Optional[str] = None,
+        skip_role: Optional[str] = None,
+    ) -> List[Message]:
+        """Returns the messages from the last runs, with at least enough runs to spend max_tokens.
+        Runs are added newest first and deferred runs are only loaded while the budget is not spent, the caller
+        trims the result to the budget with get_history_messages.
+        """
+        last_n = max(1, len((self.runs or {}).get(session_id, [])))
+        while True:
+            history = self.get_messages_from_last_n_runs(
+                session_id=session_id, agent_id=agent_id, team_id=team_id, last_n=last_n, skip_role=skip_role
+            )
+            if not self.has_deferred_runs(session_id):
+                return history
+            if count_history_tokens(history, max_tool_result_tokens, tokenizer) > max_tokens:
+                return history
+            last_n *= 2
+
     def get_tool_calls(self, session_id: str, num_calls: Optional[int] = None) -> List[Dict[str, Any]]:
         """Returns a list of tool calls from the messages"""
 
         tool_calls = []
+        self.load_deferred_runs(session_id)
         session_runs = self.runs.get(session_id, []) if self.runs else []
         for run_response in session_runs[::-1]:
             if run_response and run_response.messages:
@@ -982,6 +1068,7 @@ class Memory:
         self.memories = {}
         self.summaries = {}
         self.runs = {}
+        self.deferred_runs = {}
 
     # -*- Team Functions
     def add_interaction_to_team_context(
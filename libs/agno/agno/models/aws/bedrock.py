@@ -331,7 +331,7 @@ class AwsBedrock(Model):
 
             tool_config = None
             if tools is not None and tools:
-                tool_config = {"tools": self._format_tools_for_request(tools)}
+                tool_config = {"tools": self._get_formatted_tools(tools, self._format_tools_for_request)}
 
             body = {
                 "system": system_message,
@@ -367,7 +367,7 @@ class AwsBedrock(Model):
 
             tool_config = None
             if tools is not None and tools:
-                tool_config = {"tools": self._format_tools_for_request(tools)}
+                tool_config = {"tools": self._get_formatted_tools(tools, self._format_tools_for_request)}
 
             body = {
                 "system": system_message,
@@ -402,7 +402,7 @@ class AwsBedrock(Model):
 
             tool_config = None
             if tools is not None and tools:
-                tool_config = {"tools": self._format_tools_for_request(tools)}
+                tool_config = {"tools": self._get_formatted_tools(tools, self._format_tools_for_request)}
 
             body = {
                 "system": system_message,
@@ -439,7 +439,7 @@ class AwsBedrock(Model):
 
             tool_config = None
             if tools is not None and tools:
-                tool_config = {"tools": self._format_tools_for_request(tools)}
+                tool_config = {"tools": self._get_formatted_tools(tools, self._format_tools_for_request)}
 
             body = {
                 "system": system_message,
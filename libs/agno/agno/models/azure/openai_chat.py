@@ -5,6 +5,7 @@ from typing import Any, Dict, Optional
 import httpx
 
 from agno.models.openai.like import OpenAILike
+from agno.utils.http_pool import get_shared_client
 
 try:
     from openai import AsyncAzureOpenAI as AsyncAzureOpenAIClient
@@ -94,6 +95,8 @@ class AzureOpenAI(OpenAILike):
             return self.client
 
         _client_params: Dict[str, Any] = self._get_client_params()
+        if self.reuse_client:
+            return get_shared_client(AzureOpenAIClient, _client_params, http2=self.http2, limits=self.http_limits)
 
         # -*- Create client
         self.client = AzureOpenAIClient(**_client_params)
@@ -110,6 +113,10 @@ class AzureOpenAI(OpenAILike):
             return self.async_client
 
         _client_params: Dict[str, Any] = self._get_client_params()
+        if self.reuse_client:
+            return get_shared_client(
+                AsyncAzureOpenAIClient, _client_params, http2=self.http2, limits=self.http_limits, is_async=True
+            )
 
         if self.http_client:
             _client_params["http_client"] = self.http_client
@@ -1,12 +1,15 @@
 import asyncio
 import collections.abc
+import contextvars
 from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from types import AsyncGeneratorType, GeneratorType
 from typing import (
     Any,
     AsyncGenerator,
     AsyncIterator,
+    Callable,
     Dict,
     Iterator,
     List,
@@ -28,7 +31,7 @@ from agno.models.response import ModelResponse, ModelResponseEvent, ToolExecutio
 from agno.run.response import RunResponseContentEvent, RunResponseEvent
 from agno.run.team import RunResponseContentEvent as TeamRunResponseContentEvent
 from agno.run.team import TeamRunResponseEvent
-from agno.tools.function import Function, FunctionCall, FunctionExecutionResult, UserInputField
+from agno.tools.function import Function, FunctionCall, UserInputField
 from agno.utils.log import log_debug, log_error, log_warning
 from agno.utils.timer import Timer
 from agno.utils.tools import get_function_call_for_tool_call, get_function_call_for_tool_execution
@@ -252,11 +255,20 @@ class Model(ABC):
     # Instructions from the model added to the Agent.
     instructions: Optional[List[str]] = None
 
+    # If True, tool calls from one model response run in parallel in a thread pool on the sync path.
+    # Only functions marked concurrency_safe run in parallel, results and events keep the order of the tool calls.
+    concurrent_tool_calls: bool = False
+    # Maximum number of threads used to run tool calls in parallel. Defaults to one per tool call.
+    max_tool_call_workers: Optional[int] = None
+
     # The role of the tool message.
     tool_message_role: str = "tool"
     # The role of the assistant message.
     assistant_message_role: str = "assistant"
 
+    # Provider formatted tool definitions, reused while the Agent passes the same tools list
+    _formatted_tools: Optional[Tuple[List[Dict[str, Any]], int, Any]] = None
+
     def __post_init__(self):
         if self.provider is None and self.name is not None:
             self.provider = f"{self.name} ({self.id})"
@@ -269,6 +281,20 @@ class Model(ABC):
     def get_provider(self) -> str:
         return self.provider or self.name or self.__class__.__name__
 
+    def _get_formatted_tools(
+        self, tools: List[Dict[str, Any]], formatter: Callable[[List[Dict[str, Any]]], Any]
+    ) -> Any:
+        """Format tools for the provider, reusing the last result while the same tools list is passed.
+
+        The Agent and Team build a new tools list whenever their tools change, so the list identity is the cache key.
+        """
+        cached = self._formatted_tools
+        if cached is not None and cached[0] is tools and cached[1] == len(tools):
+            return cached[2]
+        formatted = formatter(tools)
+        self._formatted_tools = (tools, len(tools), formatted)
+        return formatted
+
     @abstractmethod
     def invoke(self, *args, **kwargs) -> Any:
         pass
@@ -1164,17 +1190,8 @@ class Model(ABC):
             tool_call_error=True,
         )
 
-    def run_function_call(
-        self,
-        function_call: FunctionCall,
-        function_call_results: List[Message],
-        additional_messages: Optional[List[Message]] = None,
-    ) -> Iterator[Union[ModelResponse, RunResponseEvent, TeamRunResponseEvent]]:
-        # Start function call
-        function_call_timer = Timer()
-        function_call_timer.start()
-        # Yield a tool_call_started event
-        yield ModelResponse(
+    def _tool_call_started_response(self, function_call: FunctionCall) -> ModelResponse:
+        return ModelResponse(
             content=function_call.get_call_str(),
             tool_executions=[
                 ToolExecution(
@@ -1186,22 +1203,49 @@ class Model(ABC):
             event=ModelResponseEvent.tool_call_started.value,
         )
 
-        # Run function calls sequentially
-        function_execution_result: FunctionExecutionResult = FunctionExecutionResult(status="failure")
+    def _execute_function_call(
+        self, function_call: FunctionCall
+    ) -> Tuple[Union[bool, AgentRunException], Timer, FunctionCall]:
+        """Execute a function call and return its success status, timer, and the FunctionCall object."""
+        function_call_timer = Timer()
+        function_call_timer.start()
+        success: Union[bool, AgentRunException] = False
         try:
-            function_execution_result = function_call.execute()
+            success = function_call.execute().status == "success"
         except AgentRunException as a_exc:
-            # Update additional messages from function call
-            _handle_agent_exception(a_exc, additional_messages)
-            # Set function call success to False if an exception occurred
+            success = a_exc
         except Exception as e:
             log_error(f"Error executing function {function_call.function.name}: {e}")
             raise e
+        function_call_timer.stop()
+        return success, function_call_timer, function_call
+
+    def run_function_call(
+        self,
+        function_call: FunctionCall,
+        function_call_results: List[Message],
+        additional_messages: Optional[List[Message]] = None,
+    ) -> Iterator[Union[ModelResponse, RunResponseEvent, TeamRunResponseEvent]]:
+        # Yield a tool_call_started event
+        yield self._tool_call_started_response(function_call)
 
-        function_call_success = function_execution_result.status == "success"
+        yield from self._handle_function_call_result(
+            self._execute_function_call(function_call), function_call_results, additional_messages
+        )
 
-        # Stop function call timer
-        function_call_timer.stop()
+    def _handle_function_call_result(
+        self,
+        execution: Tuple[Union[bool, AgentRunException], Timer, FunctionCall],
+        function_call_results: List[Message],
+        additional_messages: Optional[List[Message]] = None,
+    ) -> Iterator[Union[ModelResponse, RunResponseEvent, TeamRunResponseEvent]]:
+        """Process the output of an executed function call and yield its tool_call_completed event"""
+        function_call_success, function_call_timer, function_call = execution
+        if isinstance(function_call_success, AgentRunException):
+            # Update additional messages from function call
+            _handle_agent_exception(function_call_success, additional_messages)
+            # Set function call success to False if an exception occurred
+            function_call_success = False
 
         # Process function call output
         function_call_output: str = ""
@@ -1269,12 +1313,18 @@ class Model(ABC):
         # Additional messages from function calls that will be added to the function call results
         if additional_messages is None:
             additional_messages = []
+        # Concurrency safe function calls that are collected to run in parallel
+        concurrent_function_calls: List[FunctionCall] = []
 
         for fc in function_calls:
             if function_call_limit is not None:
                 current_function_call_count += 1
                 # We have reached the function call limit, so we add an error result to the function call results
                 if current_function_call_count > function_call_limit:
+                    yield from self._run_concurrent_function_calls(
+                        concurrent_function_calls, function_call_results, additional_messages
+                    )
+                    concurrent_function_calls = []
                     function_call_results.append(self.create_tool_call_limit_error_result(fc))
                     continue
 
@@ -1346,6 +1396,11 @@ class Model(ABC):
                 )
 
             if paused_tool_executions:
+                # Calls that were collected to run in parallel run before the pause, to keep the order of events
+                yield from self._run_concurrent_function_calls(
+                    concurrent_function_calls, function_call_results, additional_messages
+                )
+                concurrent_function_calls = []
                 yield ModelResponse(
                     tool_executions=paused_tool_executions,
                     event=ModelResponseEvent.tool_call_paused.value,
@@ -1353,14 +1408,63 @@ class Model(ABC):
                 # We don't execute the function calls here
                 continue
 
+            if self.concurrent_tool_calls and fc.function.concurrency_safe:
+                concurrent_function_calls.append(fc)
+                continue
+
+            yield from self._run_concurrent_function_calls(
+                concurrent_function_calls, function_call_results, additional_messages
+            )
+            concurrent_function_calls = []
             yield from self.run_function_call(
                 function_call=fc, function_call_results=function_call_results, additional_messages=additional_messages
             )
 
+        yield from self._run_concurrent_function_calls(
+            concurrent_function_calls, function_call_results, additional_messages
+        )
+
         # Add any additional messages at the end
         if additional_messages:
             function_call_results.extend(additional_messages)
 
+    def _run_concurrent_function_calls(
+        self,
+        function_calls: List[FunctionCall],
+        function_call_results: List[Message],
+        additional_messages: Optional[List[Message]] = None,
+    ) -> Iterator[Union[ModelResponse, RunResponseEvent, TeamRunResponseEvent]]:
+        """Run concurrency safe function calls in a thread pool.
+
+        The tool_call_started events are yielded before the calls start and the results are processed in the order of
+        the function calls, so the events and the function call results are the same as when running sequentially.
+        """
+        if len(function_calls) == 1:
+            yield from self.run_function_call(
+                function_call=function_calls[0],
+                function_call_results=function_call_results,
+                additional_messages=additional_messages,
+            )
+            return
+        if not function_calls:
+            return
+
+        for fc in function_calls:
+            yield self._tool_call_started_response(fc)
+
+        max_workers = min(len(function_calls), self.max_tool_call_workers or len(function_calls))
+        log_debug(f"Running {len(function_calls)} tool calls in parallel with {max_workers} threads")
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="agno-tool-call") as executor:
+            # Each call runs in a copy of the current context, so context variables are visible to the tools
+            futures: List[Future] = [
+                executor.submit(contextvars.copy_context().run, self._execute_function_call, fc)
+                for fc in function_calls
+            ]
+            for future in futures:
+                yield from self._handle_function_call_result(
+                    future.result(), function_call_results, additional_messages
+                )
+
     async def arun_function_call(
         self,
         function_call: FunctionCall,
@@ -1689,7 +1793,7 @@ class Model(ABC):
 
         # Deep copy all attributes
         for k, v in self.__dict__.items():
-            if k in {"response_format", "_tools", "_functions"}:
+            if k in {"response_format", "_tools", "_functions", "_formatted_tools"}:
                 continue
             try:
                 setattr(new_model, k, deepcopy(v, memo))
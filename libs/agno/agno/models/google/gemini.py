@@ -220,7 +220,7 @@ class Gemini(Model):
             config["tools"] = [Tool(google_search=GoogleSearch())]
 
         elif tools:
-            config["tools"] = [format_function_definitions(tools)]
+            config["tools"] = [self._get_formatted_tools(tools, format_function_definitions)]
 
         config = {k: v for k, v in config.items() if v is not None}
 
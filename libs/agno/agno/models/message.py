@@ -212,6 +212,8 @@ class Message(BaseModel):
     add_to_agent_memory: bool = True
     # This flag is enabled when a message is fetched from the agent's memory.
     from_history: bool = False
+    # Token counts of the message keyed by tokenizer name, cached when the message is counted
+    token_counts: Optional[Dict[str, int]] = None
     # Metrics for the message.
     metrics: MessageMetrics = Field(default_factory=MessageMetrics)
     # The references added to the message for RAG
@@ -248,6 +250,7 @@ class Message(BaseModel):
             "tool_calls": self.tool_calls,
             "thinking": self.thinking,
             "redacted_thinking": self.redacted_thinking,
+            "token_counts": self.token_counts,
         }
         # Filter out None and empty collections
         message_dict = {
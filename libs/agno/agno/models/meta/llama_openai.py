@@ -11,6 +11,7 @@ except ImportError:
 
 from agno.models.meta.llama import Message
 from agno.models.openai.like import OpenAILike
+from agno.utils.http_pool import get_shared_client
 from agno.utils.models.llama import format_message
 
 
@@ -65,6 +66,16 @@ class LlamaOpenAI(OpenAILike):
         client_params = self._get_client_params()
 
         # Llama gives a 307 redirect error, so we need to set up a custom client to allow redirects
+        if self.reuse_client:
+            return get_shared_client(
+                AsyncOpenAIClient,
+                client_params,
+                http2=self.http2,
+                limits=self.http_limits,
+                is_async=True,
+                follow_redirects=True,
+                timeout=httpx.Timeout(30.0),
+            )
         client_params["http_client"] = httpx.AsyncClient(
             limits=httpx.Limits(max_connections=1000, max_keepalive_connections=100),
             follow_redirects=True,
@@ -11,6 +11,7 @@ from agno.media import AudioResponse
 from agno.models.base import Model
 from agno.models.message import Citations, Message, UrlCitation
 from agno.models.response import ModelResponse
+from agno.utils.http_pool import get_shared_client
 from agno.utils.log import log_debug, log_error, log_warning
 from agno.utils.openai import _format_file_for_message, audio_to_message, images_to_message
 
@@ -77,6 +78,12 @@ class OpenAIChat(Model):
     default_query: Optional[Any] = None
     http_client: Optional[httpx.Client] = None
     client_params: Optional[Dict[str, Any]] = None
+    # Reuse a process-wide client and connection pool for all models with the same client params
+    reuse_client: bool = True
+    # Use HTTP/2 for the shared connection pool (requires `pip install 'httpx[http2]'`)
+    http2: bool = False
+    # Limits for the shared connection pool, defaults to agno.utils.http_pool.DEFAULT_HTTP_LIMITS
+    http_limits: Optional[httpx.Limits] = None
 
     # The role to map the message role to.
     default_role_map = {
@@ -123,6 +130,8 @@ class OpenAIChat(Model):
         client_params: Dict[str, Any] = self._get_client_params()
         if self.http_client is not None:
             client_params["http_client"] = self.http_client
+        if self.reuse_client:
+            return get_shared_client(OpenAIClient, client_params, http2=self.http2, limits=self.http_limits)
         return OpenAIClient(**client_params)
 
     def get_async_client(self) -> AsyncOpenAIClient:
@@ -135,7 +144,11 @@ class OpenAIChat(Model):
         client_params: Dict[str, Any] = self._get_client_params()
         if self.http_client:
             client_params["http_client"] = self.http_client
-        else:
+        if self.reuse_client:
+            return get_shared_client(
+                AsyncOpenAIClient, client_params, http2=self.http2, limits=self.http_limits, is_async=True
+            )
+        if not self.http_client:
             # Create a new async HTTP client with custom limits
             client_params["http_client"] = httpx.AsyncClient(
                 limits=httpx.Limits(max_connections=1000, max_keepalive_connections=100)
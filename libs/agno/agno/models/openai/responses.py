@@ -11,6 +11,7 @@ from agno.media import File
 from agno.models.base import MessageData, Model, _add_usage_metrics_to_assistant_message
 from agno.models.message import Citations, Message, UrlCitation
 from agno.models.response import ModelResponse
+from agno.utils.http_pool import get_shared_client
 from agno.utils.log import log_debug, log_error, log_warning
 from agno.utils.models.openai_responses import images_to_message
 from agno.utils.models.schema_utils import get_response_schema_for_provider
@@ -60,6 +61,12 @@ class OpenAIResponses(Model):
     default_query: Optional[Dict[str, str]] = None
     http_client: Optional[httpx.Client] = None
     client_params: Optional[Dict[str, Any]] = None
+    # Reuse a process-wide client and connection pool for all models with the same client params
+    reuse_client: bool = True
+    # Use HTTP/2 for the shared connection pool (requires `pip install 'httpx[http2]'`)
+    http2: bool = False
+    # Limits for the shared connection pool, defaults to agno.utils.http_pool.DEFAULT_HTTP_LIMITS
+    http_limits: Optional[httpx.Limits] = None
 
     # Parameters affecting built-in tools
     vector_store_name: str = "knowledge_base"
@@ -126,6 +133,8 @@ class OpenAIResponses(Model):
         client_params: Dict[str, Any] = self._get_client_params()
         if self.http_client is not None:
             client_params["http_client"] = self.http_client
+        if self.reuse_client:
+            return get_shared_client(OpenAI, client_params, http2=self.http2, limits=self.http_limits)
 
         self.client = OpenAI(**client_params)
         return self.client
@@ -143,7 +152,11 @@ class OpenAIResponses(Model):
         client_params: Dict[str, Any] = self._get_client_params()
         if self.http_client:
             client_params["http_client"] = self.http_client
-        else:
+        if self.reuse_client:
+            return get_shared_client(
+                AsyncOpenAI, client_params, http2=self.http2, limits=self.http_limits, is_async=True
+            )
+        if not self.http_client:
             # Create a new async HTTP client with custom limits
             client_params["http_client"] = httpx.AsyncClient(
                 limits=httpx.Limits(max_connections=1000, max_keepalive_connections=100)
@@ -1,8 +1,9 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Hashable, List, Optional
 
 from agno.document import Document
 from agno.reranker.base import Reranker
 from agno.utils.log import logger
+from agno.utils.model_registry import get_or_load_model, make_model_key, unload_model
 
 try:
     from sentence_transformers import CrossEncoder
@@ -15,11 +16,29 @@ class SentenceTransformerReranker(Reranker):
     model_kwargs: Optional[Dict[str, Any]] = None
     top_n: Optional[int] = None
 
+    def _get_model_key(self) -> Hashable:
+        return make_model_key("cross_encoder", self.model, self.model_kwargs)
+
+    def _get_model(self) -> CrossEncoder:
+        # Load the model once per process and share it between reranker instances
+        return get_or_load_model(
+            self._get_model_key(),
+            lambda: CrossEncoder(model_name_or_path=self.model, model_kwargs=self.model_kwargs),
+        )
+
+    def warm_up(self) -> None:
+        """Load the model ahead of the first request"""
+        self._get_model()
+
+    def unload(self) -> bool:
+        """Release the shared model loaded for this reranker"""
+        return unload_model(self._get_model_key())
+
     def _rerank(self, query: str, documents: List[Document]) -> List[Document]:
         if not documents:
             return []
 
-        sentence_transformer_client = CrossEncoder(model_name_or_path=self.model, model_kwargs=self.model_kwargs)
+        sentence_transformer_client = self._get_model()
 
         top_n = self.top_n
         if top_n and not (0 < top_n):
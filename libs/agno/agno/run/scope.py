@@ -0,0 +1,212 @@
+"""Run scopes isolate the per-run state of agents and teams.
+
+Agents and teams keep the state of the current run (run_response, run_messages, session_id, session_state, ...) on
+`self`. While a run scope is active these attributes are read from and written to the scope instead, so one configured
+instance can serve many concurrent runs (threads or asyncio tasks) without a `deep_copy` per run. When the run
+finishes its values are written back to the instance, so e.g. `agent.run_response` keeps working after a run
+(the last run to finish wins).
+
+Runs started while a scope is active (team members, agents used as tools) join that scope, so a team and its members
+share the values of the run they are part of.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from copy import copy, deepcopy
+from functools import wraps
+from inspect import isasyncgen, iscoroutinefunction, isgenerator
+from threading import Lock
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+_active_scope: ContextVar[Optional["RunScope"]] = ContextVar("agno_run_scope", default=None)
+
+
+def copy_for_run(value: Any) -> Any:
+    """Copy an instance value so changes made during a run don't leak into other runs"""
+    if isinstance(value, dict):
+        try:
+            return deepcopy(value)
+        except Exception:
+            return copy(value)
+    if isinstance(value, list):
+        return list(value)
+    # Memory v1 (AgentMemory, TeamMemory) holds the runs and messages of a single session.
+    # Memory v2 stores runs per session, so it is shared between runs.
+    if isinstance(getattr(value, "runs", None), list) and isinstance(getattr(value, "messages", None), list):
+        memory = copy(value)
+        memory.runs = list(value.runs)
+        memory.messages = list(value.messages)
+        return memory
+    return value
+
+
+def share_for_run(value: Any) -> Any:
+    """Use the instance value as is, for values that runs replace but never change in place"""
+    return value
+
+
+class RunScope:
+    """The values of run scoped attributes for one run, keyed by the instance they belong to"""
+
+    def __init__(self):
+        self.values: Dict[Tuple[int, str], Any] = {}
+        # Keep the instances alive so their ids are not reused during the run
+        self.instances: Dict[int, Any] = {}
+        self._lock = Lock()
+
+    def get(self, instance: Any, name: str, default: Any, copy_value: Callable[[Any], Any]) -> Any:
+        key = (id(instance), name)
+        try:
+            return self.values[key]
+        except KeyError:
+            pass
+        # Members of a team can run in threads that share the scope
+        with self._lock:
+            if key not in self.values:
+                self.instances[key[0]] = instance
+                self.values[key] = copy_value(instance.__dict__.get(name, default))
+            return self.values[key]
+
+    def set(self, instance: Any, name: str, value: Any) -> None:
+        self.instances[id(instance)] = instance
+        self.values[(id(instance), name)] = value
+
+    def commit(self) -> None:
+        """Write the values of the run back to their instances"""
+        for (instance_id, name), value in list(self.values.items()):
+            self.instances[instance_id].__dict__[name] = value
+
+    @contextmanager
+    def activate(self) -> Iterator["RunScope"]:
+        token = _active_scope.set(self)
+        try:
+            yield self
+        finally:
+            _active_scope.reset(token)
+
+    def iterate(self, iterator: Iterator[T]) -> Iterator[T]:
+        """Iterate a streaming run inside the scope and commit it when the stream ends"""
+        try:
+            while True:
+                with self.activate():
+                    try:
+                        item = next(iterator)
+                    except StopIteration:
+                        return
+                yield item
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                with self.activate():
+                    close()
+            self.commit()
+
+    async def aiterate(self, iterator: AsyncIterator[T]) -> AsyncIterator[T]:
+        """Iterate an async streaming run inside the scope and commit it when the stream ends"""
+        try:
+            while True:
+                with self.activate():
+                    try:
+                        item = await iterator.__anext__()
+                    except StopAsyncIteration:
+                        return
+                yield item
+        finally:
+            aclose = getattr(iterator, "aclose", None)
+            if aclose is not None:
+                with self.activate():
+                    await aclose()
+            self.commit()
+
+
+def get_active_scope() -> Optional[RunScope]:
+    return _active_scope.get()
+
+
+class RunScopedAttribute:
+    """Data descriptor that stores an attribute in the active run scope, or on the instance outside of runs"""
+
+    def __init__(self, name: str, default: Any = None, copy_value: Callable[[Any], Any] = copy_for_run):
+        self.name = name
+        self.default = default
+        self.copy_value = copy_value
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+        if instance is None:
+            return self.default
+        scope = _active_scope.get()
+        if scope is None or self.name not in instance.__dict__:
+            return instance.__dict__.get(self.name, self.default)
+        return scope.get(instance, self.name, self.default, self.copy_value)
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        scope = _active_scope.get()
+        # The first assignment initializes the instance, even if it is created during a run
+        if scope is None or self.name not in instance.__dict__:
+            instance.__dict__[self.name] = value
+        else:
+            scope.set(instance, self.name, value)
+
+
+def run_scoped_attributes(*names: str, copy_value: Callable[[Any], Any] = copy_for_run) -> Callable[[type], type]:
+    """Class decorator that turns the given attributes into run scoped attributes.
+
+    copy_value copies the instance value when a run first reads it, share_for_run gives runs the instance value.
+    """
+
+    def decorator(cls: type) -> type:
+        for name in names:
+            setattr(cls, name, RunScopedAttribute(name, default=getattr(cls, name, None), copy_value=copy_value))
+        return cls
+
+    return decorator
+
+
+def run_scoped(method: Callable[..., Any]) -> Callable[..., Any]:
+    """Run the method in a new run scope unless one is active already.
+
+    Streaming runs return generators that are executed lazily, those keep the scope until the stream ends.
+    """
+    if iscoroutinefunction(method):
+
+        @wraps(method)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            if _active_scope.get() is not None:
+                return await method(*args, **kwargs)
+            scope = RunScope()
+            try:
+                with scope.activate():
+                    result = await method(*args, **kwargs)
+            except BaseException:
+                scope.commit()
+                raise
+            if isasyncgen(result):
+                return scope.aiterate(result)
+            if isgenerator(result):
+                return scope.iterate(result)
+            scope.commit()
+            return result
+
+        return async_wrapper
+
+    @wraps(method)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        if _active_scope.get() is not None:
+            return method(*args, **kwargs)
+        scope = RunScope()
+        try:
+            with scope.activate():
+                result = method(*args, **kwargs)
+        except BaseException:
+            scope.commit()
+            raise
+        if isgenerator(result):
+            return scope.iterate(result)
+        if isasyncgen(result):
+            return scope.aiterate(result)
+        scope.commit()
+        return result
+
+    return wrapper
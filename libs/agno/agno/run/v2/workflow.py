@@ -10,7 +10,7 @@ from agno.run.base import RunStatus
 from agno.utils.log import log_error
 
 if TYPE_CHECKING:
-    from agno.workflow.v2.types import StepOutput, WorkflowMetrics
+    from agno.workflow.v2.types import StepOutput, WorkflowCheckpoint, WorkflowMetrics
 
 
 class WorkflowRunEvent(str, Enum):
@@ -42,6 +42,9 @@ class WorkflowRunEvent(str, Enum):
     steps_execution_started = "StepsExecutionStarted"
     steps_execution_completed = "StepsExecutionCompleted"
 
+    dag_execution_started = "DagExecutionStarted"
+    dag_execution_completed = "DagExecutionCompleted"
+
     step_output = "StepOutput"
 
 
@@ -335,6 +338,31 @@ class StepsExecutionCompletedEvent(BaseWorkflowRunResponseEvent):
     step_results: List["StepOutput"] = field(default_factory=list)  # noqa: F821
 
 
+@dataclass
+class DagExecutionStartedEvent(BaseWorkflowRunResponseEvent):
+    """Event sent when dag execution starts"""
+
+    event: str = WorkflowRunEvent.dag_execution_started.value
+    step_name: Optional[str] = None
+    step_index: Optional[Union[int, tuple]] = None
+    node_count: Optional[int] = None
+    max_concurrency: Optional[int] = None
+
+
+@dataclass
+class DagExecutionCompletedEvent(BaseWorkflowRunResponseEvent):
+    """Event sent when dag execution completes"""
+
+    event: str = WorkflowRunEvent.dag_execution_completed.value
+    step_name: Optional[str] = None
+    step_index: Optional[Union[int, tuple]] = None
+    node_count: Optional[int] = None
+    executed_nodes: Optional[int] = None
+
+    # Results from executed nodes, in the order they completed
+    step_results: List["StepOutput"] = field(default_factory=list)  # noqa: F821
+
+
 @dataclass
 class StepOutputEvent(BaseWorkflowRunResponseEvent):
     """Event sent when a step produces output - replaces direct StepOutput yielding"""
@@ -396,6 +424,8 @@ WorkflowRunResponseEvent = Union[
     RouterExecutionCompletedEvent,
     StepsExecutionStartedEvent,
     StepsExecutionCompletedEvent,
+    DagExecutionStartedEvent,
+    DagExecutionCompletedEvent,
     StepOutputEvent,
 ]
 
@@ -430,6 +460,10 @@ class WorkflowRunResponse:
     # Workflow metrics aggregated from all steps
     workflow_metrics: Optional["WorkflowMetrics"] = None
 
+    # Progress of the run, saved after every completed step so the run can be resumed.
+    # Only kept while checkpoints are enabled and the run is not completed.
+    checkpoint: Optional["WorkflowCheckpoint"] = None
+
     extra_data: Optional[Dict[str, Any]] = None
     created_at: int = field(default_factory=lambda: int(time()))
 
@@ -454,6 +488,7 @@ class WorkflowRunResponse:
                 "step_responses",
                 "events",
                 "workflow_metrics",
+                "checkpoint",
             ]
         }
 
@@ -489,6 +524,9 @@ class WorkflowRunResponse:
         if self.workflow_metrics is not None:
             _dict["workflow_metrics"] = self.workflow_metrics.to_dict()
 
+        if self.checkpoint is not None:
+            _dict["checkpoint"] = self.checkpoint.to_dict()
+
         if self.content and isinstance(self.content, BaseModel):
             _dict["content"] = self.content.model_dump(exclude_none=True)
 
@@ -515,6 +553,13 @@ class WorkflowRunResponse:
 
             workflow_metrics = WorkflowMetrics.from_dict(workflow_metrics_dict)
 
+        checkpoint_dict = data.pop("checkpoint", None)
+        checkpoint = None
+        if checkpoint_dict:
+            from agno.workflow.v2.types import WorkflowCheckpoint
+
+            checkpoint = WorkflowCheckpoint.from_dict(checkpoint_dict)
+
         step_responses = data.pop("step_responses", [])
         parsed_step_responses: List[Union["StepOutput", List["StepOutput"]]] = []
         if step_responses:
@@ -547,6 +592,7 @@ class WorkflowRunResponse:
             response_audio=response_audio,
             events=events,
             workflow_metrics=workflow_metrics,
+            checkpoint=checkpoint,
             **data,
         )
 
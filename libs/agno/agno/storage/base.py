@@ -1,12 +1,38 @@
+import asyncio
+import base64
+import json
 from abc import ABC, abstractmethod
-from typing import List, Literal, Optional
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Literal, Optional, Sequence, Set, Tuple
 
 from agno.storage.session import Session
+from agno.utils.string import safe_content_hash
+
+# Fields returned by `Storage.list_sessions` when no fields are given, together with the entity id field.
+DEFAULT_SESSION_LIST_FIELDS: Tuple[str, ...] = ("session_id", "user_id", "session_data", "created_at", "updated_at")
+# Computed field for `Storage.list_sessions`: the first run of the session, used to title unnamed sessions.
+FIRST_RUN_FIELD = "first_run"
+
+
+@dataclass
+class SessionPage:
+    """A page of sessions returned by `Storage.list_sessions`"""
+
+    # The projected sessions, newest first
+    sessions: List[Dict[str, Any]]
+    # Cursor for the next page, None if this is the last page
+    next_cursor: Optional[str] = None
 
 
 class Storage(ABC):
+    # Store runs in a separate append-only runs table, keyed by session_id and run_id, instead of
+    # rewriting them inside the session's memory on every upsert. Set by storages that support it.
+    incremental: bool = False
+
     def __init__(self, mode: Optional[Literal["agent", "team", "workflow", "workflow_v2"]] = "agent"):
         self._mode: Literal["agent", "team", "workflow", "workflow_v2"] = "agent" if mode is None else mode
+        # Run IDs known to be in the runs table, per session_id
+        self._saved_run_ids: Dict[str, Set[str]] = {}
 
     @property
     def mode(self) -> Literal["agent", "team", "workflow", "workflow_v2"]:
@@ -58,3 +84,219 @@ class Storage(ABC):
     @abstractmethod
     def upgrade_schema(self) -> None:
         raise NotImplementedError
+
+    # Projection queries used for lazy session loading. The defaults read the whole session, storages that keep
+    # runs in a separate table override them to only fetch the runs that are needed.
+
+    def read_projected(
+        self, session_id: str, user_id: Optional[str] = None, last_n_runs: Optional[int] = None
+    ) -> Optional[Session]:
+        """Read a session with at least its last `last_n_runs` runs in memory["runs"].
+
+        Storages that store runs separately only fetch those runs, the rest can be read with `read_runs`.
+        """
+        return self.read(session_id, user_id)
+
+    def read_runs(self, session_id: str, last_n: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Read the serialized runs of a session in the order they were added, optionally only the last N"""
+        session = self.read(session_id)
+        memory = getattr(session, "memory", None)
+        runs = (memory.get("runs") if isinstance(memory, dict) else None) or []
+        return runs[-last_n:] if last_n else runs
+
+    async def aread_projected(
+        self, session_id: str, user_id: Optional[str] = None, last_n_runs: Optional[int] = None
+    ) -> Optional[Session]:
+        if last_n_runs is None or not self.stores_runs_separately:
+            return await self.aread(session_id, user_id)
+        return await self.run_sync(self.read_projected, session_id, user_id, last_n_runs)
+
+    # Session listing. Pages are ordered by (created_at, session_id) descending and the cursor holds the last
+    # (created_at, session_id) of the previous page, so storages can seek to the next page instead of using offsets.
+
+    def list_sessions(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = 20,
+        cursor: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> SessionPage:
+        """List sessions without deserializing them, newest first.
+
+        The default reads all sessions and pages them in memory. Storages override it with a projected query.
+
+        Args:
+            user_id (Optional[str]): User ID to filter by.
+            entity_id (Optional[str]): Agent, team or workflow ID to filter by.
+            limit (Optional[int]): Maximum number of sessions in the page. None returns all sessions.
+            cursor (Optional[str]): The `next_cursor` of the previous page.
+            fields (Optional[Sequence[str]]): Fields to return, defaults to `get_list_fields()`. "first_run"
+                returns the first run of the session.
+
+        Returns:
+            SessionPage: The sessions as dicts of the requested fields and the cursor for the next page.
+        """
+        rows = [session.to_dict() for session in self.get_all_sessions(user_id, entity_id)]
+        return self.page_sessions(rows, limit=limit, cursor=cursor, fields=fields)
+
+    async def alist_sessions(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = 20,
+        cursor: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> SessionPage:
+        return await self.run_sync(self.list_sessions, user_id, entity_id, limit, cursor, fields)
+
+    @property
+    def entity_id_field(self) -> str:
+        """The field holding the agent, team or workflow ID in the current mode"""
+        if self.mode == "agent":
+            return "agent_id"
+        elif self.mode == "team":
+            return "team_id"
+        return "workflow_id"
+
+    def get_list_fields(self, fields: Optional[Sequence[str]] = None) -> List[str]:
+        """The fields to return from `list_sessions`. session_id and created_at are always included for the cursor."""
+        fields = list(fields) if fields else [*DEFAULT_SESSION_LIST_FIELDS, self.entity_id_field]
+        return list(dict.fromkeys(["session_id", "created_at", *fields]))
+
+    @staticmethod
+    def encode_session_cursor(session: Dict[str, Any]) -> str:
+        """Encode the position after `session` as an opaque cursor"""
+        position = [session.get("created_at") or 0, session["session_id"]]
+        return base64.urlsafe_b64encode(json.dumps(position).encode()).decode()
+
+    @staticmethod
+    def decode_session_cursor(cursor: str) -> Tuple[int, str]:
+        """Decode a cursor into the (created_at, session_id) of the last session of the previous page"""
+        try:
+            created_at, session_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            return int(created_at), str(session_id)
+        except Exception:
+            raise ValueError(f"Invalid session cursor: {cursor}")
+
+    def session_matches(
+        self, row: Dict[str, Any], user_id: Optional[str] = None, entity_id: Optional[str] = None
+    ) -> bool:
+        """True if a serialized session matches the user_id / entity_id filters"""
+        if user_id is not None and row.get("user_id") != user_id:
+            return False
+        return entity_id is None or row.get(self.entity_id_field) == entity_id
+
+    def get_first_run(self, row: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """The first run of a serialized session"""
+        if self.mode == "workflow_v2":
+            runs = row.get("runs")
+        else:
+            memory = row.get("memory")
+            runs = memory.get("runs") if isinstance(memory, dict) else None
+        return runs[0] if runs else None
+
+    def to_page(
+        self, rows: List[Dict[str, Any]], limit: Optional[int], fields: Optional[Sequence[str]] = None
+    ) -> SessionPage:
+        """Build a page from rows fetched in list order with up to `limit + 1` rows, the extra row signalling
+        that there is a next page"""
+        list_fields = self.get_list_fields(fields)
+        has_more = limit is not None and len(rows) > limit
+        rows = rows[:limit] if limit is not None else rows
+        sessions = []
+        for row in rows:
+            if FIRST_RUN_FIELD in list_fields and FIRST_RUN_FIELD not in row:
+                row[FIRST_RUN_FIELD] = self.get_first_run(row)
+            sessions.append({field: row.get(field) for field in list_fields})
+        return SessionPage(sessions=sessions, next_cursor=self.encode_session_cursor(rows[-1]) if has_more else None)
+
+    def page_sessions(
+        self,
+        rows: List[Dict[str, Any]],
+        limit: Optional[int] = 20,
+        cursor: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> SessionPage:
+        """Sort, seek and page serialized sessions in memory, for storages without an ordered index"""
+        rows = sorted(rows, key=lambda row: (row.get("created_at") or 0, row["session_id"]), reverse=True)
+        if cursor is not None:
+            position = self.decode_session_cursor(cursor)
+            rows = [row for row in rows if (row.get("created_at") or 0, row["session_id"]) < position]
+        return self.to_page(rows[: limit + 1] if limit is not None else rows, limit, fields)
+
+    # Async API. Storages with an async driver override these with native implementations, the defaults
+    # run the sync methods in a worker thread so they never block the event loop.
+
+    async def run_sync(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run a sync storage method from the async API"""
+        return await asyncio.to_thread(func, *args)
+
+    async def acreate(self) -> None:
+        await self.run_sync(self.create)
+
+    async def aread(self, session_id: str, user_id: Optional[str] = None) -> Optional[Session]:
+        return await self.run_sync(self.read, session_id, user_id)
+
+    async def aget_all_session_ids(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> List[str]:
+        return await self.run_sync(self.get_all_session_ids, user_id, entity_id)
+
+    async def aget_all_sessions(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> List[Session]:
+        return await self.run_sync(self.get_all_sessions, user_id, entity_id)
+
+    async def aget_recent_sessions(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = 2,
+    ) -> List[Session]:
+        return await self.run_sync(self.get_recent_sessions, user_id, entity_id, limit)
+
+    async def aupsert(self, session: Session) -> Optional[Session]:
+        return await self.run_sync(self.upsert, session)
+
+    async def adelete_session(self, session_id: Optional[str] = None):
+        return await self.run_sync(self.delete_session, session_id)
+
+    async def adrop(self) -> None:
+        await self.run_sync(self.drop)
+
+    @property
+    def stores_runs_separately(self) -> bool:
+        """True if runs are kept in the runs table. Workflow v2 sessions always store runs in the session row."""
+        return self.incremental and self.mode != "workflow_v2"
+
+    @staticmethod
+    def get_run_id(run: Dict[str, Any]) -> str:
+        """Return the run_id of a serialized run, falling back to a hash of its content"""
+        run_id = run.get("run_id") or (run.get("response") or {}).get("run_id")
+        if run_id is None:
+            run_id = safe_content_hash(json.dumps(run, sort_keys=True, default=str))
+        return run_id
+
+    def split_runs(self, session: Session) -> Tuple[Optional[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Split a session's memory into the memory stored in the session row and the runs for the runs table"""
+        memory = getattr(session, "memory", None)
+        if not self.stores_runs_separately or not isinstance(memory, dict) or "runs" not in memory:
+            return memory, []
+        runs = memory.get("runs") or []
+        return {k: v for k, v in memory.items() if k != "runs"}, runs
+
+    def merge_runs(self, session_id: str, memory: Optional[Dict[str, Any]], runs: List[Dict[str, Any]]):
+        """Put the runs read from the runs table back into the session's memory"""
+        self._saved_run_ids[session_id] = {self.get_run_id(run) for run in runs}
+        if memory is None and not runs:
+            return None
+        return {**(memory or {}), "runs": runs}
+
+    def mark_runs_saved(self, session_id: str, run_ids: List[str]) -> None:
+        self._saved_run_ids.setdefault(session_id, set()).update(run_ids)
+
+    def forget_runs(self, session_id: str) -> None:
+        self._saved_run_ids.pop(session_id, None)
+
+    def is_run_saved(self, session_id: str, run_id: Optional[str]) -> bool:
+        """True if the run is already in the runs table, so it does not need to be serialized again"""
+        if not self.stores_runs_separately or run_id is None:
+            return False
+        return run_id in self._saved_run_ids.get(session_id, set())
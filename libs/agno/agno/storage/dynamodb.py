@@ -1,9 +1,9 @@
 import time
 from dataclasses import asdict
 from decimal import Decimal
-from typing import Any, Dict, List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional, Sequence
 
-from agno.storage.base import Storage
+from agno.storage.base import FIRST_RUN_FIELD, SessionPage, Storage
 from agno.storage.session import Session
 from agno.storage.session.agent import AgentSession
 from agno.storage.session.team import TeamSession
@@ -13,7 +13,7 @@ from agno.utils.log import log_debug, log_info, logger
 
 try:
     import boto3
-    from boto3.dynamodb.conditions import Key
+    from boto3.dynamodb.conditions import Attr, Key
     from botocore.exceptions import ClientError
 except ImportError:
     raise ImportError("`boto3` not installed. Please install using `pip install boto3`.")
@@ -434,6 +434,89 @@ class DynamoDbStorage(Storage):
             logger.error(f"Error retrieving sessions: {e}")
         return sessions
 
+    def list_sessions(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = 20,
+        cursor: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> SessionPage:
+        """
+        List sessions newest first, projecting only the requested fields.
+
+        Sessions filtered by user_id or entity_id are queried from the created_at ordered index and continue from
+        the cursor with ExclusiveStartKey. Without filters the table is scanned and paged in memory.
+
+        Args:
+            user_id (Optional[str]): User ID to filter by.
+            entity_id (Optional[str]): Agent, team or workflow ID to filter by.
+            limit (Optional[int]): Maximum number of sessions in the page. None returns all sessions.
+            cursor (Optional[str]): The `next_cursor` of the previous page.
+            fields (Optional[Sequence[str]]): Fields to return, "first_run" returns the first run of the session.
+
+        Returns:
+            SessionPage: The sessions as dicts and the cursor for the next page.
+        """
+        # Field names go through placeholders, so fields that are DynamoDB reserved words can be projected
+        names: Dict[str, str] = {}
+        paths: List[str] = []
+        for field in self.get_list_fields(fields):
+            if field == FIRST_RUN_FIELD:
+                names["#runs"] = "runs"
+                if self.mode == "workflow_v2":
+                    paths.append("#runs[0]")
+                else:
+                    names["#memory"] = "memory"
+                    paths.append("#memory.#runs[0]")
+            else:
+                names[f"#f{len(paths)}"] = field
+                paths.append(f"#f{len(paths)}")
+        projection: Dict[str, Any] = {"ProjectionExpression": ", ".join(paths), "ExpressionAttributeNames": names}
+
+        position = self.decode_session_cursor(cursor) if cursor is not None else None
+        rows: List[Dict[str, Any]] = []
+        try:
+            if user_id is None and entity_id is None:
+                while True:
+                    response = self.table.scan(**projection)
+                    rows.extend(self._deserialize_item(item) for item in response.get("Items", []))
+                    if "LastEvaluatedKey" not in response:
+                        break
+                    projection["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+                return self.page_sessions(rows, limit=limit, cursor=cursor, fields=fields)
+
+            index_key, index_value = (
+                (self.entity_id_field, entity_id) if entity_id is not None else ("user_id", user_id)
+            )
+            query: Dict[str, Any] = {
+                "IndexName": f"{index_key}-index",
+                "KeyConditionExpression": Key(index_key).eq(index_value),
+                "ScanIndexForward": False,
+                **projection,
+            }
+            if entity_id is not None and user_id is not None:
+                query["FilterExpression"] = Attr("user_id").eq(user_id)
+            if position is not None:
+                query["ExclusiveStartKey"] = {
+                    "session_id": position[1],
+                    "created_at": position[0],
+                    index_key: index_value,
+                }
+            while True:
+                if limit is not None:
+                    # Fetch one extra item to know if there is a next page
+                    query["Limit"] = limit + 1 - len(rows)
+                response = self.table.query(**query)
+                rows.extend(self._deserialize_item(item) for item in response.get("Items", []))
+                if "LastEvaluatedKey" not in response or (limit is not None and len(rows) > limit):
+                    break
+                query["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+            return self.to_page(rows, limit, fields)
+        except Exception as e:
+            logger.error(f"Error listing sessions: {e}")
+        return SessionPage(sessions=[])
+
     def get_recent_sessions(
         self,
         user_id: Optional[str] = None,
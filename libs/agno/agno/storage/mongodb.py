@@ -1,8 +1,9 @@
+import time
 from datetime import datetime, timezone
-from typing import List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional, Sequence, Tuple
 from uuid import UUID
 
-from agno.storage.base import Storage
+from agno.storage.base import FIRST_RUN_FIELD, SessionPage, Storage
 from agno.storage.session import Session
 from agno.storage.session.agent import AgentSession
 from agno.storage.session.team import TeamSession
@@ -11,13 +12,22 @@ from agno.storage.session.workflow import WorkflowSession
 from agno.utils.log import log_debug, logger
 
 try:
-    from pymongo import MongoClient
+    from pymongo import MongoClient, UpdateOne
     from pymongo.collection import Collection
     from pymongo.database import Database
     from pymongo.errors import PyMongoError
 except ImportError:
     raise ImportError("`pymongo` not installed. Please install it with `pip install pymongo`")
 
+try:
+    from pymongo import AsyncMongoClient
+except ImportError:
+    # pymongo < 4.9 has no asyncio client, use motor if it is installed
+    try:
+        from motor.motor_asyncio import AsyncIOMotorClient as AsyncMongoClient  # type: ignore
+    except ImportError:
+        AsyncMongoClient = None  # type: ignore
+
 
 class MongoDbStorage(Storage):
     def __init__(
@@ -27,6 +37,8 @@ class MongoDbStorage(Storage):
         db_name: str = "agno",
         client: Optional[MongoClient] = None,
         mode: Optional[Literal["agent", "team", "workflow", "workflow_v2"]] = "agent",
+        incremental: bool = False,
+        async_client: Optional[Any] = None,
     ):
         """
         This class provides agent storage using MongoDB.
@@ -36,6 +48,10 @@ class MongoDbStorage(Storage):
             db_url: MongoDB connection URL
             db_name: Name of the database
             client: Optional existing MongoDB client
+            incremental: Store runs in an append-only `<collection_name>_runs` collection instead of the session's
+                memory, so each upsert only writes new runs.
+            async_client: Optional existing async MongoDB client (pymongo `AsyncMongoClient` or motor) used by the
+                async API. If not provided, one is created from db_url when an async driver is installed.
         """
         super().__init__(mode)
         self._client: Optional[MongoClient] = client
@@ -51,6 +67,15 @@ class MongoDbStorage(Storage):
         self.db_name: str = db_name
         self.db: Database = self._client[self.db_name]
         self.collection: Collection = self.db[self.collection_name]
+        # Append-only collection for runs when incremental is True
+        self.incremental: bool = incremental
+        self.runs_collection_name: str = f"{collection_name}_runs"
+        self.runs_collection: Collection = self.db[self.runs_collection_name]
+
+        # Async client used by the async API, created on first use. Without one the async API runs in a thread.
+        self._async_client: Optional[Any] = async_client
+        self._db_url: Optional[str] = db_url
+        self._uses_default_client: bool = client is None and db_url is None
 
     def create(self) -> None:
         """Create necessary indexes for the collection"""
@@ -67,10 +92,124 @@ class MongoDbStorage(Storage):
                 self.collection.create_index("workflow_id")
             elif self.mode == "workflow_v2":
                 self.collection.create_index("workflow_id")
+            # Serves list_sessions, which pages an entity's sessions by (created_at, session_id)
+            self.collection.create_index([(self.entity_id_field, 1), ("created_at", -1), ("session_id", -1)])
+            if self.stores_runs_separately:
+                self.runs_collection.create_index([("session_id", 1), ("run_id", 1)], unique=True)
+                self.runs_collection.create_index([("session_id", 1), ("created_at", 1)])
         except PyMongoError as e:
             logger.error(f"Error creating indexes: {e}")
             raise
 
+    def _query(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> Dict[str, Any]:
+        query = {}
+        if user_id is not None:
+            query["user_id"] = user_id
+        if entity_id is not None:
+            if self.mode == "agent":
+                query["agent_id"] = entity_id
+            elif self.mode == "team":
+                query["team_id"] = entity_id
+            elif self.mode in ["workflow", "workflow_v2"]:
+                query["workflow_id"] = entity_id
+        return query
+
+    def _read_runs(self, session_ids: List[str], last_n: Optional[int] = None) -> Dict[str, List[Dict[str, Any]]]:
+        """Read the runs of the given sessions from the runs collection, in the order they were added"""
+        if not session_ids:
+            return {}
+        run_docs = list(self._find_runs(self.runs_collection, session_ids, last_n))
+        return self._group_runs(session_ids, run_docs[::-1] if last_n is not None else run_docs)
+
+    @staticmethod
+    def _find_runs(runs_collection: Any, session_ids: List[str], last_n: Optional[int] = None) -> Any:
+        """Find the runs of the given sessions in the order they were added. With last_n the last N, newest first."""
+        cursor = runs_collection.find({"session_id": {"$in": session_ids}}, {"session_id": 1, "run_data": 1})
+        if last_n is not None:
+            return cursor.sort([("created_at", -1), ("_id", -1)]).limit(last_n)
+        return cursor.sort([("created_at", 1), ("_id", 1)])
+
+    @staticmethod
+    def _group_runs(session_ids: List[str], run_docs: Any) -> Dict[str, List[Dict[str, Any]]]:
+        runs: Dict[str, List[Dict[str, Any]]] = {session_id: [] for session_id in session_ids}
+        for doc in run_docs:
+            runs[doc["session_id"]].append(doc["run_data"])
+        return runs
+
+    def _docs_to_sessions(
+        self, docs: List[Dict[str, Any]], runs: Optional[Dict[str, List[Dict[str, Any]]]] = None
+    ) -> List[Session]:
+        """Convert documents to sessions, merging in the runs from the runs collection in incremental mode"""
+        for doc in docs:
+            # Remove MongoDB _id before converting to Session object
+            doc.pop("_id", None)
+        if self.stores_runs_separately:
+            if runs is None:
+                runs = self._read_runs([doc["session_id"] for doc in docs])
+            for doc in docs:
+                doc["memory"] = self.merge_runs(doc["session_id"], doc.get("memory"), runs.get(doc["session_id"], []))
+
+        sessions: List[Session] = []
+        for doc in docs:
+            session: Optional[Session] = None
+            if self.mode == "agent":
+                session = AgentSession.from_dict(doc)
+            elif self.mode == "team":
+                session = TeamSession.from_dict(doc)
+            elif self.mode == "workflow":
+                session = WorkflowSession.from_dict(doc)
+            elif self.mode == "workflow_v2":
+                session = WorkflowSessionV2.from_dict(doc)
+            if session is not None:
+                sessions.append(session)
+        return sessions
+
+    def _upsert_runs_ops(self, session_id: str, runs: List[Dict[str, Any]]) -> Tuple[List[UpdateOne], List[str]]:
+        """Operations that append new runs to the runs collection and update runs that were already stored"""
+        now = time.time()
+        run_ids = [self.get_run_id(run) for run in runs]
+        ops = [
+            UpdateOne(
+                {"session_id": session_id, "run_id": run_id},
+                {"$set": {"run_data": run, "updated_at": int(now)}, "$setOnInsert": {"created_at": now}},
+                upsert=True,
+            )
+            for run_id, run in zip(run_ids, runs)
+        ]
+        return ops, run_ids
+
+    def _upsert_runs(self, session_id: str, runs: List[Dict[str, Any]]) -> None:
+        """Append new runs to the runs collection. Runs that were already stored are updated in place."""
+        if not runs:
+            return
+        ops, run_ids = self._upsert_runs_ops(session_id, runs)
+        self.runs_collection.bulk_write(ops, ordered=True)
+        self.mark_runs_saved(session_id, run_ids)
+
+    def _session_update(self, session: Session) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """Build the document for a session upsert, returns the document and the runs to store separately"""
+        # Convert session to dict and add timestamps
+        session_dict = session.to_dict()
+        now = datetime.now(timezone.utc)
+        timestamp = int(now.timestamp())
+
+        # Handle UUID serialization
+        if isinstance(session.session_id, UUID):
+            session_dict["session_id"] = str(session.session_id)
+
+        # In incremental mode the runs go to the runs collection and the session only keeps the rest of the memory
+        memory, runs = self.split_runs(session)
+        if runs or self.stores_runs_separately:
+            session_dict["memory"] = memory
+
+        # Add version field for optimistic locking
+        if "_version" not in session_dict:
+            session_dict["_version"] = 1
+        else:
+            session_dict["_version"] += 1
+
+        return {**session_dict, "updated_at": timestamp}, runs
+
     def read(self, session_id: str, user_id: Optional[str] = None) -> Optional[Session]:
         """Read a Session from MongoDB
         Args:
@@ -86,21 +225,49 @@ class MongoDbStorage(Storage):
 
             doc = self.collection.find_one(query)
             if doc:
-                # Remove MongoDB _id before converting to AgentSession
-                doc.pop("_id", None)
-                if self.mode == "agent":
-                    return AgentSession.from_dict(doc)
-                elif self.mode == "team":
-                    return TeamSession.from_dict(doc)
-                elif self.mode == "workflow":
-                    return WorkflowSession.from_dict(doc)
-                elif self.mode == "workflow_v2":
-                    return WorkflowSessionV2.from_dict(doc)
+                sessions = self._docs_to_sessions([doc])
+                return sessions[0] if sessions else None
+            return None
+        except PyMongoError as e:
+            logger.error(f"Error reading session: {e}")
+            return None
+
+    def read_projected(
+        self, session_id: str, user_id: Optional[str] = None, last_n_runs: Optional[int] = None
+    ) -> Optional[Session]:
+        """Read a Session with only its last `last_n_runs` runs. Outside incremental mode this is the same as `read`.
+        Args:
+            session_id: ID of the session to read
+            user_id: ID of the user to read
+            last_n_runs: Number of runs to read from the runs collection
+        Returns:
+            Optional[Session]: The session if found, otherwise None
+        """
+        if last_n_runs is None or not self.stores_runs_separately:
+            return self.read(session_id, user_id)
+
+        try:
+            query = {"session_id": session_id}
+            if user_id:
+                query["user_id"] = user_id
+
+            doc = self.collection.find_one(query)
+            if doc:
+                sessions = self._docs_to_sessions([doc], self._read_runs([session_id], last_n=last_n_runs))
+                return sessions[0] if sessions else None
             return None
         except PyMongoError as e:
             logger.error(f"Error reading session: {e}")
             return None
 
+    def read_runs(self, session_id: str, last_n: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Read the runs of a session in the order they were added, optionally only the last N"""
+        if not self.stores_runs_separately:
+            return super().read_runs(session_id, last_n)
+        runs = self._read_runs([session_id], last_n=last_n).get(session_id, [])
+        self.mark_runs_saved(session_id, [self.get_run_id(run) for run in runs])
+        return runs
+
     def get_all_session_ids(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> List[str]:
         """Get all session IDs matching the criteria
         Args:
@@ -110,18 +277,7 @@ class MongoDbStorage(Storage):
             List[str]: List of session IDs
         """
         try:
-            query = {}
-            if user_id is not None:
-                query["user_id"] = user_id
-            if entity_id is not None:
-                if self.mode == "agent":
-                    query["agent_id"] = entity_id
-                elif self.mode == "team":
-                    query["team_id"] = entity_id
-                elif self.mode == "workflow":
-                    query["workflow_id"] = entity_id
-                elif self.mode == "workflow_v2":
-                    query["workflow_id"] = entity_id
+            query = self._query(user_id, entity_id)
             cursor = self.collection.find(query, {"session_id": 1}).sort("created_at", -1)
 
             return [str(doc["session_id"]) for doc in cursor]
@@ -138,40 +294,70 @@ class MongoDbStorage(Storage):
             List[Session]: List of sessions
         """
         try:
-            query = {}
-            if user_id is not None:
-                query["user_id"] = user_id
-            if entity_id is not None:
-                if self.mode == "agent":
-                    query["agent_id"] = entity_id
-                elif self.mode == "team":
-                    query["team_id"] = entity_id
-                elif self.mode == "workflow":
-                    query["workflow_id"] = entity_id
-                elif self.mode == "workflow_v2":
-                    query["workflow_id"] = entity_id
+            query = self._query(user_id, entity_id)
             cursor = self.collection.find(query).sort("created_at", -1)
-            sessions: List[Session] = []
-            for doc in cursor:
-                # Remove MongoDB _id before converting to AgentSession
-                doc.pop("_id", None)
-                if self.mode == "agent":
-                    _agent_session = AgentSession.from_dict(doc)
-                    if _agent_session is not None:
-                        sessions.append(_agent_session)
-                elif self.mode == "team":
-                    _team_session = TeamSession.from_dict(doc)
-                    if _team_session is not None:
-                        sessions.append(_team_session)
-                elif self.mode == "workflow":
-                    _workflow_session = WorkflowSession.from_dict(doc)
-                    if _workflow_session is not None:
-                        sessions.append(_workflow_session)
-            return sessions
+            return self._docs_to_sessions(list(cursor))
         except PyMongoError as e:
             logger.error(f"Error getting sessions: {e}")
             return []
 
+    def _read_first_runs(self, session_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Read the first run of each of the given sessions from the runs collection"""
+        pipeline: List[Dict[str, Any]] = [
+            {"$match": {"session_id": {"$in": session_ids}}},
+            {"$sort": {"created_at": 1, "_id": 1}},
+            {"$group": {"_id": "$session_id", "run_data": {"$first": "$run_data"}}},
+        ]
+        return {doc["_id"]: doc["run_data"] for doc in self.runs_collection.aggregate(pipeline)}
+
+    def list_sessions(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = 20,
+        cursor: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> SessionPage:
+        """List sessions newest first, projecting only the requested fields
+        Args:
+            user_id: ID of the user to filter by
+            entity_id: ID of the agent / team / workflow to filter by
+            limit: Maximum number of sessions in the page. None returns all sessions.
+            cursor: The `next_cursor` of the previous page
+            fields: Fields to return, "first_run" returns the first run of the session
+        Returns:
+            SessionPage: The sessions as dicts and the cursor for the next page
+        """
+        list_fields = self.get_list_fields(fields)
+        projection: Dict[str, Any] = {"_id": 0}
+        for field in list_fields:
+            if field != FIRST_RUN_FIELD:
+                projection[field] = 1
+            elif not self.stores_runs_separately:
+                projection["runs" if self.mode == "workflow_v2" else "memory.runs"] = {"$slice": 1}
+
+        query = self._query(user_id, entity_id)
+        if cursor is not None:
+            created_at, session_id = self.decode_session_cursor(cursor)
+            query["$or"] = [
+                {"created_at": {"$lt": created_at}},
+                {"created_at": created_at, "session_id": {"$lt": session_id}},
+            ]
+        try:
+            docs = self.collection.find(query, projection).sort([("created_at", -1), ("session_id", -1)])
+            if limit is not None:
+                # Fetch one extra document to know if there is a next page
+                docs = docs.limit(limit + 1)
+            rows = list(docs)
+            if FIRST_RUN_FIELD in list_fields and self.stores_runs_separately and rows:
+                first_runs = self._read_first_runs([row["session_id"] for row in rows])
+                for row in rows:
+                    row[FIRST_RUN_FIELD] = first_runs.get(row["session_id"])
+            return self.to_page(rows, limit, fields)
+        except PyMongoError as e:
+            logger.error(f"Error listing sessions: {e}")
+            return SessionPage(sessions=[])
+
     def get_recent_sessions(
         self,
         user_id: Optional[str] = None,
@@ -190,42 +376,14 @@ class MongoDbStorage(Storage):
         """
         try:
             # Build the query
-            query = {}
-            if user_id is not None:
-                query["user_id"] = user_id
-            if entity_id is not None:
-                if self.mode == "agent":
-                    query["agent_id"] = entity_id
-                elif self.mode == "team":
-                    query["team_id"] = entity_id
-                elif self.mode == "workflow":
-                    query["workflow_id"] = entity_id
-                elif self.mode == "workflow_v2":
-                    query["workflow_id"] = entity_id
+            query = self._query(user_id, entity_id)
             # Execute query with sort and limit
             cursor = self.collection.find(query)
             cursor = cursor.sort("created_at", -1)  # Sort by created_at descending
             if limit is not None:
                 cursor = cursor.limit(limit)
 
-            sessions: List[Session] = []
-            for doc in cursor:
-                # Remove MongoDB _id before converting to Session object
-                doc.pop("_id", None)
-                session: Optional[Session] = None
-
-                if self.mode == "agent":
-                    session = AgentSession.from_dict(doc)
-                elif self.mode == "team":
-                    session = TeamSession.from_dict(doc)
-                elif self.mode == "workflow":
-                    session = WorkflowSession.from_dict(doc)
-                elif self.mode == "workflow_v2":
-                    session = WorkflowSessionV2.from_dict(doc)
-                if session is not None:
-                    sessions.append(session)
-
-            return sessions
+            return self._docs_to_sessions(list(cursor))
 
         except PyMongoError as e:
             logger.error(f"Error getting last {limit} sessions: {e}")
@@ -240,34 +398,20 @@ class MongoDbStorage(Storage):
             Optional[Session]: The upserted session, otherwise None
         """
         try:
-            # Convert session to dict and add timestamps
-            session_dict = session.to_dict()
-            now = datetime.now(timezone.utc)
-            timestamp = int(now.timestamp())
-
-            # Handle UUID serialization
-            if isinstance(session.session_id, UUID):
-                session_dict["session_id"] = str(session.session_id)
-
-            # Add version field for optimistic locking
-            if "_version" not in session_dict:
-                session_dict["_version"] = 1
-            else:
-                session_dict["_version"] += 1
-
-            update_data = {**session_dict, "updated_at": timestamp}
+            update_data, runs = self._session_update(session)
 
             # For new documents, set created_at
-            query = {"session_id": session_dict["session_id"]}
+            query = {"session_id": update_data["session_id"]}
 
             doc = self.collection.find_one(query)
             if not doc:
-                update_data["created_at"] = timestamp
+                update_data["created_at"] = update_data["updated_at"]
 
             result = self.collection.update_one(query, {"$set": update_data}, upsert=True)
+            self._upsert_runs(update_data["session_id"], runs)
 
             if result.acknowledged:
-                return self.read(session_id=session_dict["session_id"])
+                return self.read(session_id=update_data["session_id"])
             return None
 
         except PyMongoError as e:
@@ -287,6 +431,9 @@ class MongoDbStorage(Storage):
 
         try:
             result = self.collection.delete_one({"session_id": session_id})
+            if self.stores_runs_separately:
+                self.runs_collection.delete_many({"session_id": session_id})
+                self.forget_runs(session_id)
             if result.deleted_count == 0:
                 log_debug(f"No session found with session_id: {session_id}")
             else:
@@ -301,9 +448,125 @@ class MongoDbStorage(Storage):
         """
         try:
             self.collection.drop()
+            if self.stores_runs_separately:
+                self.runs_collection.drop()
+                self._saved_run_ids.clear()
         except PyMongoError as e:
             logger.error(f"Error dropping collection: {e}")
 
+    def _get_async_db(self) -> Optional[Any]:
+        """Return the async database, creating an async client on first use. None if no async driver is available."""
+        if self._async_client is None:
+            if AsyncMongoClient is None or not (self._db_url or self._uses_default_client):
+                return None
+            self._async_client = AsyncMongoClient(self._db_url) if self._db_url else AsyncMongoClient()
+        return self._async_client[self.db_name]
+
+    async def _adocs_to_sessions(self, db: Any, docs: List[Dict[str, Any]]) -> List[Session]:
+        runs = None
+        if self.stores_runs_separately and docs:
+            session_ids = [doc["session_id"] for doc in docs]
+            cursor = self._find_runs(db[self.runs_collection_name], session_ids)
+            runs = self._group_runs(session_ids, [run_doc async for run_doc in cursor])
+        return self._docs_to_sessions(docs, runs)
+
+    async def aread(self, session_id: str, user_id: Optional[str] = None) -> Optional[Session]:
+        """Read a Session from MongoDB without blocking the event loop"""
+        db = self._get_async_db()
+        if db is None:
+            return await super().aread(session_id, user_id)
+
+        try:
+            query = {"session_id": session_id}
+            if user_id:
+                query["user_id"] = user_id
+
+            doc = await db[self.collection_name].find_one(query)
+            if doc:
+                sessions = await self._adocs_to_sessions(db, [doc])
+                return sessions[0] if sessions else None
+            return None
+        except PyMongoError as e:
+            logger.error(f"Error reading session: {e}")
+            return None
+
+    async def aget_all_session_ids(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> List[str]:
+        db = self._get_async_db()
+        if db is None:
+            return await super().aget_all_session_ids(user_id, entity_id)
+
+        try:
+            cursor = db[self.collection_name].find(self._query(user_id, entity_id), {"session_id": 1})
+            return [str(doc["session_id"]) async for doc in cursor.sort("created_at", -1)]
+        except PyMongoError as e:
+            logger.error(f"Error getting session IDs: {e}")
+            return []
+
+    async def aget_all_sessions(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> List[Session]:
+        return await self.aget_recent_sessions(user_id=user_id, entity_id=entity_id, limit=None)
+
+    async def aget_recent_sessions(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = 2,
+    ) -> List[Session]:
+        db = self._get_async_db()
+        if db is None:
+            return await super().aget_recent_sessions(user_id, entity_id, limit)
+
+        try:
+            cursor = db[self.collection_name].find(self._query(user_id, entity_id)).sort("created_at", -1)
+            if limit is not None:
+                cursor = cursor.limit(limit)
+            return await self._adocs_to_sessions(db, [doc async for doc in cursor])
+        except PyMongoError as e:
+            logger.error(f"Error getting last {limit} sessions: {e}")
+            return []
+
+    async def aupsert(self, session: Session, create_and_retry: bool = True) -> Optional[Session]:
+        """Upsert a session without blocking the event loop"""
+        db = self._get_async_db()
+        if db is None:
+            return await super().aupsert(session)
+
+        try:
+            update_data, runs = self._session_update(session)
+            # $setOnInsert sets created_at for new documents only, saving the lookup the sync upsert does
+            result = await db[self.collection_name].update_one(
+                {"session_id": update_data["session_id"]},
+                {"$set": update_data, "$setOnInsert": {"created_at": update_data["updated_at"]}},
+                upsert=True,
+            )
+            if runs:
+                ops, run_ids = self._upsert_runs_ops(update_data["session_id"], runs)
+                await db[self.runs_collection_name].bulk_write(ops, ordered=True)
+                self.mark_runs_saved(update_data["session_id"], run_ids)
+
+            if result.acknowledged:
+                return await self.aread(session_id=update_data["session_id"])
+            return None
+        except PyMongoError as e:
+            logger.warning(f"Error upserting session: {e}")
+            return None
+
+    async def adelete_session(self, session_id: Optional[str] = None) -> None:
+        db = self._get_async_db()
+        if db is None or session_id is None:
+            return await super().adelete_session(session_id)
+
+        try:
+            result = await db[self.collection_name].delete_one({"session_id": session_id})
+            if self.stores_runs_separately:
+                await db[self.runs_collection_name].delete_many({"session_id": session_id})
+                self.forget_runs(session_id)
+            if result.deleted_count == 0:
+                log_debug(f"No session found with session_id: {session_id}")
+            else:
+                log_debug(f"Successfully deleted session with session_id: {session_id}")
+        except PyMongoError as e:
+            logger.error(f"Error deleting session: {e}")
+
     def upgrade_schema(self) -> None:
         """Placeholder for schema upgrades"""
         pass
@@ -319,7 +582,7 @@ class MongoDbStorage(Storage):
 
         # Deep copy attributes
         for k, v in self.__dict__.items():
-            if k in {"_client", "db", "collection"}:
+            if k in {"_client", "_async_client", "db", "collection", "runs_collection"}:
                 # Reuse MongoDB connections without copying
                 setattr(copied_obj, k, v)
             else:
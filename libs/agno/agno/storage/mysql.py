@@ -1,7 +1,7 @@
 import time
-from typing import List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional, Sequence
 
-from agno.storage.base import Storage
+from agno.storage.base import FIRST_RUN_FIELD, SessionPage, Storage
 from agno.storage.session import Session
 from agno.storage.session.agent import AgentSession
 from agno.storage.session.team import TeamSession
@@ -13,9 +13,10 @@ try:
     from sqlalchemy.dialects import mysql
     from sqlalchemy.engine import Engine, create_engine
     from sqlalchemy.inspection import inspect
+    from sqlalchemy.orm import Session as SqlSession
     from sqlalchemy.orm import scoped_session, sessionmaker
-    from sqlalchemy.schema import Column, MetaData, Table
-    from sqlalchemy.sql.expression import select, text
+    from sqlalchemy.schema import Column, MetaData, Table, UniqueConstraint
+    from sqlalchemy.sql.expression import and_, func, or_, select, text, type_coerce
     from sqlalchemy.types import JSON, BigInteger, String
 except ImportError:
     raise ImportError("`sqlalchemy` not installed. Please install it using `pip install sqlalchemy pymysql`")
@@ -31,6 +32,7 @@ class MySQLStorage(Storage):
         schema_version: int = 1,
         auto_upgrade_schema: bool = False,
         mode: Optional[Literal["agent", "team", "workflow", "workflow_v2"]] = "agent",
+        incremental: bool = False,
     ):
         """
         This class provides agent storage using a MySQL table.
@@ -48,6 +50,8 @@ class MySQLStorage(Storage):
             schema_version (int): Version of the schema. Defaults to 1.
             auto_upgrade_schema (bool): Whether to automatically upgrade the schema.
             mode (Optional[Literal["agent", "team", "workflow", "workflow_v2"]]): The mode of the storage.
+            incremental (bool): Store runs in an append-only `<table_name>_runs` table instead of the session's
+                memory, so each upsert only writes new runs.
         Raises:
             ValueError: If neither db_url nor db_engine is provided.
         """
@@ -77,6 +81,11 @@ class MySQLStorage(Storage):
         self.Session: scoped_session = scoped_session(sessionmaker(bind=self.db_engine))
         # Database table for storage
         self.table: Table = self.get_table()
+        # Append-only table for runs when incremental is True
+        self.incremental: bool = incremental
+        self.runs_table_name: str = f"{table_name}_runs"
+        self.runs_table: Table = self.get_runs_table()
+        self._runs_table_created: bool = False
         log_debug(f"Created MySQLStorage: '{self.schema}.{self.table_name}'")
 
     @property
@@ -105,7 +114,7 @@ class MySQLStorage(Storage):
             Column("memory", JSON),
             Column("session_data", JSON),
             Column("extra_data", JSON),
-            Column("created_at", BigInteger, server_default=text("UNIX_TIMESTAMP()")),
+            Column("created_at", BigInteger, server_default=text("UNIX_TIMESTAMP()"), index=True),
             Column("updated_at", BigInteger, server_onupdate=text("UNIX_TIMESTAMP()")),
         ]
 
@@ -145,6 +154,27 @@ class MySQLStorage(Storage):
 
         return table
 
+    def get_runs_table(self) -> Table:
+        """
+        Define the append-only runs table used in incremental mode.
+
+        Returns:
+            Table: SQLAlchemy Table object for the runs table.
+        """
+        return Table(
+            self.runs_table_name,
+            self.metadata,
+            Column("id", BigInteger, primary_key=True, autoincrement=True),
+            Column("session_id", String(255), index=True, nullable=False),
+            Column("run_id", String(255), nullable=False),
+            Column("run_data", JSON),
+            Column("created_at", BigInteger, server_default=text("UNIX_TIMESTAMP()")),
+            Column("updated_at", BigInteger, server_onupdate=text("UNIX_TIMESTAMP()")),
+            UniqueConstraint("session_id", "run_id"),
+            extend_existing=True,
+            schema=self.schema,  # type: ignore
+        )
+
     def get_table(self) -> Table:
         """
         Get the table schema based on the schema version.
@@ -260,6 +290,130 @@ class MySQLStorage(Storage):
                 logger.error(f"Could not create table: '{self.table.fullname}': {e}")
                 raise
 
+        if self.stores_runs_separately:
+            self.create_runs_table()
+
+    def create_runs_table(self) -> None:
+        """Create the runs table used in incremental mode if it doesn't exist."""
+        if not self._runs_table_created:
+            log_debug(f"Creating table: {self.runs_table.fullname}")
+            if self.schema is not None:
+                with self.Session() as sess, sess.begin():
+                    sess.execute(text(f"CREATE SCHEMA IF NOT EXISTS `{self.schema}`;"))
+            self.runs_table.create(self.db_engine, checkfirst=True)
+            self._runs_table_created = True
+
+    def _read_runs(
+        self, sess: SqlSession, session_ids: List[str], last_n: Optional[int] = None
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Read the runs of the given sessions from the runs table, in the order they were added.
+
+        With last_n only the last N runs are read.
+        """
+        runs: Dict[str, List[Dict[str, Any]]] = {session_id: [] for session_id in session_ids}
+        if not session_ids:
+            return runs
+        stmt = select(self.runs_table.c.session_id, self.runs_table.c.run_data).where(
+            self.runs_table.c.session_id.in_(session_ids)
+        )
+        if last_n is not None:
+            rows = sess.execute(stmt.order_by(self.runs_table.c.id.desc()).limit(last_n)).fetchall()[::-1]
+        else:
+            rows = sess.execute(stmt.order_by(self.runs_table.c.id)).fetchall()
+        for session_id, run_data in rows:
+            runs[session_id].append(run_data)
+        return runs
+
+    def _list_stmt(
+        self,
+        user_id: Optional[str],
+        entity_id: Optional[str],
+        limit: Optional[int],
+        cursor: Optional[str],
+        fields: Optional[Sequence[str]],
+    ) -> Any:
+        """Projected, keyset paginated select for list_sessions"""
+        columns: List[Any] = []
+        for field in self.get_list_fields(fields):
+            if field == FIRST_RUN_FIELD:
+                # In incremental mode the first runs are read from the runs table
+                if self.stores_runs_separately:
+                    continue
+                if self.mode == "workflow_v2":
+                    if "runs" not in self.table.c:
+                        continue
+                    first_run = func.json_extract(self.table.c.runs, "$[0]")
+                else:
+                    first_run = func.json_extract(self.table.c.memory, "$.runs[0]")
+                columns.append(type_coerce(first_run, JSON).label(FIRST_RUN_FIELD))
+            elif field in self.table.c:
+                columns.append(self.table.c[field])
+            else:
+                raise ValueError(f"Unknown session field: {field}")
+
+        stmt = select(*columns)
+        if user_id is not None:
+            stmt = stmt.where(self.table.c.user_id == user_id)
+        if entity_id is not None:
+            stmt = stmt.where(self.table.c[self.entity_id_field] == entity_id)
+        if cursor is not None:
+            created_at, session_id = self.decode_session_cursor(cursor)
+            stmt = stmt.where(
+                or_(
+                    self.table.c.created_at < created_at,
+                    and_(self.table.c.created_at == created_at, self.table.c.session_id < session_id),
+                )
+            )
+        stmt = stmt.order_by(self.table.c.created_at.desc(), self.table.c.session_id.desc())
+        if limit is not None:
+            # Fetch one extra row to know if there is a next page
+            stmt = stmt.limit(limit + 1)
+        return stmt
+
+    def _read_first_runs(self, sess: SqlSession, session_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Read the first run of each of the given sessions from the runs table"""
+        first_run_ids = (
+            select(func.min(self.runs_table.c.id))
+            .where(self.runs_table.c.session_id.in_(session_ids))
+            .group_by(self.runs_table.c.session_id)
+        )
+        stmt = select(self.runs_table.c.session_id, self.runs_table.c.run_data).where(
+            self.runs_table.c.id.in_(first_run_ids)
+        )
+        return dict(sess.execute(stmt).fetchall())  # type: ignore
+
+    def _rows_to_sessions(self, sess: SqlSession, rows: List[Any], last_n_runs: Optional[int] = None) -> List[Session]:
+        """Convert table rows to sessions, merging in the runs from the runs table in incremental mode"""
+        rows_data: List[Dict[str, Any]] = [dict(row._mapping) for row in rows]
+        if self.stores_runs_separately:
+            self.create_runs_table()
+            runs = self._read_runs(sess, [row["session_id"] for row in rows_data], last_n=last_n_runs)
+            for row in rows_data:
+                row["memory"] = self.merge_runs(row["session_id"], row.get("memory"), runs.get(row["session_id"], []))
+
+        if self.mode == "agent":
+            return [AgentSession.from_dict(row) for row in rows_data]  # type: ignore
+        elif self.mode == "team":
+            return [TeamSession.from_dict(row) for row in rows_data]  # type: ignore
+        elif self.mode == "workflow":
+            return [WorkflowSession.from_dict(row) for row in rows_data]  # type: ignore
+        elif self.mode == "workflow_v2":
+            return [WorkflowSessionV2.from_dict(row) for row in rows_data]  # type: ignore
+        return []
+
+    def _upsert_runs(self, sess: SqlSession, session_id: str, runs: List[Dict[str, Any]]) -> None:
+        """Append new runs to the runs table. Runs that were already stored are updated in place."""
+        if not runs:
+            return
+        run_ids = [self.get_run_id(run) for run in runs]
+        stmt = mysql.insert(self.runs_table).values(
+            [{"session_id": session_id, "run_id": run_id, "run_data": run} for run_id, run in zip(run_ids, runs)]
+        )
+        # See: https://docs.sqlalchemy.org/en/20/dialects/mysql.html#insert-on-duplicate-key-update
+        stmt = stmt.on_duplicate_key_update(run_data=stmt.inserted.run_data, updated_at=int(time.time()))
+        sess.execute(stmt)
+        self.mark_runs_saved(session_id, run_ids)
+
     def read(self, session_id: str, user_id: Optional[str] = None) -> Optional[Session]:
         """
         Read an Session from the database.
@@ -277,14 +431,9 @@ class MySQLStorage(Storage):
                 if user_id:
                     stmt = stmt.where(self.table.c.user_id == user_id)
                 result = sess.execute(stmt).fetchone()
-                if self.mode == "agent":
-                    return AgentSession.from_dict(result._mapping) if result is not None else None
-                elif self.mode == "team":
-                    return TeamSession.from_dict(result._mapping) if result is not None else None
-                elif self.mode == "workflow":
-                    return WorkflowSession.from_dict(result._mapping) if result is not None else None
-                elif self.mode == "workflow_v2":
-                    return WorkflowSessionV2.from_dict(result._mapping) if result is not None else None
+                if result is None:
+                    return None
+                return self._rows_to_sessions(sess, [result])[0]
         except Exception as e:
             if "doesn't exist" in str(e) or "doesn't exist" in str(e):
                 log_debug(f"Table does not exist: {self.table.name}")
@@ -294,6 +443,47 @@ class MySQLStorage(Storage):
                 log_debug(f"Exception reading from table: {e}")
         return None
 
+    def read_projected(
+        self, session_id: str, user_id: Optional[str] = None, last_n_runs: Optional[int] = None
+    ) -> Optional[Session]:
+        """
+        Read a Session with only its last `last_n_runs` runs. Outside incremental mode this is the same as `read`.
+
+        Args:
+            session_id (str): ID of the session to read.
+            user_id (Optional[str]): User ID to filter by. Defaults to None.
+            last_n_runs (Optional[int]): Number of runs to read from the runs table. Defaults to all runs.
+
+        Returns:
+            Optional[Session]: Session object if found, None otherwise.
+        """
+        if last_n_runs is None or not self.stores_runs_separately:
+            return self.read(session_id, user_id)
+
+        try:
+            with self.Session() as sess:
+                stmt = select(self.table).where(self.table.c.session_id == session_id)
+                if user_id:
+                    stmt = stmt.where(self.table.c.user_id == user_id)
+                result = sess.execute(stmt).fetchone()
+                if result is None:
+                    return None
+                return self._rows_to_sessions(sess, [result], last_n_runs=last_n_runs)[0]
+        except Exception as e:
+            log_debug(f"Exception reading projected session, reading the full session: {e}")
+        return self.read(session_id, user_id)
+
+    def read_runs(self, session_id: str, last_n: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Read the runs of a session from the runs table in the order they were added, optionally only the last N"""
+        if not self.stores_runs_separately:
+            return super().read_runs(session_id, last_n)
+
+        self.create_runs_table()
+        with self.Session() as sess:
+            runs = self._read_runs(sess, [session_id], last_n=last_n)[session_id]
+        self.mark_runs_saved(session_id, [self.get_run_id(run) for run in runs])
+        return runs
+
     def get_all_session_ids(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> List[str]:
         """
         Get all session IDs, optionally filtered by user_id and/or entity_id.
@@ -362,17 +552,7 @@ class MySQLStorage(Storage):
                 stmt = stmt.order_by(self.table.c.created_at.desc())
                 # execute query
                 rows = sess.execute(stmt).fetchall()
-                if rows is not None:
-                    if self.mode == "agent":
-                        return [AgentSession.from_dict(row._mapping) for row in rows]  # type: ignore
-                    elif self.mode == "team":
-                        return [TeamSession.from_dict(row._mapping) for row in rows]  # type: ignore
-                    elif self.mode == "workflow":
-                        return [WorkflowSession.from_dict(row._mapping) for row in rows]  # type: ignore
-                    elif self.mode == "workflow_v2":
-                        return [WorkflowSessionV2.from_dict(row._mapping) for row in rows]  # type: ignore[misc]
-                else:
-                    return []
+                return self._rows_to_sessions(sess, rows) if rows is not None else []
         except Exception as e:
             log_debug(f"Exception reading from table: {e}")
             log_debug(f"Table does not exist: {self.table.name}")
@@ -380,6 +560,46 @@ class MySQLStorage(Storage):
             self.create()
         return []
 
+    def list_sessions(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = 20,
+        cursor: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> SessionPage:
+        """
+        List sessions newest first, selecting only the requested fields.
+
+        Args:
+            user_id (Optional[str]): The ID of the user to filter by.
+            entity_id (Optional[str]): The ID of the agent / team / workflow to filter by.
+            limit (Optional[int]): Maximum number of sessions in the page. None returns all sessions.
+            cursor (Optional[str]): The `next_cursor` of the previous page.
+            fields (Optional[Sequence[str]]): Columns to return, "first_run" returns the first run of the session.
+
+        Returns:
+            SessionPage: The sessions as dicts and the cursor for the next page.
+        """
+        stmt = self._list_stmt(user_id, entity_id, limit, cursor, fields)
+        try:
+            with self.Session() as sess, sess.begin():
+                rows = [dict(row._mapping) for row in sess.execute(stmt).fetchall()]
+                if FIRST_RUN_FIELD in self.get_list_fields(fields) and self.stores_runs_separately and rows:
+                    self.create_runs_table()
+                    first_runs = self._read_first_runs(sess, [row["session_id"] for row in rows])
+                    for row in rows:
+                        row[FIRST_RUN_FIELD] = first_runs.get(row["session_id"])
+                return self.to_page(rows, limit, fields)
+        except Exception as e:
+            if "doesn't exist" in str(e):
+                log_debug(f"Table does not exist: {self.table.name}")
+                log_debug("Creating table for future transactions")
+                self.create()
+            else:
+                log_debug(f"Exception reading from table: {e}")
+        return SessionPage(sessions=[])
+
     def get_recent_sessions(
         self,
         user_id: Optional[str] = None,
@@ -421,20 +641,7 @@ class MySQLStorage(Storage):
                 # Execute query
                 rows = sess.execute(stmt).fetchall()
                 if rows is not None:
-                    sessions: List[Session] = []
-                    for row in rows:
-                        session: Optional[Session] = None
-                        if self.mode == "agent":
-                            session = AgentSession.from_dict(row._mapping)  # type: ignore
-                        elif self.mode == "team":
-                            session = TeamSession.from_dict(row._mapping)  # type: ignore
-                        elif self.mode == "workflow":
-                            session = WorkflowSession.from_dict(row._mapping)  # type: ignore
-                        elif self.mode == "workflow_v2":
-                            session = WorkflowSessionV2.from_dict(row._mapping)  # type: ignore
-                        if session is not None:
-                            sessions.append(session)
-                    return sessions
+                    return [session for session in self._rows_to_sessions(sess, rows) if session is not None]
                 return []
 
         except Exception as e:
@@ -446,16 +653,24 @@ class MySQLStorage(Storage):
                 log_debug(f"Exception reading from table: {e}")
             return []
 
+    def _create_created_at_index(self) -> None:
+        """Create the created_at index list_sessions seeks on, for tables created before it was added"""
+        for idx in self.table.indexes:
+            if [column.name for column in idx.columns] == ["created_at"]:
+                idx.create(self.db_engine, checkfirst=True)
+
     def upgrade_schema(self) -> None:
         """
         Upgrade the schema to the latest version.
-        Currently handles adding the team_session_id column for agent mode.
+        Currently handles adding the team_session_id column for agent mode, and the created_at index.
         """
         if not self.auto_upgrade_schema:
             log_debug("Auto schema upgrade disabled. Skipping upgrade.")
             return
 
         try:
+            if self.table_exists():
+                self._create_created_at_index()
             if self.mode == "agent" and self.table_exists():
                 with self.Session() as sess:
                     # Check if team_session_id column exists
@@ -480,6 +695,7 @@ class MySQLStorage(Storage):
                         sess.commit()
                         self._schema_up_to_date = True
                         log_info("Schema upgrade completed successfully")
+            self._schema_up_to_date = True
         except Exception as e:
             logger.error(f"Error during schema upgrade: {e}")
             raise
@@ -499,6 +715,10 @@ class MySQLStorage(Storage):
         if self.auto_upgrade_schema and not self._schema_up_to_date:
             self.upgrade_schema()
 
+        # In incremental mode the runs go to the runs table and the session row only keeps the rest of the memory
+        memory, runs = self.split_runs(session)
+        if runs:
+            self.create_runs_table()
         try:
             with self.Session() as sess, sess.begin():
                 # Create an insert statement
@@ -508,7 +728,7 @@ class MySQLStorage(Storage):
                         agent_id=session.agent_id,  # type: ignore
                         team_session_id=session.team_session_id,  # type: ignore
                         user_id=session.user_id,
-                        memory=getattr(session, "memory", None),
+                        memory=memory,
                         agent_data=session.agent_data,  # type: ignore
                         session_data=session.session_data,
                         extra_data=session.extra_data,
@@ -519,7 +739,7 @@ class MySQLStorage(Storage):
                         agent_id=session.agent_id,  # type: ignore
                         team_session_id=session.team_session_id,  # type: ignore
                         user_id=session.user_id,
-                        memory=getattr(session, "memory", None),
+                        memory=memory,
                         agent_data=session.agent_data,  # type: ignore
                         session_data=session.session_data,
                         extra_data=session.extra_data,
@@ -531,7 +751,7 @@ class MySQLStorage(Storage):
                         team_id=session.team_id,  # type: ignore
                         user_id=session.user_id,
                         team_session_id=session.team_session_id,  # type: ignore
-                        memory=getattr(session, "memory", None),
+                        memory=memory,
                         team_data=session.team_data,  # type: ignore
                         session_data=session.session_data,
                         extra_data=session.extra_data,
@@ -542,7 +762,7 @@ class MySQLStorage(Storage):
                         team_id=session.team_id,  # type: ignore
                         user_id=session.user_id,
                         team_session_id=session.team_session_id,  # type: ignore
-                        memory=getattr(session, "memory", None),
+                        memory=memory,
                         team_data=session.team_data,  # type: ignore
                         session_data=session.session_data,
                         extra_data=session.extra_data,
@@ -553,7 +773,7 @@ class MySQLStorage(Storage):
                         session_id=session.session_id,
                         workflow_id=session.workflow_id,  # type: ignore
                         user_id=session.user_id,
-                        memory=getattr(session, "memory", None),
+                        memory=memory,
                         workflow_data=session.workflow_data,  # type: ignore
                         session_data=session.session_data,
                         extra_data=session.extra_data,
@@ -563,7 +783,7 @@ class MySQLStorage(Storage):
                     stmt = stmt.on_duplicate_key_update(
                         workflow_id=session.workflow_id,  # type: ignore
                         user_id=session.user_id,
-                        memory=getattr(session, "memory", None),
+                        memory=memory,
                         workflow_data=session.workflow_data,  # type: ignore
                         session_data=session.session_data,
                         extra_data=session.extra_data,
@@ -596,6 +816,7 @@ class MySQLStorage(Storage):
                         updated_at=int(time.time()),
                     )
                 sess.execute(stmt)
+                self._upsert_runs(sess, session.session_id, runs)
         except Exception as e:
             if create_and_retry and not self.table_exists():
                 log_debug(f"Table does not exist: {self.table.name}")
@@ -629,6 +850,9 @@ class MySQLStorage(Storage):
                 # Delete the session with the given session_id
                 delete_stmt = self.table.delete().where(self.table.c.session_id == session_id)
                 result = sess.execute(delete_stmt)
+                if self.stores_runs_separately:
+                    sess.execute(self.runs_table.delete().where(self.runs_table.c.session_id == session_id))
+                    self.forget_runs(session_id)
                 if result.rowcount == 0:
                     log_debug(f"No session found with session_id: {session_id}")
                 else:
@@ -644,9 +868,13 @@ class MySQLStorage(Storage):
             log_debug(f"Deleting table: {self.table_name}")
             # Drop with checkfirst=True to avoid errors if the table doesn't exist
             self.table.drop(self.db_engine, checkfirst=True)
+            self.runs_table.drop(self.db_engine, checkfirst=True)
+            self._saved_run_ids.clear()
+            self._runs_table_created = False
             # Clear metadata to ensure indexes are recreated properly
             self.metadata = MetaData(schema=self.schema)
             self.table = self.get_table()
+            self.runs_table = self.get_runs_table()
 
     def __deepcopy__(self, memo):
         """
@@ -667,7 +895,7 @@ class MySQLStorage(Storage):
 
         # Deep copy attributes
         for k, v in self.__dict__.items():
-            if k in {"metadata", "table", "inspector"}:
+            if k in {"metadata", "table", "runs_table", "inspector"}:
                 continue
             # Reuse db_engine and Session without copying
             elif k in {"db_engine", "SqlSession"}:
@@ -679,5 +907,6 @@ class MySQLStorage(Storage):
         copied_obj.metadata = MetaData(schema=copied_obj.schema)
         copied_obj.inspector = inspect(copied_obj.db_engine)
         copied_obj.table = copied_obj.get_table()
+        copied_obj.runs_table = copied_obj.get_runs_table()
 
         return copied_obj
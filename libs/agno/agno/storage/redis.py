@@ -1,10 +1,10 @@
 import json
 import time
 from dataclasses import asdict
-from typing import List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional, Sequence, Tuple, Union, cast
 from uuid import UUID
 
-from agno.storage.base import Storage
+from agno.storage.base import SessionPage, Storage
 from agno.storage.session import Session
 from agno.storage.session.agent import AgentSession
 from agno.storage.session.team import TeamSession
@@ -14,6 +14,7 @@ from agno.utils.log import log_debug, log_info, logger
 
 try:
     from redis import ConnectionError, Redis
+    from redis.asyncio import Redis as AsyncRedis
 except ImportError:
     raise ImportError("`redis` not installed. Please install it using `pip install redis`")
 
@@ -53,7 +54,7 @@ class RedisStorage(Storage):
         super().__init__(mode)
         self.prefix = prefix
         self.expire = expire
-        self.redis_client = Redis(
+        self._connection_kwargs: Dict[str, Any] = dict(
             host=host,
             port=port,
             db=db,
@@ -61,20 +62,95 @@ class RedisStorage(Storage):
             decode_responses=True,  # Automatically decode responses to str
             ssl=ssl,
         )
+        self.redis_client = Redis(**self._connection_kwargs)
+        # Async client used by the async API, created on first use
+        self._async_redis_client: Optional[AsyncRedis] = None
+        # Whether the sessions stored before the list index existed have been indexed
+        self._index_built: bool = False
         log_debug(f"Created RedisStorage with prefix: '{self.prefix}'")
 
     def _get_key(self, session_id: str) -> str:
         """Generate Redis key for a session."""
         return f"{self.prefix}:{session_id}"
 
+    def _index_key(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> str:
+        """Key of the sorted set indexing the sessions of a user and/or entity by created_at, used by list_sessions.
+
+        Index keys don't match the `prefix:*` pattern of the session keys.
+        """
+        return f"{self.prefix}__index:{json.dumps([user_id, entity_id], cls=UUIDEncoder)}"
+
+    def _index_keys(self, data: dict) -> List[str]:
+        """The list indexes a session belongs to: all sessions, its user, its entity and its user and entity"""
+        user_id, entity_id = data.get("user_id"), data.get(self.entity_id_field)
+        keys = [self._index_key(), self._index_key(user_id=user_id), self._index_key(entity_id=entity_id)]
+        keys.append(self._index_key(user_id, entity_id))
+        return list(dict.fromkeys(keys))
+
+    def _index_session(self, pipeline: Any, data: dict) -> None:
+        # nx keeps the score of the first upsert, sessions that don't carry created_at are indexed when first seen
+        score = data.get("created_at") or data.get("updated_at") or int(time.time())
+        for key in self._index_keys(data):
+            pipeline.zadd(key, {str(data["session_id"]): score}, nx=True)
+
+    def _unindex_session(self, pipeline: Any, data: dict) -> None:
+        for key in self._index_keys(data):
+            pipeline.zrem(key, str(data["session_id"]))
+
+    def _build_index(self) -> None:
+        """Index the sessions that were stored before the list index existed, once per prefix"""
+        if self._index_built:
+            return
+        marker = f"{self.prefix}__index:built"
+        if not self.redis_client.exists(marker):
+            log_debug(f"Building the session list index for prefix: '{self.prefix}'")
+            pipeline = self.redis_client.pipeline()
+            for key in self.redis_client.scan_iter(match=f"{self.prefix}:*"):
+                value = self.redis_client.get(key)
+                if value is not None:
+                    self._index_session(pipeline, self.deserialize(value))  # type: ignore
+            pipeline.set(marker, 1)
+            pipeline.execute()
+        self._index_built = True
+
     def serialize(self, data: dict) -> str:
         """Serialize data to JSON string."""
         return json.dumps(data, ensure_ascii=False, cls=UUIDEncoder)
 
-    def deserialize(self, data: str) -> dict:
+    def deserialize(self, data: Union[str, bytes]) -> dict:
         """Deserialize JSON string to dict."""
         return json.loads(data)
 
+    @property
+    def async_redis_client(self) -> AsyncRedis:
+        if self._async_redis_client is None:
+            self._async_redis_client = AsyncRedis(**self._connection_kwargs)
+        return self._async_redis_client
+
+    def _to_session(self, session_data: dict, user_id: Optional[str] = None) -> Optional[Session]:
+        if user_id and session_data.get("user_id") != user_id:
+            return None
+
+        if self.mode == "agent":
+            return AgentSession.from_dict(session_data)
+        elif self.mode == "team":
+            return TeamSession.from_dict(session_data)
+        elif self.mode == "workflow":
+            return WorkflowSession.from_dict(session_data)
+        elif self.mode == "workflow_v2":
+            return WorkflowSessionV2.from_dict(session_data)
+        return None
+
+    def _to_data(self, session: Session) -> dict:
+        if self.mode == "workflow_v2":
+            data = session.to_dict()
+        else:
+            data = asdict(session)
+        data["updated_at"] = int(time.time())
+        if "created_at" not in data:
+            data["created_at"] = data["updated_at"]
+        return data
+
     def create(self) -> None:
         """
         Create storage if it doesn't exist.
@@ -95,19 +171,7 @@ class RedisStorage(Storage):
             if data is None:
                 return None
 
-            session_data = self.deserialize(data)  # type: ignore
-            if user_id and session_data.get("user_id") != user_id:
-                return None
-
-            if self.mode == "agent":
-                return AgentSession.from_dict(session_data)
-            elif self.mode == "team":
-                return TeamSession.from_dict(session_data)
-            elif self.mode == "workflow":
-                return WorkflowSession.from_dict(session_data)
-            elif self.mode == "workflow_v2":
-                return WorkflowSessionV2.from_dict(session_data)
-
+            return self._to_session(self.deserialize(data), user_id)  # type: ignore
         except Exception as e:
             logger.error(f"Error reading session: {e}")
             return None
@@ -286,22 +350,77 @@ class RedisStorage(Storage):
 
         return sessions
 
+    def list_sessions(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = 20,
+        cursor: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> SessionPage:
+        """List sessions newest first.
+
+        The page is read from a sorted set indexing the sessions by created_at, so only the sessions in the page are
+        fetched. Sessions that expired or were deleted are dropped from the index as they are found.
+        """
+        position = self.decode_session_cursor(cursor) if cursor is not None else None
+        try:
+            self._build_index()
+            index_key = self._index_key(user_id, entity_id)
+            batch_size = limit + 1 if limit is not None else 1000
+            rows: List[dict] = []
+            stale: List[str] = []
+            offset = 0
+            while limit is None or len(rows) <= limit:
+                # Members with the same score come in reverse lexicographical order, matching the cursor order
+                entries = self.redis_client.zrevrangebyscore(
+                    index_key,
+                    position[0] if position is not None else "+inf",
+                    "-inf",
+                    start=offset,
+                    num=batch_size,
+                    withscores=True,
+                )
+                if not entries:
+                    break
+                offset += len(entries)
+                page: List[Tuple[str, int]] = [
+                    (session_id, int(score))
+                    for session_id, score in cast(List[Tuple[str, float]], entries)
+                    if position is None or (int(score), session_id) < position
+                ]
+                if not page:
+                    continue
+                values = self.redis_client.mget([self._get_key(session_id) for session_id, _ in page])
+                for (session_id, created_at), value in zip(page, values):  # type: ignore
+                    data = self.deserialize(value) if value is not None else None
+                    if data is None or not self.session_matches(data, user_id, entity_id):
+                        stale.append(session_id)
+                        continue
+                    # The index score is the created_at the cursor seeks on
+                    data["created_at"] = created_at
+                    rows.append(data)
+                    if limit is not None and len(rows) > limit:
+                        break
+            if stale:
+                self.redis_client.zrem(index_key, *stale)
+            return self.to_page(rows, limit, fields)
+        except Exception as e:
+            logger.error(f"Error listing sessions: {e}")
+        return SessionPage(sessions=[])
+
     def upsert(self, session: Session) -> Optional[Session]:
         """Insert or update a Session in Redis."""
         try:
-            if self.mode == "workflow_v2":
-                data = session.to_dict()
-            else:
-                data = asdict(session)
-            data["updated_at"] = int(time.time())
-            if "created_at" not in data:
-                data["created_at"] = data["updated_at"]
-
             key = self._get_key(session.session_id)
+            data = self._to_data(session)
             if self.expire is not None:
                 self.redis_client.set(key, self.serialize(data), ex=self.expire)
             else:
                 self.redis_client.set(key, self.serialize(data))
+            pipeline = self.redis_client.pipeline()
+            self._index_session(pipeline, data)
+            pipeline.execute()
             return session
         except Exception as e:
             logger.error(f"Error upserting session: {e}")
@@ -313,17 +432,69 @@ class RedisStorage(Storage):
             return
         try:
             key = self._get_key(session_id)
+            value = self.redis_client.get(key)
+            if value is not None:
+                pipeline = self.redis_client.pipeline()
+                self._unindex_session(pipeline, self.deserialize(value))  # type: ignore
+                pipeline.execute()
             self.redis_client.delete(key)
             log_debug(f"Deleted session: {session_id}")
         except Exception as e:
             logger.error(f"Error deleting session: {e}")
 
+    async def aread(self, session_id: str, user_id: Optional[str] = None) -> Optional[Session]:
+        """Read a Session from Redis without blocking the event loop."""
+        try:
+            data = await self.async_redis_client.get(self._get_key(session_id))
+            if data is None:
+                return None
+            return self._to_session(self.deserialize(data), user_id)
+        except Exception as e:
+            logger.error(f"Error reading session: {e}")
+            return None
+
+    async def aupsert(self, session: Session) -> Optional[Session]:
+        """Insert or update a Session in Redis without blocking the event loop."""
+        try:
+            key = self._get_key(session.session_id)
+            data = self._to_data(session)
+            if self.expire is not None:
+                await self.async_redis_client.set(key, self.serialize(data), ex=self.expire)
+            else:
+                await self.async_redis_client.set(key, self.serialize(data))
+            pipeline = self.async_redis_client.pipeline()
+            self._index_session(pipeline, data)
+            await pipeline.execute()
+            return session
+        except Exception as e:
+            logger.error(f"Error upserting session: {e}")
+            return None
+
+    async def adelete_session(self, session_id: Optional[str] = None):
+        """Delete a session from Redis without blocking the event loop."""
+        if session_id is None:
+            return
+        try:
+            key = self._get_key(session_id)
+            value = await self.async_redis_client.get(key)
+            if value is not None:
+                pipeline = self.async_redis_client.pipeline()
+                self._unindex_session(pipeline, self.deserialize(value))
+                await pipeline.execute()
+            await self.async_redis_client.delete(key)
+            log_debug(f"Deleted session: {session_id}")
+        except Exception as e:
+            logger.error(f"Error deleting session: {e}")
+
     def drop(self) -> None:
         """Drop all sessions from storage."""
         try:
             pattern = f"{self.prefix}:*"
             for key in self.redis_client.scan_iter(match=pattern):
                 self.redis_client.delete(key)
+            for key in self.redis_client.scan_iter(match=f"{self.prefix}__index:*"):
+                self.redis_client.delete(key)
+            self._index_built = False
             log_info(f"Dropped all sessions with prefix: {self.prefix}")
         except Exception as e:
             logger.error(f"Error dropping sessions: {e}")
@@ -1,8 +1,8 @@
 import time
 from pathlib import Path
-from typing import List, Literal, Optional
+from typing import Any, Callable, Dict, List, Literal, Optional, Sequence, Tuple
 
-from agno.storage.base import Storage
+from agno.storage.base import FIRST_RUN_FIELD, SessionPage, Storage
 from agno.storage.session import Session
 from agno.storage.session.agent import AgentSession
 from agno.storage.session.team import TeamSession
@@ -13,13 +13,14 @@ from agno.utils.log import log_debug, log_info, log_warning, logger
 try:
     from sqlalchemy.dialects import sqlite
     from sqlalchemy.engine import Engine, create_engine
+    from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
     from sqlalchemy.inspection import inspect
     from sqlalchemy.orm import Session as SqlSession
     from sqlalchemy.orm import sessionmaker
-    from sqlalchemy.schema import Column, MetaData, Table
+    from sqlalchemy.schema import Column, MetaData, Table, UniqueConstraint
     from sqlalchemy.sql import text
-    from sqlalchemy.sql.expression import select
-    from sqlalchemy.types import String
+    from sqlalchemy.sql.expression import and_, func, or_, select, type_coerce
+    from sqlalchemy.types import Integer, String
 except ImportError:
     raise ImportError("`sqlalchemy` not installed. Please install it using `pip install sqlalchemy`")
 
@@ -34,6 +35,8 @@ class SqliteStorage(Storage):
         schema_version: int = 1,
         auto_upgrade_schema: bool = False,
         mode: Optional[Literal["agent", "team", "workflow", "workflow_v2"]] = "agent",
+        incremental: bool = False,
+        async_db_engine: Optional[AsyncEngine] = None,
     ):
         """
         This class provides agent storage using a sqlite database.
@@ -49,6 +52,10 @@ class SqliteStorage(Storage):
             db_url: The database URL to connect to.
             db_file: The database file to connect to.
             db_engine: The SQLAlchemy database engine to use.
+            incremental: Store runs in an append-only `<table_name>_runs` table instead of the session's memory,
+                so each upsert only writes new runs.
+            async_db_engine: The SQLAlchemy async engine used by the async API. If not provided, an aiosqlite engine
+                is created for file databases. Without one the async API runs the sync methods in a thread.
         """
         super().__init__(mode)
         _engine: Optional[Engine] = db_engine
@@ -83,6 +90,16 @@ class SqliteStorage(Storage):
         self.SqlSession: sessionmaker[SqlSession] = sessionmaker(bind=self.db_engine)
         # Database table for storage
         self.table: Table = self.get_table()
+        # Append-only table for runs when incremental is True
+        self.incremental: bool = incremental
+        self.runs_table_name: str = f"{table_name}_runs"
+        self.runs_table: Table = self.get_runs_table()
+        self._runs_table_created: bool = False
+
+        # Async engine and session, created on first use of the async API
+        self.async_db_engine: Optional[AsyncEngine] = async_db_engine
+        self.AsyncSqlSession: Optional[async_sessionmaker[AsyncSession]] = None
+        self._async_engine_unavailable: bool = False
 
     @property
     def mode(self) -> Optional[Literal["agent", "team", "workflow", "workflow_v2"]]:
@@ -109,7 +126,7 @@ class SqliteStorage(Storage):
             Column("memory", sqlite.JSON),
             Column("session_data", sqlite.JSON),
             Column("extra_data", sqlite.JSON),
-            Column("created_at", sqlite.INTEGER, default=lambda: int(time.time())),
+            Column("created_at", sqlite.INTEGER, default=lambda: int(time.time()), index=True),
             Column("updated_at", sqlite.INTEGER, onupdate=lambda: int(time.time())),
         ]
 
@@ -153,6 +170,27 @@ class SqliteStorage(Storage):
 
         return table
 
+    def get_runs_table(self) -> Table:
+        """
+        Define the append-only runs table used in incremental mode.
+
+        Returns:
+            Table: SQLAlchemy Table object for the runs table.
+        """
+        return Table(
+            self.runs_table_name,
+            self.metadata,
+            Column("id", Integer, primary_key=True, autoincrement=True),
+            Column("session_id", String, index=True, nullable=False),
+            Column("run_id", String, nullable=False),
+            Column("run_data", sqlite.JSON),
+            Column("created_at", sqlite.INTEGER, default=lambda: int(time.time())),
+            Column("updated_at", sqlite.INTEGER, onupdate=lambda: int(time.time())),
+            UniqueConstraint("session_id", "run_id"),
+            extend_existing=True,
+            sqlite_autoincrement=True,
+        )
+
     def get_table(self) -> Table:
         """
         Get the table schema based on the schema version.
@@ -227,6 +265,136 @@ class SqliteStorage(Storage):
                 logger.error(f"Error creating table: {e}")
                 raise
 
+        if self.stores_runs_separately:
+            self.create_runs_table()
+
+    def create_runs_table(self) -> None:
+        """Create the runs table used in incremental mode if it doesn't exist."""
+        if not self._runs_table_created:
+            log_debug(f"Creating table: {self.runs_table_name}")
+            self.runs_table.create(self.db_engine, checkfirst=True)
+            self._runs_table_created = True
+
+    def _filter_stmt(self, stmt: Any, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> Any:
+        """Apply the user_id / entity_id filters and the created_at ordering to a select statement"""
+        if user_id is not None:
+            stmt = stmt.where(self.table.c.user_id == user_id)
+        if entity_id is not None:
+            if self.mode == "agent":
+                stmt = stmt.where(self.table.c.agent_id == entity_id)
+            elif self.mode == "team":
+                stmt = stmt.where(self.table.c.team_id == entity_id)
+            elif self.mode in ["workflow", "workflow_v2"]:
+                stmt = stmt.where(self.table.c.workflow_id == entity_id)
+        # order by created_at desc
+        return stmt.order_by(self.table.c.created_at.desc())
+
+    def _read_stmt(self, session_id: str, user_id: Optional[str] = None) -> Any:
+        stmt = select(self.table).where(self.table.c.session_id == session_id)
+        if user_id:
+            stmt = stmt.where(self.table.c.user_id == user_id)
+        return stmt
+
+    def _runs_stmt(self, session_ids: List[str], last_n: Optional[int] = None) -> Any:
+        """Select the runs of the given sessions from the runs table, in the order they were added.
+
+        With last_n only the last N runs are selected, newest first.
+        """
+        stmt = select(self.runs_table.c.session_id, self.runs_table.c.run_data).where(
+            self.runs_table.c.session_id.in_(session_ids)
+        )
+        if last_n is not None:
+            return stmt.order_by(self.runs_table.c.id.desc()).limit(last_n)
+        return stmt.order_by(self.runs_table.c.id)
+
+    def _list_stmt(
+        self,
+        user_id: Optional[str],
+        entity_id: Optional[str],
+        limit: Optional[int],
+        cursor: Optional[str],
+        fields: Optional[Sequence[str]],
+    ) -> Any:
+        """Projected, keyset paginated select for list_sessions"""
+        columns: List[Any] = []
+        for field in self.get_list_fields(fields):
+            if field == FIRST_RUN_FIELD:
+                # In incremental mode the first runs are read from the runs table
+                if not self.stores_runs_separately:
+                    if self.mode == "workflow_v2":
+                        first_run = func.json_extract(self.table.c.runs, "$[0]")
+                    else:
+                        first_run = func.json_extract(self.table.c.memory, "$.runs[0]")
+                    columns.append(type_coerce(first_run, sqlite.JSON).label(FIRST_RUN_FIELD))
+            elif field in self.table.c:
+                columns.append(self.table.c[field])
+            else:
+                raise ValueError(f"Unknown session field: {field}")
+
+        stmt = self._filter_stmt(select(*columns), user_id, entity_id).order_by(self.table.c.session_id.desc())
+        if cursor is not None:
+            created_at, session_id = self.decode_session_cursor(cursor)
+            stmt = stmt.where(
+                or_(
+                    self.table.c.created_at < created_at,
+                    and_(self.table.c.created_at == created_at, self.table.c.session_id < session_id),
+                )
+            )
+        if limit is not None:
+            # Fetch one extra row to know if there is a next page
+            stmt = stmt.limit(limit + 1)
+        return stmt
+
+    def _first_runs_stmt(self, session_ids: List[str]) -> Any:
+        """Select the first run of each of the given sessions from the runs table"""
+        first_run_ids = (
+            select(func.min(self.runs_table.c.id))
+            .where(self.runs_table.c.session_id.in_(session_ids))
+            .group_by(self.runs_table.c.session_id)
+        )
+        return select(self.runs_table.c.session_id, self.runs_table.c.run_data).where(
+            self.runs_table.c.id.in_(first_run_ids)
+        )
+
+    def _to_sessions(self, rows_data: List[Dict[str, Any]], run_rows: Optional[Sequence[Any]] = None) -> List[Session]:
+        """Convert table rows to sessions, merging in the runs from the runs table in incremental mode"""
+        if run_rows is not None:
+            runs: Dict[str, List[Dict[str, Any]]] = {row["session_id"]: [] for row in rows_data}
+            for session_id, run_data in run_rows:
+                runs[session_id].append(run_data)
+            for row in rows_data:
+                row["memory"] = self.merge_runs(row["session_id"], row.get("memory"), runs[row["session_id"]])
+
+        if self.mode == "agent":
+            return [AgentSession.from_dict(row) for row in rows_data]  # type: ignore
+        elif self.mode == "team":
+            return [TeamSession.from_dict(row) for row in rows_data]  # type: ignore
+        elif self.mode == "workflow":
+            return [WorkflowSession.from_dict(row) for row in rows_data]  # type: ignore
+        elif self.mode == "workflow_v2":
+            return [WorkflowSessionV2.from_dict(row) for row in rows_data]  # type: ignore
+        return []
+
+    def _rows_to_sessions(self, sess: SqlSession, rows: Sequence[Any]) -> List[Session]:
+        rows_data: List[Dict[str, Any]] = [dict(row._mapping) for row in rows]
+        run_rows = None
+        if self.stores_runs_separately and rows_data:
+            self.create_runs_table()
+            run_rows = sess.execute(self._runs_stmt([row["session_id"] for row in rows_data])).fetchall()
+        return self._to_sessions(rows_data, run_rows)
+
+    def _upsert_runs_stmt(self, session_id: str, runs: List[Dict[str, Any]]) -> Tuple[Any, List[str]]:
+        """Statement that appends new runs to the runs table and updates runs that were already stored"""
+        run_ids = [self.get_run_id(run) for run in runs]
+        stmt = sqlite.insert(self.runs_table).values(
+            [{"session_id": session_id, "run_id": run_id, "run_data": run} for run_id, run in zip(run_ids, runs)]
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["session_id", "run_id"],
+            set_=dict(run_data=stmt.excluded.run_data, updated_at=int(time.time())),
+        )
+        return stmt, run_ids
+
     def read(self, session_id: str, user_id: Optional[str] = None) -> Optional[Session]:
         """
         Read a Session from the database.
@@ -240,18 +408,10 @@ class SqliteStorage(Storage):
         """
         try:
             with self.SqlSession() as sess:
-                stmt = select(self.table).where(self.table.c.session_id == session_id)
-                if user_id:
-                    stmt = stmt.where(self.table.c.user_id == user_id)
-                result = sess.execute(stmt).fetchone()
-                if self.mode == "agent":
-                    return AgentSession.from_dict(result._mapping) if result is not None else None  # type: ignore
-                elif self.mode == "team":
-                    return TeamSession.from_dict(result._mapping) if result is not None else None  # type: ignore
-                elif self.mode == "workflow":
-                    return WorkflowSession.from_dict(result._mapping) if result is not None else None  # type: ignore
-                elif self.mode == "workflow_v2":
-                    return WorkflowSessionV2.from_dict(result._mapping) if result is not None else None  # type: ignore
+                result = sess.execute(self._read_stmt(session_id, user_id)).fetchone()
+                if result is None:
+                    return None
+                return self._rows_to_sessions(sess, [result])[0]
         except Exception as e:
             if "no such table" in str(e):
                 log_debug(f"Table does not exist: {self.table.name}")
@@ -260,6 +420,47 @@ class SqliteStorage(Storage):
                 log_debug(f"Exception reading from table: {e}")
         return None
 
+    def read_projected(
+        self, session_id: str, user_id: Optional[str] = None, last_n_runs: Optional[int] = None
+    ) -> Optional[Session]:
+        """
+        Read a Session with only its last `last_n_runs` runs. Outside incremental mode this is the same as `read`.
+
+        Args:
+            session_id (str): ID of the session to read.
+            user_id (Optional[str]): User ID to filter by. Defaults to None.
+            last_n_runs (Optional[int]): Number of runs to read from the runs table. Defaults to all runs.
+
+        Returns:
+            Optional[Session]: Session object if found, None otherwise.
+        """
+        if last_n_runs is None or not self.stores_runs_separately:
+            return self.read(session_id, user_id)
+
+        try:
+            with self.SqlSession() as sess:
+                result = sess.execute(self._read_stmt(session_id, user_id)).fetchone()
+                if result is None:
+                    return None
+                self.create_runs_table()
+                run_rows = sess.execute(self._runs_stmt([session_id], last_n=last_n_runs)).fetchall()
+                return self._to_sessions([dict(result._mapping)], run_rows[::-1])[0]
+        except Exception as e:
+            log_debug(f"Exception reading projected session, reading the full session: {e}")
+        return self.read(session_id, user_id)
+
+    def read_runs(self, session_id: str, last_n: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Read the runs of a session from the runs table in the order they were added, optionally only the last N"""
+        if not self.stores_runs_separately:
+            return super().read_runs(session_id, last_n)
+
+        self.create_runs_table()
+        with self.SqlSession() as sess:
+            run_rows = sess.execute(self._runs_stmt([session_id], last_n=last_n)).fetchall()
+        runs = [run_data for _, run_data in (run_rows[::-1] if last_n is not None else run_rows)]
+        self.mark_runs_saved(session_id, [self.get_run_id(run) for run in runs])
+        return runs
+
     def get_all_session_ids(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> List[str]:
         """
         Get all session IDs, optionally filtered by user_id and/or entity_id.
@@ -274,20 +475,7 @@ class SqliteStorage(Storage):
         try:
             with self.SqlSession() as sess, sess.begin():
                 # get all session_ids
-                stmt = select(self.table.c.session_id)
-                if user_id is not None:
-                    stmt = stmt.where(self.table.c.user_id == user_id)
-                if entity_id is not None:
-                    if self.mode == "agent":
-                        stmt = stmt.where(self.table.c.agent_id == entity_id)
-                    elif self.mode == "team":
-                        stmt = stmt.where(self.table.c.team_id == entity_id)
-                    elif self.mode == "workflow":
-                        stmt = stmt.where(self.table.c.workflow_id == entity_id)
-                    elif self.mode == "workflow_v2":
-                        stmt = stmt.where(self.table.c.workflow_id == entity_id)
-                # order by created_at desc
-                stmt = stmt.order_by(self.table.c.created_at.desc())
+                stmt = self._filter_stmt(select(self.table.c.session_id), user_id, entity_id)
                 # execute query
                 rows = sess.execute(stmt).fetchall()
                 return [row[0] for row in rows] if rows is not None else []
@@ -313,31 +501,9 @@ class SqliteStorage(Storage):
         try:
             with self.SqlSession() as sess, sess.begin():
                 # get all sessions
-                stmt = select(self.table)
-                if user_id is not None:
-                    stmt = stmt.where(self.table.c.user_id == user_id)
-                if entity_id is not None:
-                    if self.mode == "agent":
-                        stmt = stmt.where(self.table.c.agent_id == entity_id)
-                    elif self.mode == "team":
-                        stmt = stmt.where(self.table.c.team_id == entity_id)
-                    elif self.mode in ["workflow", "workflow_v2"]:
-                        stmt = stmt.where(self.table.c.workflow_id == entity_id)
-                # order by created_at desc
-                stmt = stmt.order_by(self.table.c.created_at.desc())
-
+                stmt = self._filter_stmt(select(self.table), user_id, entity_id)
                 rows = sess.execute(stmt).fetchall()
-                if rows is not None:
-                    if self.mode == "agent":
-                        return [AgentSession.from_dict(row._mapping) for row in rows]  # type: ignore
-                    elif self.mode == "team":
-                        return [TeamSession.from_dict(row._mapping) for row in rows]  # type: ignore
-                    elif self.mode == "workflow":
-                        return [WorkflowSession.from_dict(row._mapping) for row in rows]  # type: ignore
-                    elif self.mode == "workflow_v2":
-                        return [WorkflowSessionV2.from_dict(row._mapping) for row in rows]  # type: ignore
-                else:
-                    return []
+                return self._rows_to_sessions(sess, rows) if rows is not None else []
         except Exception as e:
             if "no such table" in str(e):
                 log_debug(f"Table does not exist: {self.table.name}")
@@ -346,6 +512,47 @@ class SqliteStorage(Storage):
                 log_debug(f"Exception reading from table: {e}")
         return []
 
+    def list_sessions(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = 20,
+        cursor: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> SessionPage:
+        """
+        List sessions newest first, selecting only the requested fields.
+
+        Args:
+            user_id (Optional[str]): The ID of the user to filter by.
+            entity_id (Optional[str]): The ID of the agent / team / workflow to filter by.
+            limit (Optional[int]): Maximum number of sessions in the page. None returns all sessions.
+            cursor (Optional[str]): The `next_cursor` of the previous page.
+            fields (Optional[Sequence[str]]): Columns to return, "first_run" returns the first run of the session.
+
+        Returns:
+            SessionPage: The sessions as dicts and the cursor for the next page.
+        """
+        stmt = self._list_stmt(user_id, entity_id, limit, cursor, fields)
+        try:
+            with self.SqlSession() as sess, sess.begin():
+                rows = [dict(row._mapping) for row in sess.execute(stmt).fetchall()]
+                if FIRST_RUN_FIELD in self.get_list_fields(fields) and self.stores_runs_separately and rows:
+                    self.create_runs_table()
+                    first_runs = dict(
+                        sess.execute(self._first_runs_stmt([row["session_id"] for row in rows])).fetchall()
+                    )
+                    for row in rows:
+                        row[FIRST_RUN_FIELD] = first_runs.get(row["session_id"])
+                return self.to_page(rows, limit, fields)
+        except Exception as e:
+            if "no such table" in str(e):
+                log_debug(f"Table does not exist: {self.table.name}")
+                self.create()
+            else:
+                log_debug(f"Exception reading from table: {e}")
+        return SessionPage(sessions=[])
+
     def get_recent_sessions(
         self,
         user_id: Optional[str] = None,
@@ -365,35 +572,14 @@ class SqliteStorage(Storage):
         """
         try:
             with self.SqlSession() as sess, sess.begin():
-                # Build the query
-                stmt = select(self.table)
-                if user_id is not None:
-                    stmt = stmt.where(self.table.c.user_id == user_id)
-                if entity_id is not None:
-                    if self.mode == "agent":
-                        stmt = stmt.where(self.table.c.agent_id == entity_id)
-                    elif self.mode == "team":
-                        stmt = stmt.where(self.table.c.team_id == entity_id)
-                    elif self.mode in ["workflow", "workflow_v2"]:
-                        stmt = stmt.where(self.table.c.workflow_id == entity_id)
-
-                # Order by created_at desc and limit to num_history_sessions
-                stmt = stmt.order_by(self.table.c.created_at.desc())
+                # Build the query, ordered by created_at desc and limited to num_history_sessions
+                stmt = self._filter_stmt(select(self.table), user_id, entity_id)
                 if limit is not None:
                     stmt = stmt.limit(limit)
 
                 # Execute query
                 rows = sess.execute(stmt).fetchall()
-                if rows is not None:
-                    if self.mode == "agent":  # type: ignore
-                        return [AgentSession.from_dict(row._mapping) for row in rows]  # type: ignore
-                    elif self.mode == "team":
-                        return [TeamSession.from_dict(row._mapping) for row in rows]  # type: ignore
-                    elif self.mode == "workflow":
-                        return [WorkflowSession.from_dict(row._mapping) for row in rows]  # type: ignore
-                    elif self.mode == "workflow_v2":
-                        return [WorkflowSessionV2.from_dict(row._mapping) for row in rows]  # type: ignore
-                return []
+                return self._rows_to_sessions(sess, rows) if rows is not None else []
         except Exception as e:
             if "no such table" in str(e):
                 log_debug(f"Table does not exist: {self.table.name}")
@@ -402,16 +588,24 @@ class SqliteStorage(Storage):
                 log_debug(f"Exception reading from table: {e}")
         return []
 
+    def _create_created_at_index(self) -> None:
+        """Create the created_at index list_sessions seeks on, for tables created before it was added"""
+        for idx in self.table.indexes:
+            if [column.name for column in idx.columns] == ["created_at"]:
+                idx.create(self.db_engine, checkfirst=True)
+
     def upgrade_schema(self) -> None:
         """
         Upgrade the schema of the storage table.
-        Currently handles adding the team_session_id column for agent mode.
+        Currently handles adding the team_session_id column for agent mode, and the created_at index.
         """
         if not self.auto_upgrade_schema:
             log_debug("Auto schema upgrade disabled. Skipping upgrade.")
             return
 
         try:
+            if self.table_exists():
+                self._create_created_at_index()
             if self.mode == "agent" and self.table_exists():
                 with self.SqlSession() as sess:
                     # Check if team_session_id column exists using SQLite PRAGMA
@@ -426,10 +620,126 @@ class SqliteStorage(Storage):
                         sess.commit()
                         self._schema_up_to_date = True
                         log_info("Schema upgrade completed successfully")
+            self._schema_up_to_date = True
         except Exception as e:
             logger.error(f"Error during schema upgrade: {e}")
             raise
 
+    def _upsert_stmt(self, session: Session, memory: Optional[Dict[str, Any]]) -> Any:
+        """Insert-or-update statement for a session row"""
+        if self.mode == "agent":
+            # Create an insert statement
+            stmt = sqlite.insert(self.table).values(
+                session_id=session.session_id,
+                agent_id=session.agent_id,  # type: ignore
+                team_session_id=session.team_session_id,  # type: ignore
+                user_id=session.user_id,
+                memory=memory,
+                agent_data=session.agent_data,  # type: ignore
+                session_data=session.session_data,
+                extra_data=session.extra_data,
+            )
+
+            # Define the upsert if the session_id already exists
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["session_id"],
+                set_=dict(
+                    agent_id=session.agent_id,  # type: ignore
+                    team_session_id=session.team_session_id,  # type: ignore
+                    user_id=session.user_id,
+                    memory=memory,
+                    agent_data=session.agent_data,  # type: ignore
+                    session_data=session.session_data,
+                    extra_data=session.extra_data,
+                    updated_at=int(time.time()),
+                ),
+            )
+        elif self.mode == "team":
+            # Create an insert statement
+            stmt = sqlite.insert(self.table).values(
+                session_id=session.session_id,
+                team_id=session.team_id,  # type: ignore
+                user_id=session.user_id,
+                team_session_id=session.team_session_id,  # type: ignore
+                memory=memory,
+                team_data=session.team_data,  # type: ignore
+                session_data=session.session_data,
+                extra_data=session.extra_data,
+            )
+
+            # Define the upsert if the session_id already exists
+            # See: https://docs.sqlalchemy.org/en/20/dialects/sqlite.html#insert-on-conflict-upsert
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["session_id"],
+                set_=dict(
+                    team_id=session.team_id,  # type: ignore
+                    user_id=session.user_id,
+                    team_session_id=session.team_session_id,  # type: ignore
+                    memory=memory,
+                    team_data=session.team_data,  # type: ignore
+                    session_data=session.session_data,
+                    extra_data=session.extra_data,
+                    updated_at=int(time.time()),
+                ),
+            )
+        elif self.mode == "workflow":
+            # Create an insert statement
+            stmt = sqlite.insert(self.table).values(
+                session_id=session.session_id,
+                workflow_id=session.workflow_id,  # type: ignore
+                user_id=session.user_id,
+                memory=memory,
+                workflow_data=session.workflow_data,  # type: ignore
+                session_data=session.session_data,
+                extra_data=session.extra_data,
+            )
+
+            # Define the upsert if the session_id already exists
+            # See: https://docs.sqlalchemy.org/en/20/dialects/sqlite.html#insert-on-conflict-upsert
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["session_id"],
+                set_=dict(
+                    workflow_id=session.workflow_id,  # type: ignore
+                    user_id=session.user_id,
+                    memory=memory,
+                    workflow_data=session.workflow_data,  # type: ignore
+                    session_data=session.session_data,
+                    extra_data=session.extra_data,
+                    updated_at=int(time.time()),
+                ),
+            )
+        elif self.mode == "workflow_v2":
+            # Convert session to dict to ensure proper serialization
+            session_dict = session.to_dict()
+
+            # Create an insert statement for WorkflowSessionV2
+            stmt = sqlite.insert(self.table).values(
+                session_id=session.session_id,
+                workflow_id=session.workflow_id,  # type: ignore
+                workflow_name=session.workflow_name,  # type: ignore
+                user_id=session.user_id,
+                runs=session_dict.get("runs"),
+                workflow_data=session.workflow_data,  # type: ignore
+                session_data=session.session_data,
+                extra_data=session.extra_data,
+            )
+
+            # Define the upsert if the session_id already exists
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["session_id"],
+                set_=dict(
+                    workflow_id=session.workflow_id,  # type: ignore
+                    workflow_name=session.workflow_name,  # type: ignore
+                    user_id=session.user_id,
+                    runs=session_dict.get("runs"),
+                    workflow_data=session.workflow_data,  # type: ignore
+                    session_data=session.session_data,
+                    extra_data=session.extra_data,
+                    updated_at=int(time.time()),
+                ),
+            )
+        return stmt
+
     def upsert(self, session: Session, create_and_retry: bool = True) -> Optional[Session]:
         """
         Insert or update a Session in the database.
@@ -445,121 +755,17 @@ class SqliteStorage(Storage):
         if self.auto_upgrade_schema and not self._schema_up_to_date:
             self.upgrade_schema()
 
+        # In incremental mode the runs go to the runs table and the session row only keeps the rest of the memory
+        memory, runs = self.split_runs(session)
+        if runs:
+            self.create_runs_table()
         try:
             with self.SqlSession() as sess, sess.begin():
-                if self.mode == "agent":
-                    # Create an insert statement
-                    stmt = sqlite.insert(self.table).values(
-                        session_id=session.session_id,
-                        agent_id=session.agent_id,  # type: ignore
-                        team_session_id=session.team_session_id,  # type: ignore
-                        user_id=session.user_id,
-                        memory=getattr(session, "memory", None),
-                        agent_data=session.agent_data,  # type: ignore
-                        session_data=session.session_data,
-                        extra_data=session.extra_data,
-                    )
-
-                    # Define the upsert if the session_id already exists
-                    stmt = stmt.on_conflict_do_update(
-                        index_elements=["session_id"],
-                        set_=dict(
-                            agent_id=session.agent_id,  # type: ignore
-                            team_session_id=session.team_session_id,  # type: ignore
-                            user_id=session.user_id,
-                            memory=getattr(session, "memory", None),
-                            agent_data=session.agent_data,  # type: ignore
-                            session_data=session.session_data,
-                            extra_data=session.extra_data,
-                            updated_at=int(time.time()),
-                        ),
-                    )
-                elif self.mode == "team":
-                    # Create an insert statement
-                    stmt = sqlite.insert(self.table).values(
-                        session_id=session.session_id,
-                        team_id=session.team_id,  # type: ignore
-                        user_id=session.user_id,
-                        team_session_id=session.team_session_id,  # type: ignore
-                        memory=getattr(session, "memory", None),
-                        team_data=session.team_data,  # type: ignore
-                        session_data=session.session_data,
-                        extra_data=session.extra_data,
-                    )
-
-                    # Define the upsert if the session_id already exists
-                    # See: https://docs.sqlalchemy.org/en/20/dialects/sqlite.html#insert-on-conflict-upsert
-                    stmt = stmt.on_conflict_do_update(
-                        index_elements=["session_id"],
-                        set_=dict(
-                            team_id=session.team_id,  # type: ignore
-                            user_id=session.user_id,
-                            team_session_id=session.team_session_id,  # type: ignore
-                            memory=getattr(session, "memory", None),
-                            team_data=session.team_data,  # type: ignore
-                            session_data=session.session_data,
-                            extra_data=session.extra_data,
-                            updated_at=int(time.time()),
-                        ),
-                    )
-                elif self.mode == "workflow":
-                    # Create an insert statement
-                    stmt = sqlite.insert(self.table).values(
-                        session_id=session.session_id,
-                        workflow_id=session.workflow_id,  # type: ignore
-                        user_id=session.user_id,
-                        memory=getattr(session, "memory", None),
-                        workflow_data=session.workflow_data,  # type: ignore
-                        session_data=session.session_data,
-                        extra_data=session.extra_data,
-                    )
-
-                    # Define the upsert if the session_id already exists
-                    # See: https://docs.sqlalchemy.org/en/20/dialects/sqlite.html#insert-on-conflict-upsert
-                    stmt = stmt.on_conflict_do_update(
-                        index_elements=["session_id"],
-                        set_=dict(
-                            workflow_id=session.workflow_id,  # type: ignore
-                            user_id=session.user_id,
-                            memory=getattr(session, "memory", None),
-                            workflow_data=session.workflow_data,  # type: ignore
-                            session_data=session.session_data,
-                            extra_data=session.extra_data,
-                            updated_at=int(time.time()),
-                        ),
-                    )
-                elif self.mode == "workflow_v2":
-                    # Convert session to dict to ensure proper serialization
-                    session_dict = session.to_dict()
-
-                    # Create an insert statement for WorkflowSessionV2
-                    stmt = sqlite.insert(self.table).values(
-                        session_id=session.session_id,
-                        workflow_id=session.workflow_id,  # type: ignore
-                        workflow_name=session.workflow_name,  # type: ignore
-                        user_id=session.user_id,
-                        runs=session_dict.get("runs"),
-                        workflow_data=session.workflow_data,  # type: ignore
-                        session_data=session.session_data,
-                        extra_data=session.extra_data,
-                    )
-
-                    # Define the upsert if the session_id already exists
-                    stmt = stmt.on_conflict_do_update(
-                        index_elements=["session_id"],
-                        set_=dict(
-                            workflow_id=session.workflow_id,  # type: ignore
-                            workflow_name=session.workflow_name,  # type: ignore
-                            user_id=session.user_id,
-                            runs=session_dict.get("runs"),
-                            workflow_data=session.workflow_data,  # type: ignore
-                            session_data=session.session_data,
-                            extra_data=session.extra_data,
-                            updated_at=int(time.time()),
-                        ),
-                    )
-
-                sess.execute(stmt)
+                sess.execute(self._upsert_stmt(session, memory))
+                if runs:
+                    runs_stmt, run_ids = self._upsert_runs_stmt(session.session_id, runs)
+                    sess.execute(runs_stmt)
+                    self.mark_runs_saved(session.session_id, run_ids)
         except Exception as e:
             if create_and_retry and not self.table_exists():
                 log_debug(f"Table does not exist: {self.table.name}")
@@ -593,6 +799,9 @@ class SqliteStorage(Storage):
                 # Delete the session with the given session_id
                 delete_stmt = self.table.delete().where(self.table.c.session_id == session_id)
                 result = sess.execute(delete_stmt)
+                if self.stores_runs_separately:
+                    sess.execute(self.runs_table.delete().where(self.runs_table.c.session_id == session_id))
+                    self.forget_runs(session_id)
                 if result.rowcount == 0:
                     log_debug(f"No session found with session_id: {session_id}")
                 else:
@@ -608,9 +817,176 @@ class SqliteStorage(Storage):
             log_debug(f"Deleting table: {self.table_name}")
             # Drop with checkfirst=True to avoid errors if the table doesn't exist
             self.table.drop(self.db_engine, checkfirst=True)
+            self.runs_table.drop(self.db_engine, checkfirst=True)
+            self._saved_run_ids.clear()
+            self._runs_table_created = False
             # Clear metadata to ensure indexes are recreated properly
             self.metadata = MetaData()
             self.table = self.get_table()
+            self.runs_table = self.get_runs_table()
+
+    @property
+    def in_memory(self) -> bool:
+        return self.db_engine.url.database in (None, "", ":memory:")
+
+    async def run_sync(self, func: Callable[..., Any], *args: Any) -> Any:
+        # SQLite keeps one connection per thread for in-memory databases, so a worker thread would see an empty
+        # database. In-memory calls don't block on IO, run them inline.
+        if self.in_memory:
+            return func(*args)
+        return await super().run_sync(func, *args)
+
+    def _get_async_session(self) -> Optional[async_sessionmaker[AsyncSession]]:
+        """Return the async session factory, creating an aiosqlite engine on first use.
+
+        Returns None if no async engine is available, in which case the async API falls back to threads.
+        """
+        if self.AsyncSqlSession is not None or self._async_engine_unavailable:
+            return self.AsyncSqlSession
+
+        if self.async_db_engine is None:
+            if self.in_memory:
+                # An in-memory database is private to its engine, so it can't be shared with an async engine
+                self._async_engine_unavailable = True
+                return None
+            url = self.db_engine.url
+            try:
+                self.async_db_engine = create_async_engine(url.set(drivername="sqlite+aiosqlite"))
+            except Exception as e:
+                log_debug(f"Async engine not available, falling back to threads: {e}")
+                self._async_engine_unavailable = True
+                return None
+        self.AsyncSqlSession = async_sessionmaker(bind=self.async_db_engine)
+        return self.AsyncSqlSession
+
+    async def _arows_to_sessions(self, sess: AsyncSession, rows: Sequence[Any]) -> List[Session]:
+        rows_data: List[Dict[str, Any]] = [dict(row._mapping) for row in rows]
+        run_rows = None
+        if self.stores_runs_separately and rows_data:
+            if not self._runs_table_created:
+                await self.run_sync(self.create_runs_table)
+            run_rows = (await sess.execute(self._runs_stmt([row["session_id"] for row in rows_data]))).fetchall()
+        return self._to_sessions(rows_data, run_rows)
+
+    async def aread(self, session_id: str, user_id: Optional[str] = None) -> Optional[Session]:
+        """
+        Read a Session from the database without blocking the event loop.
+
+        Args:
+            session_id (str): ID of the session to read.
+            user_id (Optional[str]): User ID to filter by. Defaults to None.
+
+        Returns:
+            Optional[Session]: Session object if found, None otherwise.
+        """
+        AsyncSqlSession = self._get_async_session()
+        if AsyncSqlSession is None:
+            return await super().aread(session_id, user_id)
+
+        try:
+            async with AsyncSqlSession() as sess:
+                result = (await sess.execute(self._read_stmt(session_id, user_id))).fetchone()
+                if result is None:
+                    return None
+                return (await self._arows_to_sessions(sess, [result]))[0]
+        except Exception as e:
+            if "no such table" in str(e):
+                log_debug(f"Table does not exist: {self.table.name}")
+                await self.run_sync(self.create)
+            else:
+                log_debug(f"Exception reading from table: {e}")
+        return None
+
+    async def aget_all_session_ids(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> List[str]:
+        AsyncSqlSession = self._get_async_session()
+        if AsyncSqlSession is None:
+            return await super().aget_all_session_ids(user_id, entity_id)
+
+        try:
+            async with AsyncSqlSession() as sess:
+                stmt = self._filter_stmt(select(self.table.c.session_id), user_id, entity_id)
+                rows = (await sess.execute(stmt)).fetchall()
+                return [row[0] for row in rows]
+        except Exception as e:
+            log_debug(f"Exception reading from table: {e}")
+        return []
+
+    async def aget_all_sessions(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> List[Session]:
+        return await self.aget_recent_sessions(user_id=user_id, entity_id=entity_id, limit=None)
+
+    async def aget_recent_sessions(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = 2,
+    ) -> List[Session]:
+        AsyncSqlSession = self._get_async_session()
+        if AsyncSqlSession is None:
+            return await super().aget_recent_sessions(user_id, entity_id, limit)
+
+        try:
+            async with AsyncSqlSession() as sess:
+                stmt = self._filter_stmt(select(self.table), user_id, entity_id)
+                if limit is not None:
+                    stmt = stmt.limit(limit)
+                rows = (await sess.execute(stmt)).fetchall()
+                return await self._arows_to_sessions(sess, rows)
+        except Exception as e:
+            log_debug(f"Exception reading from table: {e}")
+        return []
+
+    async def aupsert(self, session: Session, create_and_retry: bool = True) -> Optional[Session]:
+        """
+        Insert or update a Session in the database without blocking the event loop.
+
+        Args:
+            session (Session): The session data to upsert.
+            create_and_retry (bool): Retry upsert if table does not exist.
+
+        Returns:
+            Optional[Session]: The upserted Session, or None if operation failed.
+        """
+        AsyncSqlSession = self._get_async_session()
+        if AsyncSqlSession is None:
+            return await super().aupsert(session)
+
+        if self.auto_upgrade_schema and not self._schema_up_to_date:
+            await self.run_sync(self.upgrade_schema)
+
+        memory, runs = self.split_runs(session)
+        if runs and not self._runs_table_created:
+            await self.run_sync(self.create_runs_table)
+        try:
+            async with AsyncSqlSession() as sess, sess.begin():
+                await sess.execute(self._upsert_stmt(session, memory))
+                if runs:
+                    runs_stmt, run_ids = self._upsert_runs_stmt(session.session_id, runs)
+                    await sess.execute(runs_stmt)
+                    self.mark_runs_saved(session.session_id, run_ids)
+        except Exception as e:
+            if create_and_retry and not await self.run_sync(self.table_exists):
+                log_debug(f"Table does not exist: {self.table.name}")
+                log_debug("Creating table and retrying upsert")
+                await self.run_sync(self.create)
+                return await self.aupsert(session, create_and_retry=False)
+            log_warning(f"Exception upserting into table: {e}")
+            return None
+        return await self.aread(session_id=session.session_id)
+
+    async def adelete_session(self, session_id: Optional[str] = None):
+        AsyncSqlSession = self._get_async_session()
+        if AsyncSqlSession is None or session_id is None:
+            return await super().adelete_session(session_id)
+
+        try:
+            async with AsyncSqlSession() as sess, sess.begin():
+                await sess.execute(self.table.delete().where(self.table.c.session_id == session_id))
+                if self.stores_runs_separately:
+                    await sess.execute(self.runs_table.delete().where(self.runs_table.c.session_id == session_id))
+                    self.forget_runs(session_id)
+            log_debug(f"Successfully deleted session with session_id: {session_id}")
+        except Exception as e:
+            logger.error(f"Error deleting session: {e}")
 
     def __deepcopy__(self, memo):
         """
@@ -631,10 +1007,10 @@ class SqliteStorage(Storage):
 
         # Deep copy attributes
         for k, v in self.__dict__.items():
-            if k in {"metadata", "table", "inspector"}:
+            if k in {"metadata", "table", "runs_table", "inspector"}:
                 continue
             # Reuse db_engine and Session without copying
-            elif k in {"db_engine", "SqlSession"}:
+            elif k in {"db_engine", "SqlSession", "async_db_engine", "AsyncSqlSession"}:
                 setattr(copied_obj, k, v)
             else:
                 setattr(copied_obj, k, deepcopy(v, memo))
@@ -643,5 +1019,6 @@ class SqliteStorage(Storage):
         copied_obj.metadata = MetaData()
         copied_obj.inspector = inspect(copied_obj.db_engine)
         copied_obj.table = copied_obj.get_table()
+        copied_obj.runs_table = copied_obj.get_runs_table()
 
         return copied_obj
@@ -1,11 +1,11 @@
 import time
 from dataclasses import asdict
 from pathlib import Path
-from typing import List, Literal, Optional, Union
+from typing import Any, Dict, List, Literal, Optional, Sequence, Tuple, Union
 
 import yaml
 
-from agno.storage.base import Storage
+from agno.storage.base import FIRST_RUN_FIELD, SessionPage, Storage
 from agno.storage.session import Session
 from agno.storage.session.agent import AgentSession
 from agno.storage.session.team import TeamSession
@@ -21,6 +21,8 @@ class YamlStorage(Storage):
         super().__init__(mode)
         self.dir_path = Path(dir_path)
         self.dir_path.mkdir(parents=True, exist_ok=True)
+        # Listing rows of the session files for list_sessions, keyed by path and validated by the file's mtime and size
+        self._list_rows: Dict[Path, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
 
     def serialize(self, data: dict) -> str:
         return yaml.dump(data, default_flow_style=False)
@@ -138,6 +140,47 @@ class YamlStorage(Storage):
                         sessions.append(_session)
         return sessions
 
+    def list_sessions(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = 20,
+        cursor: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> SessionPage:
+        """List sessions newest first.
+
+        Only the session files that changed since the last listing are parsed, the listing fields of the others
+        (everything except memory and runs) are kept in memory.
+        """
+        load_runs = any(field in ("memory", "runs") for field in self.get_list_fields(fields))
+        rows: List[Dict[str, Any]] = []
+        files = set()
+        for file in self.dir_path.glob("*.yaml"):
+            try:
+                stat = file.stat()
+            except FileNotFoundError:
+                continue
+            files.add(file)
+            version = (stat.st_mtime_ns, stat.st_size)
+            cached = self._list_rows.get(file)
+            if cached is not None and cached[0] == version and not load_runs:
+                row = cached[1]
+            else:
+                with open(file, "r", encoding="utf-8") as f:
+                    data = self.deserialize(f.read())
+                row = {key: value for key, value in data.items() if key not in ("memory", "runs")}
+                row[FIRST_RUN_FIELD] = self.get_first_run(data)
+                self._list_rows[file] = (version, row)
+                if load_runs:
+                    row = {**data, FIRST_RUN_FIELD: row[FIRST_RUN_FIELD]}
+            if self.session_matches(row, user_id, entity_id):
+                rows.append(row)
+        # Forget the files that were deleted
+        for file in set(self._list_rows) - files:
+            del self._list_rows[file]
+        return self.page_sessions(rows, limit=limit, cursor=cursor, fields=fields)
+
     def get_recent_sessions(
         self,
         user_id: Optional[str] = None,
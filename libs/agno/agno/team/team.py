@@ -42,6 +42,7 @@ from agno.reasoning.step import NextAction, ReasoningStep, ReasoningSteps
 from agno.run.base import RunResponseExtraData, RunStatus
 from agno.run.messages import RunMessages
 from agno.run.response import RunEvent, RunResponse, RunResponseEvent
+from agno.run.scope import run_scoped, run_scoped_attributes, share_for_run
 from agno.run.team import TeamRunEvent, TeamRunResponse, TeamRunResponseEvent, ToolCallCompletedEvent
 from agno.storage.base import Storage
 from agno.storage.session.team import TeamSession
@@ -75,7 +76,7 @@ from agno.utils.log import (
     use_team_logger,
 )
 from agno.utils.merge_dict import merge_dictionaries
-from agno.utils.message import get_text_from_message
+from agno.utils.message import get_history_messages, get_text_from_message
 from agno.utils.response import (
     async_generator_wrapper,
     check_if_run_cancelled,
@@ -88,8 +89,43 @@ from agno.utils.response import (
 from agno.utils.safe_formatter import SafeFormatter
 from agno.utils.string import is_valid_uuid, parse_response_model_str, url_safe_string
 from agno.utils.timer import Timer
-
-
+from agno.utils.tokens import Tokenizer
+
+
+# State of the current run, isolated per run so one instance can serve concurrent runs
+@run_scoped_attributes(
+    "run_id",
+    "run_input",
+    "run_messages",
+    "run_response",
+    "session_id",
+    "session_name",
+    "session_state",
+    "session_metrics",
+    "full_team_session_metrics",
+    "user_id",
+    "extra_data",
+    "images",
+    "videos",
+    "audio",
+    "files",
+    "team_session",
+    "memory",
+    "stream",
+    "stream_intermediate_steps",
+    "team_session_id",
+    "team_session_state",
+    "workflow_session_state",
+    "_member_response_model",
+)
+# The tools are rebuilt into new containers and never changed in place. Runs share them, so the model's
+# formatted tools cache, keyed on the identity of the tools list, is reused across runs
+@run_scoped_attributes(
+    "_tool_instructions",
+    "_tools_for_model",
+    "_functions_for_model",
+    copy_value=share_for_run,
+)
 @dataclass(init=False)
 class Team:
     """
@@ -99,6 +135,9 @@ class Team:
     members: List[Union[Agent, "Team"]]
 
     mode: Literal["route", "coordinate", "collaborate"] = "coordinate"
+    # In collaborate mode, the maximum number of members that run at the same time. Defaults to all members.
+    # Set to 1 to run the members one after another.
+    max_concurrent_members: Optional[int] = None
 
     # Model for this Team
     model: Optional[Model] = None
@@ -258,6 +297,12 @@ class Team:
     num_of_interactions_from_history: Optional[int] = None
     # Number of historical runs to include in the messages
     num_history_runs: int = 3
+    # If set, the history is the most recent runs that fit in this many tokens, instead of the last num_history_runs
+    max_history_tokens: Optional[int] = None
+    # If set, tool results in the history are truncated to this many tokens
+    max_history_tool_result_tokens: Optional[int] = None
+    # Tokenizer used to count history tokens. Defaults to tiktoken if installed, otherwise a character based estimate
+    tokenizer: Optional[Tokenizer] = None
 
     # --- Team Storage ---
     storage: Optional[Storage] = None
@@ -303,6 +348,7 @@ class Team:
         self,
         members: List[Union[Agent, "Team"]],
         mode: Literal["route", "coordinate", "collaborate"] = "coordinate",
+        max_concurrent_members: Optional[int] = None,
         model: Optional[Model] = None,
         name: Optional[str] = None,
         team_id: Optional[str] = None,
@@ -358,6 +404,9 @@ class Team:
         add_history_to_messages: bool = False,
         num_of_interactions_from_history: Optional[int] = None,
         num_history_runs: int = 3,
+        max_history_tokens: Optional[int] = None,
+        max_history_tool_result_tokens: Optional[int] = None,
+        tokenizer: Optional[Tokenizer] = None,
         storage: Optional[Storage] = None,
         extra_data: Optional[Dict[str, Any]] = None,
         reasoning: bool = False,
@@ -379,6 +428,7 @@ class Team:
         self.members = members
 
         self.mode = mode
+        self.max_concurrent_members = max_concurrent_members
 
         self.model = model
 
@@ -447,6 +497,9 @@ class Team:
         self.add_history_to_messages = add_history_to_messages
         self.num_of_interactions_from_history = num_of_interactions_from_history
         self.num_history_runs = num_history_runs
+        self.max_history_tokens = max_history_tokens
+        self.max_history_tool_result_tokens = max_history_tool_result_tokens
+        self.tokenizer = tokenizer
 
         self.storage = storage
         self.extra_data = extra_data
@@ -774,6 +827,7 @@ class Team:
         **kwargs: Any,
     ) -> Iterator[Union[RunResponseEvent, TeamRunResponseEvent]]: ...
 
+    @run_scoped
     def run(
         self,
         message: Union[str, List, Dict, Message, BaseModel],
@@ -1178,6 +1232,7 @@ class Team:
         **kwargs: Any,
     ) -> AsyncIterator[Union[RunResponseEvent, TeamRunResponseEvent]]: ...
 
+    @run_scoped
     async def arun(
         self,
         message: Union[str, List, Dict, Message, BaseModel],
@@ -1205,7 +1260,7 @@ class Team:
         self.initialize_team(session_id=session_id)
 
         # Read existing session from storage
-        self.read_from_storage(session_id=session_id)
+        await self.aread_from_storage(session_id=session_id)
 
         effective_filters = knowledge_filters
 
@@ -1448,7 +1503,7 @@ class Team:
         self._convert_response_to_structured_format(run_response=run_response)
 
         # 7. Save session to storage
-        self.write_to_storage(session_id=session_id, user_id=user_id)
+        await self.awrite_to_storage(session_id=session_id, user_id=user_id)
 
         # 8. Log Team Run
         await self._alog_team_run(session_id=session_id, user_id=user_id)
@@ -1527,7 +1582,7 @@ class Team:
             )
 
         # 5. Save session to storage
-        self.write_to_storage(session_id=session_id, user_id=user_id)
+        await self.awrite_to_storage(session_id=session_id, user_id=user_id)
 
         # 6. Log Team Run
         await self._alog_team_run(session_id=session_id, user_id=user_id)
@@ -5358,25 +5413,40 @@ class Team:
 
         # 2. Add history to run_messages
         if self.enable_team_history or self.add_history_to_messages:
-            from copy import deepcopy
-
             history = []
+            # With a token budget, the budget decides how many runs are added
+            num_history_runs = self.num_history_runs if self.max_history_tokens is None else None
             if isinstance(self.memory, TeamMemory):
                 history = self.memory.get_messages_from_last_n_runs(
-                    last_n=self.num_history_runs, skip_role=self.system_message_role
+                    last_n=num_history_runs, skip_role=self.system_message_role
+                )
+            elif isinstance(self.memory, Memory) and self.max_history_tokens is not None:
+                # Deferred runs are only loaded until the token budget is spent
+                history = self.memory.get_messages_within_tokens(
+                    session_id=session_id,
+                    max_tokens=self.max_history_tokens,
+                    max_tool_result_tokens=self.max_history_tool_result_tokens,
+                    tokenizer=self.tokenizer,
+                    skip_role=self.system_message_role,
+                    team_id=self.team_id if self.team_session_id is not None else None,
                 )
             elif isinstance(self.memory, Memory):
                 history = self.memory.get_messages_from_last_n_runs(
                     session_id=session_id,
-                    last_n=self.num_history_runs,
+                    last_n=num_history_runs,
                     skip_role=self.system_message_role,
                     # Only filter by team_id if this is part of a team
                     team_id=self.team_id if self.team_session_id is not None else None,
                 )
 
             if len(history) > 0:
-                # Create a deep copy of the history messages to avoid modifying the original messages
-                history_copy = [deepcopy(msg) for msg in history]
+                # Copy the history messages to avoid modifying the original messages
+                history_copy = get_history_messages(
+                    history,
+                    max_tokens=self.max_history_tokens,
+                    max_tool_result_tokens=self.max_history_tool_result_tokens,
+                    tokenizer=self.tokenizer,
+                )
 
                 # Tag each message as coming from history
                 for _msg in history_copy:
@@ -5911,97 +5981,44 @@ class Team:
                 task_description, expected_output, team_context_str, team_member_interactions_str
             )
 
-            for member_agent_index, member_agent in enumerate(self.members):
+            for member_agent in self.members:
                 self._initialize_member(member_agent, session_id=session_id)
 
-                if stream:
-                    member_agent_run_response_stream = member_agent.run(
-                        member_agent_task,
-                        user_id=user_id,
-                        # All members have the same session_id
-                        session_id=session_id,
-                        images=images,
-                        videos=videos,
-                        audio=audio,
-                        files=files,
-                        stream=True,
-                        stream_intermediate_steps=stream_intermediate_steps,
-                    )
-                    for member_agent_run_response_chunk in member_agent_run_response_stream:
-                        check_if_run_cancelled(member_agent_run_response_chunk)
-                        yield member_agent_run_response_chunk
-                else:
-                    member_agent_run_response = member_agent.run(
-                        member_agent_task,
-                        user_id=user_id,
-                        # All members have the same session_id
-                        session_id=session_id,
-                        images=images,
-                        videos=videos,
-                        audio=audio,
-                        files=files,
-                        stream=False,
-                    )
-
+            run_kwargs: Dict[str, Any] = dict(
+                user_id=user_id,
+                # All members have the same session_id
+                session_id=session_id,
+                images=images,
+                videos=videos,
+                audio=audio,
+                files=files,
+            )
+            if stream:
+                for member_agent_index, member_agent_run_response_chunk in self._stream_members(
+                    member_agent_task, stream_intermediate_steps=stream_intermediate_steps, **run_kwargs
+                ):
+                    if member_agent_run_response_chunk is None:
+                        # The member finished its run
+                        self._add_member_interaction(
+                            member_agent_index, task_description=task_description, session_id=session_id
+                        )
+                        continue
+                    check_if_run_cancelled(member_agent_run_response_chunk)
+                    yield member_agent_run_response_chunk
+            else:
+                for member_agent_index, member_agent_run_response in self._run_members(member_agent_task, **run_kwargs):
                     check_if_run_cancelled(member_agent_run_response)
-
-                    try:
-                        if member_agent_run_response.content is None and (
-                            member_agent_run_response.tools is None or len(member_agent_run_response.tools) == 0
-                        ):
-                            yield f"Agent {member_agent.name}: No response from the member agent."
-                        elif isinstance(member_agent_run_response.content, str):
-                            if len(member_agent_run_response.content.strip()) > 0:
-                                yield f"Agent {member_agent.name}: {member_agent_run_response.content}"
-                            elif (
-                                member_agent_run_response.tools is not None and len(member_agent_run_response.tools) > 0
-                            ):
-                                yield f"Agent {member_agent.name}: {','.join([tool.result for tool in member_agent_run_response.tools])}"  # type: ignore
-                        elif issubclass(type(member_agent_run_response.content), BaseModel):
-                            yield f"Agent {member_agent.name}: {member_agent_run_response.content.model_dump_json(indent=2)}"  # type: ignore
-                        else:
-                            import json
-
-                            yield f"Agent {member_agent.name}: {json.dumps(member_agent_run_response.content, indent=2)}"
-                    except Exception as e:
-                        yield f"Agent {member_agent.name}: Error - {str(e)}"
-
-                # Update the memory
-                member_name = member_agent.name if member_agent.name else f"agent_{member_agent_index}"
-                if isinstance(self.memory, TeamMemory):
-                    self.memory = cast(TeamMemory, self.memory)
-                    self.memory.add_interaction_to_team_context(
-                        member_name=member_name,
-                        task=task_description,
-                        run_response=member_agent.run_response,  # type: ignore
-                    )
-                else:
-                    self.memory = cast(Memory, self.memory)
-                    self.memory.add_interaction_to_team_context(
-                        session_id=session_id,
-                        member_name=member_name,
-                        task=task_description,
-                        run_response=member_agent.run_response,  # type: ignore
+                    yield self._get_member_response_str(member_agent_index, member_agent_run_response)
+                    self._add_member_interaction(
+                        member_agent_index, task_description=task_description, session_id=session_id
                     )
 
-                # Add the member run to the team run response
-                self.run_response = cast(TeamRunResponse, self.run_response)
-                self.run_response.add_member_run(member_agent.run_response)  # type: ignore
-
-                # Update team session state
-                self._update_team_session_state(member_agent)
-
-                self._update_workflow_session_state(member_agent)
-
-                # Update the team media
-                self._update_team_media(member_agent.run_response)  # type: ignore
-
             # Afterward, switch back to the team logger
             use_team_logger()
 
         async def arun_member_agents(
             task_description: str, expected_output: Optional[str] = None
-        ) -> AsyncIterator[str]:
+        ) -> AsyncIterator[Union[RunResponseEvent, TeamRunResponseEvent, str]]:
             """
             Send the same task to all the member agents and return the responses.
 
@@ -6026,84 +6043,38 @@ class Team:
                 task_description, expected_output, team_context_str, team_member_interactions_str
             )
 
-            # Create tasks for all member agents
-            tasks = []
-            for member_agent_index, member_agent in enumerate(self.members):
-                # We cannot stream responses with async gather
-                current_agent = member_agent  # Create a reference to the current agent
-                current_index = member_agent_index  # Create a reference to the current index
-                self._initialize_member(current_agent, session_id=session_id)
-
-                async def run_member_agent(agent=current_agent, idx=current_index) -> str:
-                    response = await agent.arun(
-                        member_agent_task,
-                        user_id=user_id,
-                        # All members have the same session_id
-                        session_id=session_id,
-                        images=images,
-                        videos=videos,
-                        audio=audio,
-                        files=files,
-                        stream=False,
-                        refresh_session_before_write=True,
-                    )
-                    check_if_run_cancelled(response)
-
-                    member_name = agent.name if agent.name else f"agent_{idx}"
-                    self.memory = cast(TeamMemory, self.memory)
-                    if isinstance(self.memory, TeamMemory):
-                        self.memory = cast(TeamMemory, self.memory)
-                        self.memory.add_interaction_to_team_context(
-                            member_name=member_name, task=task_description, run_response=agent.run_response
-                        )
-                    else:
-                        self.memory = cast(Memory, self.memory)
-                        self.memory.add_interaction_to_team_context(
-                            session_id=session_id,
-                            member_name=member_name,
-                            task=task_description,
-                            run_response=agent.run_response,
-                        )
-
-                    # Add the member run to the team run response
-                    self.run_response = cast(TeamRunResponse, self.run_response)
-                    self.run_response.add_member_run(agent.run_response)
-
-                    # Update team session state
-                    self._update_team_session_state(current_agent)
-
-                    self._update_workflow_session_state(current_agent)
-
-                    # Update the team media
-                    self._update_team_media(agent.run_response)
-
-                    try:
-                        if response.content is None and (response.tools is None or len(response.tools) == 0):
-                            return f"Agent {member_name}: No response from the member agent."
-                        elif isinstance(response.content, str):
-                            if len(response.content.strip()) > 0:
-                                return f"Agent {member_name}: {response.content}"
-                            elif response.tools is not None and len(response.tools) > 0:
-                                return (
-                                    f"Agent {member_name}: {','.join([tool.get('content') for tool in response.tools])}"
-                                )
-                        elif issubclass(type(response.content), BaseModel):
-                            return f"Agent {member_name}: {response.content.model_dump_json(indent=2)}"  # type: ignore
-                        else:
-                            import json
-
-                            return f"Agent {member_name}: {json.dumps(response.content, indent=2)}"
-                    except Exception as e:
-                        return f"Agent {member_name}: Error - {str(e)}"
-
-                    return f"Agent {member_name}: No Response"
-
-                tasks.append(run_member_agent)
+            for member_agent in self.members:
+                self._initialize_member(member_agent, session_id=session_id)
 
-            # Need to collect and process yielded values from each task
-            results = await asyncio.gather(*[task() for task in tasks])
-            for result in results:
-                yield result
+            run_kwargs: Dict[str, Any] = dict(
+                user_id=user_id,
+                # All members have the same session_id
+                session_id=session_id,
+                images=images,
+                videos=videos,
+                audio=audio,
+                files=files,
+            )
+            if stream:
+                async for member_agent_index, member_agent_run_response_chunk in self._astream_members(
+                    member_agent_task, stream_intermediate_steps=stream_intermediate_steps, **run_kwargs
+                ):
+                    if member_agent_run_response_chunk is None:
+                        # The member finished its run
+                        self._add_member_interaction(
+                            member_agent_index, task_description=task_description, session_id=session_id
+                        )
+                        continue
+                    check_if_run_cancelled(member_agent_run_response_chunk)
+                    yield member_agent_run_response_chunk
+            else:
+                member_agent_run_responses = await self._arun_members(member_agent_task, **run_kwargs)
+                for member_agent_index, member_agent_run_response in enumerate(member_agent_run_responses):
+                    check_if_run_cancelled(member_agent_run_response)
+                    self._add_member_interaction(
+                        member_agent_index, task_description=task_description, session_id=session_id
+                    )
+                    yield self._get_member_response_str(member_agent_index, member_agent_run_response)
 
             # Afterward, switch back to the team logger
             use_team_logger()
@@ -6119,6 +6090,198 @@ class Team:
 
         return run_member_agents_func
 
+    def _get_max_concurrent_members(self) -> int:
+        return max(1, min(len(self.members), self.max_concurrent_members or len(self.members)))
+
+    def _run_members(self, task: str, **run_kwargs: Any) -> Iterator[Tuple[int, Any]]:
+        """Run all members on the same task and yield (member index, run response) in member order.
+
+        Members run on a thread pool bounded by max_concurrent_members, so the latency is that of the slowest member.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        from contextvars import copy_context
+        from functools import partial
+
+        max_workers = self._get_max_concurrent_members()
+        if max_workers == 1:
+            for member_index, member in enumerate(self.members):
+                yield member_index, member.run(task, stream=False, **run_kwargs)
+            return
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="agno-team-member") as executor:
+            futures = [
+                # Members share the session, so each one refreshes it before writing its run
+                executor.submit(
+                    copy_context().run,
+                    partial(member.run, task, stream=False, refresh_session_before_write=True, **run_kwargs),
+                )
+                for member in self.members
+            ]
+            for member_index, future in enumerate(futures):
+                yield member_index, future.result()
+
+    def _stream_members(
+        self, task: str, stream_intermediate_steps: bool = False, **run_kwargs: Any
+    ) -> Iterator[Tuple[int, Optional[Union[RunResponseEvent, TeamRunResponseEvent]]]]:
+        """Stream all members on the same task, multiplexing their events in order of arrival.
+
+        Yields (member index, event) tuples and (member index, None) once a member finished its run. Events carry the
+        agent_id or team_id of the member that produced them.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        from contextvars import copy_context
+        from queue import Queue
+
+        max_workers = self._get_max_concurrent_members()
+        if max_workers == 1:
+            for member_index, member in enumerate(self.members):
+                yield from (
+                    (member_index, event)
+                    for event in member.run(
+                        task, stream=True, stream_intermediate_steps=stream_intermediate_steps, **run_kwargs
+                    )
+                )
+                yield member_index, None
+            return
+
+        events: Queue = Queue()
+
+        def stream_member(member_index: int, member: Union[Agent, "Team"]) -> None:
+            try:
+                for event in member.run(
+                    task,
+                    stream=True,
+                    stream_intermediate_steps=stream_intermediate_steps,
+                    refresh_session_before_write=True,
+                    **run_kwargs,
+                ):
+                    events.put((member_index, event, None))
+            except BaseException as e:
+                events.put((member_index, None, e))
+                return
+            events.put((member_index, None, None))
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="agno-team-member") as executor:
+            for member_index, member in enumerate(self.members):
+                executor.submit(copy_context().run, stream_member, member_index, member)
+            running = len(self.members)
+            while running > 0:
+                member_index, event, error = events.get()
+                if event is not None:
+                    yield member_index, event
+                    continue
+                running -= 1
+                if error is not None:
+                    raise error
+                yield member_index, None
+
+    async def _arun_members(self, task: str, **run_kwargs: Any) -> List[Any]:
+        """Run all members on the same task concurrently and return their run responses in member order"""
+        semaphore = asyncio.Semaphore(self._get_max_concurrent_members())
+
+        async def run_member(member: Union[Agent, "Team"]) -> Any:
+            async with semaphore:
+                return await member.arun(task, stream=False, refresh_session_before_write=True, **run_kwargs)
+
+        return await asyncio.gather(*[run_member(member) for member in self.members])
+
+    async def _astream_members(
+        self, task: str, stream_intermediate_steps: bool = False, **run_kwargs: Any
+    ) -> AsyncIterator[Tuple[int, Optional[Union[RunResponseEvent, TeamRunResponseEvent]]]]:
+        """Async version of _stream_members, members run as concurrent tasks"""
+        events: asyncio.Queue = asyncio.Queue()
+        semaphore = asyncio.Semaphore(self._get_max_concurrent_members())
+
+        async def stream_member(member_index: int, member: Union[Agent, "Team"]) -> None:
+            try:
+                async with semaphore:
+                    member_stream = await member.arun(
+                        task,
+                        stream=True,
+                        stream_intermediate_steps=stream_intermediate_steps,
+                        refresh_session_before_write=True,
+                        **run_kwargs,
+                    )
+                    async for event in member_stream:
+                        await events.put((member_index, event, None))
+            except BaseException as e:
+                await events.put((member_index, None, e))
+                return
+            await events.put((member_index, None, None))
+
+        tasks = [asyncio.create_task(stream_member(idx, member)) for idx, member in enumerate(self.members)]
+        try:
+            running = len(tasks)
+            while running > 0:
+                member_index, event, error = await events.get()
+                if event is not None:
+                    yield member_index, event
+                    continue
+                running -= 1
+                if error is not None:
+                    raise error
+                yield member_index, None
+        finally:
+            for member_task in tasks:
+                member_task.cancel()
+
+    def _get_member_agent_name(self, member_index: int) -> str:
+        member = self.members[member_index]
+        return member.name if member.name else f"agent_{member_index}"
+
+    def _get_member_response_str(self, member_index: int, run_response: Any) -> str:
+        """Format the run response of a member as the result of the run_member_agents tool"""
+        member_name = self._get_member_agent_name(member_index)
+        try:
+            if run_response.content is None and (run_response.tools is None or len(run_response.tools) == 0):
+                return f"Agent {member_name}: No response from the member agent."
+            elif isinstance(run_response.content, str):
+                if len(run_response.content.strip()) > 0:
+                    return f"Agent {member_name}: {run_response.content}"
+                elif run_response.tools is not None and len(run_response.tools) > 0:
+                    return f"Agent {member_name}: {','.join([str(tool.result) for tool in run_response.tools])}"
+            elif issubclass(type(run_response.content), BaseModel):
+                return f"Agent {member_name}: {run_response.content.model_dump_json(indent=2)}"  # type: ignore
+            else:
+                import json
+
+                return f"Agent {member_name}: {json.dumps(run_response.content, indent=2)}"
+        except Exception as e:
+            return f"Agent {member_name}: Error - {str(e)}"
+        return f"Agent {member_name}: No Response"
+
+    def _add_member_interaction(self, member_index: int, task_description: str, session_id: str) -> None:
+        """Add the last run of a member to the team context, run response, session state and media"""
+        member_agent = self.members[member_index]
+        member_name = self._get_member_agent_name(member_index)
+        if isinstance(self.memory, TeamMemory):
+            self.memory = cast(TeamMemory, self.memory)
+            self.memory.add_interaction_to_team_context(
+                member_name=member_name,
+                task=task_description,
+                run_response=member_agent.run_response,  # type: ignore
+            )
+        else:
+            self.memory = cast(Memory, self.memory)
+            self.memory.add_interaction_to_team_context(
+                session_id=session_id,
+                member_name=member_name,
+                task=task_description,
+                run_response=member_agent.run_response,  # type: ignore
+            )
+
+        # Add the member run to the team run response
+        self.run_response = cast(TeamRunResponse, self.run_response)
+        self.run_response.add_member_run(member_agent.run_response)  # type: ignore
+
+        # Update team session state
+        self._update_team_session_state(member_agent)
+
+        self._update_workflow_session_state(member_agent)
+
+        # Update the team media
+        self._update_team_media(member_agent.run_response)  # type: ignore
+
     def _determine_team_context(
         self, session_id: str, images: List[Image], videos: List[Video], audio: List[Audio]
     ) -> Tuple[Optional[str], Optional[str]]:
@@ -6846,6 +7009,18 @@ class Team:
                 self.load_team_session(session=self.team_session)
         return self.team_session
 
+    async def aread_from_storage(self, session_id: str) -> Optional[TeamSession]:
+        """Load the TeamSession from storage without blocking the event loop
+
+        Returns:
+            Optional[TeamSession]: The loaded TeamSession or None if not found.
+        """
+        if self.storage is not None and session_id is not None:
+            self.team_session = cast(TeamSession, await self.storage.aread(session_id=session_id))
+            if self.team_session is not None:
+                self.load_team_session(session=self.team_session)
+        return self.team_session
+
     def write_to_storage(self, session_id: str, user_id: Optional[str] = None) -> Optional[TeamSession]:
         """Save the TeamSession to storage
 
@@ -6863,6 +7038,24 @@ class Team:
                 self.memory.runs.pop(session_id)  # type: ignore
         return self.team_session
 
+    async def awrite_to_storage(self, session_id: str, user_id: Optional[str] = None) -> Optional[TeamSession]:
+        """Save the TeamSession to storage without blocking the event loop
+
+        Returns:
+            Optional[TeamSession]: The saved TeamSession or None if not saved.
+        """
+        if self.storage is not None:
+            self.team_session = cast(
+                TeamSession,
+                await self.storage.aupsert(session=self._get_team_session(session_id=session_id, user_id=user_id)),
+            )
+
+        # Remove session from memory
+        if not self.cache_session:
+            if self.memory is not None and self.memory.runs is not None and session_id in self.memory.runs:
+                self.memory.runs.pop(session_id)  # type: ignore
+        return self.team_session
+
     def rename_session(self, session_name: str, session_id: Optional[str] = None) -> None:
         """Rename the current session and save to storage"""
         if self.session_id is None and session_id is None:
@@ -7749,9 +7942,14 @@ class Team:
                 self.memory = cast(Memory, self.memory)
                 # We fake the structure on storage, to maintain the interface with the legacy implementation
                 if self.memory.runs is not None:
-                    memory_dict = self.memory.to_dict()
+                    memory_dict = self.memory.to_dict(include_runs=False)
                     run_responses = self.memory.runs.get(session_id)
                     if run_responses is not None:
+                        if self.storage is not None and self.storage.stores_runs_separately:
+                            # Runs already in the storage's runs table are not serialized again
+                            run_responses = [
+                                rr for rr in run_responses[:-1] if not self.storage.is_run_saved(session_id, rr.run_id)
+                            ] + run_responses[-1:]
                         memory_dict["runs"] = [rr.to_dict() for rr in run_responses]
 
         return TeamSession(
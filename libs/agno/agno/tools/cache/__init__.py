@@ -0,0 +1,12 @@
+from agno.tools.cache.base import ToolCache, ToolCacheMetrics, get_tool_cache_key
+from agno.tools.cache.in_memory import InMemoryToolCache
+from agno.tools.cache.sqlite import SqliteToolCache, get_default_tool_cache
+
+__all__ = [
+    "ToolCache",
+    "ToolCacheMetrics",
+    "get_tool_cache_key",
+    "InMemoryToolCache",
+    "SqliteToolCache",
+    "get_default_tool_cache",
+]
@@ -0,0 +1,105 @@
+import asyncio
+import json
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from hashlib import sha256
+from threading import Lock
+from typing import Any, Dict, Optional
+
+
+@dataclass
+class ToolCacheMetrics:
+    """Hit/miss counters for a tool result cache"""
+
+    hits: int = 0
+    misses: int = 0
+    sets: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "sets": self.sets,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_rate": round(self.hit_rate, 4),
+        }
+
+
+def get_tool_cache_key(function_name: str, *arguments: Optional[Dict[str, Any]]) -> str:
+    """Build a stable cache key for a tool call.
+
+    Arguments are serialized as canonical JSON (sorted keys, compact separators), so the key does not depend on
+    argument order or on the repr of the values. The function name is kept as a readable prefix.
+    """
+    merged: Dict[str, Any] = {}
+    for args in arguments:
+        if args:
+            merged.update(args)
+    canonical = json.dumps(merged, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return f"{function_name}:{sha256(canonical.encode()).hexdigest()}"
+
+
+class ToolCache(ABC):
+    """Base class for tool result caches.
+
+    A cache miss is reported as None, so tools returning None are never served from the cache.
+    """
+
+    def __init__(self, ttl: Optional[int] = 3600, max_size: Optional[int] = None):
+        """
+        Args:
+            ttl: Default time-to-live for entries in seconds. None means entries never expire.
+            max_size: Maximum number of entries to keep. The least recently used entries are evicted first.
+        """
+        self.ttl = ttl
+        self.max_size = max_size
+        self.metrics = ToolCacheMetrics()
+        self._metrics_lock = Lock()
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    async def aget(self, key: str) -> Optional[Any]:
+        return await asyncio.to_thread(self.get, key)
+
+    async def aset(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        await asyncio.to_thread(self.set, key, value, ttl)
+
+    async def adelete(self, key: str) -> None:
+        await asyncio.to_thread(self.delete, key)
+
+    async def aclear(self) -> None:
+        await asyncio.to_thread(self.clear)
+
+    def _get_ttl(self, ttl: Optional[int]) -> Optional[int]:
+        return ttl if ttl is not None else self.ttl
+
+    def _record(self, **counts: int) -> None:
+        with self._metrics_lock:
+            for name, count in counts.items():
+                setattr(self.metrics, name, getattr(self.metrics, name) + count)
+
+    def __deepcopy__(self, memo):
+        # Caches hold connections and are meant to be shared between copies of agents and tools
+        return self
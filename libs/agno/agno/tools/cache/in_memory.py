@@ -0,0 +1,67 @@
+from collections import OrderedDict
+from threading import Lock
+from time import time
+from typing import Any, Optional, Tuple
+
+from agno.tools.cache.base import ToolCache
+
+
+class InMemoryToolCache(ToolCache):
+    """Process-local LRU cache for tool results"""
+
+    def __init__(self, ttl: Optional[int] = 3600, max_size: Optional[int] = 1024):
+        super().__init__(ttl=ttl, max_size=max_size)
+        # key -> (expires_at, value), ordered from least to most recently used
+        self._entries: "OrderedDict[str, Tuple[Optional[float], Any]]" = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._record(misses=1)
+                return None
+            expires_at, value = entry
+            if expires_at is not None and expires_at < time():
+                del self._entries[key]
+                self._record(misses=1, expirations=1)
+                return None
+            self._entries.move_to_end(key)
+        self._record(hits=1)
+        return value
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        ttl = self._get_ttl(ttl)
+        evicted = 0
+        with self._lock:
+            self._entries[key] = (time() + ttl if ttl is not None else None, value)
+            self._entries.move_to_end(key)
+            if self.max_size is not None:
+                while len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+                    evicted += 1
+        self._record(sets=1, evictions=evicted)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    # Lookups never block, so the async API skips the thread hop
+    async def aget(self, key: str) -> Optional[Any]:
+        return self.get(key)
+
+    async def aset(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        self.set(key, value, ttl)
+
+    async def adelete(self, key: str) -> None:
+        self.delete(key)
+
+    async def aclear(self) -> None:
+        self.clear()
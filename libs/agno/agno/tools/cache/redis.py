@@ -0,0 +1,198 @@
+import json
+from time import time
+from typing import Any, List, Optional, Tuple
+
+try:
+    from redis import Redis
+    from redis.asyncio import Redis as AsyncRedis
+except ImportError:
+    raise ImportError("`redis` not installed. Please install it using `pip install redis`")
+
+from agno.tools.cache.base import ToolCache
+from agno.utils.log import log_warning
+
+
+class RedisToolCache(ToolCache):
+    """Tool result cache stored in Redis.
+
+    Entries expire through Redis TTLs. When max_size is set, a sorted set of last access times is kept next to the
+    entries so the least recently used ones can be evicted, and a sorted set of expiry times so the members of expired
+    entries are pruned from it.
+    """
+
+    def __init__(
+        self,
+        prefix: str = "agno_tool_cache",
+        host: str = "localhost",
+        port: int = 6379,
+        db: int = 0,
+        password: Optional[str] = None,
+        ssl: Optional[bool] = False,
+        ttl: Optional[int] = 3600,
+        max_size: Optional[int] = None,
+        redis_client: Optional[Redis] = None,
+        async_redis_client: Optional[AsyncRedis] = None,
+    ):
+        """
+        Args:
+            prefix: Prefix for Redis keys to namespace the cache entries
+            host: Redis host address
+            port: Redis port number
+            db: Redis database number
+            password: Redis password if authentication is required
+            ssl: Whether to use SSL for Redis connection
+            ttl: Default time-to-live for entries in seconds. None means entries never expire.
+            max_size: Maximum number of entries to keep. None leaves eviction to the Redis maxmemory policy.
+            redis_client: An existing Redis client to use.
+            async_redis_client: An existing asyncio Redis client to use for the async API.
+        """
+        super().__init__(ttl=ttl, max_size=max_size)
+        self.prefix = prefix
+        self._connection_kwargs = dict(host=host, port=port, db=db, password=password, ssl=ssl)
+        self.redis_client = redis_client or Redis(**self._connection_kwargs)  # type: ignore
+        self._async_redis_client = async_redis_client
+
+    @property
+    def async_redis_client(self) -> AsyncRedis:
+        if self._async_redis_client is None:
+            self._async_redis_client = AsyncRedis(**self._connection_kwargs)  # type: ignore
+        return self._async_redis_client
+
+    @property
+    def index_key(self) -> str:
+        return f"{self.prefix}:__index__"
+
+    @property
+    def expiry_key(self) -> str:
+        return f"{self.prefix}:__expiry__"
+
+    def _get_key(self, key: str) -> str:
+        return f"{self.prefix}:{key}"
+
+    def _serialize(self, key: str, value: Any) -> Optional[str]:
+        try:
+            return json.dumps(value)
+        except (TypeError, ValueError) as e:
+            log_warning(f"Could not cache result for {key}: {e}")
+            return None
+
+    def _load(self, key: str, value: Optional[Any]) -> Optional[Any]:
+        if value is None:
+            self._record(misses=1)
+            return None
+        self._record(hits=1)
+        return json.loads(value)
+
+    def get(self, key: str) -> Optional[Any]:
+        value = self.redis_client.get(self._get_key(key))
+        if value is not None and self.max_size is not None:
+            self.redis_client.zadd(self.index_key, {key: time()})
+        return self._load(key, value)
+
+    def _pop_expired(self, pipeline: Any, now: float) -> None:
+        """Queue the commands that remove and return the entries whose TTL has passed from the expiry set"""
+        pipeline.zrangebyscore(self.expiry_key, "-inf", now)
+        pipeline.zremrangebyscore(self.expiry_key, "-inf", now)
+
+    def _set_commands(
+        self, pipeline: Any, key: str, serialized: str, ttl: Optional[int], expired: List[Any], now: float
+    ) -> None:
+        """Queue the commands that store an entry and update the LRU index.
+
+        Redis drops expired entries on its own but not their index members, so the members of expired entries are
+        removed before the index is counted. Otherwise dead keys would count against max_size.
+        """
+        pipeline.set(self._get_key(key), serialized, ex=ttl)
+        if self.max_size is None:
+            return
+        if expired:
+            pipeline.zrem(self.index_key, *expired)
+            self._record(expirations=len(expired))
+        pipeline.zadd(self.index_key, {key: now})
+        if ttl is not None:
+            pipeline.zadd(self.expiry_key, {key: now + ttl})
+        else:
+            pipeline.zrem(self.expiry_key, key)
+        pipeline.zcard(self.index_key)
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        serialized = self._serialize(key, value)
+        if serialized is None:
+            return
+        now = time()
+        expired: List[Any] = []
+        if self.max_size is not None:
+            pipeline = self.redis_client.pipeline()
+            self._pop_expired(pipeline, now)
+            expired = pipeline.execute()[0]
+        pipeline = self.redis_client.pipeline()
+        self._set_commands(pipeline, key, serialized, self._get_ttl(ttl), expired, now)
+        results = pipeline.execute()
+        self._record(sets=1)
+        if self.max_size is not None and results[-1] > self.max_size:
+            popped: List[Tuple[Any, float]] = self.redis_client.zpopmin(self.index_key, results[-1] - self.max_size)  # type: ignore
+            members = self._evicted_members(popped)
+            if members:
+                pipeline = self.redis_client.pipeline()
+                pipeline.delete(*[self._get_key(member) for member in members])
+                pipeline.zrem(self.expiry_key, *members)
+                pipeline.execute()
+
+    def _evicted_members(self, popped: List[Tuple[Any, float]]) -> List[str]:
+        members = [self._decode(member) for member, _ in popped]
+        self._record(evictions=len(members))
+        return members
+
+    @staticmethod
+    def _decode(member: Any) -> str:
+        return member.decode() if isinstance(member, bytes) else member
+
+    def delete(self, key: str) -> None:
+        pipeline = self.redis_client.pipeline()
+        pipeline.delete(self._get_key(key))
+        pipeline.zrem(self.index_key, key)
+        pipeline.zrem(self.expiry_key, key)
+        pipeline.execute()
+
+    def clear(self) -> None:
+        keys = list(self.redis_client.scan_iter(match=f"{self.prefix}:*"))
+        if keys:
+            self.redis_client.delete(*keys)
+
+    async def aget(self, key: str) -> Optional[Any]:
+        value = await self.async_redis_client.get(self._get_key(key))
+        if value is not None and self.max_size is not None:
+            await self.async_redis_client.zadd(self.index_key, {key: time()})
+        return self._load(key, value)
+
+    async def aset(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        serialized = self._serialize(key, value)
+        if serialized is None:
+            return
+        now = time()
+        expired: List[Any] = []
+        if self.max_size is not None:
+            pipeline = self.async_redis_client.pipeline()
+            self._pop_expired(pipeline, now)
+            expired = (await pipeline.execute())[0]
+        pipeline = self.async_redis_client.pipeline()
+        self._set_commands(pipeline, key, serialized, self._get_ttl(ttl), expired, now)
+        results = await pipeline.execute()
+        self._record(sets=1)
+        if self.max_size is not None and results[-1] > self.max_size:
+            popped: List[Tuple[Any, float]] = await self.async_redis_client.zpopmin(  # type: ignore
+                self.index_key, results[-1] - self.max_size
+            )
+            members = self._evicted_members(popped)
+            if members:
+                pipeline = self.async_redis_client.pipeline()
+                pipeline.delete(*[self._get_key(member) for member in members])
+                pipeline.zrem(self.expiry_key, *members)
+                await pipeline.execute()
+
+    async def adelete(self, key: str) -> None:
+        pipeline = self.async_redis_client.pipeline()
+        pipeline.delete(self._get_key(key))
+        pipeline.zrem(self.index_key, key)
+        pipeline.zrem(self.expiry_key, key)
+        await pipeline.execute()
@@ -0,0 +1,158 @@
+import json
+import sqlite3
+from pathlib import Path
+from tempfile import gettempdir
+from threading import Lock
+from time import time
+from typing import Any, Dict, Optional, Tuple
+
+from agno.tools.cache.base import ToolCache
+from agno.utils.log import log_debug, log_warning
+
+
+class SqliteToolCache(ToolCache):
+    """Tool result cache stored in a single sqlite file.
+
+    Entries are indexed by key, expiry and last access, so lookups, expiry and LRU eviction never scan the table.
+    Values are stored as JSON, results that cannot be serialized are not cached.
+    """
+
+    def __init__(
+        self,
+        db_file: Optional[str] = None,
+        table_name: str = "agno_tool_cache",
+        ttl: Optional[int] = 3600,
+        max_size: Optional[int] = 10_000,
+    ):
+        """
+        Args:
+            db_file: The sqlite file to use. Defaults to `<tempdir>/agno_cache/tool_cache.db`.
+            table_name: The table that stores the cache entries.
+            ttl: Default time-to-live for entries in seconds. None means entries never expire.
+            max_size: Maximum number of entries to keep in the table.
+        """
+        super().__init__(ttl=ttl, max_size=max_size)
+        self.db_file = Path(db_file) if db_file is not None else Path(gettempdir()) / "agno_cache" / "tool_cache.db"
+        self.table_name = table_name
+        self._lock = Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+        self._size: int = 0
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.db_file.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(str(self.db_file), check_same_thread=False, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table_name} "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL, accessed_at REAL NOT NULL)"
+            )
+            connection.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_{self.table_name}_accessed_at ON {self.table_name} (accessed_at)"
+            )
+            connection.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_{self.table_name}_expires_at ON {self.table_name} (expires_at)"
+            )
+            self._size = connection.execute(f"SELECT COUNT(*) FROM {self.table_name}").fetchone()[0]
+            self._connection = connection
+            log_debug(f"Opened tool cache: {self.db_file}")
+        return self._connection
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self.connection.execute(f"SELECT COUNT(*) FROM {self.table_name}").fetchone()[0]
+
+    def get(self, key: str) -> Optional[Any]:
+        now = time()
+        with self._lock:
+            row = self.connection.execute(
+                f"SELECT value, expires_at FROM {self.table_name} WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self._record(misses=1)
+                return None
+            value, expires_at = row
+            if expires_at is not None and expires_at < now:
+                self.connection.execute(f"DELETE FROM {self.table_name} WHERE key = ?", (key,))
+                self._size -= 1
+                self._record(misses=1, expirations=1)
+                return None
+            self.connection.execute(f"UPDATE {self.table_name} SET accessed_at = ? WHERE key = ?", (now, key))
+        self._record(hits=1)
+        return json.loads(value)
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        try:
+            serialized = json.dumps(value)
+        except (TypeError, ValueError) as e:
+            log_warning(f"Could not cache result for {key}: {e}")
+            return
+
+        now = time()
+        ttl = self._get_ttl(ttl)
+        evicted = 0
+        with self._lock:
+            connection = self.connection
+            exists = connection.execute(f"SELECT 1 FROM {self.table_name} WHERE key = ?", (key,)).fetchone()
+            connection.execute(
+                f"INSERT INTO {self.table_name} (key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET value = excluded.value, expires_at = excluded.expires_at, "
+                "accessed_at = excluded.accessed_at",
+                (key, serialized, now + ttl if ttl is not None else None, now),
+            )
+            if exists is None:
+                self._size += 1
+            if self.max_size is not None and self._size > self.max_size:
+                evicted = self._evict(now)
+        self._record(sets=1, evictions=evicted)
+
+    def _evict(self, now: float) -> int:
+        """Drop expired entries, then the least recently used ones, until the table fits in max_size"""
+        connection = self.connection
+        expired = connection.execute(f"DELETE FROM {self.table_name} WHERE expires_at < ?", (now,)).rowcount
+        self._size -= expired
+        evicted = 0
+        overflow = self._size - self.max_size  # type: ignore
+        if overflow > 0:
+            evicted = connection.execute(
+                f"DELETE FROM {self.table_name} WHERE key IN "
+                f"(SELECT key FROM {self.table_name} ORDER BY accessed_at LIMIT ?)",
+                (overflow,),
+            ).rowcount
+            self._size -= evicted
+        if expired:
+            self._record(expirations=expired)
+        return evicted
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._size -= self.connection.execute(f"DELETE FROM {self.table_name} WHERE key = ?", (key,)).rowcount
+
+    def clear(self) -> None:
+        with self._lock:
+            self.connection.execute(f"DELETE FROM {self.table_name}")
+            self._size = 0
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+_default_caches: Dict[Tuple[str, Optional[int]], SqliteToolCache] = {}
+_default_caches_lock = Lock()
+
+
+def get_default_tool_cache(cache_dir: Optional[str] = None, max_size: Optional[int] = 10_000) -> SqliteToolCache:
+    """Return the shared sqlite cache for a cache directory, so all tools using it share one file and connection"""
+    base_cache_dir = Path(cache_dir) if cache_dir is not None else Path(gettempdir()) / "agno_cache"
+    db_file = str(base_cache_dir / "tool_cache.db")
+    with _default_caches_lock:
+        cache = _default_caches.get((db_file, max_size))
+        if cache is None:
+            cache = SqliteToolCache(db_file=db_file, max_size=max_size)
+            _default_caches[(db_file, max_size)] = cache
+        return cache
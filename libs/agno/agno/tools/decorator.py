@@ -1,6 +1,7 @@
 from functools import update_wrapper, wraps
 from typing import Any, Callable, Dict, List, Optional, TypeVar, Union, overload
 
+from agno.tools.cache.base import ToolCache
 from agno.tools.function import Function, get_entrypoint_docstring
 from agno.utils.log import logger
 
@@ -71,12 +72,15 @@ def tool(
     requires_user_input: Optional[bool] = None,
     user_input_fields: Optional[List[str]] = None,
     external_execution: Optional[bool] = None,
+    concurrency_safe: Optional[bool] = None,
     pre_hook: Optional[Callable] = None,
     post_hook: Optional[Callable] = None,
     tool_hooks: Optional[List[Callable]] = None,
     cache_results: bool = False,
     cache_dir: Optional[str] = None,
     cache_ttl: int = 3600,
+    cache_max_size: Optional[int] = 10_000,
+    cache: Optional[ToolCache] = None,
 ) -> Callable[[F], Function]: ...
 
 
@@ -100,12 +104,15 @@ def tool(*args, **kwargs) -> Union[Function, Callable[[F], Function]]:
         requires_user_input: Optional[bool] - If True, the function will require user input before execution
         user_input_fields: Optional[List[str]] - List of fields that will be provided to the function as user input
         external_execution: Optional[bool] - If True, the function will be executed outside of the agent's context
+        concurrency_safe: Optional[bool] - If True, the function can run in parallel with other tool calls
         pre_hook: Optional[Callable] - Hook that runs before the function is executed.
         post_hook: Optional[Callable] - Hook that runs after the function is executed.
         tool_hooks: Optional[List[Callable]] - List of hooks that run before and after the function is executed.
         cache_results: bool - If True, enable caching of function results
         cache_dir: Optional[str] - Directory to store cache files
         cache_ttl: int - Time-to-live for cached results in seconds
+        cache_max_size: Optional[int] - Maximum number of entries in the default cache for cache_dir
+        cache: Optional[ToolCache] - Cache backend to store results in, defaults to a sqlite cache in cache_dir
 
     Returns:
         Union[Function, Callable[[F], Function]]: Decorated function or decorator
@@ -138,12 +145,15 @@ def tool(*args, **kwargs) -> Union[Function, Callable[[F], Function]]:
             "requires_user_input",
             "user_input_fields",
             "external_execution",
+            "concurrency_safe",
             "pre_hook",
             "post_hook",
             "tool_hooks",
             "cache_results",
             "cache_dir",
             "cache_ttl",
+            "cache_max_size",
+            "cache",
         }
     )
 
@@ -1,6 +1,10 @@
+from collections import OrderedDict
+from copy import deepcopy
 from dataclasses import dataclass
 from functools import partial
-from typing import Any, Callable, Dict, List, Literal, Optional, Type, TypeVar, get_type_hints
+from threading import Lock
+from types import FunctionType
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple, Type, TypeVar, get_type_hints
 
 from docstring_parser import parse
 from pydantic import BaseModel, Field, validate_call
@@ -10,6 +14,39 @@ from agno.utils.log import log_debug, log_error, log_exception, log_warning
 
 T = TypeVar("T")
 
+# Compiled (parameters, description) of callables, keyed by their definition so closures created by the same
+# function body on every run share one entry
+_compiled_schemas: "OrderedDict[Tuple[Any, ...], Tuple[Dict[str, Any], Optional[str]]]" = OrderedDict()
+_compiled_schemas_lock = Lock()
+COMPILED_SCHEMAS_MAX_SIZE = 1024
+
+
+def _get_schema_cache_key(c: Callable, name: str, strict: bool) -> Optional[Tuple[Any, ...]]:
+    """Key a callable by its definition: code, docstring, annotations and which parameters have defaults."""
+    func = getattr(c, "__func__", c)
+    code = getattr(func, "__code__", None)
+    if code is None:
+        return None
+    try:
+        annotations = tuple(getattr(func, "__annotations__", {}).items())
+        hash(annotations)
+    except TypeError:
+        return None
+    return (
+        code,
+        name,
+        strict,
+        func.__doc__,
+        annotations,
+        len(func.__defaults__ or ()),
+        tuple(sorted(func.__kwdefaults__ or {})),
+    )
+
+
+def clear_compiled_schemas() -> None:
+    with _compiled_schemas_lock:
+        _compiled_schemas.clear()
+
 
 def get_entrypoint_docstring(entrypoint: Callable) -> str:
     from inspect import getdoc
@@ -111,16 +148,26 @@ class Function(BaseModel):
     # If True, the function will be executed outside the agent's control.
     external_execution: Optional[bool] = None
 
+    # If True, the function has no side effects on shared state and can run in parallel with other tool calls
+    # when the model has concurrent_tool_calls enabled.
+    concurrency_safe: bool = False
+
     # Caching configuration
     cache_results: bool = False
     cache_dir: Optional[str] = None
     cache_ttl: int = 3600
+    # Maximum number of entries in the default cache for cache_dir
+    cache_max_size: Optional[int] = 10_000
+    # The cache backend (a ToolCache) to store results in. Defaults to a sqlite cache in cache_dir.
+    cache: Optional[Any] = None
 
     # --*-- FOR INTERNAL USE ONLY --*--
     # The agent that the function is associated with
     _agent: Optional[Any] = None
     # The team that the function is associated with
     _team: Optional[Any] = None
+    # The entrypoint and settings process_entrypoint last compiled the schema for
+    _compiled_for: Optional[Tuple[Any, Tuple[Any, ...]]] = None
 
     def to_dict(self) -> Dict[str, Any]:
         return self.model_dump(
@@ -135,6 +182,20 @@ class Function(BaseModel):
         from agno.utils.json_schema import get_json_schema
 
         function_name = name or c.__name__
+        cache_key = _get_schema_cache_key(c, function_name, strict)
+        if cache_key is not None:
+            with _compiled_schemas_lock:
+                compiled = _compiled_schemas.get(cache_key)
+                if compiled is not None:
+                    _compiled_schemas.move_to_end(cache_key)
+            if compiled is not None:
+                return cls(
+                    name=function_name,
+                    description=compiled[1],
+                    parameters=deepcopy(compiled[0]),
+                    entrypoint=cls._wrap_callable(c),
+                )
+
         parameters = {"type": "object", "properties": {}, "required": []}
         try:
             sig = signature(c)
@@ -193,10 +254,16 @@ class Function(BaseModel):
             log_warning(f"Could not parse args for {function_name}: {e}", exc_info=True)
 
         entrypoint = cls._wrap_callable(c)
+        description = get_entrypoint_docstring(entrypoint=c)
+        if cache_key is not None:
+            with _compiled_schemas_lock:
+                _compiled_schemas[cache_key] = (deepcopy(parameters), description)
+                if len(_compiled_schemas) > COMPILED_SCHEMAS_MAX_SIZE:
+                    _compiled_schemas.popitem(last=False)
 
         return cls(
             name=function_name,
-            description=get_entrypoint_docstring(entrypoint=c),
+            description=description,
             parameters=parameters,
             entrypoint=entrypoint,
         )
@@ -215,6 +282,12 @@ class Function(BaseModel):
         if self.entrypoint is None:
             return
 
+        # Skip if the entrypoint was already processed with the same settings, e.g. by a previous run
+        compiled_with = (strict, self.requires_user_input, tuple(self.user_input_fields or ()))
+        if self._compiled_for is not None and self._compiled_for[0] is self.entrypoint:
+            if self._compiled_for[1] == compiled_with:
+                return
+
         parameters = {"type": "object", "properties": {}, "required": []}
 
         params_set_by_user = False
@@ -319,6 +392,7 @@ class Function(BaseModel):
             self.entrypoint = self._wrap_callable(self.entrypoint)
         except Exception as e:
             log_warning(f"Failed to add validate decorator to entrypoint: {e}")
+        self._compiled_for = (self.entrypoint, compiled_with)
 
     @staticmethod
     def _wrap_callable(func: Callable) -> Callable:
@@ -331,10 +405,15 @@ class Function(BaseModel):
         # Don't wrap callables that are already wrapped with validate_call
         elif getattr(func, "_wrapped_for_validation", False):
             return func
+        # Reuse the wrapper built for this function by an earlier run
+        elif isinstance(func, FunctionType) and "_validated_call" in func.__dict__:
+            return func.__dict__["_validated_call"]
         # Wrap the callable with validate_call
         else:
             wrapped = validate_call(func, config=dict(arbitrary_types_allowed=True))  # type: ignore
             wrapped._wrapped_for_validation = True  # Mark as wrapped to avoid infinite recursion
+            if isinstance(func, FunctionType):
+                func.__dict__["_validated_call"] = wrapped
             return wrapped
 
     def process_schema_for_strict(self):
@@ -345,7 +424,7 @@ class Function(BaseModel):
 
     def _get_cache_key(self, entrypoint_args: Dict[str, Any], call_args: Optional[Dict[str, Any]] = None) -> str:
         """Generate a cache key based on function name and arguments."""
-        from hashlib import md5
+        from agno.tools.cache.base import get_tool_cache_key
 
         copy_entrypoint_args = entrypoint_args.copy()
         # Remove agent from entrypoint_args
@@ -353,57 +432,41 @@ class Function(BaseModel):
             del copy_entrypoint_args["agent"]
         if "team" in copy_entrypoint_args:
             del copy_entrypoint_args["team"]
-        args_str = str(copy_entrypoint_args)
-
-        kwargs_str = str(sorted((call_args or {}).items()))
-        key_str = f"{self.name}:{args_str}:{kwargs_str}"
-        return md5(key_str.encode()).hexdigest()
+        return get_tool_cache_key(self.name, copy_entrypoint_args, call_args)
 
-    def _get_cache_file_path(self, cache_key: str) -> str:
-        """Get the full path for the cache file."""
-        from pathlib import Path
-        from tempfile import gettempdir
+    def get_cache(self) -> Any:
+        """Return the cache backend, creating the shared default cache on first use."""
+        if self.cache is None:
+            from agno.tools.cache.sqlite import get_default_tool_cache
 
-        base_cache_dir = self.cache_dir or Path(gettempdir()) / "agno_cache"
-        func_cache_dir = Path(base_cache_dir) / "functions" / self.name
-        func_cache_dir.mkdir(parents=True, exist_ok=True)
-        return str(func_cache_dir / f"{cache_key}.json")
+            self.cache = get_default_tool_cache(cache_dir=self.cache_dir, max_size=self.cache_max_size)
+        return self.cache
 
-    def _get_cached_result(self, cache_file: str) -> Optional[Any]:
+    def _get_cached_result(self, cache_key: str) -> Optional[Any]:
         """Retrieve cached result if valid."""
-        import json
-        from pathlib import Path
-        from time import time
-
-        cache_path = Path(cache_file)
-        if not cache_path.exists():
-            return None
-
         try:
-            with cache_path.open("r") as f:
-                cache_data = json.load(f)
-
-            timestamp = cache_data.get("timestamp", 0)
-            result = cache_data.get("result")
-
-            if time() - timestamp <= self.cache_ttl:
-                return result
-
-            # Remove expired entry
-            cache_path.unlink()
+            return self.get_cache().get(cache_key)
         except Exception as e:
             log_error(f"Error reading cache: {e}")
+        return None
 
+    async def _aget_cached_result(self, cache_key: str) -> Optional[Any]:
+        try:
+            return await self.get_cache().aget(cache_key)
+        except Exception as e:
+            log_error(f"Error reading cache: {e}")
         return None
 
-    def _save_to_cache(self, cache_file: str, result: Any):
+    def _save_to_cache(self, cache_key: str, result: Any):
         """Save result to cache."""
-        import json
-        from time import time
+        try:
+            self.get_cache().set(cache_key, result, ttl=self.cache_ttl)
+        except Exception as e:
+            log_error(f"Error writing cache: {e}")
 
+    async def _asave_to_cache(self, cache_key: str, result: Any):
         try:
-            with open(cache_file, "w") as f:
-                json.dump({"timestamp": time(), "result": result}, f)
+            await self.get_cache().aset(cache_key, result, ttl=self.cache_ttl)
         except Exception as e:
             log_error(f"Error writing cache: {e}")
 
@@ -614,8 +677,7 @@ class FunctionCall(BaseModel):
         # Check cache if enabled and not a generator function
         if self.function.cache_results and not isgenerator(self.function.entrypoint):
             cache_key = self.function._get_cache_key(entrypoint_args, self.arguments)
-            cache_file = self.function._get_cache_file_path(cache_key)
-            cached_result = self.function._get_cached_result(cache_file)
+            cached_result = self.function._get_cached_result(cache_key)
 
             if cached_result is not None:
                 log_debug(f"Cache hit for: {self.get_call_str()}")
@@ -642,8 +704,7 @@ class FunctionCall(BaseModel):
                 # Only cache non-generator results
                 if self.function.cache_results:
                     cache_key = self.function._get_cache_key(entrypoint_args, self.arguments)
-                    cache_file = self.function._get_cache_file_path(cache_key)
-                    self.function._save_to_cache(cache_file, self.result)
+                    self.function._save_to_cache(cache_key, self.result)
 
         except AgentRunException as e:
             log_debug(f"{e.__class__.__name__}: {e}")
@@ -799,8 +860,7 @@ class FunctionCall(BaseModel):
             isasyncgen(self.function.entrypoint) or isgenerator(self.function.entrypoint)
         ):
             cache_key = self.function._get_cache_key(entrypoint_args, self.arguments)
-            cache_file = self.function._get_cache_file_path(cache_key)
-            cached_result = self.function._get_cached_result(cache_file)
+            cached_result = await self.function._aget_cached_result(cache_key)
             if cached_result is not None:
                 log_debug(f"Cache hit for: {self.get_call_str()}")
                 self.result = cached_result
@@ -826,8 +886,7 @@ class FunctionCall(BaseModel):
             # Only cache if not a generator
             if self.function.cache_results and not (isgenerator(self.result) or isasyncgen(self.result)):
                 cache_key = self.function._get_cache_key(entrypoint_args, self.arguments)
-                cache_file = self.function._get_cache_file_path(cache_key)
-                self.function._save_to_cache(cache_file, self.result)
+                await self.function._asave_to_cache(cache_key, self.result)
 
         except AgentRunException as e:
             log_debug(f"{e.__class__.__name__}: {e}")
@@ -1,6 +1,7 @@
 from collections import OrderedDict
 from typing import Any, Callable, Dict, List, Optional
 
+from agno.tools.cache.base import ToolCache
 from agno.tools.function import Function
 from agno.utils.log import log_debug, log_warning, logger
 
@@ -18,9 +19,12 @@ class Toolkit:
         external_execution_required_tools: Optional[list[str]] = None,
         stop_after_tool_call_tools: Optional[List[str]] = None,
         show_result_tools: Optional[List[str]] = None,
+        concurrency_safe_tools: Optional[List[str]] = None,
         cache_results: bool = False,
         cache_ttl: int = 3600,
         cache_dir: Optional[str] = None,
+        cache_max_size: Optional[int] = 10_000,
+        cache: Optional[ToolCache] = None,
         auto_register: bool = True,
     ):
         """Initialize a new Toolkit.
@@ -34,12 +38,16 @@ class Toolkit:
             exclude_tools: List of tool names to exclude from the toolkit
             requires_confirmation_tools: List of tool names that require user confirmation
             external_execution_required_tools: List of tool names that will be executed outside of the agent loop
-            cache_results (bool): Enable in-memory caching of function results.
+            cache_results (bool): Enable caching of function results.
             cache_ttl (int): Time-to-live for cached results in seconds.
-            cache_dir (Optional[str]): Directory to store cache files. Defaults to system temp dir.
+            cache_dir (Optional[str]): Directory of the default sqlite cache file. Defaults to system temp dir.
+            cache_max_size (Optional[int]): Maximum number of entries in the default cache.
+            cache (Optional[ToolCache]): Cache backend shared by the toolkit's functions. Overrides cache_dir.
             auto_register (bool): Whether to automatically register all methods in the class.
             stop_after_tool_call_tools (Optional[List[str]]): List of function names that should stop the agent after execution.
             show_result_tools (Optional[List[str]]): List of function names whose results should be shown.
+            concurrency_safe_tools (Optional[List[str]]): List of function names that can run in parallel with other
+                tool calls.
         """
         self.name: str = name
         self.tools: List[Callable] = tools
@@ -52,6 +60,7 @@ class Toolkit:
 
         self.stop_after_tool_call_tools: list[str] = stop_after_tool_call_tools or []
         self.show_result_tools: list[str] = show_result_tools or []
+        self.concurrency_safe_tools: list[str] = concurrency_safe_tools or []
 
         self._check_tools_filters(
             available_tools=[tool.__name__ for tool in tools], include_tools=include_tools, exclude_tools=exclude_tools
@@ -63,6 +72,8 @@ class Toolkit:
         self.cache_results: bool = cache_results
         self.cache_ttl: int = cache_ttl
         self.cache_dir: Optional[str] = cache_dir
+        self.cache_max_size: Optional[int] = cache_max_size
+        self.cache: Optional[ToolCache] = cache
 
         # Automatically register all methods if auto_register is True
         if auto_register and self.tools:
@@ -128,10 +139,13 @@ class Toolkit:
                 cache_results=self.cache_results,
                 cache_dir=self.cache_dir,
                 cache_ttl=self.cache_ttl,
+                cache_max_size=self.cache_max_size,
+                cache=self.cache,
                 requires_confirmation=tool_name in self.requires_confirmation_tools,
                 external_execution=tool_name in self.external_execution_required_tools,
                 stop_after_tool_call=tool_name in self.stop_after_tool_call_tools,
                 show_result=tool_name in self.show_result_tools,
+                concurrency_safe=tool_name in self.concurrency_safe_tools,
             )
             self.functions[f.name] = f
             log_debug(f"Function: {f.name} registered with {self.name}")
@@ -0,0 +1,216 @@
+"""Process-wide registry of HTTP connection pools and the SDK clients built on top of them.
+
+Model classes create their SDK client on every request. Without a shared pool each request pays for a new TCP and
+TLS handshake, so clients are registered here by their class and parameters and reused by every model instance
+(including deep copies of agents and teams) that is configured the same way.
+
+Async clients are bound to the event loop they were created in, so they are registered per loop. The clients of a loop
+that was closed (e.g. by `asyncio.run`) are closed and forgotten the next time a shared async client is requested.
+Async clients created outside of an event loop are registered separately, they are bound to the loop they are first
+used in.
+"""
+
+import asyncio
+import atexit
+import inspect
+from threading import Lock
+from typing import Any, Dict, Hashable, List, Optional, Set, Tuple, Type
+
+import httpx
+
+from agno.utils.log import log_debug, log_warning
+
+DEFAULT_HTTP_LIMITS = httpx.Limits(max_connections=1000, max_keepalive_connections=100, keepalive_expiry=30.0)
+
+_lock = Lock()
+_sync_clients: Dict[Hashable, Any] = {}
+# The clients hold a reference to their loop, so loops are never garbage collected and are pruned once they are closed
+_async_clients: Dict[asyncio.AbstractEventLoop, Dict[Hashable, Any]] = {}
+_loopless_async_clients: Dict[Hashable, Any] = {}
+# Keeps the tasks closing async clients from inside a running event loop alive until they are done
+_closing_tasks: Set["asyncio.Task[None]"] = set()
+
+
+def _freeze(value: Any) -> Hashable:
+    """Turn client params into a hashable key. Objects without a value identity (callables, clients) use their id."""
+    if value is None or isinstance(value, (str, int, float, bool, bytes)):
+        return value
+    if isinstance(value, httpx.URL):
+        return str(value)
+    if isinstance(value, dict):
+        return tuple(sorted((str(k), _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, httpx.Limits):
+        return ("limits", value.max_connections, value.max_keepalive_connections, value.keepalive_expiry)
+    if isinstance(value, httpx.Timeout):
+        return ("timeout", value.connect, value.read, value.write, value.pool)
+    return ("id", id(value))
+
+
+def _get_http_client_kwargs(http2: bool, limits: Optional[httpx.Limits], **kwargs: Any) -> Dict[str, Any]:
+    if http2:
+        try:
+            import h2  # noqa: F401
+        except ImportError:
+            raise ImportError("`h2` not installed. Please install using `pip install 'httpx[http2]'`")
+    return {"http2": http2, "limits": limits or DEFAULT_HTTP_LIMITS, **kwargs}
+
+
+def _get_running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def get_shared_client(
+    client_class: Type[Any],
+    client_params: Dict[str, Any],
+    http2: bool = False,
+    limits: Optional[httpx.Limits] = None,
+    is_async: bool = False,
+    **http_client_kwargs: Any,
+) -> Any:
+    """Return a shared `client_class(**client_params)` instance.
+
+    If client_params has no `http_client`, the client gets a keep-alive connection pool configured with
+    http2, limits and http_client_kwargs (e.g. follow_redirects).
+
+    Args:
+        client_class: The SDK client class, e.g. `openai.OpenAI` or `openai.AsyncOpenAI`.
+        client_params: The params to create the client with. Together with the class they form the registry key.
+        http2: Whether the connection pool uses HTTP/2.
+        limits: Connection pool limits. Defaults to DEFAULT_HTTP_LIMITS.
+        is_async: Whether the client is async. Async clients are shared per event loop.
+    """
+    key = (
+        client_class.__module__,
+        client_class.__qualname__,
+        _freeze(client_params),
+        http2,
+        _freeze(limits),
+        _freeze(http_client_kwargs),
+    )
+    loop = _get_running_loop() if is_async else None
+    with _lock:
+        if loop is not None:
+            stale_clients = _pop_closed_loop_clients()
+            if stale_clients:
+                _close_later(loop, stale_clients)
+        if not is_async:
+            clients = _sync_clients
+        elif loop is not None:
+            clients = _async_clients.setdefault(loop, {})
+        else:
+            clients = _loopless_async_clients
+        client = clients.get(key)
+        if client is not None and not _is_closed(client):
+            return client
+
+        params = dict(client_params)
+        if params.get("http_client") is None:
+            http_client_class = httpx.AsyncClient if is_async else httpx.Client
+            params["http_client"] = http_client_class(
+                **_get_http_client_kwargs(http2=http2, limits=limits, **http_client_kwargs)
+            )
+        client = client_class(**params)
+        clients[key] = client
+        log_debug(f"Created shared {client_class.__name__} client")
+        return client
+
+
+def _pop_closed_loop_clients() -> List[Any]:
+    """Forget the async clients of the event loops that were closed and return them, called with the lock held"""
+    clients: List[Any] = []
+    for loop in [loop for loop in _async_clients if loop.is_closed()]:
+        clients.extend(_async_clients.pop(loop).values())
+    if clients:
+        log_debug(f"Closing {len(clients)} shared async clients of closed event loops")
+    return clients
+
+
+def _is_closed(client: Any) -> bool:
+    is_closed = getattr(client, "is_closed", None)
+    try:
+        return bool(is_closed()) if callable(is_closed) else False
+    except Exception:
+        return False
+
+
+def _close_later(loop: asyncio.AbstractEventLoop, clients: List[Any]) -> None:
+    task = loop.create_task(_aclose_clients(clients))
+    _closing_tasks.add(task)
+    task.add_done_callback(_closing_tasks.discard)
+
+
+async def _aclose_clients(clients: List[Any]) -> None:
+    for client in clients:
+        try:
+            close = getattr(client, "aclose", None) or client.close
+            result = close()
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            log_warning(f"Error closing shared client: {e}")
+
+
+def close_shared_clients() -> None:
+    """Close and forget all shared clients.
+
+    Async clients are closed with `aclose` on their own event loop when it is not running, and the async clients
+    created outside of an event loop or of a closed loop on a new loop. Called from inside a running event loop, its
+    async clients are closed in background tasks, await `aclose_shared_clients` instead to wait for them.
+    """
+    with _lock:
+        clients = list(_sync_clients.values())
+        loopless_clients = _pop_closed_loop_clients() + list(_loopless_async_clients.values())
+        loop_clients = [
+            (loop, list(loop_async_clients.values())) for loop, loop_async_clients in _async_clients.items()
+        ]
+        _sync_clients.clear()
+        _async_clients.clear()
+        _loopless_async_clients.clear()
+    for client in clients:
+        try:
+            client.close()
+        except Exception as e:
+            log_warning(f"Error closing shared client: {e}")
+
+    running_loop = _get_running_loop()
+    for loop, async_clients in loop_clients:
+        if loop is running_loop:
+            _close_later(running_loop, async_clients)
+        elif not loop.is_running():
+            loop.run_until_complete(_aclose_clients(async_clients))
+        else:
+            log_debug(f"Could not close {len(async_clients)} shared async clients, their event loop is not available")
+    if loopless_clients:
+        if running_loop is not None:
+            _close_later(running_loop, loopless_clients)
+        else:
+            asyncio.run(_aclose_clients(loopless_clients))
+
+
+async def aclose_shared_clients() -> None:
+    """Close the shared async clients of the running event loop, and the ones created outside of an event loop"""
+    loop = asyncio.get_running_loop()
+    with _lock:
+        clients = (
+            list(_async_clients.pop(loop, {}).values())
+            + _pop_closed_loop_clients()
+            + list(_loopless_async_clients.values())
+        )
+        _loopless_async_clients.clear()
+    await _aclose_clients(clients)
+
+
+def get_shared_client_count() -> Tuple[int, int]:
+    """Return the number of shared (sync, async) clients, mostly useful for debugging and tests"""
+    with _lock:
+        return len(_sync_clients), len(_loopless_async_clients) + sum(
+            len(clients) for clients in _async_clients.values()
+        )
+
+
+atexit.register(close_shared_clients)
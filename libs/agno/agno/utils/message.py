@@ -1,8 +1,16 @@
-from typing import Dict, List, Union
+import json
+from copy import deepcopy
+from typing import Dict, List, Optional, Union
 
 from pydantic import BaseModel
 
 from agno.models.message import Message
+from agno.utils.log import log_debug
+from agno.utils.tokens import Tokenizer, get_default_tokenizer
+
+# Tokens added to each message for its role and formatting
+MESSAGE_TOKEN_OVERHEAD = 4
+TRUNCATED_TOOL_RESULT_NOTICE = "\n\n[Tool result truncated, the full result had {num_tokens} tokens]"
 
 
 def get_text_from_message(message: Union[List, Dict, str, Message, BaseModel]) -> str:
@@ -45,3 +53,104 @@ def get_text_from_message(message: Union[List, Dict, str, Message, BaseModel]) -
     if isinstance(message, Message) and message.content is not None:
         return get_text_from_message(message.content)
     return ""
+
+
+def count_message_tokens(message: Message, tokenizer: Optional[Tokenizer] = None) -> int:
+    """Return the number of tokens of the message. The count is cached on the message per tokenizer."""
+    tokenizer = tokenizer or get_default_tokenizer()
+    if message.token_counts is not None and tokenizer.name in message.token_counts:
+        return message.token_counts[tokenizer.name]
+
+    text = message.get_content_string()
+    if message.tool_calls:
+        text += json.dumps(message.tool_calls, default=str)
+    num_tokens = tokenizer.count(text) + MESSAGE_TOKEN_OVERHEAD
+
+    if message.token_counts is None:
+        message.token_counts = {}
+    message.token_counts[tokenizer.name] = num_tokens
+    return num_tokens
+
+
+def _is_oversized_tool_result(message: Message, num_tokens: int, max_tool_result_tokens: Optional[int]) -> bool:
+    return (
+        max_tool_result_tokens is not None
+        and message.role == "tool"
+        and isinstance(message.content, str)
+        and num_tokens - MESSAGE_TOKEN_OVERHEAD > max_tool_result_tokens
+    )
+
+
+def truncate_tool_result(message: Message, max_tokens: int, tokenizer: Optional[Tokenizer] = None) -> None:
+    """Truncate the content of a tool message to max_tokens in place"""
+    tokenizer = tokenizer or get_default_tokenizer()
+    content = message.get_content_string()
+    num_tokens = tokenizer.count(content)
+    if num_tokens <= max_tokens:
+        return
+    message.content = tokenizer.truncate(content, max_tokens) + TRUNCATED_TOOL_RESULT_NOTICE.format(
+        num_tokens=num_tokens
+    )
+    message.token_counts = None
+
+
+def count_history_tokens(
+    history: List[Message],
+    max_tool_result_tokens: Optional[int] = None,
+    tokenizer: Optional[Tokenizer] = None,
+) -> int:
+    """Return the number of tokens of the history messages, counting tool results as they would be truncated"""
+    tokenizer = tokenizer or get_default_tokenizer()
+    notice_tokens = tokenizer.count(TRUNCATED_TOOL_RESULT_NOTICE)
+    total_tokens = 0
+    for message in history:
+        num_tokens = count_message_tokens(message, tokenizer)
+        if _is_oversized_tool_result(message, num_tokens, max_tool_result_tokens):
+            num_tokens = max_tool_result_tokens + notice_tokens + MESSAGE_TOKEN_OVERHEAD  # type: ignore
+        total_tokens += num_tokens
+    return total_tokens
+
+
+def get_history_messages(
+    history: List[Message],
+    max_tokens: Optional[int] = None,
+    max_tool_result_tokens: Optional[int] = None,
+    tokenizer: Optional[Tokenizer] = None,
+) -> List[Message]:
+    """Return copies of the history messages to add to a run.
+
+    With max_tokens, only the most recent runs that fit in the budget are returned. The history is split into runs
+    at user messages and runs are kept or dropped as a whole, so tool calls keep their results.
+    Tool results longer than max_tool_result_tokens are truncated in the copies and counted truncated.
+    """
+    if max_tokens is None and max_tool_result_tokens is None:
+        return [deepcopy(msg) for msg in history]
+
+    tokenizer = tokenizer or get_default_tokenizer()
+    selected = history
+    if max_tokens is not None:
+        # Split the history into runs, a run starts at a user message
+        runs: List[List[Message]] = []
+        for message in history:
+            if not runs or (message.role == "user" and any(m.role != "system" for m in runs[-1])):
+                runs.append([])
+            runs[-1].append(message)
+
+        total_tokens = 0
+        num_runs = 0
+        for run_messages in reversed(runs):
+            run_tokens = count_history_tokens(run_messages, max_tool_result_tokens, tokenizer)
+            if total_tokens + run_tokens > max_tokens:
+                break
+            total_tokens += run_tokens
+            num_runs += 1
+        selected = [message for run_messages in runs[len(runs) - num_runs :] for message in run_messages]
+        log_debug(f"History within {max_tokens} tokens: {num_runs}/{len(runs)} runs, {total_tokens} tokens")
+
+    history_copy = []
+    for message in selected:
+        message_copy = deepcopy(message)
+        if _is_oversized_tool_result(message, count_message_tokens(message, tokenizer), max_tool_result_tokens):
+            truncate_tool_result(message_copy, max_tool_result_tokens, tokenizer)  # type: ignore
+        history_copy.append(message_copy)
+    return history_copy
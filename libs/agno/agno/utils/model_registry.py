@@ -0,0 +1,58 @@
+"""Process-wide registry for locally loaded models (SentenceTransformer, CrossEncoder, FastEmbed, ...).
+
+Loading a local model takes seconds, so each model is loaded once, lazily, and shared by every embedder and
+reranker instance (including deep copies of agents) that asks for the same key.
+"""
+
+import json
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from agno.utils.log import log_debug
+
+_models: Dict[Hashable, Any] = {}
+_load_locks: Dict[Hashable, threading.Lock] = {}
+_registry_lock = threading.Lock()
+
+
+def make_model_key(kind: str, name: str, params: Optional[Dict[str, Any]] = None) -> Hashable:
+    """Build a hashable registry key from a model kind, name and (possibly unhashable) load parameters."""
+    return (kind, name, json.dumps(params, sort_keys=True, default=str) if params else None)
+
+
+def get_or_load_model(key: Hashable, loader: Callable[[], Any]) -> Any:
+    """Return the model registered under key, loading it with loader() on first use.
+
+    Concurrent callers asking for the same key wait for a single load; different keys load in parallel.
+    """
+    model = _models.get(key)
+    if model is not None:
+        return model
+
+    with _registry_lock:
+        load_lock = _load_locks.setdefault(key, threading.Lock())
+
+    with load_lock:
+        model = _models.get(key)
+        if model is None:
+            log_debug(f"Loading local model: {key}")
+            model = loader()
+            _models[key] = model
+    return model
+
+
+def is_model_loaded(key: Hashable) -> bool:
+    return key in _models
+
+
+def unload_model(key: Hashable) -> bool:
+    """Drop a model from the registry so it can be garbage collected. Returns True if it was loaded."""
+    with _registry_lock:
+        _load_locks.pop(key, None)
+        return _models.pop(key, None) is not None
+
+
+def unload_all_models() -> None:
+    with _registry_lock:
+        _load_locks.clear()
+        _models.clear()
@@ -0,0 +1,83 @@
+"""Tokenizers used to count the tokens of messages, e.g. to fit the history into a token budget."""
+
+from typing import Any, List, Optional
+
+from agno.utils.log import log_debug
+
+
+class Tokenizer:
+    """Counts and truncates text in tokens. Subclasses implement `encode` and `decode`."""
+
+    # Identifies the tokenizer in the token counts cached on messages
+    name: str = "tokenizer"
+
+    def encode(self, text: str) -> List[Any]:
+        raise NotImplementedError
+
+    def decode(self, tokens: List[Any]) -> str:
+        raise NotImplementedError
+
+    def count(self, text: str) -> int:
+        return len(self.encode(text)) if text else 0
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        """Return the first max_tokens tokens of text"""
+        tokens = self.encode(text)
+        if len(tokens) <= max_tokens:
+            return text
+        return self.decode(tokens[:max_tokens])
+
+
+class TiktokenTokenizer(Tokenizer):
+    """Tokenizer backed by tiktoken, exact for OpenAI models and a close estimate for most others"""
+
+    def __init__(self, encoding: str = "o200k_base"):
+        try:
+            import tiktoken
+        except ImportError:
+            raise ImportError("`tiktoken` not installed. Please install using `pip install tiktoken`")
+
+        self.name = f"tiktoken:{encoding}"
+        self._encoding = tiktoken.get_encoding(encoding)
+
+    def encode(self, text: str) -> List[Any]:
+        return self._encoding.encode(text, disallowed_special=())
+
+    def decode(self, tokens: List[Any]) -> str:
+        return self._encoding.decode(tokens)
+
+
+class HeuristicTokenizer(Tokenizer):
+    """Estimates tokens from the number of characters, used when no tokenizer library is installed"""
+
+    def __init__(self, chars_per_token: int = 4):
+        self.chars_per_token = max(1, chars_per_token)
+        self.name = f"heuristic:{self.chars_per_token}"
+
+    def encode(self, text: str) -> List[Any]:
+        # Chunks of chars_per_token characters stand in for tokens
+        return [text[i : i + self.chars_per_token] for i in range(0, len(text), self.chars_per_token)]
+
+    def decode(self, tokens: List[Any]) -> str:
+        return "".join(tokens)
+
+    def count(self, text: str) -> int:
+        return -(-len(text) // self.chars_per_token)
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        return text[: max_tokens * self.chars_per_token]
+
+
+_default_tokenizer: Optional[Tokenizer] = None
+
+
+def get_default_tokenizer() -> Tokenizer:
+    """Return the shared tiktoken tokenizer if tiktoken is installed, otherwise a character based estimate"""
+    global _default_tokenizer
+    if _default_tokenizer is None:
+        try:
+            _default_tokenizer = TiktokenTokenizer()
+        except Exception as e:
+            log_debug(f"Using heuristic token counts: {e}")
+            _default_tokenizer = HeuristicTokenizer()
+    return _default_tokenizer
@@ -1,5 +1,6 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 from agno.document import Document
 
@@ -34,6 +35,16 @@ class VectorDb(ABC):
     def id_exists(self, id: str) -> bool:
         raise NotImplementedError
 
+    def existing_ids(self, ids: List[str]) -> Set[str]:
+        """Return the subset of ids (document ids or content hashes) that already exist, using one query.
+
+        Callers fall back to doc_exists when a backend does not implement this.
+        """
+        raise NotImplementedError
+
+    async def async_existing_ids(self, ids: List[str]) -> Set[str]:
+        return await asyncio.to_thread(self.existing_ids, ids)
+
     @abstractmethod
     def insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
         raise NotImplementedError
@@ -91,6 +102,13 @@ class VectorDb(ABC):
     def optimize(self) -> None:
         raise NotImplementedError
 
+    def delete_by_ids(self, ids: List[str]) -> None:
+        """Delete the documents with the given ids, used to remove outdated chunks when syncing a knowledge base"""
+        raise NotImplementedError
+
+    async def async_delete_by_ids(self, ids: List[str]) -> None:
+        await asyncio.to_thread(self.delete_by_ids, ids)
+
     @abstractmethod
     def delete(self) -> bool:
         raise NotImplementedError
@@ -303,6 +303,7 @@ class CouchbaseSearch(VectorDb):
         log_debug(f"Inserting {len(documents)} documents")
 
         docs_to_insert: Dict[str, Any] = {}
+        Document.embed_batch(documents, embedder=self.embedder)
         for document in documents:
             try:
                 doc_data = self.prepare_doc(document)
@@ -378,6 +379,7 @@ class CouchbaseSearch(VectorDb):
         logger.info(f"Upserting {len(documents)} documents")
 
         docs_to_upsert: Dict[str, Any] = {}
+        Document.embed_batch(documents, embedder=self.embedder)
         for document in documents:
             try:
                 doc_data = self.prepare_doc(document)
@@ -840,6 +842,7 @@ class CouchbaseSearch(VectorDb):
 
         async_collection_instance = await self.get_async_collection()
         all_docs_to_insert: Dict[str, Any] = {}
+        await Document.async_embed_batch(documents, embedder=self.embedder)
 
         for document in documents:
             try:
@@ -893,6 +896,7 @@ class CouchbaseSearch(VectorDb):
 
         async_collection_instance = await self.get_async_collection()
         all_docs_to_upsert: Dict[str, Any] = {}
+        await Document.async_embed_batch(documents, embedder=self.embedder)
 
         for document in documents:
             try:
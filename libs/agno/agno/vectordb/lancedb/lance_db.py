@@ -219,17 +219,16 @@ class LanceDb(VectorDb):
         log_debug(f"Inserting {len(documents)} documents")
         data = []
 
-        for document in documents:
-            if self.doc_exists(document):
-                continue
+        documents = [document for document in documents if not self.doc_exists(document)]
+        Document.embed_batch(documents, embedder=self.embedder)
 
+        for document in documents:
             # Add filters to document metadata if provided
             if filters:
                 meta_data = document.meta_data.copy() if document.meta_data else {}
                 meta_data.update(filters)
                 document.meta_data = meta_data
 
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = str(md5(cleaned_content.encode()).hexdigest())
             payload = {
@@ -277,18 +276,17 @@ class LanceDb(VectorDb):
         log_debug(f"Inserting {len(documents)} documents")
         data = []
 
+        documents = [document for document in documents if not await self.async_doc_exists(document)]
+        await Document.async_embed_batch(documents, embedder=self.embedder)
+
         # Prepare documents for insertion
         for document in documents:
-            if await self.async_doc_exists(document):
-                continue
-
             # Add filters to document metadata if provided
             if filters:
                 meta_data = document.meta_data.copy() if document.meta_data else {}
                 meta_data.update(filters)
                 document.meta_data = meta_data
 
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = str(md5(cleaned_content.encode()).hexdigest())
             payload = {
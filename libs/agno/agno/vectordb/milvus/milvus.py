@@ -1,6 +1,6 @@
 import json
 from hashlib import md5
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Set, Union
 
 try:
     import asyncio
@@ -357,6 +357,13 @@ class Milvus(VectorDb):
             return len(collection_points) > 0
         return False
 
+    def existing_ids(self, ids: List[str]) -> Set[str]:
+        """Return the subset of ids that already exist in the collection, using a single query."""
+        if not self.client or not ids:
+            return set()
+        collection_points = self.client.get(collection_name=self.collection, ids=ids, output_fields=["id"])
+        return {point["id"] for point in collection_points}
+
     def _insert_hybrid_document(self, document: Document) -> None:
         """Insert a document with both dense and sparse vectors."""
         data = self._prepare_document_data(document, include_vectors=True)
@@ -380,13 +387,13 @@ class Milvus(VectorDb):
     def insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
         """Insert documents based on search type."""
         log_debug(f"Inserting {len(documents)} documents")
+        Document.embed_batch(documents, embedder=self.embedder)
 
         if self.search_type == SearchType.hybrid:
             for document in documents:
                 self._insert_hybrid_document(document)
         else:
             for document in documents:
-                document.embed(embedder=self.embedder)
                 cleaned_content = document.content.replace("\x00", "\ufffd")
                 doc_id = md5(cleaned_content.encode()).hexdigest()
 
@@ -413,13 +420,13 @@ class Milvus(VectorDb):
     async def async_insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
         """Insert documents asynchronously based on search type."""
         log_debug(f"Inserting {len(documents)} documents asynchronously")
+        await Document.async_embed_batch(documents, embedder=self.embedder)
 
         if self.search_type == SearchType.hybrid:
             await asyncio.gather(*[self._async_insert_hybrid_document(doc) for doc in documents])
         else:
 
             async def process_document(document):
-                document.embed(embedder=self.embedder)
                 cleaned_content = document.content.replace("\x00", "\ufffd")
                 doc_id = md5(cleaned_content.encode()).hexdigest()
 
@@ -464,8 +471,8 @@ class Milvus(VectorDb):
             filters (Optional[Dict[str, Any]]): Filters to apply while upserting
         """
         log_debug(f"Upserting {len(documents)} documents")
+        Document.embed_batch(documents, embedder=self.embedder)
         for document in documents:
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = md5(cleaned_content.encode()).hexdigest()
             data = {
@@ -484,9 +491,9 @@ class Milvus(VectorDb):
 
     async def async_upsert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
         log_debug(f"Upserting {len(documents)} documents asynchronously")
+        await Document.async_embed_batch(documents, embedder=self.embedder)
 
         async def process_document(document):
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = md5(cleaned_content.encode()).hexdigest()
             data = {
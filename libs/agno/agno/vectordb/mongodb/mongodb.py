@@ -1,6 +1,6 @@
 import asyncio
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 from bson import ObjectId
 
@@ -485,10 +485,22 @@ class MongoDb(VectorDb):
             logger.error(f"Error checking document ID existence: {e}")
             return False
 
+    def existing_ids(self, ids: List[str]) -> Set[str]:
+        """Return the subset of ids that already exist in the collection, using a single query."""
+        if not ids:
+            return set()
+        try:
+            collection = self._get_collection()
+            return {doc["_id"] for doc in collection.find({"_id": {"$in": ids}}, {"_id": 1})}
+        except Exception as e:
+            logger.error(f"Error checking existing document IDs: {e}")
+            return set()
+
     def insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
         """Insert documents into the MongoDB collection."""
         log_debug(f"Inserting {len(documents)} documents")
         collection = self._get_collection()
+        Document.embed_batch(documents, embedder=self.embedder)
 
         prepared_docs = []
         for document in documents:
@@ -513,6 +525,7 @@ class MongoDb(VectorDb):
         """Upsert documents into the MongoDB collection."""
         log_info(f"Upserting {len(documents)} documents")
         collection = self._get_collection()
+        Document.embed_batch(documents, embedder=self.embedder)
 
         for document in documents:
             try:
@@ -916,7 +929,8 @@ class MongoDb(VectorDb):
 
     def prepare_doc(self, document: Document, filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Prepare a document for insertion or upsertion into MongoDB."""
-        document.embed(embedder=self.embedder)
+        if document.embedding is None:
+            document.embed(embedder=self.embedder)
         if document.embedding is None:
             raise ValueError(f"Failed to generate embedding for document: {document.id}")
 
@@ -966,6 +980,7 @@ class MongoDb(VectorDb):
         """Insert documents asynchronously."""
         log_debug(f"Inserting {len(documents)} documents asynchronously")
         collection = await self._get_async_collection()
+        await Document.async_embed_batch(documents, embedder=self.embedder)
 
         prepared_docs = []
         for document in documents:
@@ -990,6 +1005,7 @@ class MongoDb(VectorDb):
         """Upsert documents asynchronously."""
         log_info(f"Upserting {len(documents)} documents asynchronously")
         collection = await self._get_async_collection()
+        await Document.async_embed_batch(documents, embedder=self.embedder)
 
         for document in documents:
             try:
@@ -0,0 +1,5 @@
+from agno.vectordb.numpydb.numpydb import NumpyDb
+
+__all__ = [
+    "NumpyDb",
+]
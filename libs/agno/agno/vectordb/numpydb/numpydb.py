@@ -0,0 +1,694 @@
+import asyncio
+import json
+import os
+import shutil
+from pathlib import Path
+from threading import RLock
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    raise ImportError("`numpy` not installed. Please install using `pip install numpy`")
+
+from agno.document import Document
+from agno.embedder import Embedder
+from agno.reranker.base import Reranker
+from agno.utils.log import log_debug, log_info, logger
+from agno.utils.string import safe_content_hash
+from agno.vectordb.base import VectorDb
+from agno.vectordb.distance import Distance
+
+
+def _grow(array: np.ndarray, size: int, fill: Any) -> np.ndarray:
+    """Return the array with room for at least size items, doubling its capacity so appends are amortized O(1)"""
+    if len(array) >= size:
+        return array
+    grown = np.full(max(size, 2 * len(array), 1024), fill, dtype=array.dtype)
+    grown[: len(array)] = array
+    return grown
+
+
+def _value_key(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, default=str)
+
+
+class NumpyDb(VectorDb):
+    """Embedded vector database that keeps embeddings in a memory-mapped NumPy matrix.
+
+    A collection is a directory with:
+    - vectors.bin: the embeddings as a float32 or float16 matrix, opened with np.memmap. New rows are appended.
+    - records.jsonl: one line per row with its id, name, content and metadata, and tombstones for deleted rows.
+    - ivf.npz: the optional IVF index (centroids and the cluster of every row).
+
+    Only the ids, content hashes, names and record offsets are kept in memory. Metadata values are encoded per key as
+    an int32 column, filters are answered with bitmaps of these columns that are cached and extended on append.
+    """
+
+    def __init__(
+        self,
+        collection: str,
+        path: str = "tmp/numpydb",
+        embedder: Optional[Embedder] = None,
+        distance: Distance = Distance.cosine,
+        dtype: str = "float32",
+        reranker: Optional[Reranker] = None,
+        ivf: bool = False,
+        ivf_min_rows: int = 100_000,
+        nlist: Optional[int] = None,
+        nprobe: int = 8,
+        search_chunk_size: int = 262_144,
+        max_cached_bitmaps: int = 256,
+    ):
+        """
+        Args:
+            collection: Name of the collection, stored in a directory of that name under path.
+            path: Directory of the collections.
+            embedder: Embedder for the documents and queries, defaults to OpenAIEmbedder.
+            distance: Distance metric used for search.
+            dtype: Storage type of the embeddings, "float32" or "float16" (half the size, slightly less precise).
+            reranker: Reranker applied to the search results.
+            ivf: Build an IVF index once the collection has ivf_min_rows rows, so searches only scan the nprobe
+                clusters closest to the query instead of all rows.
+            ivf_min_rows: Number of rows at which the IVF index is built.
+            nlist: Number of IVF clusters, defaults to the square root of the number of rows.
+            nprobe: Number of IVF clusters scanned per search.
+            search_chunk_size: Number of rows scored at a time, bounds the memory used by a search.
+            max_cached_bitmaps: Number of metadata filter bitmaps kept in memory.
+        """
+        if dtype not in ("float32", "float16"):
+            raise ValueError(f"Unsupported dtype: {dtype}, use float32 or float16")
+
+        self.collection_name: str = collection
+        self.path: str = path
+
+        if embedder is None:
+            from agno.embedder.openai import OpenAIEmbedder
+
+            embedder = OpenAIEmbedder()
+            log_info("Embedder not provided, using OpenAIEmbedder as default.")
+        self.embedder: Embedder = embedder
+        self.distance: Distance = distance
+        self.dtype: str = dtype
+        self.reranker: Optional[Reranker] = reranker
+
+        self.ivf: bool = ivf
+        self.ivf_min_rows: int = ivf_min_rows
+        self.nlist: Optional[int] = nlist
+        self.nprobe: int = nprobe
+        self.search_chunk_size: int = search_chunk_size
+        self.max_cached_bitmaps: int = max_cached_bitmaps
+
+        self._lock = RLock()
+        self._loaded = False
+        # Incremented when the collection is rewritten (optimize, drop), invalidating row numbers
+        self._generation = 0
+        self._reset_state()
+
+    @property
+    def collection_path(self) -> Path:
+        return Path(self.path) / self.collection_name
+
+    @property
+    def _vectors_file(self) -> Path:
+        return self.collection_path / "vectors.bin"
+
+    @property
+    def _records_file(self) -> Path:
+        return self.collection_path / "records.jsonl"
+
+    @property
+    def _config_file(self) -> Path:
+        return self.collection_path / "config.json"
+
+    @property
+    def _ivf_file(self) -> Path:
+        return self.collection_path / "ivf.npz"
+
+    def _reset_state(self) -> None:
+        self.dimensions: Optional[int] = None
+        self._count = 0
+        self._vectors: Optional[np.ndarray] = None
+        self._norms = np.zeros(0, dtype=np.float32)
+        self._live = np.zeros(0, dtype=bool)
+        self._offsets = np.zeros(0, dtype=np.int64)
+        self._ids: List[str] = []
+        self._names: List[Optional[str]] = []
+        self._content_hashes: List[str] = []
+        self._row_by_id: Dict[str, int] = {}
+        self._rows_by_content_hash: Dict[str, Set[int]] = {}
+        self._name_counts: Dict[str, int] = {}
+        # Metadata key -> int32 value code per row (-1 if the row has no value for the key), and the value codes
+        self._columns: Dict[str, np.ndarray] = {}
+        self._value_codes: Dict[str, Dict[str, int]] = {}
+        # (key, value code) -> cached bitmap of the rows with that value
+        self._bitmaps: Dict[Tuple[str, int], np.ndarray] = {}
+        self._centroids: Optional[np.ndarray] = None
+        self._clusters = np.zeros(0, dtype=np.int32)
+
+    # Loading
+
+    def _load(self) -> None:
+        """Read the collection from disk once, later changes are applied to the in-memory state as they are made"""
+        with self._lock:
+            if self._loaded or not self.exists():
+                return
+            config = json.loads(self._config_file.read_text())
+            self.dimensions = config.get("dimensions")
+            self.dtype = config.get("dtype", self.dtype)
+            self.distance = Distance(config.get("distance", self.distance))
+
+            records: List[Tuple[int, Dict[str, Any]]] = []
+            deleted: List[int] = []
+            if self._records_file.exists():
+                offset = 0
+                with open(self._records_file, "rb") as f:
+                    for line in f:
+                        # An incomplete last line is the remainder of an interrupted write
+                        if not line.endswith(b"\n"):
+                            break
+                        record = json.loads(line)
+                        if "deleted" in record:
+                            deleted.append(record["deleted"])
+                        else:
+                            records.append((offset, record))
+                        offset += len(line)
+                if self._records_file.stat().st_size > offset:
+                    os.truncate(self._records_file, offset)
+
+            # Rows written to vectors.bin without their record are dropped as well
+            if self.dimensions is not None and self._vectors_file.exists():
+                row_size = self.dimensions * np.dtype(self.dtype).itemsize
+                if self._vectors_file.stat().st_size > len(records) * row_size:
+                    os.truncate(self._vectors_file, len(records) * row_size)
+
+            self._register_rows([record for _, record in records], [offset for offset, _ in records])
+            for row in deleted:
+                self._delete_row(row)
+            self._load_ivf()
+            self._loaded = True
+            log_debug(f"Loaded {self._count} rows from {self.collection_path}")
+
+    def _open_vectors(self) -> None:
+        if self._count == 0 or self.dimensions is None:
+            self._vectors = None
+        else:
+            self._vectors = np.memmap(
+                self._vectors_file, dtype=self.dtype, mode="r", shape=(self._count, self.dimensions)
+            )
+
+    def _register_rows(self, records: List[Dict[str, Any]], offsets: List[int]) -> None:
+        """Add rows whose vectors and records are on disk to the in-memory state"""
+        start, end = self._count, self._count + len(records)
+        self._count = end
+        self._open_vectors()
+
+        self._live = _grow(self._live, end, False)
+        self._live[start:end] = True
+        self._offsets = _grow(self._offsets, end, 0)
+        self._offsets[start:end] = offsets
+        self._norms = _grow(self._norms, end, 0.0)
+        if self._vectors is not None and end > start:
+            for chunk_start in range(start, end, self.search_chunk_size):
+                chunk = np.asarray(
+                    self._vectors[chunk_start : min(end, chunk_start + self.search_chunk_size)], np.float32
+                )
+                self._norms[chunk_start : chunk_start + len(chunk)] = np.linalg.norm(chunk, axis=1)
+
+        for row, record in enumerate(records, start=start):
+            self._ids.append(record["id"])
+            self._names.append(record.get("name"))
+            self._content_hashes.append(record["content_hash"])
+            previous_row = self._row_by_id.get(record["id"])
+            if previous_row is not None:
+                self._delete_row(previous_row)
+            self._row_by_id[record["id"]] = row
+            self._rows_by_content_hash.setdefault(record["content_hash"], set()).add(row)
+            if record.get("name"):
+                self._name_counts[record["name"]] = self._name_counts.get(record["name"], 0) + 1
+            for key, value in (record.get("meta_data") or {}).items():
+                self._set_value(key, value, row)
+
+        for key in self._columns:
+            self._columns[key] = _grow(self._columns[key], end, -1)
+        for (key, code), bitmap in list(self._bitmaps.items()):
+            bitmap = _grow(bitmap, end, False)
+            bitmap[start:end] = self._columns[key][start:end] == code
+            self._bitmaps[(key, code)] = bitmap
+
+        if self._centroids is not None and end > start:
+            self._clusters = _grow(self._clusters, end, -1)
+            self._clusters[start:end] = self._assign_clusters(start, end)
+
+    def _set_value(self, key: str, value: Any, row: int) -> None:
+        codes = self._value_codes.setdefault(key, {})
+        code = codes.setdefault(_value_key(value), len(codes))
+        column = self._columns.get(key)
+        if column is None:
+            column = np.full(max(self._count, 1024), -1, dtype=np.int32)
+        column = _grow(column, row + 1, -1)
+        column[row] = code
+        self._columns[key] = column
+
+    def _delete_row(self, row: int) -> None:
+        if row >= self._count or not self._live[row]:
+            return
+        self._live[row] = False
+        row_id = self._ids[row]
+        if self._row_by_id.get(row_id) == row:
+            del self._row_by_id[row_id]
+        rows = self._rows_by_content_hash.get(self._content_hashes[row])
+        if rows is not None:
+            rows.discard(row)
+            if not rows:
+                del self._rows_by_content_hash[self._content_hashes[row]]
+        name = self._names[row]
+        if name and name in self._name_counts:
+            self._name_counts[name] -= 1
+            if self._name_counts[name] <= 0:
+                del self._name_counts[name]
+
+    def _read_records(self, rows: List[int]) -> List[Dict[str, Any]]:
+        records = []
+        with open(self._records_file, "rb") as f:
+            for row in rows:
+                f.seek(int(self._offsets[row]))
+                records.append(json.loads(f.readline()))
+        return records
+
+    # Collection
+
+    def create(self) -> None:
+        """Create the collection directory if it does not exist"""
+        with self._lock:
+            if self.exists():
+                self._load()
+                return
+            log_debug(f"Creating collection: {self.collection_path}")
+            self.collection_path.mkdir(parents=True, exist_ok=True)
+            self._reset_state()
+            self.dimensions = getattr(self.embedder, "dimensions", None)
+            self._write_config()
+            self._records_file.touch()
+            self._vectors_file.touch()
+            self._loaded = True
+
+    async def async_create(self) -> None:
+        await asyncio.to_thread(self.create)
+
+    def _write_config(self) -> None:
+        config = {"dimensions": self.dimensions, "dtype": self.dtype, "distance": self.distance.value}
+        self._config_file.write_text(json.dumps(config))
+
+    def exists(self) -> bool:
+        return self._config_file.exists()
+
+    async def async_exists(self) -> bool:
+        return self.exists()
+
+    def drop(self) -> None:
+        """Delete the collection directory"""
+        with self._lock:
+            if self.collection_path.exists():
+                log_debug(f"Deleting collection: {self.collection_path}")
+                self._vectors = None
+                shutil.rmtree(self.collection_path)
+            self._reset_state()
+            self._loaded = False
+            self._generation += 1
+
+    async def async_drop(self) -> None:
+        await asyncio.to_thread(self.drop)
+
+    def delete(self) -> bool:
+        """Delete all rows of the collection, keeping the collection"""
+        with self._lock:
+            if not self.exists():
+                return False
+            self.drop()
+            self.create()
+            return True
+
+    def get_count(self) -> int:
+        self._load()
+        return int(self._live[: self._count].sum())
+
+    # Lookups
+
+    def doc_exists(self, document: Document) -> bool:
+        self._load()
+        return safe_content_hash(document.content) in self._rows_by_content_hash
+
+    async def async_doc_exists(self, document: Document) -> bool:
+        return self.doc_exists(document)
+
+    def name_exists(self, name: str) -> bool:
+        self._load()
+        return name in self._name_counts
+
+    async def async_name_exists(self, name: str) -> bool:  # type: ignore[override]
+        return self.name_exists(name)
+
+    def id_exists(self, id: str) -> bool:
+        self._load()
+        return id in self._row_by_id
+
+    def existing_ids(self, ids: List[str]) -> Set[str]:
+        """Return the subset of ids that exist in the collection, matching either the id or the content hash"""
+        self._load()
+        return {id for id in ids if id in self._row_by_id or id in self._rows_by_content_hash}
+
+    # Writes
+
+    def upsert_available(self) -> bool:
+        return True
+
+    def _reuse_embeddings(self, documents: List[Document]) -> None:
+        """Copy the stored embedding of documents whose content is already in the collection, so it is not re-embedded"""
+        with self._lock:
+            self._load()
+            if self._vectors is None:
+                return
+            for doc in documents:
+                if doc.embedding is None:
+                    rows = self._rows_by_content_hash.get(safe_content_hash(doc.content))
+                    if rows:
+                        doc.embedding = np.asarray(self._vectors[next(iter(rows))], dtype=np.float32).tolist()
+
+    def _write(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        """Append the embedded documents to the collection. A document with the id of an existing row replaces it."""
+        with self._lock:
+            if not self.exists():
+                self.create()
+            self._load()
+
+            documents = [doc for doc in documents if doc.embedding is not None]
+            if not documents:
+                return
+            if self.dimensions is None:
+                self.dimensions = len(documents[0].embedding)  # type: ignore[arg-type]
+                self._write_config()
+
+            vectors = np.asarray([doc.embedding for doc in documents], dtype=self.dtype)
+            if vectors.ndim != 2 or vectors.shape[1] != self.dimensions:
+                raise ValueError(f"Expected embeddings with {self.dimensions} dimensions, got {vectors.shape[-1]}")
+
+            records = []
+            for doc in documents:
+                content_hash = safe_content_hash(doc.content)
+                meta_data = {**(doc.meta_data or {}), **(filters or {})}
+                records.append(
+                    {
+                        "id": doc.id or content_hash,
+                        "name": doc.name,
+                        "content": doc.content,
+                        "meta_data": meta_data,
+                        "usage": doc.usage,
+                        "content_hash": content_hash,
+                    }
+                )
+
+            # Vectors first: rows without a record are dropped when the collection is loaded
+            with open(self._vectors_file, "ab") as f:
+                f.write(vectors.tobytes())
+            offsets = []
+            with open(self._records_file, "ab") as f:
+                offset = f.tell()
+                for record in records:
+                    line = (json.dumps(record, default=str) + "\n").encode("utf-8")
+                    f.write(line)
+                    offsets.append(offset)
+                    offset += len(line)
+
+            self._register_rows(records, offsets)
+            log_debug(f"Inserted {len(records)} documents into {self.collection_path}")
+
+            if self.ivf and self._centroids is None and self.get_count() >= self.ivf_min_rows:
+                self.build_index()
+
+    def insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        log_debug(f"Inserting {len(documents)} documents")
+        self._reuse_embeddings(documents)
+        Document.embed_batch(documents, embedder=self.embedder)
+        self._write(documents, filters)
+
+    async def async_insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        log_debug(f"Inserting {len(documents)} documents")
+        await asyncio.to_thread(self._reuse_embeddings, documents)
+        await Document.async_embed_batch(documents, embedder=self.embedder)
+        await asyncio.to_thread(self._write, documents, filters)
+
+    def upsert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        """Insert documents, replacing rows with the same id. Unchanged content reuses its stored embedding."""
+        self.insert(documents, filters)
+
+    async def async_upsert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        await self.async_insert(documents, filters)
+
+    def _delete_rows(self, rows: List[int]) -> int:
+        rows = [row for row in rows if self._live[row]]
+        if not rows:
+            return 0
+        with open(self._records_file, "ab") as f:
+            for row in rows:
+                f.write((json.dumps({"deleted": row}) + "\n").encode("utf-8"))
+        for row in rows:
+            self._delete_row(row)
+        return len(rows)
+
+    def delete_by_id(self, id: str) -> bool:
+        with self._lock:
+            self._load()
+            row = self._row_by_id.get(id)
+            return row is not None and self._delete_rows([row]) > 0
+
+    def delete_by_ids(self, ids: List[str]) -> None:
+        with self._lock:
+            self._load()
+            self._delete_rows([self._row_by_id[id] for id in ids if id in self._row_by_id])
+
+    def delete_by_name(self, name: str) -> bool:
+        with self._lock:
+            self._load()
+            if name not in self._name_counts:
+                return False
+            rows = [row for row, row_name in enumerate(self._names) if row_name == name and self._live[row]]
+            return self._delete_rows(rows) > 0
+
+    def delete_by_metadata(self, metadata: Dict[str, Any]) -> bool:
+        with self._lock:
+            self._load()
+            rows = [int(row) for row in np.flatnonzero(self._get_filter_mask(metadata))]
+            return self._delete_rows(rows) > 0
+
+    def optimize(self) -> None:
+        """Rewrite the collection without deleted rows, and rebuild the IVF index if enabled"""
+        with self._lock:
+            self._load()
+            if self._count == 0:
+                return
+            live_rows = [int(row) for row in np.flatnonzero(self._live[: self._count])]
+            records = self._read_records(live_rows)
+            vectors = np.asarray(self._vectors[live_rows]) if self._vectors is not None and live_rows else None  # type: ignore[index]
+
+            self._vectors = None
+            vectors_tmp = self._vectors_file.with_suffix(".tmp")
+            records_tmp = self._records_file.with_suffix(".tmp")
+            with open(vectors_tmp, "wb") as f:
+                if vectors is not None:
+                    f.write(vectors.tobytes())
+            with open(records_tmp, "wb") as f:
+                for record in records:
+                    f.write((json.dumps(record, default=str) + "\n").encode("utf-8"))
+            os.replace(vectors_tmp, self._vectors_file)
+            os.replace(records_tmp, self._records_file)
+            self._ivf_file.unlink(missing_ok=True)
+
+            self._reset_state()
+            self._loaded = False
+            self._generation += 1
+            self._load()
+            log_info(f"Optimized {self.collection_path}: {self._count} rows")
+            if self.ivf and self._count >= self.ivf_min_rows:
+                self.build_index()
+
+    # IVF index
+
+    def _normalized(self, vectors: np.ndarray) -> np.ndarray:
+        vectors = np.asarray(vectors, dtype=np.float32)
+        if self.distance == Distance.cosine:
+            return vectors / np.maximum(np.linalg.norm(vectors, axis=-1, keepdims=True), 1e-12)
+        return vectors
+
+    def _assign_clusters(self, start: int, end: int) -> np.ndarray:
+        clusters = np.empty(end - start, dtype=np.int32)
+        for chunk_start in range(start, end, self.search_chunk_size):
+            chunk_end = min(end, chunk_start + self.search_chunk_size)
+            chunk = self._normalized(self._vectors[chunk_start:chunk_end])  # type: ignore[index]
+            clusters[chunk_start - start : chunk_end - start] = self._nearest_centroids(chunk, 1)[:, 0]
+        return clusters
+
+    def _nearest_centroids(self, vectors: np.ndarray, n: int) -> np.ndarray:
+        centroids: np.ndarray = self._centroids  # type: ignore[assignment]
+        distances = (centroids**2).sum(axis=1)[None, :] - 2 * vectors @ centroids.T
+        n = min(n, len(centroids))
+        nearest = np.argpartition(distances, n - 1, axis=1)[:, :n]
+        return nearest
+
+    def build_index(self, nlist: Optional[int] = None, iterations: int = 10, sample_size: int = 100_000) -> None:
+        """Cluster the rows with k-means, searches then only score the rows of the nprobe closest clusters"""
+        with self._lock:
+            self._load()
+            live_rows = np.flatnonzero(self._live[: self._count])
+            if self._vectors is None or len(live_rows) == 0:
+                return
+            nlist = min(nlist or self.nlist or max(1, int(np.sqrt(len(live_rows)))), len(live_rows))
+            rng = np.random.default_rng(0)
+            sample_rows = np.sort(rng.choice(live_rows, size=min(sample_size, len(live_rows)), replace=False))
+            sample = self._normalized(self._vectors[sample_rows])
+            centroids = sample[rng.choice(len(sample), size=nlist, replace=False)].copy()
+            for _ in range(iterations):
+                self._centroids = centroids
+                assignments = self._nearest_centroids(sample, 1)[:, 0]
+                for cluster in range(nlist):
+                    members = sample[assignments == cluster]
+                    if len(members) > 0:
+                        centroids[cluster] = members.mean(axis=0)
+            self._centroids = self._normalized(centroids) if self.distance == Distance.cosine else centroids
+            self._clusters = _grow(np.zeros(0, dtype=np.int32), self._count, -1)
+            self._clusters[: self._count] = self._assign_clusters(0, self._count)
+            np.savez(self._ivf_file, centroids=self._centroids, clusters=self._clusters[: self._count])
+            log_info(f"Built IVF index with {nlist} clusters for {len(live_rows)} rows")
+
+    def _load_ivf(self) -> None:
+        if not self._ivf_file.exists():
+            return
+        data = np.load(self._ivf_file)
+        self._centroids = data["centroids"]
+        clusters = data["clusters"]
+        self._clusters = _grow(np.zeros(0, dtype=np.int32), self._count, -1)
+        self._clusters[: len(clusters)] = clusters[: self._count]
+        # Rows appended after the index was saved
+        if len(clusters) < self._count:
+            self._clusters[len(clusters) : self._count] = self._assign_clusters(len(clusters), self._count)
+
+    # Search
+
+    def _get_bitmap(self, key: str, value: Any) -> np.ndarray:
+        code = self._value_codes.get(key, {}).get(_value_key(value))
+        if code is None:
+            return np.zeros(self._count, dtype=bool)
+        bitmap = self._bitmaps.get((key, code))
+        if bitmap is None:
+            bitmap = self._columns[key] == code
+            if len(self._bitmaps) >= self.max_cached_bitmaps:
+                del self._bitmaps[next(iter(self._bitmaps))]
+            self._bitmaps[(key, code)] = bitmap
+        return bitmap[: self._count]
+
+    def _get_filter_mask(self, filters: Optional[Dict[str, Any]]) -> np.ndarray:
+        """Return the bitmap of the live rows matching all filters"""
+        mask = self._live[: self._count].copy()
+        for key, value in (filters or {}).items():
+            mask &= self._get_bitmap(key, value)
+        return mask
+
+    def _score(
+        self, vectors: np.ndarray, norms: np.ndarray, rows: np.ndarray, query: np.ndarray, query_norm: float
+    ) -> np.ndarray:
+        """Score the rows against the query, higher is closer"""
+        if rows[-1] - rows[0] + 1 == len(rows):
+            # Contiguous rows are read as a slice of the memmap instead of a gather
+            row_vectors = vectors[rows[0] : rows[-1] + 1]
+        else:
+            row_vectors = vectors[rows]
+        dots = np.asarray(row_vectors, dtype=np.float32) @ query
+        if self.distance == Distance.cosine:
+            return dots / np.maximum(norms[rows] * query_norm, 1e-12)
+        if self.distance == Distance.l2:
+            # Ranking by -||v - q||^2 without the constant ||q||^2
+            return 2 * dots - norms[rows] ** 2
+        return dots
+
+    def _top_k(
+        self,
+        vectors: np.ndarray,
+        norms: np.ndarray,
+        candidates: np.ndarray,
+        query: np.ndarray,
+        limit: int,
+    ) -> List[int]:
+        """Return the rows of the limit candidates closest to the query, scoring search_chunk_size rows at a time"""
+        query_norm = float(np.linalg.norm(query))
+        best_rows: List[np.ndarray] = []
+        best_scores: List[np.ndarray] = []
+        for start in range(0, len(candidates), self.search_chunk_size):
+            rows = candidates[start : start + self.search_chunk_size]
+            scores = self._score(vectors, norms, rows, query, query_norm)
+            if len(scores) > limit:
+                top = np.argpartition(-scores, limit - 1)[:limit]
+                rows, scores = rows[top], scores[top]
+            best_rows.append(rows)
+            best_scores.append(scores)
+        if not best_rows:
+            return []
+        rows = np.concatenate(best_rows)
+        scores = np.concatenate(best_scores)
+        return [int(row) for row in rows[np.argsort(-scores, kind="stable")[:limit]]]
+
+    def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+        query_embedding = self.embedder.get_embedding(query)
+        if query_embedding is None:
+            logger.error(f"Error getting embedding for Query: {query}")
+            return []
+        return self._search_by_embedding(query, query_embedding, limit, filters)
+
+    async def async_search(
+        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Document]:
+        return await asyncio.to_thread(self.search, query, limit, filters)
+
+    def vector_search(self, query: str, limit: int = 5) -> List[Document]:
+        return self.search(query, limit=limit)
+
+    def _search_by_embedding(
+        self, query: str, query_embedding: List[float], limit: int, filters: Optional[Dict[str, Any]]
+    ) -> List[Document]:
+        query_vector = np.asarray(query_embedding, dtype=np.float32)
+        with self._lock:
+            self._load()
+            if self._vectors is None or limit <= 0:
+                return []
+            # Rows are only appended, so views of the current rows stay valid while new rows are written
+            vectors, norms, generation = self._vectors, self._norms[: self._count], self._generation
+            candidates = np.flatnonzero(self._get_filter_mask(filters))
+            if self._centroids is not None and len(candidates) > limit:
+                probe = self._nearest_centroids(self._normalized(query_vector[None, :]), self.nprobe)[0]
+                candidates = candidates[np.isin(self._clusters[candidates], probe)]
+
+        # Score outside of the lock, so searches run concurrently with each other and with writes
+        rows = self._top_k(vectors, norms, candidates, query_vector, limit)
+
+        with self._lock:
+            if generation != self._generation:
+                # The collection was rewritten during the search, the rows don't match the records anymore
+                return self._search_by_embedding(query, query_embedding, limit, filters)
+            records = self._read_records(rows)
+        embeddings: List[np.ndarray] = list(np.asarray(vectors[rows], dtype=np.float32)) if rows else []
+
+        search_results = [
+            Document(
+                id=record["id"],
+                name=record.get("name"),
+                meta_data=record.get("meta_data") or {},
+                content=record["content"],
+                embedder=self.embedder,
+                embedding=embedding.tolist(),
+                usage=record.get("usage"),
+            )
+            for record, embedding in zip(records, embeddings)
+        ]
+        if self.reranker:
+            search_results = self.reranker.rerank(query=query, documents=search_results)
+        log_debug(f"Found {len(search_results)} documents")
+        return search_results
@@ -1,6 +1,6 @@
 import asyncio
 from math import sqrt
-from typing import Any, Dict, List, Optional, Union, cast
+from typing import Any, Dict, List, Optional, Set, Union, cast
 
 try:
     from sqlalchemy.dialects import postgresql
@@ -274,6 +274,32 @@ class PgVector(VectorDb):
         """
         return self._record_exists(self.table.c.id, id)
 
+    def existing_ids(self, ids: List[str]) -> Set[str]:
+        """
+        Return the subset of ids that already exist in the table, matching either the id or the content hash.
+
+        Args:
+            ids (List[str]): The IDs or content hashes to check.
+
+        Returns:
+            Set[str]: The IDs that exist in the table.
+        """
+        if not ids:
+            return set()
+        try:
+            with self.Session() as sess, sess.begin():
+                stmt = select(self.table.c.id, self.table.c.content_hash).where(
+                    self.table.c.id.in_(ids) | self.table.c.content_hash.in_(ids)
+                )
+                found: Set[str] = set()
+                for row in sess.execute(stmt).fetchall():
+                    found.add(row.id)
+                    found.add(row.content_hash)
+                return found.intersection(ids)
+        except Exception as e:
+            logger.error(f"Error checking existing ids: {e}")
+            return set()
+
     def _clean_content(self, content: str) -> str:
         """
         Clean the content by replacing null characters.
@@ -306,11 +332,13 @@ class PgVector(VectorDb):
                     batch_docs = documents[i : i + batch_size]
                     log_debug(f"Processing batch starting at index {i}, size: {len(batch_docs)}")
                     try:
+                        # Reuse the stored embeddings of unchanged content, embed the rest of the batch
+                        self._reuse_embeddings(sess, batch_docs)
+                        Document.embed_batch(batch_docs, embedder=self.embedder)
                         # Prepare documents for insertion
                         batch_records = []
                         for doc in batch_docs:
                             try:
-                                doc.embed(embedder=self.embedder)
                                 cleaned_content = self._clean_content(doc.content)
                                 content_hash = safe_content_hash(doc.content)
                                 _id = doc.id or content_hash
@@ -359,6 +387,28 @@ class PgVector(VectorDb):
         """
         return True
 
+    def _reuse_embeddings(self, sess: Session, documents: List[Document]) -> None:
+        """
+        Set the stored embedding on documents whose content hash is already in the table, so they are not re-embedded.
+
+        Args:
+            sess (Session): The session to query with.
+            documents (List[Document]): The documents to embed.
+        """
+        hashes = {safe_content_hash(doc.content) for doc in documents if doc.embedding is None}
+        if not hashes:
+            return
+        stmt = select(self.table.c.content_hash, self.table.c.embedding).where(self.table.c.content_hash.in_(hashes))
+        embeddings = {row.content_hash: row.embedding for row in sess.execute(stmt).fetchall()}
+        reused = 0
+        for doc in documents:
+            embedding = embeddings.get(safe_content_hash(doc.content))
+            if doc.embedding is None and embedding is not None:
+                doc.embedding = list(embedding)
+                reused += 1
+        if reused:
+            log_debug(f"Reusing {reused} stored embeddings")
+
     def upsert(
         self,
         documents: List[Document],
@@ -379,11 +429,13 @@ class PgVector(VectorDb):
                     batch_docs = documents[i : i + batch_size]
                     log_debug(f"Processing batch starting at index {i}, size: {len(batch_docs)}")
                     try:
+                        # Reuse the stored embeddings of unchanged content, embed the rest of the batch
+                        self._reuse_embeddings(sess, batch_docs)
+                        Document.embed_batch(batch_docs, embedder=self.embedder)
                         # Prepare documents for upserting
                         batch_records = []
                         for doc in batch_docs:
                             try:
-                                doc.embed(embedder=self.embedder)
                                 cleaned_content = self._clean_content(doc.content)
                                 content_hash = safe_content_hash(doc.content)
 
@@ -1018,6 +1070,28 @@ class PgVector(VectorDb):
             logger.error(f"Error creating GIN index '{gin_index_name}': {e}")
             raise
 
+    def delete_by_ids(self, ids: List[str]) -> None:
+        """
+        Delete the records with the given IDs.
+
+        Args:
+            ids (List[str]): The IDs of the records to delete.
+        """
+        from sqlalchemy import delete
+
+        if not ids:
+            return
+        with self.Session() as sess:
+            try:
+                for i in range(0, len(ids), 1000):
+                    sess.execute(delete(self.table).where(self.table.c.id.in_(ids[i : i + 1000])))
+                sess.commit()
+                log_debug(f"Deleted {len(ids)} records from table '{self.table.fullname}'.")
+            except Exception as e:
+                logger.error(f"Error deleting records from table '{self.table.fullname}': {e}")
+                sess.rollback()
+                raise
+
     def delete(self) -> bool:
         """
         Delete all records from the table.
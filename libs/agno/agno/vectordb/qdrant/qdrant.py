@@ -312,6 +312,8 @@ class Qdrant(VectorDb):
             batch_size (int): Batch size for inserting documents
         """
         log_debug(f"Inserting {len(documents)} documents")
+        if self.search_type in [SearchType.vector, SearchType.hybrid]:
+            Document.embed_batch(documents, embedder=self.embedder)
         points = []
         for document in documents:
             cleaned_content = document.content.replace("\x00", "\ufffd")
@@ -325,13 +327,11 @@ class Qdrant(VectorDb):
 
             if self.search_type == SearchType.vector:
                 # For vector search, maintain backward compatibility with unnamed vectors
-                document.embed(embedder=self.embedder)
                 vector = document.embedding  # type: ignore
             else:
                 # For other search types, use named vectors
                 vector = {}
                 if self.search_type in [SearchType.hybrid]:
-                    document.embed(embedder=self.embedder)
                     vector[self.dense_vector_name] = document.embedding
 
                 if self.search_type in [SearchType.keyword, SearchType.hybrid]:
@@ -373,6 +373,8 @@ class Qdrant(VectorDb):
             filters (Optional[Dict[str, Any]]): Filters to apply while inserting documents
         """
         log_debug(f"Inserting {len(documents)} documents asynchronously")
+        if self.search_type in [SearchType.vector, SearchType.hybrid]:
+            await Document.async_embed_batch(documents, embedder=self.embedder)
 
         async def process_document(document):
             cleaned_content = document.content.replace("\x00", "\ufffd")
@@ -380,13 +382,11 @@ class Qdrant(VectorDb):
 
             if self.search_type == SearchType.vector:
                 # For vector search, maintain backward compatibility with unnamed vectors
-                document.embed(embedder=self.embedder)
                 vector = document.embedding
             else:
                 # For other search types, use named vectors
                 vector = {}
                 if self.search_type in [SearchType.hybrid]:
-                    document.embed(embedder=self.embedder)
                     vector[self.dense_vector_name] = document.embedding
 
                 if self.search_type in [SearchType.keyword, SearchType.hybrid]:
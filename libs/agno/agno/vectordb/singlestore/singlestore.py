@@ -170,10 +170,10 @@ class SingleStore(VectorDb):
             filters (Optional[Dict[str, Any]]): Optional filters for the insert.
             batch_size (int): Number of documents to insert in each batch.
         """
+        Document.embed_batch(documents, embedder=self.embedder)
         with self.Session.begin() as sess:
             counter = 0
             for document in documents:
-                document.embed(embedder=self.embedder)
                 cleaned_content = document.content.replace("\x00", "\ufffd")
                 content_hash = md5(cleaned_content.encode()).hexdigest()
                 _id = document.id or content_hash
@@ -213,10 +213,10 @@ class SingleStore(VectorDb):
             filters (Optional[Dict[str, Any]]): Optional filters for the upsert.
             batch_size (int): Number of documents to upsert in each batch.
         """
+        Document.embed_batch(documents, embedder=self.embedder)
         with self.Session.begin() as sess:
             counter = 0
             for document in documents:
-                document.embed(embedder=self.embedder)
                 cleaned_content = document.content.replace("\x00", "\ufffd")
                 content_hash = md5(cleaned_content.encode()).hexdigest()
                 _id = document.id or content_hash
@@ -250,8 +250,8 @@ class Weaviate(VectorDb):
         log_debug(f"Inserting {len(documents)} documents into Weaviate.")
         collection = self.get_client().collections.get(self.collection)
 
+        Document.embed_batch(documents, embedder=self.embedder)
         for document in documents:
-            document.embed(embedder=self.embedder)
             if document.embedding is None:
                 logger.error(f"Document embedding is None: {document.name}")
                 continue
@@ -295,11 +295,12 @@ class Weaviate(VectorDb):
         try:
             collection = client.collections.get(self.collection)
 
-            # Process documents first
+            # Embed all documents first
+            await Document.async_embed_batch(documents, embedder=self.embedder)
+
+            # Process documents
             for document in documents:
                 try:
-                    # Embed document
-                    document.embed(embedder=self.embedder)
                     if document.embedding is None:
                         logger.error(f"Document embedding is None: {document.name}")
                         continue
@@ -359,8 +360,8 @@ class Weaviate(VectorDb):
         try:
             collection = client.collections.get(self.collection)
 
+            await Document.async_embed_batch(documents, embedder=self.embedder)
             for document in documents:
-                document.embed(embedder=self.embedder)
                 if document.embedding is None:
                     logger.error(f"Document embedding is None: {document.name}")
                     continue
@@ -1,4 +1,5 @@
 from agno.workflow.v2.condition import Condition
+from agno.workflow.v2.dag import Dag
 from agno.workflow.v2.loop import Loop
 from agno.workflow.v2.parallel import Parallel
 from agno.workflow.v2.router import Router
@@ -15,6 +16,7 @@ __all__ = [
     "Parallel",
     "Condition",
     "Router",
+    "Dag",
     "WorkflowExecutionInput",
     "StepInput",
     "StepOutput",
@@ -0,0 +1,219 @@
+"""Memoization of workflow step outputs.
+
+A step with a cache stores its output under a key made of the step name, a fingerprint of the executor configuration
+(agent/team settings, or the source of a function) and a hash of the step input. When the same step receives the
+same input again, e.g. when re-running a workflow while iterating on later steps, the cached output is returned
+instead of executing the step. Only use a cache for steps that are deterministic for a given input.
+Outputs whose content is neither JSON data nor a pydantic model of an importable class are not cached, a hit would
+return them with another type.
+
+Outputs are stored in any `ToolCache` backend from `agno.tools.cache` (in memory, SQLite or Redis), which handle
+expiry, eviction, metrics and the async API.
+"""
+
+import inspect
+import json
+from hashlib import sha256
+from importlib import import_module
+from typing import Any, Dict, List, Optional, Type
+
+from pydantic import BaseModel
+
+from agno.agent import Agent
+from agno.models.base import Model
+from agno.team import Team
+from agno.tools.function import Function
+from agno.tools.toolkit import Toolkit
+from agno.utils.log import log_debug, log_warning
+
+AGENT_FINGERPRINT_FIELDS = [
+    "name",
+    "model",
+    "instructions",
+    "description",
+    "goal",
+    "expected_output",
+    "additional_context",
+    "system_message",
+    "tools",
+    "response_model",
+    "use_json_mode",
+    "add_history_to_messages",
+    "num_history_runs",
+]
+TEAM_FINGERPRINT_FIELDS = [
+    "name",
+    "mode",
+    "model",
+    "instructions",
+    "description",
+    "expected_output",
+    "success_criteria",
+    "tools",
+    "response_model",
+    "members",
+]
+
+
+def _canonicalize(value: Any, depth: int = 0) -> Any:
+    """Turn a configuration value into JSON compatible data that is stable across processes"""
+    if depth > 8:
+        return type(value).__name__
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, dict):
+        return {str(k): _canonicalize(v, depth + 1) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_canonicalize(v, depth + 1) for v in value]
+    if isinstance(value, (set, frozenset)):
+        return sorted(str(_canonicalize(v, depth + 1)) for v in value)
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, type) and issubclass(value, BaseModel):
+        return value.model_json_schema()
+    if isinstance(value, Model):
+        return {
+            "class": f"{type(value).__module__}.{type(value).__qualname__}",
+            **{
+                k: v
+                for k, v in vars(value).items()
+                if not k.startswith("_") and k not in ("api_key", "client", "async_client") and _is_scalar(v)
+            },
+        }
+    if isinstance(value, Toolkit):
+        return {"toolkit": value.name, "functions": sorted(value.functions.keys())}
+    if isinstance(value, Function):
+        return {"function": value.name}
+    if isinstance(value, Team):
+        return _get_config(value, TEAM_FINGERPRINT_FIELDS, depth + 1)
+    if isinstance(value, Agent):
+        return _get_config(value, AGENT_FINGERPRINT_FIELDS, depth + 1)
+    if callable(value):
+        return f"{getattr(value, '__module__', '')}.{getattr(value, '__qualname__', type(value).__name__)}"
+    return type(value).__name__
+
+
+def _is_scalar(value: Any) -> bool:
+    return value is None or isinstance(value, (str, int, float, bool))
+
+
+def _get_config(executor: Any, fields: List[str], depth: int = 0) -> Dict[str, Any]:
+    return {field: _canonicalize(getattr(executor, field, None), depth) for field in fields}
+
+
+def _hash(data: Any) -> str:
+    return sha256(json.dumps(data, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def get_executor_fingerprint(executor: Any, executor_type: str) -> str:
+    """Hash the configuration of a step executor. Functions are fingerprinted by their source code."""
+    if executor_type == "function":
+        try:
+            source = inspect.getsource(executor)
+        except (OSError, TypeError):
+            source = None
+        config: Any = {"function": _canonicalize(executor), "source": source}
+    elif executor_type == "team":
+        config = _get_config(executor, TEAM_FINGERPRINT_FIELDS)
+    else:
+        config = _get_config(executor, AGENT_FINGERPRINT_FIELDS)
+    return _hash({"type": executor_type, "config": config})
+
+
+def _get_output_data(step_output: Any) -> Any:
+    if step_output.parallel_step_outputs:
+        return {name: _get_output_data(output) for name, output in step_output.parallel_step_outputs.items()}
+    return _canonicalize(step_output.content)
+
+
+def _get_media_data(media: Optional[List[Any]]) -> Optional[List[Any]]:
+    # Artifacts get a new random id every time they are created, so the id is not part of the input
+    return [{k: v for k, v in item.to_dict().items() if k != "id"} for item in media] if media else None
+
+
+def get_step_input_data(step_input: Any) -> Dict[str, Any]:
+    """Return the parts of a StepInput that determine the output of a step.
+
+    Previous steps contribute their content only, their responses hold run ids and timestamps that differ per run.
+    """
+    previous_step_outputs = step_input.previous_step_outputs or {}
+    return {
+        "message": _canonicalize(step_input.message),
+        "additional_data": _canonicalize(step_input.additional_data),
+        "previous_step_outputs": {name: _get_output_data(output) for name, output in previous_step_outputs.items()},
+        "images": _get_media_data(step_input.images),
+        "videos": _get_media_data(step_input.videos),
+        "audio": _get_media_data(step_input.audio),
+    }
+
+
+def get_step_cache_key(step_name: Optional[str], executor_fingerprint: str, step_input: Any) -> Optional[str]:
+    """Return the cache key of a step for the given StepInput, or None if the input can't be hashed"""
+    try:
+        input_hash = _hash(get_step_input_data(step_input))
+    except Exception as e:
+        log_warning(f"Could not hash the input of step {step_name}, skipping the cache: {e}")
+        return None
+    key = _hash({"step_name": step_name, "executor": executor_fingerprint, "input": input_hash})
+    log_debug(f"Step {step_name} cache key: {key}")
+    return key
+
+
+def _get_model_path(model_class: Type[BaseModel]) -> str:
+    return f"{model_class.__module__}:{model_class.__qualname__}"
+
+
+def _import_model(path: str) -> Optional[Type[BaseModel]]:
+    module_name, _, qualname = path.partition(":")
+    try:
+        model: Any = import_module(module_name)
+        for name in qualname.split("."):
+            model = getattr(model, name)
+    except (ImportError, AttributeError):
+        return None
+    return model if isinstance(model, type) and issubclass(model, BaseModel) else None
+
+
+def _set_cached_content(step_output: Any, value: Dict[str, Any]) -> bool:
+    """Put the content of a StepOutput in its cache value so a hit restores it with the same type.
+    Returns False if the content can't be restored: models of classes that can't be imported, or non JSON data."""
+    content = step_output.content
+    if isinstance(content, BaseModel):
+        content_type = _get_model_path(type(content))
+        if _import_model(content_type) is not type(content):
+            return False
+        value["content"] = content.model_dump(mode="json")
+        value["content_type"] = content_type
+    else:
+        try:
+            if json.loads(json.dumps(content)) != content:
+                return False
+        except (TypeError, ValueError):
+            return False
+        value["content"] = content
+    for name, output in (step_output.parallel_step_outputs or {}).items():
+        if not _set_cached_content(output, value["parallel_step_outputs"][name]):
+            return False
+    return True
+
+
+def get_step_cache_value(step_output: Any) -> Optional[Dict[str, Any]]:
+    """Return a StepOutput as JSON data, so every cache backend can store it and later runs don't share its objects.
+
+    Returns None if the output should not be cached because its content would come back with another type. Contents
+    must be JSON data (str, numbers, dicts and lists) or pydantic models of classes that can be imported.
+    """
+    value = json.loads(json.dumps(step_output.to_dict(), default=str))
+    return value if _set_cached_content(step_output, value) else None
+
+
+def restore_cached_content(step_output: Any, value: Dict[str, Any]) -> None:
+    """Give a StepOutput loaded from the cache its pydantic model contents back"""
+    content_type = value.get("content_type")
+    if content_type is not None:
+        model = _import_model(content_type)
+        if model is None:
+            raise ValueError(f"Could not import the content type {content_type}")
+        step_output.content = model.model_validate(value["content"])
+    for name, output in (step_output.parallel_step_outputs or {}).items():
+        restore_cached_content(output, value["parallel_step_outputs"][name])
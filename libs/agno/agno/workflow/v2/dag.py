@@ -0,0 +1,413 @@
+import asyncio
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+from agno.run.response import RunResponseEvent
+from agno.run.team import TeamRunResponseEvent
+from agno.run.v2.workflow import (
+    DagExecutionCompletedEvent,
+    DagExecutionStartedEvent,
+    WorkflowRunResponse,
+    WorkflowRunResponseEvent,
+)
+from agno.utils.log import log_debug, logger
+from agno.workflow.v2.step import Step
+from agno.workflow.v2.types import StepInput, StepOutput
+
+WorkflowSteps = List[
+    Union[
+        Callable[
+            [StepInput], Union[StepOutput, Awaitable[StepOutput], Iterator[StepOutput], AsyncIterator[StepOutput]]
+        ],
+        Step,
+        "Steps",  # type: ignore # noqa: F821
+        "Loop",  # type: ignore # noqa: F821
+        "Parallel",  # type: ignore # noqa: F821
+        "Condition",  # type: ignore # noqa: F821
+        "Router",  # type: ignore # noqa: F821
+    ]
+]
+
+
+@dataclass
+class Dag:
+    """Steps that run as soon as the steps they depend on have completed.
+
+    Dependencies are declared with `Step(depends_on=[...])` or with the `dependencies` mapping of step name to the
+    names of the steps it depends on. A step receives the outputs of its dependencies as previous step outputs, steps
+    without dependencies receive the input of the Dag. Ready steps run concurrently, in threads for sync execution and
+    in tasks for async execution, up to max_concurrency at a time. The Dag returns the step outputs in the order the
+    steps completed. A step that raises stops the Dag and the error is raised to the workflow.
+    """
+
+    steps: WorkflowSteps
+
+    name: Optional[str] = None
+    description: Optional[str] = None
+
+    # Step name -> names of the steps it depends on, in addition to Step.depends_on
+    dependencies: Optional[Dict[str, List[str]]] = None
+    # Maximum number of steps running at the same time, None runs all ready steps at once
+    max_concurrency: Optional[int] = None
+
+    def __init__(
+        self,
+        *steps: WorkflowSteps,
+        name: Optional[str] = None,
+        description: Optional[str] = None,
+        dependencies: Optional[Dict[str, List[str]]] = None,
+        max_concurrency: Optional[int] = None,
+    ):
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.steps = list(steps)
+        self.name = name
+        self.description = description
+        self.dependencies = dependencies
+        self.max_concurrency = max_concurrency
+
+    def _prepare_steps(self):
+        """Prepare the steps for execution - mirrors workflow logic"""
+        from agno.agent.agent import Agent
+        from agno.team.team import Team
+        from agno.workflow.v2.condition import Condition
+        from agno.workflow.v2.loop import Loop
+        from agno.workflow.v2.parallel import Parallel
+        from agno.workflow.v2.router import Router
+        from agno.workflow.v2.steps import Steps
+
+        prepared_steps: WorkflowSteps = []
+        for step in self.steps:
+            if callable(step) and hasattr(step, "__name__"):
+                prepared_steps.append(Step(name=step.__name__, description="User-defined callable step", executor=step))
+            elif isinstance(step, Agent):
+                prepared_steps.append(Step(name=step.name, description=step.description, agent=step))
+            elif isinstance(step, Team):
+                prepared_steps.append(Step(name=step.name, description=step.description, team=step))
+            elif isinstance(step, (Step, Steps, Loop, Parallel, Condition, Router, Dag)):
+                prepared_steps.append(step)
+            else:
+                raise ValueError(f"Invalid step type: {type(step).__name__}")
+
+        self.steps = prepared_steps
+
+    def _get_graph(self) -> Dict[str, List[str]]:
+        """Return step name -> dependency names, validating that names are unique and the graph has no cycles"""
+        graph: Dict[str, List[str]] = {}
+        for step in self.steps:
+            step_name = getattr(step, "name", None)
+            if not step_name:
+                raise ValueError(f"Steps of Dag {self.name} need a name")
+            if step_name in graph:
+                raise ValueError(f"Dag {self.name} has more than one step named {step_name}")
+            depends_on = list(getattr(step, "depends_on", None) or [])
+            for dependency in (self.dependencies or {}).get(step_name, []):
+                if dependency not in depends_on:
+                    depends_on.append(dependency)
+            graph[step_name] = depends_on
+
+        for step_name in self.dependencies or {}:
+            if step_name not in graph:
+                raise ValueError(f"Dag {self.name} has dependencies for unknown step {step_name}")
+        for step_name, depends_on in graph.items():
+            for dependency in depends_on:
+                if dependency not in graph:
+                    raise ValueError(f"Step {step_name} depends on unknown step {dependency}")
+
+        # Kahn's algorithm, every step is resolved unless there is a cycle
+        resolved: set = set()
+        remaining = dict(graph)
+        while remaining:
+            ready = [name for name, depends_on in remaining.items() if all(d in resolved for d in depends_on)]
+            if not ready:
+                raise ValueError(f"Dag {self.name} has a dependency cycle between {', '.join(remaining)}")
+            for name in ready:
+                resolved.add(name)
+                del remaining[name]
+        return graph
+
+    def _create_node_input(
+        self, step_input: StepInput, depends_on: List[str], node_outputs: Dict[str, StepOutput]
+    ) -> StepInput:
+        """Create the input of a step from the Dag input and the outputs of its dependencies"""
+        previous_step_outputs = dict(step_input.previous_step_outputs or {})
+        images = list(step_input.images or [])
+        videos = list(step_input.videos or [])
+        audio = list(step_input.audio or [])
+        for dependency in depends_on:
+            output = node_outputs[dependency]
+            # Re-insert so the dependencies are the most recent outputs, in the declared order
+            previous_step_outputs.pop(dependency, None)
+            previous_step_outputs[dependency] = output
+            images.extend(output.images or [])
+            videos.extend(output.videos or [])
+            audio.extend(output.audio or [])
+
+        return StepInput(
+            message=step_input.message,
+            previous_step_outputs=previous_step_outputs or None,
+            additional_data=step_input.additional_data,
+            images=images or None,
+            videos=videos or None,
+            audio=audio or None,
+        )
+
+    def _get_node_step_index(self, step_index: Optional[Union[int, tuple]], index: int) -> Union[int, tuple]:
+        # Dag as a main step: nodes get x.1, x.2, ... As a child step: nodes extend the parent index
+        if step_index is None or isinstance(step_index, int):
+            return (step_index if step_index is not None else 0, index)
+        return step_index + (index,)
+
+    def _get_ready_nodes(
+        self, graph: Dict[str, List[str]], pending: List[str], node_outputs: Dict[str, StepOutput]
+    ) -> List[str]:
+        return [name for name in pending if all(dependency in node_outputs for dependency in graph[name])]
+
+    def _complete_node(self, step_name: str, events: List[Any], node_outputs: Dict[str, StepOutput]) -> bool:
+        """Record the output of a completed step, returns True if the step requested early termination"""
+        outputs = [event for event in events if isinstance(event, StepOutput)]
+        # Dependents receive the last output (Loop, Condition and Router return several)
+        node_outputs[step_name] = outputs[-1] if outputs else StepOutput(step_name=step_name, content="")
+        log_debug(f"Dag {self.name}: step {step_name} completed")
+        if any(output.stop for output in outputs):
+            logger.info(f"Early termination requested by step {step_name}")
+            return True
+        return False
+
+    def _execute_nodes(
+        self, step_input: StepInput, run_node: Callable[[int, Any, StepInput], List[Any]]
+    ) -> Iterator[Tuple[str, List[Any]]]:
+        """Run the steps in threads as their dependencies complete, yielding (step name, events) per completed step"""
+        graph = self._get_graph()
+        steps_by_name = {step.name: (index, step) for index, step in enumerate(self.steps)}  # type: ignore[union-attr]
+        pending = list(graph)
+        node_outputs: Dict[str, StepOutput] = {}
+        stop = False
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrency or len(self.steps)) as executor:
+            running: Dict[Future, str] = {}
+            try:
+                while pending or running:
+                    if not stop:
+                        for step_name in self._get_ready_nodes(graph, pending, node_outputs):
+                            pending.remove(step_name)
+                            index, step = steps_by_name[step_name]
+                            node_input = self._create_node_input(step_input, graph[step_name], node_outputs)
+                            running[executor.submit(run_node, index, step, node_input)] = step_name
+                    if not running:
+                        break
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        step_name = running.pop(future)
+                        events = future.result()
+                        stop = self._complete_node(step_name, events, node_outputs) or stop
+                        yield step_name, events
+            except BaseException:
+                for future in running:
+                    future.cancel()
+                raise
+
+    async def _aexecute_nodes(
+        self, step_input: StepInput, run_node: Callable[[int, Any, StepInput], Awaitable[List[Any]]]
+    ) -> AsyncIterator[Tuple[str, List[Any]]]:
+        """Run the steps in tasks as their dependencies complete, yielding (step name, events) per completed step"""
+        graph = self._get_graph()
+        steps_by_name = {step.name: (index, step) for index, step in enumerate(self.steps)}  # type: ignore[union-attr]
+        pending = list(graph)
+        node_outputs: Dict[str, StepOutput] = {}
+        stop = False
+        semaphore = asyncio.Semaphore(self.max_concurrency) if self.max_concurrency else None
+
+        async def run_limited(index: int, step: Any, node_input: StepInput) -> List[Any]:
+            if semaphore is None:
+                return await run_node(index, step, node_input)
+            async with semaphore:
+                return await run_node(index, step, node_input)
+
+        running: Dict[asyncio.Task, str] = {}
+        try:
+            while pending or running:
+                if not stop:
+                    for step_name in self._get_ready_nodes(graph, pending, node_outputs):
+                        pending.remove(step_name)
+                        index, step = steps_by_name[step_name]
+                        node_input = self._create_node_input(step_input, graph[step_name], node_outputs)
+                        running[asyncio.create_task(run_limited(index, step, node_input))] = step_name
+                if not running:
+                    break
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    step_name = running.pop(task)
+                    events = task.result()
+                    stop = self._complete_node(step_name, events, node_outputs) or stop
+                    yield step_name, events
+        finally:
+            for task in running:
+                task.cancel()
+
+    def execute(
+        self,
+        step_input: StepInput,
+        session_id: Optional[str] = None,
+        user_id: Optional[str] = None,
+    ) -> List[StepOutput]:
+        """Execute the steps in dependency order, running ready steps concurrently"""
+        log_debug(f"Dag Start: {self.name} ({len(self.steps)} steps)", center=True, symbol="=")
+
+        self._prepare_steps()
+
+        def run_node(index: int, step: Any, node_input: StepInput) -> List[Any]:
+            output = step.execute(node_input, session_id=session_id, user_id=user_id)
+            return output if isinstance(output, list) else [output]
+
+        all_results: List[StepOutput] = []
+        for _, events in self._execute_nodes(step_input, run_node):
+            all_results.extend(event for event in events if isinstance(event, StepOutput))
+
+        log_debug(f"Dag End: {self.name} ({len(all_results)} results)", center=True, symbol="=")
+        return all_results
+
+    def execute_stream(
+        self,
+        step_input: StepInput,
+        session_id: Optional[str] = None,
+        user_id: Optional[str] = None,
+        stream_intermediate_steps: bool = False,
+        workflow_run_response: Optional[WorkflowRunResponse] = None,
+        step_index: Optional[Union[int, tuple]] = None,
+    ) -> Iterator[Union[WorkflowRunResponseEvent, TeamRunResponseEvent, RunResponseEvent, StepOutput]]:
+        """Execute the steps in dependency order with streaming, yielding the events of each step as it completes"""
+        log_debug(f"Dag Start: {self.name} ({len(self.steps)} steps)", center=True, symbol="=")
+
+        self._prepare_steps()
+
+        if stream_intermediate_steps and workflow_run_response:
+            yield DagExecutionStartedEvent(
+                run_id=workflow_run_response.run_id or "",
+                workflow_name=workflow_run_response.workflow_name or "",
+                workflow_id=workflow_run_response.workflow_id or "",
+                session_id=workflow_run_response.session_id or "",
+                step_name=self.name,
+                step_index=step_index,
+                node_count=len(self.steps),
+                max_concurrency=self.max_concurrency,
+            )
+
+        def run_node(index: int, step: Any, node_input: StepInput) -> List[Any]:
+            # Events are collected in the thread and yielded when the step completes
+            return list(
+                step.execute_stream(
+                    node_input,
+                    session_id=session_id,
+                    user_id=user_id,
+                    stream_intermediate_steps=stream_intermediate_steps,
+                    workflow_run_response=workflow_run_response,
+                    step_index=self._get_node_step_index(step_index, index),
+                )
+            )
+
+        all_results: List[StepOutput] = []
+        for _, events in self._execute_nodes(step_input, run_node):
+            for event in events:
+                if isinstance(event, StepOutput):
+                    all_results.append(event)
+                yield event
+
+        log_debug(f"Dag End: {self.name} ({len(all_results)} results)", center=True, symbol="=")
+
+        if stream_intermediate_steps and workflow_run_response:
+            yield DagExecutionCompletedEvent(
+                run_id=workflow_run_response.run_id or "",
+                workflow_name=workflow_run_response.workflow_name or "",
+                workflow_id=workflow_run_response.workflow_id or "",
+                session_id=workflow_run_response.session_id or "",
+                step_name=self.name,
+                step_index=step_index,
+                node_count=len(self.steps),
+                executed_nodes=len(all_results),
+                step_results=all_results,
+            )
+
+    async def aexecute(
+        self,
+        step_input: StepInput,
+        session_id: Optional[str] = None,
+        user_id: Optional[str] = None,
+    ) -> List[StepOutput]:
+        """Execute the steps in dependency order asynchronously, running ready steps concurrently"""
+        log_debug(f"Dag Start: {self.name} ({len(self.steps)} steps)", center=True, symbol="=")
+
+        self._prepare_steps()
+
+        async def run_node(index: int, step: Any, node_input: StepInput) -> List[Any]:
+            output = await step.aexecute(node_input, session_id=session_id, user_id=user_id)
+            return output if isinstance(output, list) else [output]
+
+        all_results: List[StepOutput] = []
+        async for _, events in self._aexecute_nodes(step_input, run_node):
+            all_results.extend(event for event in events if isinstance(event, StepOutput))
+
+        log_debug(f"Dag End: {self.name} ({len(all_results)} results)", center=True, symbol="=")
+        return all_results
+
+    async def aexecute_stream(
+        self,
+        step_input: StepInput,
+        session_id: Optional[str] = None,
+        user_id: Optional[str] = None,
+        stream_intermediate_steps: bool = False,
+        workflow_run_response: Optional[WorkflowRunResponse] = None,
+        step_index: Optional[Union[int, tuple]] = None,
+    ) -> AsyncIterator[Union[WorkflowRunResponseEvent, TeamRunResponseEvent, RunResponseEvent, StepOutput]]:
+        """Execute the steps in dependency order with async streaming, yielding the events of each completed step"""
+        log_debug(f"Dag Start: {self.name} ({len(self.steps)} steps)", center=True, symbol="=")
+
+        self._prepare_steps()
+
+        if stream_intermediate_steps and workflow_run_response:
+            yield DagExecutionStartedEvent(
+                run_id=workflow_run_response.run_id or "",
+                workflow_name=workflow_run_response.workflow_name or "",
+                workflow_id=workflow_run_response.workflow_id or "",
+                session_id=workflow_run_response.session_id or "",
+                step_name=self.name,
+                step_index=step_index,
+                node_count=len(self.steps),
+                max_concurrency=self.max_concurrency,
+            )
+
+        async def run_node(index: int, step: Any, node_input: StepInput) -> List[Any]:
+            return [
+                event
+                async for event in step.aexecute_stream(
+                    node_input,
+                    session_id=session_id,
+                    user_id=user_id,
+                    stream_intermediate_steps=stream_intermediate_steps,
+                    workflow_run_response=workflow_run_response,
+                    step_index=self._get_node_step_index(step_index, index),
+                )
+            ]
+
+        all_results: List[StepOutput] = []
+        async for _, events in self._aexecute_nodes(step_input, run_node):
+            for event in events:
+                if isinstance(event, StepOutput):
+                    all_results.append(event)
+                yield event
+
+        log_debug(f"Dag End: {self.name} ({len(all_results)} results)", center=True, symbol="=")
+
+        if stream_intermediate_steps and workflow_run_response:
+            yield DagExecutionCompletedEvent(
+                run_id=workflow_run_response.run_id or "",
+                workflow_name=workflow_run_response.workflow_name or "",
+                workflow_id=workflow_run_response.workflow_id or "",
+                session_id=workflow_run_response.session_id or "",
+                step_name=self.name,
+                step_index=step_index,
+                node_count=len(self.steps),
+                executed_nodes=len(all_results),
+                step_results=all_results,
+            )
@@ -1,6 +1,6 @@
 import asyncio
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
+from functools import partial
 from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Optional, Union
 
 from agno.run.response import RunResponseEvent
@@ -13,6 +13,7 @@ from agno.run.v2.workflow import (
 )
 from agno.utils.log import log_debug, logger
 from agno.workflow.v2.condition import Condition
+from agno.workflow.v2.scheduler import get_scheduler
 from agno.workflow.v2.step import Step
 from agno.workflow.v2.steps import Steps
 from agno.workflow.v2.types import StepInput, StepOutput
@@ -55,6 +56,7 @@ class Parallel:
         """Prepare the steps for execution - mirrors workflow logic"""
         from agno.agent.agent import Agent
         from agno.team.team import Team
+        from agno.workflow.v2.dag import Dag
         from agno.workflow.v2.loop import Loop
         from agno.workflow.v2.router import Router
         from agno.workflow.v2.step import Step
@@ -68,7 +70,7 @@ class Parallel:
                 prepared_steps.append(Step(name=step.name, description=step.description, agent=step))
             elif isinstance(step, Team):
                 prepared_steps.append(Step(name=step.name, description=step.description, team=step))
-            elif isinstance(step, (Step, Steps, Loop, Parallel, Condition, Router)):
+            elif isinstance(step, (Step, Steps, Loop, Parallel, Condition, Router, Dag)):
                 prepared_steps.append(step)
             else:
                 raise ValueError(f"Invalid step type: {type(step).__name__}")
@@ -164,6 +166,10 @@ class Parallel:
                     "executor_type": executor_type,
                     "executor_name": executor_name,
                     "metrics": actual_metrics,
+                    "cache_hit": isinstance(result.metrics, dict) and result.metrics.get("cache_hit", False),
+                    "queue_wait_time": result.metrics.get("queue_wait_time")
+                    if isinstance(result.metrics, dict)
+                    else None,
                 }
             else:
                 # Even if no metrics, record the step execution
@@ -238,39 +244,14 @@ class Parallel:
         # Use index to preserve order
         indexed_steps = list(enumerate(self.steps))
 
-        with ThreadPoolExecutor(max_workers=len(self.steps)) as executor:
-            # Submit all tasks with their original indices
-            future_to_index = {
-                executor.submit(execute_step_with_index, indexed_step): indexed_step[0]
-                for indexed_step in indexed_steps
-            }
-
-            # Collect results
-            results_with_indices = []
-            for future in as_completed(future_to_index):
-                try:
-                    index, result = future.result()
-                    results_with_indices.append((index, result))
-                    step_name = getattr(self.steps[index], "name", f"step_{index}")
-                    log_debug(f"Parallel step {step_name} completed")
-                except Exception as e:
-                    index = future_to_index[future]
-                    step_name = getattr(self.steps[index], "name", f"step_{index}")
-                    logger.error(f"Parallel step {step_name} failed: {e}")
-                    results_with_indices.append(
-                        (
-                            index,
-                            StepOutput(
-                                step_name=step_name,
-                                content=f"Step {step_name} failed: {str(e)}",
-                                success=False,
-                                error=str(e),
-                            ),
-                        )
-                    )
+        # Run the steps on the threads of the workflow scheduler, shared by all parallel blocks
+        results_with_indices = get_scheduler().run_tasks(
+            [partial(execute_step_with_index, indexed_step) for indexed_step in indexed_steps]
+        )
+        for index, _ in results_with_indices:
+            step_name = getattr(self.steps[index], "name", f"step_{index}")
+            log_debug(f"Parallel step {step_name} completed")
 
-        # Sort by original index to preserve order
-        results_with_indices.sort(key=lambda x: x[0])
         results = [result for _, result in results_with_indices]
 
         # Flatten results - handle steps that return List[StepOutput] (like Condition/Loop)
@@ -361,41 +342,19 @@ class Parallel:
         all_events_with_indices = []
         step_results = []
 
-        with ThreadPoolExecutor(max_workers=len(self.steps)) as executor:
-            # Submit all tasks with their original indices
-            future_to_index = {
-                executor.submit(execute_step_stream_with_index, indexed_step): indexed_step[0]
-                for indexed_step in indexed_steps
-            }
+        # Run the steps on the threads of the workflow scheduler, shared by all parallel blocks
+        for index, events in get_scheduler().run_tasks(
+            [partial(execute_step_stream_with_index, indexed_step) for indexed_step in indexed_steps]
+        ):
+            all_events_with_indices.append((index, events))
 
-            # Collect results as they complete
-            for future in as_completed(future_to_index):
-                try:
-                    index, events = future.result()
-                    all_events_with_indices.append((index, events))
-
-                    # Extract StepOutput from events for the final result
-                    step_outputs = [event for event in events if isinstance(event, StepOutput)]
-                    if step_outputs:
-                        step_results.extend(step_outputs)
-
-                    step_name = getattr(self.steps[index], "name", f"step_{index}")
-                    log_debug(f"Parallel step {step_name} streaming completed")
-                except Exception as e:
-                    index = future_to_index[future]
-                    step_name = getattr(self.steps[index], "name", f"step_{index}")
-                    logger.error(f"Parallel step {step_name} streaming failed: {e}")
-                    error_event = StepOutput(
-                        step_name=step_name,
-                        content=f"Step {step_name} failed: {str(e)}",
-                        success=False,
-                        error=str(e),
-                    )
-                    all_events_with_indices.append((index, [error_event]))
-                    step_results.append(error_event)
+            # Extract StepOutput from events for the final result
+            step_outputs = [event for event in events if isinstance(event, StepOutput)]
+            if step_outputs:
+                step_results.extend(step_outputs)
 
-        # Sort events by original index to preserve order
-        all_events_with_indices.sort(key=lambda x: x[0])
+            step_name = getattr(self.steps[index], "name", f"step_{index}")
+            log_debug(f"Parallel step {step_name} streaming completed")
 
         # Yield all collected streaming events in order (but not final StepOutputs)
         for _, events in all_events_with_indices:
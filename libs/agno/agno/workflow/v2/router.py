@@ -48,6 +48,7 @@ class Router:
         from agno.agent.agent import Agent
         from agno.team.team import Team
         from agno.workflow.v2.condition import Condition
+        from agno.workflow.v2.dag import Dag
         from agno.workflow.v2.loop import Loop
         from agno.workflow.v2.parallel import Parallel
         from agno.workflow.v2.step import Step
@@ -61,7 +62,7 @@ class Router:
                 prepared_steps.append(Step(name=step.name, description=step.description, agent=step))
             elif isinstance(step, Team):
                 prepared_steps.append(Step(name=step.name, description=step.description, team=step))
-            elif isinstance(step, (Step, Steps, Loop, Parallel, Condition, Router)):
+            elif isinstance(step, (Step, Steps, Loop, Parallel, Condition, Router, Dag)):
                 prepared_steps.append(step)
             else:
                 raise ValueError(f"Invalid step type: {type(step).__name__}")
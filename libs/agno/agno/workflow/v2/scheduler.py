@@ -0,0 +1,349 @@
+"""Scheduling of workflow step executions.
+
+A StepScheduler is shared by all Parallel blocks of a workflow (and by default by all workflows of the process):
+
+- Parallel blocks run their steps on one bounded thread pool instead of creating a pool per call. When no worker is
+  free the calling thread runs the steps itself, so nested parallels can't deadlock or spawn unbounded threads.
+- Every step execution (agent, team or function) takes a slot before it runs. Slots are limited globally
+  (max_concurrency) and per executor (executor_limits, keyed by executor name or model id).
+- When a step fails with a rate limit error (HTTP 429) its executor and model are paused with exponential backoff,
+  and queued executions for them wait until the pause is over instead of hitting the provider again.
+- The time a step waited for its slot is reported in the step metrics (queue_wait_time) and totalled on the scheduler.
+"""
+
+import asyncio
+import os
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar, copy_context
+from functools import wraps
+from inspect import isasyncgenfunction, iscoroutinefunction, isgeneratorfunction
+from threading import Condition, Lock
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
+
+from agno.exceptions import ModelRateLimitError
+from agno.utils.log import log_debug, log_warning
+
+T = TypeVar("T")
+
+# Phrases of rate limit errors that don't carry a status code. A bare "429" is not matched, it also appears in ids,
+# token counts and tool results.
+RATE_LIMIT_PHRASES = ("rate limit", "rate_limit", "too many requests")
+
+_active_scheduler: ContextVar[Optional["StepScheduler"]] = ContextVar("agno_step_scheduler", default=None)
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """Return True if the error is a rate limit (HTTP 429) error of a model provider"""
+    if isinstance(error, ModelRateLimitError):
+        return True
+    # Provider SDK errors carry the status code themselves or on their HTTP response
+    if getattr(error, "status_code", None) == 429:
+        return True
+    if getattr(getattr(error, "response", None), "status_code", None) == 429:
+        return True
+    message = str(error).lower()
+    return any(phrase in message for phrase in RATE_LIMIT_PHRASES)
+
+
+class StepScheduler:
+    """Bounds the threads and concurrent step executions of workflows, and backs off on rate limits"""
+
+    def __init__(
+        self,
+        max_concurrency: Optional[int] = None,
+        executor_limits: Optional[Dict[str, int]] = None,
+        max_workers: Optional[int] = None,
+        rate_limit_backoff: float = 1.0,
+        max_rate_limit_backoff: float = 60.0,
+    ):
+        """
+        Args:
+            max_concurrency: Maximum number of steps executing at the same time, None for no limit.
+            executor_limits: Maximum concurrent executions per executor name (agent, team or function) or model id.
+            max_workers: Size of the thread pool shared by Parallel blocks, defaults to max_concurrency
+                or min(32, cpu_count + 4).
+            rate_limit_backoff: Seconds an executor is paused after its first rate limit error, doubled on each
+                consecutive rate limit error.
+            max_rate_limit_backoff: Maximum seconds an executor is paused after a rate limit error.
+        """
+        self.max_concurrency = max_concurrency
+        self.executor_limits = executor_limits or {}
+        self.max_workers = max_workers or max_concurrency or min(32, (os.cpu_count() or 1) + 4)
+        self.rate_limit_backoff = rate_limit_backoff
+        self.max_rate_limit_backoff = max_rate_limit_backoff
+
+        self._condition = Condition()
+        self._running = 0
+        self._running_by_key: Dict[str, int] = {}
+        # key -> (paused until (monotonic time), consecutive rate limit errors)
+        self._rate_limits: Dict[str, Tuple[float, int]] = {}
+        # Futures of asyncio tasks waiting for a slot, woken up when a slot is released
+        self._async_waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._busy_workers = 0
+
+        # Totals for all executions that went through the scheduler
+        self.executions = 0
+        self.queued_executions = 0
+        self.total_queue_wait_time = 0.0
+        self.max_queue_wait_time = 0.0
+        self.rate_limited_executions = 0
+
+    @property
+    def metrics(self) -> Dict[str, Any]:
+        with self._condition:
+            return {
+                "executions": self.executions,
+                "queued_executions": self.queued_executions,
+                "total_queue_wait_time": self.total_queue_wait_time,
+                "max_queue_wait_time": self.max_queue_wait_time,
+                "rate_limited_executions": self.rate_limited_executions,
+                "running": self._running,
+            }
+
+    # Threads
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            with self._condition:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="agno-step")
+        return self._executor
+
+    def _reserve_worker(self) -> bool:
+        with self._condition:
+            if self._busy_workers >= self.max_workers:
+                return False
+            self._busy_workers += 1
+            return True
+
+    def _run_on_worker(self, task: Callable[[], T]) -> T:
+        try:
+            return task()
+        finally:
+            with self._condition:
+                self._busy_workers -= 1
+
+    def run_tasks(self, tasks: List[Callable[[], T]]) -> List[T]:
+        """Run the tasks concurrently and return their results in order.
+
+        Tasks are handed to idle workers of the shared pool, the calling thread runs the tasks no worker is free for.
+        Tasks are never queued behind busy workers, so a task may itself call run_tasks without risking a deadlock.
+        """
+        results: List[Any] = [None] * len(tasks)
+        errors: Dict[int, BaseException] = {}
+        futures: Dict[int, Future] = {}
+
+        pending = list(range(len(tasks)))
+        while pending:
+            # Keep one task for the calling thread, it would otherwise only wait
+            while len(pending) > 1 and self._reserve_worker():
+                index = pending.pop(0)
+                # Copy the context so the task sees the active scheduler and run scope
+                futures[index] = self._get_executor().submit(copy_context().run, self._run_on_worker, tasks[index])
+            index = pending.pop(0)
+            try:
+                results[index] = tasks[index]()
+            except BaseException as e:
+                errors[index] = e
+
+        for index, future in futures.items():
+            try:
+                results[index] = future.result()
+            except BaseException as e:
+                errors[index] = e
+
+        if errors:
+            raise errors[min(errors)]
+        return results
+
+    def shutdown(self, wait: bool = True) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+    # Slots
+
+    def _get_pause(self, keys: List[str]) -> float:
+        """Return the seconds until the rate limit pause of the keys is over"""
+        now = time.monotonic()
+        return max([self._rate_limits[key][0] - now for key in keys if key in self._rate_limits] + [0.0])
+
+    def _can_start(self, keys: List[str]) -> bool:
+        if self.max_concurrency is not None and self._running >= self.max_concurrency:
+            return False
+        for key in keys:
+            limit = self.executor_limits.get(key)
+            if limit is not None and self._running_by_key.get(key, 0) >= limit:
+                return False
+        return self._get_pause(keys) <= 0
+
+    def _start(self, keys: List[str], queue_wait_time: float) -> None:
+        self._running += 1
+        for key in keys:
+            self._running_by_key[key] = self._running_by_key.get(key, 0) + 1
+        self.executions += 1
+        if queue_wait_time > 0:
+            self.queued_executions += 1
+            self.total_queue_wait_time += queue_wait_time
+            self.max_queue_wait_time = max(self.max_queue_wait_time, queue_wait_time)
+
+    def _notify(self) -> None:
+        self._condition.notify_all()
+        for loop, waiter in self._async_waiters:
+            loop.call_soon_threadsafe(_wake_up, waiter)
+        self._async_waiters.clear()
+
+    def acquire(self, keys: List[str]) -> float:
+        """Wait for a slot for an execution of the given executor keys and return the seconds waited"""
+        start = time.monotonic()
+        queued = False
+        with self._condition:
+            while not self._can_start(keys):
+                queued = True
+                pause = self._get_pause(keys)
+                self._condition.wait(timeout=pause if pause > 0 else None)
+            queue_wait_time = time.monotonic() - start if queued else 0.0
+            self._start(keys, queue_wait_time)
+        if queued:
+            log_debug(f"Step execution for {keys} waited {queue_wait_time:.3f}s for a slot")
+        return queue_wait_time
+
+    async def aacquire(self, keys: List[str]) -> float:
+        """Wait for a slot without blocking the event loop and return the seconds waited"""
+        loop = asyncio.get_running_loop()
+        start = time.monotonic()
+        queued = False
+        while True:
+            with self._condition:
+                if self._can_start(keys):
+                    queue_wait_time = time.monotonic() - start if queued else 0.0
+                    self._start(keys, queue_wait_time)
+                    break
+                queued = True
+                pause = self._get_pause(keys)
+                waiter = loop.create_future()
+                self._async_waiters.append((loop, waiter))
+            await asyncio.wait({waiter}, timeout=pause if pause > 0 else None)
+        if queued:
+            log_debug(f"Step execution for {keys} waited {queue_wait_time:.3f}s for a slot")
+        return queue_wait_time
+
+    def release(self, keys: List[str], error: Optional[BaseException] = None) -> None:
+        """Release the slot of an execution. A rate limit error pauses the keys of the execution."""
+        with self._condition:
+            self._running -= 1
+            for key in keys:
+                self._running_by_key[key] -= 1
+                if self._running_by_key[key] == 0:
+                    del self._running_by_key[key]
+
+            if error is not None and is_rate_limit_error(error):
+                self.rate_limited_executions += 1
+                for key in keys:
+                    _, strikes = self._rate_limits.get(key, (0.0, 0))
+                    pause = min(self.rate_limit_backoff * 2**strikes, self.max_rate_limit_backoff)
+                    self._rate_limits[key] = (time.monotonic() + pause, strikes + 1)
+                log_warning(f"Rate limit hit by {keys}, pausing their executions for {pause:.1f}s")
+            elif error is None:
+                for key in keys:
+                    self._rate_limits.pop(key, None)
+            self._notify()
+
+
+def _wake_up(waiter: asyncio.Future) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+_default_scheduler: Optional[StepScheduler] = None
+_default_scheduler_lock = Lock()
+
+
+def get_scheduler() -> StepScheduler:
+    """Return the scheduler of the running workflow, or the scheduler shared by all workflows of the process"""
+    global _default_scheduler
+    scheduler = _active_scheduler.get()
+    if scheduler is not None:
+        return scheduler
+    if _default_scheduler is None:
+        with _default_scheduler_lock:
+            if _default_scheduler is None:
+                _default_scheduler = StepScheduler()
+    return _default_scheduler
+
+
+@contextmanager
+def use_scheduler(scheduler: Optional[StepScheduler]) -> Iterator[None]:
+    """Make the scheduler the active scheduler, None keeps the current one"""
+    if scheduler is None:
+        yield
+        return
+    token = _active_scheduler.set(scheduler)
+    try:
+        yield
+    finally:
+        _active_scheduler.reset(token)
+
+
+def with_workflow_scheduler(method: Callable[..., Any]) -> Callable[..., Any]:
+    """Run a workflow method with the scheduler of the workflow (`self.scheduler`) active.
+
+    Streaming methods return generators that are executed lazily, those activate the scheduler for every item.
+    """
+    if isasyncgenfunction(method):
+
+        @wraps(method)
+        async def async_gen_wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            iterator = method(self, *args, **kwargs)
+            try:
+                while True:
+                    with use_scheduler(self.scheduler):
+                        try:
+                            item = await iterator.__anext__()
+                        except StopAsyncIteration:
+                            return
+                    yield item
+            finally:
+                with use_scheduler(self.scheduler):
+                    await iterator.aclose()
+
+        return async_gen_wrapper
+
+    if isgeneratorfunction(method):
+
+        @wraps(method)
+        def gen_wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            iterator = method(self, *args, **kwargs)
+            try:
+                while True:
+                    with use_scheduler(self.scheduler):
+                        try:
+                            item = next(iterator)
+                        except StopIteration:
+                            return
+                    yield item
+            finally:
+                with use_scheduler(self.scheduler):
+                    iterator.close()
+
+        return gen_wrapper
+
+    if iscoroutinefunction(method):
+
+        @wraps(method)
+        async def async_wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            with use_scheduler(self.scheduler):
+                return await method(self, *args, **kwargs)
+
+        return async_wrapper
+
+    @wraps(method)
+    def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        with use_scheduler(self.scheduler):
+            return method(self, *args, **kwargs)
+
+    return wrapper
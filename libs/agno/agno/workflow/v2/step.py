@@ -15,7 +15,15 @@ from agno.run.v2.workflow import (
     WorkflowRunResponseEvent,
 )
 from agno.team import Team
+from agno.tools.cache import ToolCache
 from agno.utils.log import log_debug, logger, use_agent_logger, use_team_logger, use_workflow_logger
+from agno.workflow.v2.cache import (
+    get_executor_fingerprint,
+    get_step_cache_key,
+    get_step_cache_value,
+    restore_cached_content,
+)
+from agno.workflow.v2.scheduler import get_scheduler
 from agno.workflow.v2.types import StepInput, StepOutput
 
 StepExecutor = Callable[
@@ -56,6 +64,14 @@ class Step:
     # If False, only warn about missing inputs
     strict_input_validation: bool = False
 
+    # Names of the steps whose outputs this step needs, used when the step runs inside a Dag
+    depends_on: Optional[List[str]] = None
+
+    # Memoize the step output by step name, executor configuration and input. Only for deterministic steps.
+    cache: Optional[ToolCache] = None
+    # Seconds a cached output is valid, None to use the ttl of the cache
+    cache_ttl: Optional[int] = None
+
     _retry_count: int = 0
 
     def __init__(
@@ -70,6 +86,9 @@ class Step:
         timeout_seconds: Optional[int] = None,
         skip_on_failure: bool = False,
         strict_input_validation: bool = False,
+        depends_on: Optional[List[str]] = None,
+        cache: Optional[ToolCache] = None,
+        cache_ttl: Optional[int] = None,
     ):
         # Auto-detect name for function executors if not provided
         if name is None and executor is not None:
@@ -89,6 +108,9 @@ class Step:
         self.timeout_seconds = timeout_seconds
         self.skip_on_failure = skip_on_failure
         self.strict_input_validation = strict_input_validation
+        self.depends_on = depends_on
+        self.cache = cache
+        self.cache_ttl = cache_ttl
 
         # Set the active executor
         self._set_active_executor()
@@ -161,6 +183,104 @@ class Step:
             }
         return None
 
+    def _get_scheduler_keys(self) -> List[str]:
+        """Keys the step scheduler limits and rate limits executions of this step by: executor name and model id"""
+        keys = [self.executor_name]
+        model = getattr(self.active_executor, "model", None)
+        model_id = getattr(model, "id", None)
+        if isinstance(model_id, str) and model_id not in keys:
+            keys.append(model_id)
+        return keys
+
+    def _add_queue_wait_time(self, step_output: StepOutput, queue_wait_time: float) -> None:
+        """Record the seconds the step waited for a scheduler slot in the step metrics"""
+        if queue_wait_time <= 0:
+            return
+        step_output.metrics = {
+            **(
+                step_output.metrics
+                or {
+                    "step_name": self.name,
+                    "executor_type": self._executor_type,
+                    "executor_name": self.executor_name,
+                    "metrics": None,
+                }
+            ),
+            "queue_wait_time": queue_wait_time,
+        }
+
+    def _get_cache_key(self, step_input: StepInput) -> Optional[str]:
+        if self.cache is None:
+            return None
+        executor_fingerprint = get_executor_fingerprint(self.active_executor, self._executor_type)
+        return get_step_cache_key(self.name, executor_fingerprint, step_input)
+
+    def _load_cached_output(self, cached: Optional[Dict[str, Any]]) -> Optional[StepOutput]:
+        if cached is None:
+            return None
+        step_output = StepOutput.from_dict(cached)
+        restore_cached_content(step_output, cached)
+        step_output.metrics = {
+            **(
+                step_output.metrics
+                or {
+                    "step_name": self.name,
+                    "executor_type": self._executor_type,
+                    "executor_name": self.executor_name,
+                    "metrics": None,
+                }
+            ),
+            "cache_hit": True,
+        }
+        log_debug(f"Step {self.name} output loaded from cache")
+        return step_output
+
+    def _get_cached_output(self, cache_key: Optional[str]) -> Optional[StepOutput]:
+        """Return the cached output of the step, a failing cache is skipped"""
+        if self.cache is None or cache_key is None:
+            return None
+        try:
+            return self._load_cached_output(self.cache.get(cache_key))
+        except Exception as e:
+            logger.warning(f"Failed to read step {self.name} from cache: {e}")
+            return None
+
+    async def _aget_cached_output(self, cache_key: Optional[str]) -> Optional[StepOutput]:
+        if self.cache is None or cache_key is None:
+            return None
+        try:
+            return self._load_cached_output(await self.cache.aget(cache_key))
+        except Exception as e:
+            logger.warning(f"Failed to read step {self.name} from cache: {e}")
+            return None
+
+    def _get_cache_value(self, step_output: StepOutput) -> Optional[Dict[str, Any]]:
+        value = get_step_cache_value(step_output)
+        if value is None:
+            log_debug(f"Step {self.name} output is not cached, its content can't be restored from the cache")
+        return value
+
+    def _cache_output(self, cache_key: Optional[str], step_output: StepOutput) -> None:
+        """Store a successful step output in the cache"""
+        if self.cache is None or cache_key is None or not step_output.success:
+            return
+        try:
+            value = self._get_cache_value(step_output)
+            if value is not None:
+                self.cache.set(cache_key, value, ttl=self.cache_ttl)
+        except Exception as e:
+            logger.warning(f"Failed to write step {self.name} to cache: {e}")
+
+    async def _acache_output(self, cache_key: Optional[str], step_output: StepOutput) -> None:
+        if self.cache is None or cache_key is None or not step_output.success:
+            return
+        try:
+            value = self._get_cache_value(step_output)
+            if value is not None:
+                await self.cache.aset(cache_key, value, ttl=self.cache_ttl)
+        except Exception as e:
+            logger.warning(f"Failed to write step {self.name} to cache: {e}")
+
     def execute(
         self, step_input: StepInput, session_id: Optional[str] = None, user_id: Optional[str] = None
     ) -> StepOutput:
@@ -170,8 +290,17 @@ class Step:
         if step_input.previous_step_outputs:
             step_input.previous_step_content = step_input.get_last_step_content()
 
+        cache_key = self._get_cache_key(step_input)
+        cached_output = self._get_cached_output(cache_key)
+        if cached_output is not None:
+            return cached_output
+
         # Execute with retries
+        scheduler = get_scheduler()
+        scheduler_keys = self._get_scheduler_keys()
         for attempt in range(self.max_retries + 1):
+            queue_wait_time = scheduler.acquire(scheduler_keys)
+            execution_error: Optional[Exception] = None
             try:
                 response: Union[RunResponse, TeamRunResponse, StepOutput]
                 if self._executor_type == "function":
@@ -250,10 +379,13 @@ class Step:
 
                 # Create StepOutput from response
                 step_output = self._process_step_output(response)  # type: ignore
+                self._cache_output(cache_key, step_output)
+                self._add_queue_wait_time(step_output, queue_wait_time)
 
                 return step_output
 
             except Exception as e:
+                execution_error = e
                 self.retry_count = attempt + 1
                 logger.warning(f"Step {self.name} failed (attempt {attempt + 1}): {e}")
 
@@ -264,6 +396,8 @@ class Step:
                         return StepOutput(content=f"Step {self.name} failed but skipped", success=False, error=str(e))
                     else:
                         raise e
+            finally:
+                scheduler.release(scheduler_keys, execution_error)
 
         return StepOutput(content=f"Step {self.name} failed but skipped", success=False)
 
@@ -292,8 +426,29 @@ class Step:
                 step_index=step_index,
             )
 
+        cache_key = self._get_cache_key(step_input)
+        cached_output = self._get_cached_output(cache_key)
+        if cached_output is not None:
+            yield cached_output
+            if stream_intermediate_steps and workflow_run_response:
+                yield StepCompletedEvent(
+                    run_id=workflow_run_response.run_id or "",
+                    workflow_name=workflow_run_response.workflow_name or "",
+                    workflow_id=workflow_run_response.workflow_id or "",
+                    session_id=workflow_run_response.session_id or "",
+                    step_name=self.name,
+                    step_index=step_index,
+                    content=cached_output.content,
+                    step_response=cached_output,
+                )
+            return
+
         # Execute with retries and streaming
+        scheduler = get_scheduler()
+        scheduler_keys = self._get_scheduler_keys()
         for attempt in range(self.max_retries + 1):
+            queue_wait_time = scheduler.acquire(scheduler_keys)
+            execution_error: Optional[Exception] = None
             try:
                 log_debug(f"Step {self.name} streaming attempt {attempt + 1}/{self.max_retries + 1}")
                 final_response = None
@@ -384,6 +539,9 @@ class Step:
                 # Switch back to workflow logger after execution
                 use_workflow_logger()
 
+                self._cache_output(cache_key, final_response)
+                self._add_queue_wait_time(final_response, queue_wait_time)
+
                 # Yield the step output
                 yield final_response
 
@@ -402,6 +560,7 @@ class Step:
 
                 return
             except Exception as e:
+                execution_error = e
                 self.retry_count = attempt + 1
                 logger.warning(f"Step {self.name} failed (attempt {attempt + 1}): {e}")
 
@@ -416,6 +575,8 @@ class Step:
                         return
                     else:
                         raise e
+            finally:
+                scheduler.release(scheduler_keys, execution_error)
 
         return
 
@@ -429,8 +590,17 @@ class Step:
         if step_input.previous_step_outputs:
             step_input.previous_step_content = step_input.get_last_step_content()
 
+        cache_key = self._get_cache_key(step_input)
+        cached_output = await self._aget_cached_output(cache_key)
+        if cached_output is not None:
+            return cached_output
+
         # Execute with retries
+        scheduler = get_scheduler()
+        scheduler_keys = self._get_scheduler_keys()
         for attempt in range(self.max_retries + 1):
+            queue_wait_time = await scheduler.aacquire(scheduler_keys)
+            execution_error: Optional[Exception] = None
             try:
                 if self._executor_type == "function":
                     import inspect
@@ -525,10 +695,13 @@ class Step:
 
                 # Create StepOutput from response
                 step_output = self._process_step_output(response)  # type: ignore
+                await self._acache_output(cache_key, step_output)
+                self._add_queue_wait_time(step_output, queue_wait_time)
 
                 return step_output
 
             except Exception as e:
+                execution_error = e
                 self.retry_count = attempt + 1
                 logger.warning(f"Step {self.name} failed (attempt {attempt + 1}): {e}")
 
@@ -539,6 +712,8 @@ class Step:
                         return StepOutput(content=f"Step {self.name} failed but skipped", success=False, error=str(e))
                     else:
                         raise e
+            finally:
+                scheduler.release(scheduler_keys, execution_error)
 
         return StepOutput(content=f"Step {self.name} failed but skipped", success=False)
 
@@ -567,8 +742,29 @@ class Step:
                 step_index=step_index,
             )
 
+        cache_key = self._get_cache_key(step_input)
+        cached_output = await self._aget_cached_output(cache_key)
+        if cached_output is not None:
+            yield cached_output
+            if stream_intermediate_steps and workflow_run_response:
+                yield StepCompletedEvent(
+                    run_id=workflow_run_response.run_id or "",
+                    workflow_name=workflow_run_response.workflow_name or "",
+                    workflow_id=workflow_run_response.workflow_id or "",
+                    session_id=workflow_run_response.session_id or "",
+                    step_name=self.name,
+                    step_index=step_index,
+                    content=cached_output.content,
+                    step_response=cached_output,
+                )
+            return
+
         # Execute with retries and streaming
+        scheduler = get_scheduler()
+        scheduler_keys = self._get_scheduler_keys()
         for attempt in range(self.max_retries + 1):
+            queue_wait_time = await scheduler.aacquire(scheduler_keys)
+            execution_error: Optional[Exception] = None
             try:
                 log_debug(f"Async step {self.name} streaming attempt {attempt + 1}/{self.max_retries + 1}")
                 final_response = None
@@ -676,6 +872,9 @@ class Step:
                 # Switch back to workflow logger after execution
                 use_workflow_logger()
 
+                await self._acache_output(cache_key, final_response)
+                self._add_queue_wait_time(final_response, queue_wait_time)
+
                 # Yield the final response
                 yield final_response
 
@@ -694,6 +893,7 @@ class Step:
                 return
 
             except Exception as e:
+                execution_error = e
                 self.retry_count = attempt + 1
                 logger.warning(f"Step {self.name} failed (attempt {attempt + 1}): {e}")
 
@@ -707,6 +907,8 @@ class Step:
                         yield step_output
                     else:
                         raise e
+            finally:
+                scheduler.release(scheduler_keys, execution_error)
 
         return
 
@@ -1,11 +1,28 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Union
 
 from pydantic import BaseModel
 
-from agno.media import AudioArtifact, ImageArtifact, VideoArtifact
+from agno.media import Audio, AudioArtifact, Image, ImageArtifact, Video, VideoArtifact
 from agno.run.response import RunResponse
 from agno.run.team import TeamRunResponse
+from agno.utils.log import log_warning
+
+
+def _media_from_dicts(
+    media_dicts: Optional[List[Dict[str, Any]]], artifact_class: Any, media_class: Any
+) -> Optional[List[Any]]:
+    """Rebuild input media, artifacts are stored with an id and media passed to run() without one"""
+    if not media_dicts:
+        return None
+    media = []
+    for media_dict in media_dicts:
+        try:
+            media_class_to_use = artifact_class if "id" in media_dict else media_class
+            media.append(media_class_to_use.model_validate(media_dict))
+        except Exception as e:
+            log_warning(f"Could not restore {media_class.__name__.lower()} from dict: {e}")
+    return media or None
 
 
 @dataclass
@@ -56,6 +73,27 @@ class WorkflowExecutionInput:
             "audio": [aud.to_dict() for aud in self.audio] if self.audio else None,
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "WorkflowExecutionInput":
+        """Create WorkflowExecutionInput from dictionary"""
+        return cls(
+            message=data.get("message"),
+            additional_data=data.get("additional_data"),
+            images=_media_from_dicts(data.get("images"), ImageArtifact, Image),  # type: ignore[arg-type]
+            videos=_media_from_dicts(data.get("videos"), VideoArtifact, Video),  # type: ignore[arg-type]
+            audio=_media_from_dicts(data.get("audio"), AudioArtifact, Audio),  # type: ignore[arg-type]
+        )
+
+    def copy(self) -> "WorkflowExecutionInput":
+        """Return a copy with its own media lists, the media lists are extended while the workflow runs"""
+        return WorkflowExecutionInput(
+            message=self.message,
+            additional_data=self.additional_data,
+            images=list(self.images) if self.images else None,
+            videos=list(self.videos) if self.videos else None,
+            audio=list(self.audio) if self.audio else None,
+        )
+
 
 @dataclass
 class StepInput:
@@ -220,7 +258,14 @@ class StepOutput:
                 content_dict = str(self.content)
 
         return {
+            "step_name": self.step_name,
+            "step_id": self.step_id,
+            "executor_type": self.executor_type,
+            "executor_name": self.executor_name,
             "content": content_dict,
+            "parallel_step_outputs": {name: output.to_dict() for name, output in self.parallel_step_outputs.items()}
+            if self.parallel_step_outputs
+            else None,
             "response": self.response.to_dict() if self.response else None,
             "images": [img.to_dict() for img in self.images] if self.images else None,
             "videos": [vid.to_dict() for vid in self.videos] if self.videos else None,
@@ -260,8 +305,17 @@ class StepOutput:
         if audio:
             audio = [AudioArtifact.model_validate(aud) for aud in audio]
 
+        parallel_step_outputs = data.get("parallel_step_outputs")
+        if parallel_step_outputs:
+            parallel_step_outputs = {name: cls.from_dict(output) for name, output in parallel_step_outputs.items()}
+
         return cls(
+            step_name=data.get("step_name"),
+            step_id=data.get("step_id"),
+            executor_type=data.get("executor_type"),
+            executor_name=data.get("executor_name"),
             content=data.get("content"),
+            parallel_step_outputs=parallel_step_outputs,
             response=response,
             images=images,
             videos=videos,
@@ -287,13 +341,21 @@ class StepMetrics:
     # For parallel steps: nested step metrics
     parallel_steps: Optional[Dict[str, "StepMetrics"]] = None
 
+    # True if the step output was loaded from the step cache instead of executing the step
+    cache_hit: bool = False
+    # Seconds the step waited for a slot of the step scheduler
+    queue_wait_time: Optional[float] = None
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary - only include relevant fields"""
         result = {
             "step_name": self.step_name,
             "executor_type": self.executor_type,
             "executor_name": self.executor_name,
+            "cache_hit": self.cache_hit,
         }
+        if self.queue_wait_time is not None:
+            result["queue_wait_time"] = self.queue_wait_time
 
         # Only include the relevant field based on executor type
         if self.executor_type == "parallel" and self.parallel_steps:
@@ -319,6 +381,8 @@ class StepMetrics:
             executor_name=data["executor_name"],
             metrics=data.get("metrics") if data.get("executor_type") != "parallel" else None,
             parallel_steps=parallel_steps,
+            cache_hit=data.get("cache_hit", False),
+            queue_wait_time=data.get("queue_wait_time"),
         )
 
 
@@ -328,12 +392,18 @@ class WorkflowMetrics:
 
     total_steps: int
     steps: Dict[str, StepMetrics]
+    # Number of steps whose output was loaded from the step cache
+    cache_hits: int = 0
+    # Total seconds steps waited for a slot of the step scheduler
+    queue_wait_time: float = 0.0
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
         return {
             "total_steps": self.total_steps,
             "steps": {name: step.to_dict() for name, step in self.steps.items()},
+            "cache_hits": self.cache_hits,
+            "queue_wait_time": self.queue_wait_time,
         }
 
     @classmethod
@@ -344,4 +414,75 @@ class WorkflowMetrics:
         return cls(
             total_steps=data["total_steps"],
             steps=steps,
+            cache_hits=data.get("cache_hits", 0),
+            queue_wait_time=data.get("queue_wait_time", 0.0),
+        )
+
+
+@dataclass
+class StepCheckpoint:
+    """Outputs of a completed top-level step of a workflow run"""
+
+    step_index: int
+    step_name: str
+    outputs: List[StepOutput]
+    # True if the step returned a list of outputs (Steps, Loop, Condition, Router)
+    is_list: bool = False
+    # The workflow session state after the step
+    session_state: Optional[Dict[str, Any]] = None
+
+    def get_output(self) -> Union[StepOutput, List[StepOutput]]:
+        """Return the output in the form the step returned it"""
+        if self.is_list or len(self.outputs) != 1:
+            return self.outputs
+        return self.outputs[0]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "step_index": self.step_index,
+            "step_name": self.step_name,
+            "outputs": [output.to_dict() for output in self.outputs],
+            "is_list": self.is_list,
+            "session_state": self.session_state,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "StepCheckpoint":
+        return cls(
+            step_index=data["step_index"],
+            step_name=data["step_name"],
+            outputs=[StepOutput.from_dict(output) for output in data.get("outputs") or []],
+            is_list=data.get("is_list", False),
+            session_state=data.get("session_state"),
+        )
+
+
+@dataclass
+class WorkflowCheckpoint:
+    """Progress of a workflow run, saved after every completed top-level step so the run can be resumed"""
+
+    execution_input: WorkflowExecutionInput
+    steps: List[StepCheckpoint] = field(default_factory=list)
+
+    def get_step(self, step_index: int, step_name: str) -> Optional[StepCheckpoint]:
+        for step in self.steps:
+            if step.step_index == step_index and step.step_name == step_name:
+                return step
+        return None
+
+    def get_session_state(self) -> Optional[Dict[str, Any]]:
+        """Return the workflow session state after the last completed step"""
+        return self.steps[-1].session_state if self.steps else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "execution_input": self.execution_input.to_dict(),
+            "steps": [step.to_dict() for step in self.steps],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "WorkflowCheckpoint":
+        return cls(
+            execution_input=WorkflowExecutionInput.from_dict(data.get("execution_input") or {}),
+            steps=[StepCheckpoint.from_dict(step) for step in data.get("steps") or []],
         )
@@ -1,3 +1,4 @@
+from copy import deepcopy
 from dataclasses import dataclass
 from datetime import datetime
 from os import getenv
@@ -42,12 +43,22 @@ from agno.utils.log import (
     use_workflow_logger,
 )
 from agno.workflow.v2.condition import Condition
+from agno.workflow.v2.dag import Dag
 from agno.workflow.v2.loop import Loop
 from agno.workflow.v2.parallel import Parallel
 from agno.workflow.v2.router import Router
+from agno.workflow.v2.scheduler import StepScheduler, with_workflow_scheduler
 from agno.workflow.v2.step import Step
 from agno.workflow.v2.steps import Steps
-from agno.workflow.v2.types import StepInput, StepMetrics, StepOutput, WorkflowExecutionInput, WorkflowMetrics
+from agno.workflow.v2.types import (
+    StepCheckpoint,
+    StepInput,
+    StepMetrics,
+    StepOutput,
+    WorkflowCheckpoint,
+    WorkflowExecutionInput,
+    WorkflowMetrics,
+)
 
 WorkflowSteps = Union[
     Callable[
@@ -66,6 +77,7 @@ WorkflowSteps = Union[
             Parallel,
             Condition,
             Router,
+            Dag,
         ]
     ],
 ]
@@ -109,6 +121,13 @@ class Workflow:
     store_events: bool = False
     events_to_skip: Optional[List[WorkflowRunEvent]] = None
 
+    # Save the progress of the run to storage after every completed step, so runs can be resumed with resume()
+    enable_checkpoints: bool = False
+
+    # Limits the threads and concurrent step executions of the workflow, defaults to the scheduler shared by all
+    # workflows of the process
+    scheduler: Optional[StepScheduler] = None
+
     def __init__(
         self,
         workflow_id: Optional[str] = None,
@@ -125,6 +144,8 @@ class Workflow:
         stream_intermediate_steps: bool = False,
         store_events: bool = False,
         events_to_skip: Optional[List[WorkflowRunEvent]] = None,
+        enable_checkpoints: bool = False,
+        scheduler: Optional[StepScheduler] = None,
     ):
         self.workflow_id = workflow_id
         self.name = name
@@ -140,6 +161,8 @@ class Workflow:
         self.events_to_skip = events_to_skip or []
         self.stream = stream
         self.stream_intermediate_steps = stream_intermediate_steps
+        self.enable_checkpoints = enable_checkpoints
+        self.scheduler = scheduler
 
     @property
     def run_parameters(self) -> Dict[str, Any]:
@@ -348,6 +371,8 @@ class Workflow:
                 "executor_name": metrics_dict.get("executor_name", "unknown"),
                 "metrics": metrics_dict.get("metrics"),
                 "parallel_steps": metrics_dict.get("parallel_steps"),
+                "cache_hit": metrics_dict.get("cache_hit", False),
+                "queue_wait_time": metrics_dict.get("queue_wait_time"),
             }
         )
 
@@ -355,16 +380,25 @@ class Workflow:
         """Aggregate metrics from all step responses into structured workflow metrics"""
         steps_dict = {}
         total_steps = 0
+        cache_hits = 0
+        queue_wait_time = 0.0
 
         def process_step_output(step_output: StepOutput):
             """Process a single step output for metrics"""
-            nonlocal total_steps
+            nonlocal total_steps, cache_hits, queue_wait_time
             total_steps += 1
 
             # Add step-specific metrics
             if step_output.step_name and step_output.metrics:
                 step_metrics = self._convert_dict_to_step_metrics(step_output.step_name, step_output.metrics)
                 steps_dict[step_output.step_name] = step_metrics
+                if step_metrics.cache_hit:
+                    cache_hits += 1
+                queue_wait_time += step_metrics.queue_wait_time or 0.0
+                for parallel_step_metrics in (step_metrics.parallel_steps or {}).values():
+                    if parallel_step_metrics.cache_hit:
+                        cache_hits += 1
+                    queue_wait_time += parallel_step_metrics.queue_wait_time or 0.0
 
         # Process all step responses
         for step_response in step_responses:
@@ -379,8 +413,65 @@ class Workflow:
         return WorkflowMetrics(
             total_steps=total_steps,
             steps=steps_dict,
+            cache_hits=cache_hits,
+            queue_wait_time=queue_wait_time,
         )
 
+    def _add_run_to_session(self, workflow_run_response: WorkflowRunResponse) -> None:
+        """Add the run to the workflow session, replacing the version of the run saved by a checkpoint"""
+        if self.workflow_session is None:
+            return
+        if workflow_run_response.status == RunStatus.completed:
+            # Completed runs are not resumed, so their checkpoint is not stored
+            workflow_run_response.checkpoint = None
+        runs = self.workflow_session.runs or []
+        for index, run in enumerate(runs):
+            if run.run_id == workflow_run_response.run_id:
+                runs[index] = workflow_run_response
+                return
+        self.workflow_session.add_run(workflow_run_response)
+
+    def _save_checkpoint(self, workflow_run_response: WorkflowRunResponse) -> None:
+        """Save the run with its checkpoint to storage"""
+        self._add_run_to_session(workflow_run_response)
+        self.write_to_storage()
+
+    def _get_step_checkpoint(
+        self, workflow_run_response: WorkflowRunResponse, step_index: int, step_name: str
+    ) -> Optional[StepCheckpoint]:
+        """Return the checkpoint of the step if it completed before the run was resumed"""
+        if workflow_run_response.checkpoint is None:
+            return None
+        step_checkpoint = workflow_run_response.checkpoint.get_step(step_index, step_name)
+        if step_checkpoint is not None:
+            log_debug(f"Restored step {step_index + 1}: {step_name} from checkpoint")
+        return step_checkpoint
+
+    def _save_step_checkpoint(
+        self,
+        workflow_run_response: WorkflowRunResponse,
+        step_index: int,
+        step_name: str,
+        step_output: Union[StepOutput, List[StepOutput]],
+        collected_step_outputs: List[Union[StepOutput, List[StepOutput]]],
+    ) -> None:
+        """Save the outputs of a completed step, the session state and the metrics so far to storage"""
+        if workflow_run_response.checkpoint is None:
+            return
+        workflow_run_response.checkpoint.steps.append(
+            StepCheckpoint(
+                step_index=step_index,
+                step_name=step_name,
+                outputs=list(step_output) if isinstance(step_output, list) else [step_output],
+                is_list=isinstance(step_output, list),
+                session_state=deepcopy(self.workflow_session_state),
+            )
+        )
+        workflow_run_response.step_responses = list(collected_step_outputs)
+        workflow_run_response.workflow_metrics = self._aggregate_workflow_metrics(collected_step_outputs)
+        self._save_checkpoint(workflow_run_response)
+        log_debug(f"Saved checkpoint for step {step_index + 1}: {step_name}")
+
     def _call_custom_function(
         self, func: Callable, workflow: "Workflow", execution_input: WorkflowExecutionInput, **kwargs: Any
     ) -> Any:
@@ -416,6 +507,7 @@ class Workflow:
             logger.warning(f"Function signature inspection failed: {e}. Falling back to original calling convention.")
             return func(workflow, execution_input, **kwargs)
 
+    @with_workflow_scheduler
     def _execute(
         self, execution_input: WorkflowExecutionInput, workflow_run_response: WorkflowRunResponse, **kwargs: Any
     ) -> WorkflowRunResponse:
@@ -441,6 +533,10 @@ class Workflow:
 
             workflow_run_response.status = RunStatus.completed
         else:
+            if workflow_run_response.checkpoint is not None:
+                # Save the run before the first step, so it can be resumed even if no step completes
+                self._save_checkpoint(workflow_run_response)
+
             try:
                 # Track outputs from each step for enhanced data flow
                 collected_step_outputs: List[Union[StepOutput, List[StepOutput]]] = []
@@ -457,16 +553,21 @@ class Workflow:
                     step_name = getattr(step, "name", f"step_{i + 1}")
                     log_debug(f"Executing step {i + 1}/{self._get_step_count()}: {step_name}")
 
-                    # Create enhanced StepInput
-                    step_input = self._create_step_input(
-                        execution_input=execution_input,
-                        previous_step_outputs=previous_step_outputs,
-                        shared_images=shared_images,
-                        shared_videos=shared_videos,
-                        shared_audio=shared_audio,
-                    )
+                    step_checkpoint = self._get_step_checkpoint(workflow_run_response, i, step_name)
+                    if step_checkpoint is not None:
+                        # The step completed before the run was resumed
+                        step_output = step_checkpoint.get_output()
+                    else:
+                        # Create enhanced StepInput
+                        step_input = self._create_step_input(
+                            execution_input=execution_input,
+                            previous_step_outputs=previous_step_outputs,
+                            shared_images=shared_images,
+                            shared_videos=shared_videos,
+                            shared_audio=shared_audio,
+                        )
 
-                    step_output = step.execute(step_input, session_id=self.session_id, user_id=self.user_id)  # type: ignore[union-attr]
+                        step_output = step.execute(step_input, session_id=self.session_id, user_id=self.user_id)  # type: ignore[union-attr]
 
                     # Update the workflow-level previous_step_outputs dictionary
                     if isinstance(step_output, list):
@@ -505,6 +606,11 @@ class Workflow:
 
                     self._collect_workflow_session_state_from_agents_and_teams()
 
+                    if step_checkpoint is None:
+                        self._save_step_checkpoint(
+                            workflow_run_response, i, step_name, step_output, collected_step_outputs
+                        )
+
                 # Update the workflow_run_response with completion data
                 if collected_step_outputs:
                     workflow_run_response.workflow_metrics = self._aggregate_workflow_metrics(collected_step_outputs)
@@ -535,11 +641,12 @@ class Workflow:
 
             finally:
                 if self.workflow_session:
-                    self.workflow_session.add_run(workflow_run_response)
+                    self._add_run_to_session(workflow_run_response)
                 self.write_to_storage()
 
         return workflow_run_response
 
+    @with_workflow_scheduler
     def _execute_stream(
         self,
         execution_input: WorkflowExecutionInput,
@@ -578,6 +685,10 @@ class Workflow:
             workflow_run_response.status = RunStatus.completed
 
         else:
+            if workflow_run_response.checkpoint is not None:
+                # Save the run before the first step, so it can be resumed even if no step completes
+                self._save_checkpoint(workflow_run_response)
+
             try:
                 # Track outputs from each step for enhanced data flow
                 collected_step_outputs: List[Union[StepOutput, List[StepOutput]]] = []
@@ -596,6 +707,20 @@ class Workflow:
                     step_name = getattr(step, "name", f"step_{i + 1}")
                     log_debug(f"Streaming step {i + 1}/{self._get_step_count()}: {step_name}")
 
+                    step_checkpoint = self._get_step_checkpoint(workflow_run_response, i, step_name)
+                    if step_checkpoint is not None:
+                        # The step completed before the run was resumed
+                        for step_output in step_checkpoint.outputs:
+                            collected_step_outputs.append(step_output)
+                            previous_step_outputs[step_name] = step_output
+                            shared_images.extend(step_output.images or [])
+                            shared_videos.extend(step_output.videos or [])
+                            shared_audio.extend(step_output.audio or [])
+                            output_images.extend(step_output.images or [])
+                            output_videos.extend(step_output.videos or [])
+                            output_audio.extend(step_output.audio or [])
+                        continue
+
                     # Create enhanced StepInput
                     step_input = self._create_step_input(
                         execution_input=execution_input,
@@ -604,6 +729,7 @@ class Workflow:
                         shared_videos=shared_videos,
                         shared_audio=shared_audio,
                     )
+                    step_outputs: List[StepOutput] = []
 
                     # Execute step with streaming and yield all events
                     for event in step.execute_stream(  # type: ignore[union-attr]
@@ -618,6 +744,7 @@ class Workflow:
                         if isinstance(event, StepOutput):
                             step_output = event
                             collected_step_outputs.append(step_output)
+                            step_outputs.append(step_output)
 
                             # Update the workflow-level previous_step_outputs dictionary
                             previous_step_outputs[step_name] = step_output
@@ -669,6 +796,16 @@ class Workflow:
 
                     self._collect_workflow_session_state_from_agents_and_teams()
 
+                    # Step and Parallel return a single output, the other primitives a list of outputs
+                    if isinstance(step, (Step, Parallel)) and len(step_outputs) == 1:
+                        self._save_step_checkpoint(
+                            workflow_run_response, i, step_name, step_outputs[0], collected_step_outputs
+                        )
+                    else:
+                        self._save_step_checkpoint(
+                            workflow_run_response, i, step_name, step_outputs, collected_step_outputs
+                        )
+
                 # Update the workflow_run_response with completion data
                 if collected_step_outputs:
                     workflow_run_response.workflow_metrics = self._aggregate_workflow_metrics(collected_step_outputs)
@@ -721,7 +858,7 @@ class Workflow:
 
         # Store the completed workflow response
         if self.workflow_session:
-            self.workflow_session.add_run(workflow_run_response)
+            self._add_run_to_session(workflow_run_response)
 
         # Save to storage after complete execution
         self.write_to_storage()
@@ -774,6 +911,7 @@ class Workflow:
                 # For regular async functions, use the same signature inspection logic in fallback
                 return await func(**call_kwargs)  # type: ignore
 
+    @with_workflow_scheduler
     async def _aexecute(
         self, execution_input: WorkflowExecutionInput, workflow_run_response: WorkflowRunResponse, **kwargs: Any
     ) -> WorkflowRunResponse:
@@ -810,6 +948,10 @@ class Workflow:
             workflow_run_response.status = RunStatus.completed
 
         else:
+            if workflow_run_response.checkpoint is not None:
+                # Save the run before the first step, so it can be resumed even if no step completes
+                self._save_checkpoint(workflow_run_response)
+
             try:
                 # Track outputs from each step for enhanced data flow
                 collected_step_outputs: List[Union[StepOutput, List[StepOutput]]] = []
@@ -826,16 +968,21 @@ class Workflow:
                     step_name = getattr(step, "name", f"step_{i + 1}")
                     log_debug(f"Async Executing step {i + 1}/{self._get_step_count()}: {step_name}")
 
-                    # Create enhanced StepInput
-                    step_input = self._create_step_input(
-                        execution_input=execution_input,
-                        previous_step_outputs=previous_step_outputs,
-                        shared_images=shared_images,
-                        shared_videos=shared_videos,
-                        shared_audio=shared_audio,
-                    )
+                    step_checkpoint = self._get_step_checkpoint(workflow_run_response, i, step_name)
+                    if step_checkpoint is not None:
+                        # The step completed before the run was resumed
+                        step_output = step_checkpoint.get_output()
+                    else:
+                        # Create enhanced StepInput
+                        step_input = self._create_step_input(
+                            execution_input=execution_input,
+                            previous_step_outputs=previous_step_outputs,
+                            shared_images=shared_images,
+                            shared_videos=shared_videos,
+                            shared_audio=shared_audio,
+                        )
 
-                    step_output = await step.aexecute(step_input, session_id=self.session_id, user_id=self.user_id)  # type: ignore[union-attr]
+                        step_output = await step.aexecute(step_input, session_id=self.session_id, user_id=self.user_id)  # type: ignore[union-attr]
 
                     # Update the workflow-level previous_step_outputs dictionary
                     if isinstance(step_output, list):
@@ -873,6 +1020,11 @@ class Workflow:
 
                     self._collect_workflow_session_state_from_agents_and_teams()
 
+                    if step_checkpoint is None:
+                        self._save_step_checkpoint(
+                            workflow_run_response, i, step_name, step_output, collected_step_outputs
+                        )
+
                 # Update the workflow_run_response with completion data
                 if collected_step_outputs:
                     workflow_run_response.workflow_metrics = self._aggregate_workflow_metrics(collected_step_outputs)
@@ -899,11 +1051,12 @@ class Workflow:
 
         # Store error response
         if self.workflow_session:
-            self.workflow_session.add_run(workflow_run_response)
+            self._add_run_to_session(workflow_run_response)
         self.write_to_storage()
 
         return workflow_run_response
 
+    @with_workflow_scheduler
     async def _aexecute_stream(
         self,
         execution_input: WorkflowExecutionInput,
@@ -952,6 +1105,10 @@ class Workflow:
             workflow_run_response.status = RunStatus.completed
 
         else:
+            if workflow_run_response.checkpoint is not None:
+                # Save the run before the first step, so it can be resumed even if no step completes
+                self._save_checkpoint(workflow_run_response)
+
             try:
                 # Track outputs from each step for enhanced data flow
                 collected_step_outputs: List[Union[StepOutput, List[StepOutput]]] = []
@@ -970,6 +1127,20 @@ class Workflow:
                     step_name = getattr(step, "name", f"step_{i + 1}")
                     log_debug(f"Async streaming step {i + 1}/{self._get_step_count()}: {step_name}")
 
+                    step_checkpoint = self._get_step_checkpoint(workflow_run_response, i, step_name)
+                    if step_checkpoint is not None:
+                        # The step completed before the run was resumed
+                        for step_output in step_checkpoint.outputs:
+                            collected_step_outputs.append(step_output)
+                            previous_step_outputs[step_name] = step_output
+                            shared_images.extend(step_output.images or [])
+                            shared_videos.extend(step_output.videos or [])
+                            shared_audio.extend(step_output.audio or [])
+                            output_images.extend(step_output.images or [])
+                            output_videos.extend(step_output.videos or [])
+                            output_audio.extend(step_output.audio or [])
+                        continue
+
                     # Create enhanced StepInput
                     step_input = self._create_step_input(
                         execution_input=execution_input,
@@ -978,6 +1149,7 @@ class Workflow:
                         shared_videos=shared_videos,
                         shared_audio=shared_audio,
                     )
+                    step_outputs: List[StepOutput] = []
 
                     # Execute step with streaming and yield all events
                     async for event in step.aexecute_stream(  # type: ignore[union-attr]
@@ -991,6 +1163,7 @@ class Workflow:
                         if isinstance(event, StepOutput):
                             step_output = event
                             collected_step_outputs.append(step_output)
+                            step_outputs.append(step_output)
 
                             # Update the workflow-level previous_step_outputs dictionary
                             previous_step_outputs[step_name] = step_output
@@ -1042,6 +1215,16 @@ class Workflow:
 
                     self._collect_workflow_session_state_from_agents_and_teams()
 
+                    # Step and Parallel return a single output, the other primitives a list of outputs
+                    if isinstance(step, (Step, Parallel)) and len(step_outputs) == 1:
+                        self._save_step_checkpoint(
+                            workflow_run_response, i, step_name, step_outputs[0], collected_step_outputs
+                        )
+                    else:
+                        self._save_step_checkpoint(
+                            workflow_run_response, i, step_name, step_outputs, collected_step_outputs
+                        )
+
                 # Update the workflow_run_response with completion data
                 if collected_step_outputs:
                     workflow_run_response.workflow_metrics = self._aggregate_workflow_metrics(collected_step_outputs)
@@ -1094,7 +1277,7 @@ class Workflow:
 
         # Store the completed workflow response
         if self.workflow_session:
-            self.workflow_session.add_run(workflow_run_response)
+            self._add_run_to_session(workflow_run_response)
 
         # Save to storage after complete execution
         self.write_to_storage()
@@ -1210,6 +1393,9 @@ class Workflow:
             images=images,  # type: ignore
             videos=videos,  # type: ignore
         )
+        if self.enable_checkpoints and not callable(self.steps):
+            workflow_run_response.checkpoint = WorkflowCheckpoint(execution_input=inputs.copy())
+
         log_debug(
             f"Created pipeline input with session state keys: {list(self.workflow_session_state.keys()) if self.workflow_session_state else 'None'}"
         )
@@ -1320,6 +1506,9 @@ class Workflow:
             images=images,  # type: ignore
             videos=videos,  # type: ignore
         )
+        if self.enable_checkpoints and not callable(self.steps):
+            workflow_run_response.checkpoint = WorkflowCheckpoint(execution_input=inputs.copy())
+
         log_debug(
             f"Created async pipeline input with session state keys: {list(self.workflow_session_state.keys()) if self.workflow_session_state else 'None'}"
         )
@@ -1336,10 +1525,152 @@ class Workflow:
         else:
             return await self._aexecute(execution_input=inputs, workflow_run_response=workflow_run_response, **kwargs)
 
+    def _prepare_resume(
+        self, run_id: str, user_id: Optional[str] = None, session_id: Optional[str] = None
+    ) -> WorkflowExecutionInput:
+        """Load the run to resume and restore the workflow to the state after its last completed step"""
+        if user_id is not None:
+            self.user_id = user_id
+        if session_id is not None:
+            self.session_id = session_id
+        if callable(self.steps):
+            raise ValueError("Only workflows with steps can be resumed")
+
+        self.run_id = run_id
+        self.initialize_workflow()
+        self.load_session()
+        self._prepare_steps()
+
+        workflow_run_response: Optional[WorkflowRunResponse] = None
+        if self.workflow_session is not None:
+            workflow_run_response = next(
+                (run for run in self.workflow_session.runs or [] if run.run_id == run_id), None
+            )
+        if workflow_run_response is None and self.run_response is not None and self.run_response.run_id == run_id:
+            workflow_run_response = self.run_response
+        if workflow_run_response is None:
+            raise ValueError(f"Run {run_id} not found in session {self.session_id}")
+        if workflow_run_response.status == RunStatus.completed:
+            raise ValueError(f"Run {run_id} is already completed")
+        if workflow_run_response.checkpoint is None:
+            raise ValueError(f"Run {run_id} has no checkpoint, set enable_checkpoints=True to resume runs")
+
+        log_debug(
+            f"Resuming run {run_id} after {len(workflow_run_response.checkpoint.steps)} completed steps", center=True
+        )
+        self.run_response = workflow_run_response
+
+        session_state = workflow_run_response.checkpoint.get_session_state()
+        if session_state is not None:
+            self.workflow_session_state = deepcopy(session_state)
+        self._update_workflow_session_state()
+        self.update_agents_and_teams_session_info()
+
+        return workflow_run_response.checkpoint.execution_input.copy()
+
+    @overload
+    def resume(
+        self,
+        run_id: str,
+        user_id: Optional[str] = None,
+        session_id: Optional[str] = None,
+        stream: Literal[False] = False,
+        stream_intermediate_steps: Optional[bool] = None,
+    ) -> WorkflowRunResponse: ...
+
+    @overload
+    def resume(
+        self,
+        run_id: str,
+        user_id: Optional[str] = None,
+        session_id: Optional[str] = None,
+        stream: Literal[True] = True,
+        stream_intermediate_steps: Optional[bool] = None,
+    ) -> Iterator[WorkflowRunResponseEvent]: ...
+
+    def resume(
+        self,
+        run_id: str,
+        user_id: Optional[str] = None,
+        session_id: Optional[str] = None,
+        stream: bool = False,
+        stream_intermediate_steps: Optional[bool] = None,
+        **kwargs: Any,
+    ) -> Union[WorkflowRunResponse, Iterator[WorkflowRunResponseEvent]]:
+        """Resume a run that did not complete. Steps completed before are restored from the run's checkpoint
+        instead of being executed again. Requires enable_checkpoints=True and storage for runs of another process."""
+        self._set_debug()
+
+        stream = stream or self.stream or False
+        stream_intermediate_steps = (stream_intermediate_steps or self.stream_intermediate_steps or False) and stream
+
+        execution_input = self._prepare_resume(run_id=run_id, user_id=user_id, session_id=session_id)
+
+        if stream:
+            return self._execute_stream(
+                execution_input=execution_input,
+                workflow_run_response=self.run_response,  # type: ignore[arg-type]
+                stream_intermediate_steps=stream_intermediate_steps,
+                **kwargs,
+            )
+        else:
+            return self._execute(execution_input=execution_input, workflow_run_response=self.run_response, **kwargs)  # type: ignore[arg-type]
+
+    @overload
+    async def aresume(
+        self,
+        run_id: str,
+        user_id: Optional[str] = None,
+        session_id: Optional[str] = None,
+        stream: Literal[False] = False,
+        stream_intermediate_steps: Optional[bool] = None,
+    ) -> WorkflowRunResponse: ...
+
+    @overload
+    async def aresume(
+        self,
+        run_id: str,
+        user_id: Optional[str] = None,
+        session_id: Optional[str] = None,
+        stream: Literal[True] = True,
+        stream_intermediate_steps: Optional[bool] = None,
+    ) -> AsyncIterator[WorkflowRunResponseEvent]: ...
+
+    async def aresume(
+        self,
+        run_id: str,
+        user_id: Optional[str] = None,
+        session_id: Optional[str] = None,
+        stream: bool = False,
+        stream_intermediate_steps: Optional[bool] = None,
+        **kwargs: Any,
+    ) -> Union[WorkflowRunResponse, AsyncIterator[WorkflowRunResponseEvent]]:
+        """Resume a run that did not complete asynchronously, see resume()"""
+        self._set_debug()
+
+        stream = stream or self.stream or False
+        stream_intermediate_steps = (stream_intermediate_steps or self.stream_intermediate_steps or False) and stream
+
+        execution_input = self._prepare_resume(run_id=run_id, user_id=user_id, session_id=session_id)
+
+        if stream:
+            return self._aexecute_stream(
+                execution_input=execution_input,
+                workflow_run_response=self.run_response,  # type: ignore[arg-type]
+                stream_intermediate_steps=stream_intermediate_steps,
+                **kwargs,
+            )
+        else:
+            return await self._aexecute(
+                execution_input=execution_input,
+                workflow_run_response=self.run_response,  # type: ignore[arg-type]
+                **kwargs,
+            )
+
     def _prepare_steps(self):
         """Prepare the steps for execution"""
         if not callable(self.steps) and self.steps is not None:
-            prepared_steps: List[Union[Step, Steps, Loop, Parallel, Condition, Router]] = []
+            prepared_steps: List[Union[Step, Steps, Loop, Parallel, Condition, Router, Dag]] = []
             for i, step in enumerate(self.steps):  # type: ignore
                 if callable(step) and hasattr(step, "__name__"):
                     step_name = step.__name__
@@ -1353,7 +1684,7 @@ class Workflow:
                     step_name = step.name or f"step_{i + 1}"
                     log_debug(f"Step {i + 1}: Team '{step_name}' with {len(step.members)} members")
                     prepared_steps.append(Step(name=step_name, description=step.description, team=step))
-                elif isinstance(step, (Step, Steps, Loop, Parallel, Condition, Router)):
+                elif isinstance(step, (Step, Steps, Loop, Parallel, Condition, Router, Dag)):
                     step_type = type(step).__name__
                     step_name = getattr(step, "name", f"unnamed_{step_type.lower()}")
                     log_debug(f"Step {i + 1}: {step_type} '{step_name}'")
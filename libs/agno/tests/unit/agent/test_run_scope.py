@@ -0,0 +1,147 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Iterator, Optional
+
+import pytest
+
+from agno.agent import Agent
+from agno.models.base import Model
+from agno.models.response import ModelResponse
+from agno.run.scope import get_active_scope
+
+
+@dataclass
+class EchoModel(Model):
+    """Echoes the user message and the session state the agent has at that moment"""
+
+    id: str = "echo"
+    name: str = "Echo"
+    provider: str = "Echo"
+    agent: Optional[Agent] = None
+    delay: float = 0.05
+
+    def _respond(self, messages) -> str:
+        user_message = [m for m in messages if m.role == "user"][-1].content
+        return f"{user_message}|{self.agent.session_id}|{self.agent.session_state['request']}"  # type: ignore
+
+    def invoke(self, messages, **kwargs) -> Any:
+        time.sleep(self.delay)
+        return self._respond(messages)
+
+    async def ainvoke(self, messages, **kwargs) -> Any:
+        await asyncio.sleep(self.delay)
+        return self._respond(messages)
+
+    def invoke_stream(self, messages, **kwargs) -> Iterator[Any]:
+        time.sleep(self.delay)
+        yield self._respond(messages)
+
+    async def ainvoke_stream(self, messages, **kwargs) -> AsyncIterator[Any]:  # type: ignore
+        await asyncio.sleep(self.delay)
+        yield self._respond(messages)
+
+    def parse_provider_response(self, response: Any, **kwargs) -> ModelResponse:
+        return ModelResponse(role="assistant", content=response)
+
+    def parse_provider_response_delta(self, response: Any) -> ModelResponse:
+        return ModelResponse(role="assistant", content=response)
+
+
+def make_agent() -> Agent:
+    model = EchoModel()
+    agent = Agent(model=model, telemetry=False)
+    model.agent = agent
+    return agent
+
+
+def test_concurrent_runs_are_isolated():
+    agent = make_agent()
+
+    def run(i: int) -> str:
+        response = agent.run(f"request {i}", session_id=f"session {i}", session_state={"request": i})
+        return response.content  # type: ignore
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        contents = list(executor.map(run, range(8)))
+
+    assert contents == [f"request {i}|session {i}|{i}" for i in range(8)]
+    # The instance keeps the state of the last run that finished
+    assert agent.run_response is not None
+    assert agent.session_id == agent.run_response.session_id
+    assert get_active_scope() is None
+
+
+@pytest.mark.asyncio
+async def test_concurrent_async_runs_are_isolated():
+    agent = make_agent()
+
+    async def run(i: int) -> str:
+        response = await agent.arun(f"request {i}", session_id=f"session {i}", session_state={"request": i})
+        assert agent.run_response is response
+        return response.content  # type: ignore
+
+    contents = await asyncio.gather(*[run(i) for i in range(8)])
+
+    assert contents == [f"request {i}|session {i}|{i}" for i in range(8)]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_async_streams_are_isolated():
+    agent = make_agent()
+
+    async def run(i: int) -> str:
+        content = ""
+        async for event in await agent.arun(
+            f"request {i}", stream=True, session_id=f"session {i}", session_state={"request": i}
+        ):
+            if event.event == "RunResponseContent":
+                content += event.content
+        return content
+
+    contents = await asyncio.gather(*[run(i) for i in range(4)])
+
+    assert contents == [f"request {i}|session {i}|{i}" for i in range(4)]
+
+
+def test_stream_commits_when_finished():
+    agent = make_agent()
+
+    events = agent.run("hello", stream=True, session_id="streamed", session_state={"request": 1})
+    assert agent.session_id is None
+
+    list(events)
+    assert agent.session_id == "streamed"
+    assert agent.run_response is not None and agent.run_response.content == "hello|streamed|1"
+
+
+@dataclass
+class ToolFormattingModel(EchoModel):
+    """Formats the tools it is called with through the provider formatted tools cache"""
+
+    format_calls: int = 0
+
+    def _format(self, tools):
+        self.format_calls += 1
+        return tools
+
+    def invoke(self, messages, **kwargs) -> Any:
+        if kwargs.get("tools"):
+            self._get_formatted_tools(kwargs["tools"], self._format)
+        return super().invoke(messages, **kwargs)
+
+
+def test_runs_reuse_the_formatted_tools():
+    def get_weather(city: str) -> str:
+        """Get the weather of a city"""
+        return "sunny"
+
+    model = ToolFormattingModel(delay=0)
+    agent = Agent(model=model, tools=[get_weather], telemetry=False)
+    model.agent = agent
+
+    for i in range(3):
+        agent.run(f"request {i}", session_id="session", session_state={"request": i})
+
+    assert model.format_calls == 1
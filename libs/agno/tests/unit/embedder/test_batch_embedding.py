@@ -0,0 +1,115 @@
+from typing import Dict, List, Optional, Tuple
+from unittest.mock import MagicMock
+
+import pytest
+
+from agno.document import Document
+from agno.embedder.base import Embedder
+from agno.embedder.openai import OpenAIEmbedder
+
+
+class CountingEmbedder(Embedder):
+    """Embedder that records every request it would send to a provider"""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.requests: List[List[str]] = []
+
+    def get_embedding(self, text: str) -> List[float]:
+        return [float(len(text))]
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        self.requests.append([text])
+        return self.get_embedding(text), {"total_tokens": 1}
+
+    def _get_batch_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        self.requests.append(list(texts))
+        return [[float(len(text))] for text in texts], [{"total_tokens": len(texts)}] * len(texts)
+
+
+def test_split_batches_respects_batch_size():
+    embedder = CountingEmbedder(batch_size=2)
+    assert embedder.split_batches(["a", "b", "c", "d", "e"]) == [["a", "b"], ["c", "d"], ["e"]]
+
+
+def test_split_batches_respects_token_limit():
+    embedder = CountingEmbedder(batch_size=100, max_batch_tokens=10)
+    # Each text is estimated at 5 tokens, so at most two fit in one request
+    texts = ["x" * 16] * 5
+    assert [len(batch) for batch in embedder.split_batches(texts)] == [2, 2, 1]
+
+
+def test_split_batches_oversized_text_gets_own_batch():
+    embedder = CountingEmbedder(batch_size=100, max_batch_tokens=4)
+    assert embedder.split_batches(["x" * 100, "y"]) == [["x" * 100], ["y"]]
+
+
+def test_get_embeddings_batch_preserves_order():
+    embedder = CountingEmbedder(batch_size=2)
+    embeddings = embedder.get_embeddings_batch(["a", "bb", "ccc"])
+    assert embeddings == [[1.0], [2.0], [3.0]]
+    assert embedder.requests == [["a", "bb"], ["ccc"]]
+
+
+@pytest.mark.asyncio
+async def test_async_get_embeddings_batch():
+    embedder = CountingEmbedder(batch_size=10)
+    embeddings, usages = await embedder.async_get_embeddings_batch_and_usage(["a", "bb"])
+    assert embeddings == [[1.0], [2.0]]
+    assert usages == [{"total_tokens": 2}, {"total_tokens": 2}]
+    assert embedder.requests == [["a", "bb"]]
+
+
+def test_document_embed_batch_uses_one_request():
+    embedder = CountingEmbedder()
+    documents = [Document(content="a"), Document(content="bb")]
+    Document.embed_batch(documents, embedder=embedder)
+    assert [doc.embedding for doc in documents] == [[1.0], [2.0]]
+    assert embedder.requests == [["a", "bb"]]
+
+
+def test_document_embed_batch_falls_back_on_error():
+    embedder = CountingEmbedder()
+    embedder._get_batch_embeddings_and_usage = MagicMock(side_effect=RuntimeError("boom"))  # type: ignore
+    documents = [Document(content="a"), Document(content="bb")]
+    Document.embed_batch(documents, embedder=embedder)
+    assert [doc.embedding for doc in documents] == [[1.0], [2.0]]
+    assert embedder.requests == [["a"], ["bb"]]
+
+
+def test_document_embed_batch_retries_empty_embeddings():
+    embedder = CountingEmbedder()
+    embedder._get_batch_embeddings_and_usage = MagicMock(  # type: ignore
+        return_value=([[1.0], []], [{"total_tokens": 2}, None])
+    )
+    documents = [Document(content="a"), Document(content="bb")]
+    Document.embed_batch(documents, embedder=embedder)
+    assert [doc.embedding for doc in documents] == [[1.0], [2.0]]
+    assert embedder.requests == [["bb"]]
+
+
+@pytest.mark.asyncio
+async def test_document_async_embed_batch_falls_back_on_error():
+    embedder = CountingEmbedder()
+    embedder._async_get_batch_embeddings_and_usage = MagicMock(side_effect=RuntimeError("boom"))  # type: ignore
+    documents = [Document(content="a"), Document(content="bb")]
+    await Document.async_embed_batch(documents, embedder=embedder)
+    assert [doc.embedding for doc in documents] == [[1.0], [2.0]]
+    assert embedder.requests == [["a"], ["bb"]]
+
+
+def test_openai_embedder_sends_one_request_per_batch():
+    client = MagicMock()
+    response = MagicMock()
+    response.data = [MagicMock(index=1, embedding=[0.2]), MagicMock(index=0, embedding=[0.1])]
+    response.usage.model_dump.return_value = {"prompt_tokens": 2, "total_tokens": 2}
+    client.embeddings.create.return_value = response
+
+    embedder = OpenAIEmbedder(openai_client=client)
+    embeddings, usages = embedder.get_embeddings_batch_and_usage(["first", "second"])
+
+    assert embeddings == [[0.1], [0.2]]
+    # The usage of the request is counted once, on the first text
+    assert usages == [{"prompt_tokens": 2, "total_tokens": 2}, None]
+    client.embeddings.create.assert_called_once()
+    assert client.embeddings.create.call_args.kwargs["input"] == ["first", "second"]
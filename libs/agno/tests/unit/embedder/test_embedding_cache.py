@@ -0,0 +1,114 @@
+from copy import deepcopy
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+
+from agno.embedder.base import Embedder
+from agno.embedder.cache import EmbeddingCache
+
+
+class CountingEmbedder(Embedder):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.id = "counting"
+        self.calls: List[List[str]] = []
+
+    def get_embedding(self, text: str) -> List[float]:
+        return self.get_embedding_and_usage(text)[0]
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        self.calls.append([text])
+        return [float(len(text)), 0.5], {"total_tokens": 1}
+
+    def _get_batch_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        self.calls.append(list(texts))
+        return [[float(len(text)), 0.5] for text in texts], [{"total_tokens": 1}] * len(texts)
+
+
+def test_cache_requires_embedder():
+    with pytest.raises(ValueError):
+        EmbeddingCache()
+
+
+def test_get_embedding_hits_cache():
+    inner = CountingEmbedder(dimensions=2)
+    cache = EmbeddingCache(embedder=inner)
+
+    assert cache.get_embedding("hello") == [5.0, 0.5]
+    assert cache.get_embedding("hello") == [5.0, 0.5]
+    assert inner.calls == [["hello"]]
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cache.dimensions == 2
+
+
+def test_batch_only_embeds_missing_texts():
+    inner = CountingEmbedder()
+    cache = EmbeddingCache(embedder=inner)
+    cache.get_embedding("a")
+
+    embeddings, usages = cache.get_embeddings_batch_and_usage(["a", "bb", "ccc"])
+
+    assert embeddings == [[1.0, 0.5], [2.0, 0.5], [3.0, 0.5]]
+    assert usages == [None, {"total_tokens": 1}, {"total_tokens": 1}]
+    assert inner.calls == [["a"], ["bb", "ccc"]]
+
+
+@pytest.mark.asyncio
+async def test_async_batch_uses_cache():
+    inner = CountingEmbedder()
+    cache = EmbeddingCache(embedder=inner)
+    await cache.async_get_embeddings_batch_and_usage(["a", "bb"])
+    embeddings, _ = await cache.async_get_embeddings_batch_and_usage(["bb", "a"])
+    assert embeddings == [[2.0, 0.5], [1.0, 0.5]]
+    assert inner.calls == [["a", "bb"]]
+
+
+def test_lru_eviction():
+    inner = CountingEmbedder()
+    cache = EmbeddingCache(embedder=inner, max_size=2)
+    for text in ["a", "bb", "ccc"]:
+        cache.get_embedding(text)
+    cache.get_embedding("a")
+    assert inner.calls[-1] == ["a"]
+    assert len(inner.calls) == 4
+
+
+def test_ttl_expiry(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("agno.embedder.cache.time.time", lambda: now[0])
+    inner = CountingEmbedder()
+    cache = EmbeddingCache(embedder=inner, ttl=10)
+
+    cache.get_embedding("a")
+    now[0] += 5
+    cache.get_embedding("a")
+    assert len(inner.calls) == 1
+
+    now[0] += 10
+    cache.get_embedding("a")
+    assert len(inner.calls) == 2
+
+
+def test_disk_tier_survives_new_cache(tmp_path):
+    db_file = tmp_path / "embeddings.db"
+    first = EmbeddingCache(embedder=CountingEmbedder(), db_file=db_file)
+    first.get_embeddings_batch(["a", "bb"])
+    first.close()
+
+    inner = CountingEmbedder()
+    second = EmbeddingCache(embedder=inner, db_file=db_file)
+    assert second.get_embeddings_batch(["a", "bb"]) == [[1.0, 0.5], [2.0, 0.5]]
+    assert inner.calls == []
+
+
+def test_disk_tier_size_limit(tmp_path):
+    cache = EmbeddingCache(embedder=CountingEmbedder(), db_file=tmp_path / "embeddings.db", max_disk_size=2)
+    for text in ["a", "bb", "ccc"]:
+        cache.get_embedding(text)
+    count = cache._connection.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]  # type: ignore
+    assert count == 2
+
+
+def test_deepcopy_shares_cache():
+    cache = EmbeddingCache(embedder=CountingEmbedder())
+    assert deepcopy(cache) is cache
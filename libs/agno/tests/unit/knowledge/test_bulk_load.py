@@ -0,0 +1,158 @@
+from typing import Any, Dict, List, Optional, Set
+
+import pytest
+
+from agno.document import Document
+from agno.knowledge.document import DocumentKnowledgeBase
+from agno.utils.string import safe_content_hash
+from agno.vectordb.base import VectorDb
+
+
+class InMemoryVectorDb(VectorDb):
+    """Minimal vector db that records how it is called"""
+
+    def __init__(self, set_based: bool = True):
+        self.rows: Dict[str, Document] = {}
+        self.insert_calls: List[int] = []
+        self.upsert_calls: List[int] = []
+        self.existing_ids_calls = 0
+        self.doc_exists_calls = 0
+        self.set_based = set_based
+
+    def create(self) -> None:
+        pass
+
+    async def async_create(self) -> None:
+        pass
+
+    def doc_exists(self, document: Document) -> bool:
+        self.doc_exists_calls += 1
+        return safe_content_hash(document.content) in self.rows
+
+    async def async_doc_exists(self, document: Document) -> bool:
+        return self.doc_exists(document)
+
+    def name_exists(self, name: str) -> bool:
+        return False
+
+    async def async_name_exists(self, name: str) -> bool:
+        return False
+
+    def existing_ids(self, ids: List[str]) -> Set[str]:
+        if not self.set_based:
+            raise NotImplementedError
+        self.existing_ids_calls += 1
+        return {id for id in ids if id in self.rows}
+
+    def insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        self.insert_calls.append(len(documents))
+        for doc in documents:
+            self.rows[safe_content_hash(doc.content)] = doc
+
+    async def async_insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        self.insert(documents, filters)
+
+    def upsert_available(self) -> bool:
+        return True
+
+    def upsert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        self.upsert_calls.append(len(documents))
+        for doc in documents:
+            self.rows[safe_content_hash(doc.content)] = doc
+
+    async def async_upsert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        self.upsert(documents, filters)
+
+    def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+        return []
+
+    async def async_search(
+        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Document]:
+        return []
+
+    def drop(self) -> None:
+        self.rows = {}
+
+    async def async_drop(self) -> None:
+        self.drop()
+
+    def exists(self) -> bool:
+        return True
+
+    async def async_exists(self) -> bool:
+        return True
+
+    def delete(self) -> bool:
+        self.rows = {}
+        return True
+
+
+def make_documents(count: int) -> List[Document]:
+    return [Document(content=f"document {i}", meta_data={"index": i}) for i in range(count)]
+
+
+def test_bulk_load_batches_inserts_and_existence_checks():
+    vector_db = InMemoryVectorDb()
+    knowledge = DocumentKnowledgeBase(
+        documents=make_documents(25), vector_db=vector_db, bulk_load=True, load_batch_size=10
+    )
+
+    knowledge.load()
+
+    assert len(vector_db.rows) == 25
+    assert vector_db.insert_calls == [10, 10, 5]
+    assert vector_db.existing_ids_calls == 3
+    assert vector_db.doc_exists_calls == 0
+    assert knowledge.valid_metadata_filters == {"index"}
+
+
+def test_bulk_load_skips_existing_and_duplicates():
+    vector_db = InMemoryVectorDb()
+    documents = make_documents(5)
+    vector_db.insert(documents[:2])
+    vector_db.insert_calls = []
+
+    knowledge = DocumentKnowledgeBase(
+        documents=documents + [Document(content="document 4")], vector_db=vector_db, bulk_load=True
+    )
+    knowledge.load()
+
+    assert vector_db.insert_calls == [3]
+    assert len(vector_db.rows) == 5
+
+
+def test_bulk_load_falls_back_to_doc_exists():
+    vector_db = InMemoryVectorDb(set_based=False)
+    knowledge = DocumentKnowledgeBase(documents=make_documents(4), vector_db=vector_db, bulk_load=True)
+
+    knowledge.load()
+
+    assert vector_db.insert_calls == [4]
+    assert vector_db.doc_exists_calls == 4
+
+
+def test_bulk_load_upsert_with_concurrency():
+    vector_db = InMemoryVectorDb()
+    knowledge = DocumentKnowledgeBase(
+        documents=make_documents(20), vector_db=vector_db, bulk_load=True, load_batch_size=5, load_concurrency=4
+    )
+
+    knowledge.load(upsert=True)
+
+    assert sorted(vector_db.upsert_calls) == [5, 5, 5, 5]
+    assert len(vector_db.rows) == 20
+
+
+@pytest.mark.asyncio
+async def test_async_bulk_load():
+    vector_db = InMemoryVectorDb()
+    knowledge = DocumentKnowledgeBase(
+        documents=make_documents(12), vector_db=vector_db, bulk_load=True, load_batch_size=5, load_concurrency=2
+    )
+
+    await knowledge.aload()
+
+    assert sorted(vector_db.insert_calls) == [2, 5, 5]
+    assert vector_db.existing_ids_calls == 3
+    assert len(vector_db.rows) == 12
@@ -0,0 +1,123 @@
+import asyncio
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+from unittest.mock import patch
+
+import pytest
+
+from agno.document import Document
+from agno.embedder.base import Embedder
+from agno.knowledge.pipeline import IngestionPipeline, get_retry_after, is_rate_limit_error
+from tests.unit.knowledge.test_bulk_load import InMemoryVectorDb
+
+
+class RateLimitError(Exception):
+    def __init__(self, message: str = "Too many requests", status_code: int = 429):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class FakeEmbedder(Embedder):
+    def __init__(self, rate_limited_calls: int = 0, delay: float = 0.0):
+        super().__init__(dimensions=2)
+        self.rate_limited_calls = rate_limited_calls
+        self.delay = delay
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def async_get_embeddings_batch_and_usage(
+        self, texts: List[str]
+    ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        self.calls += 1
+        if self.calls <= self.rate_limited_calls:
+            raise RateLimitError()
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+        return [[float(len(text)), 1.0] for text in texts], [None] * len(texts)
+
+
+class EmbeddingVectorDb(InMemoryVectorDb):
+    def __init__(self, embedder: Embedder):
+        super().__init__()
+        self.embedder = embedder
+
+
+async def document_lists(num_lists: int, docs_per_list: int) -> AsyncIterator[List[Document]]:
+    for i in range(num_lists):
+        yield [Document(content=f"list {i} document {j}") for j in range(docs_per_list)]
+
+
+@pytest.mark.asyncio
+async def test_pipeline_embeds_and_writes_in_batches():
+    embedder = FakeEmbedder(delay=0.01)
+    vector_db = EmbeddingVectorDb(embedder)
+    pipeline = IngestionPipeline(vector_db, batch_size=4, embedding_concurrency=3, queue_size=2)
+
+    metrics = await pipeline.run(document_lists(5, 4))
+
+    assert metrics.documents_read == 20
+    assert metrics.documents_embedded == 20
+    assert metrics.documents_written == 20
+    assert metrics.batches_written == 5
+    assert sorted(vector_db.insert_calls) == [4, 4, 4, 4, 4]
+    assert all(doc.embedding is not None for doc in vector_db.rows.values())
+    assert 1 < embedder.max_in_flight <= 3
+
+
+@pytest.mark.asyncio
+async def test_pipeline_skips_duplicates_and_existing_documents():
+    vector_db = InMemoryVectorDb()
+    await IngestionPipeline(vector_db, batch_size=10).run(document_lists(1, 3))
+
+    async def with_duplicates() -> AsyncIterator[List[Document]]:
+        yield [Document(content="list 0 document 0"), Document(content="new"), Document(content="new")]
+
+    metrics = await IngestionPipeline(vector_db, batch_size=10).run(with_duplicates())
+
+    assert metrics.documents_written == 1
+    assert metrics.documents_skipped == 2
+    assert len(vector_db.rows) == 4
+
+
+@pytest.mark.asyncio
+async def test_pipeline_retries_rate_limited_embedding_requests():
+    embedder = FakeEmbedder(rate_limited_calls=2)
+    vector_db = EmbeddingVectorDb(embedder)
+    pipeline = IngestionPipeline(vector_db, batch_size=10, embedding_concurrency=1, retry_delay=0.001)
+
+    metrics = await pipeline.run(document_lists(1, 3))
+
+    assert metrics.embedding_retries == 2
+    assert metrics.documents_embedded == 3
+    assert metrics.documents_written == 3
+
+
+@pytest.mark.asyncio
+async def test_pipeline_writes_unembedded_documents_when_retries_are_exhausted():
+    embedder = FakeEmbedder(rate_limited_calls=10)
+    vector_db = EmbeddingVectorDb(embedder)
+    pipeline = IngestionPipeline(vector_db, batch_size=10, max_retries=1, retry_delay=0.001)
+
+    with patch("agno.knowledge.pipeline.logger.warning") as mock_warning:
+        metrics = await pipeline.run(document_lists(1, 2))
+
+    mock_warning.assert_called_once()
+    assert metrics.documents_embedded == 0
+    assert metrics.documents_written == 2
+
+
+def test_rate_limit_detection():
+    class Response:
+        status_code = 429
+        headers = {"retry-after": "2"}
+
+    class APIError(Exception):
+        response = Response()
+
+    assert is_rate_limit_error(RateLimitError())
+    assert is_rate_limit_error(APIError())
+    assert not is_rate_limit_error(ValueError("bad input"))
+    assert get_retry_after(APIError()) == 2.0
+    assert get_retry_after(RateLimitError()) is None
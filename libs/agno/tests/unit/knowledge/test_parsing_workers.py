@@ -0,0 +1,34 @@
+import pytest
+
+from agno.document.reader.csv_reader import CSVReader
+from agno.knowledge.csv import CSVKnowledgeBase
+
+
+@pytest.fixture
+def csv_dir(tmp_path):
+    for i in range(6):
+        (tmp_path / f"table_{i}.csv").write_text(f"name,value\nrow_{i},{i}\n")
+    (tmp_path / "notes.txt").write_text("not a csv")
+    return tmp_path
+
+
+def test_csv_knowledge_base_reads_files_in_worker_processes(csv_dir):
+    sequential = CSVKnowledgeBase(path=csv_dir, reader=CSVReader())
+    parallel = CSVKnowledgeBase(path=csv_dir, reader=CSVReader(), parsing_workers=2)
+
+    expected = sorted(doc.content for documents in sequential.document_lists for doc in documents)
+    assert sorted(doc.content for documents in parallel.document_lists for doc in documents) == expected
+    assert len(expected) == 6
+
+
+@pytest.mark.asyncio
+async def test_csv_knowledge_base_adds_metadata_in_worker_processes(csv_dir):
+    knowledge_base = CSVKnowledgeBase(
+        path=[{"path": str(csv_dir / f"table_{i}.csv"), "metadata": {"table": i}} for i in range(3)],
+        reader=CSVReader(),
+        parsing_workers=2,
+    )
+
+    document_lists = [documents async for documents in knowledge_base.async_document_lists]
+
+    assert sorted(doc.meta_data["table"] for documents in document_lists for doc in documents) == [0, 1, 2]
@@ -0,0 +1,86 @@
+from pathlib import Path
+
+import pytest
+
+from agno.document.reader.csv_reader import CSVReader
+from agno.document.reader.text_reader import TextReader
+from agno.knowledge.csv import CSVKnowledgeBase
+from agno.knowledge.text import TextKnowledgeBase
+from tests.unit.knowledge.test_bulk_load import InMemoryVectorDb
+
+
+def write_csv_files(directory: Path, files: int) -> Path:
+    for f in range(files):
+        (directory / f"data_{f}.csv").write_text(f"name,value\nfile {f},{f}", encoding="utf-8")
+    return directory
+
+
+def test_stream_load_writes_bounded_batches(tmp_path):
+    vector_db = InMemoryVectorDb()
+    knowledge = CSVKnowledgeBase(
+        path=write_csv_files(tmp_path, files=10),
+        reader=CSVReader(chunk=False),
+        vector_db=vector_db,
+        stream_load=True,
+        load_batch_size=2,
+        load_concurrency=2,
+    )
+
+    knowledge.load()
+
+    assert len(vector_db.rows) == 10
+    assert sorted(vector_db.insert_calls) == [2, 2, 2, 2, 2]
+    assert vector_db.existing_ids_calls == 5
+    assert knowledge.valid_metadata_filters == {"page", "start_row", "rows"}
+
+
+@pytest.mark.asyncio
+async def test_async_stream_load(tmp_path):
+    vector_db = InMemoryVectorDb()
+    knowledge = CSVKnowledgeBase(
+        path=write_csv_files(tmp_path, files=5),
+        reader=CSVReader(chunk=False),
+        vector_db=vector_db,
+        stream_load=True,
+        load_batch_size=2,
+    )
+
+    await knowledge.aload()
+
+    assert len(vector_db.rows) == 5
+    assert sorted(vector_db.insert_calls) == [1, 2, 2]
+
+
+def write_text_files_with_a_bad_file(directory: Path) -> Path:
+    (directory / "a_invalid.txt").write_bytes(b"\xff\xfe not utf-8 \x80")
+    (directory / "b_valid.txt").write_text("Tom Kha Gai is a coconut soup.", encoding="utf-8")
+    return directory
+
+
+def test_stream_load_skips_files_that_fail_to_read(tmp_path):
+    vector_db = InMemoryVectorDb()
+    knowledge = TextKnowledgeBase(
+        path=write_text_files_with_a_bad_file(tmp_path),
+        reader=TextReader(chunk=False),
+        vector_db=vector_db,
+        stream_load=True,
+    )
+
+    knowledge.load()
+
+    assert [doc.content for doc in vector_db.rows.values()] == ["Tom Kha Gai is a coconut soup."]
+
+
+@pytest.mark.asyncio
+async def test_async_stream_load_skips_files_that_fail_to_read(tmp_path):
+    vector_db = InMemoryVectorDb()
+    knowledge = TextKnowledgeBase(
+        path=write_text_files_with_a_bad_file(tmp_path),
+        reader=TextReader(chunk=False),
+        vector_db=vector_db,
+        stream_load=True,
+    )
+
+    await knowledge.aload()
+
+    assert [doc.content for doc in vector_db.rows.values()] == ["Tom Kha Gai is a coconut soup."]
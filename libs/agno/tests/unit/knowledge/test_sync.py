@@ -0,0 +1,155 @@
+import os
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+
+from agno.document import Document
+from agno.document.chunking.strategy import ChunkingStrategy
+from agno.document.reader.text_reader import TextReader
+from agno.embedder.base import Embedder
+from agno.knowledge.text import TextKnowledgeBase
+from agno.vectordb.numpydb import NumpyDb
+
+
+@dataclass
+class CountingEmbedder(Embedder):
+    dimensions: Optional[int] = 8
+    calls: int = 0
+
+    def get_embedding(self, text: str) -> List[float]:
+        self.calls += 1
+        return [float(len(text) % (i + 2)) for i in range(self.dimensions)]  # type: ignore[arg-type]
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        return self.get_embedding(text), None
+
+
+class LineChunking(ChunkingStrategy):
+    def __init__(self, lines: int = 1):
+        self.lines = lines
+
+    def chunk(self, document: Document) -> List[Document]:
+        lines = document.content.splitlines()
+        return [
+            Document(name=document.name, content="\n".join(lines[i : i + self.lines]), meta_data={"line": i})
+            for i in range(0, len(lines), self.lines)
+        ]
+
+
+@pytest.fixture
+def docs_dir(tmp_path):
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    (docs / "soups.txt").write_text("Tom Kha Gai is a coconut soup.\nMinestrone is a vegetable soup.")
+    (docs / "noodles.txt").write_text("Pad Thai is a rice noodle dish.\nRamen is a noodle soup.")
+    return docs
+
+
+def create_knowledge_base(tmp_path, docs_dir) -> TextKnowledgeBase:
+    return TextKnowledgeBase(
+        path=docs_dir,
+        vector_db=NumpyDb(collection="recipes", path=str(tmp_path / "db"), embedder=CountingEmbedder()),
+        reader=TextReader(chunking_strategy=LineChunking()),
+        sync_state_path=str(tmp_path / "sync.json"),
+    )
+
+
+def touch(path, content: str) -> None:
+    stat = path.stat()
+    path.write_text(content)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_sync_skips_unchanged_sources(tmp_path, docs_dir):
+    knowledge_base = create_knowledge_base(tmp_path, docs_dir)
+
+    result = knowledge_base.sync()
+    assert result.sources_updated == 2
+    assert result.chunks_written == 4
+    assert knowledge_base.vector_db.get_count() == 4  # type: ignore
+
+    knowledge_base = create_knowledge_base(tmp_path, docs_dir)
+    knowledge_base.reader.read = None  # type: ignore  # unchanged sources must not be read
+    result = knowledge_base.sync()
+    assert result.to_dict() == {
+        "sources_unchanged": 2,
+        "sources_updated": 0,
+        "sources_removed": 0,
+        "chunks_written": 0,
+        "chunks_deleted": 0,
+    }
+
+
+def test_sync_rewrites_only_changed_chunks(tmp_path, docs_dir):
+    create_knowledge_base(tmp_path, docs_dir).sync()
+
+    touch(docs_dir / "soups.txt", "Tom Kha Gai is a coconut soup.\nGazpacho is a cold soup.")
+    knowledge_base = create_knowledge_base(tmp_path, docs_dir)
+    result = knowledge_base.sync()
+
+    assert result.sources_unchanged == 1
+    assert result.sources_updated == 1
+    assert result.chunks_written == 1
+    assert result.chunks_deleted == 1
+    assert knowledge_base.vector_db.embedder.calls == 1  # type: ignore
+    contents = {doc.content for doc in knowledge_base.search("soup", num_documents=10)}
+    assert "Gazpacho is a cold soup." in contents
+    assert "Minestrone is a vegetable soup." not in contents
+
+    # A new modification time alone re-reads the file but writes nothing
+    touch(docs_dir / "noodles.txt", (docs_dir / "noodles.txt").read_text())
+    result = create_knowledge_base(tmp_path, docs_dir).sync()
+    assert result.sources_unchanged == 2
+    assert result.chunks_written == 0
+
+
+def test_sync_deletes_chunks_of_removed_sources(tmp_path, docs_dir):
+    create_knowledge_base(tmp_path, docs_dir).sync()
+
+    (docs_dir / "noodles.txt").unlink()
+    knowledge_base = create_knowledge_base(tmp_path, docs_dir)
+    result = knowledge_base.sync()
+
+    assert result.sources_removed == 1
+    assert result.chunks_deleted == 2
+    assert knowledge_base.vector_db.get_count() == 2  # type: ignore
+
+
+@pytest.mark.asyncio
+async def test_async_sync_resyncs_when_chunking_changes(tmp_path, docs_dir):
+    await create_knowledge_base(tmp_path, docs_dir).async_sync()
+
+    knowledge_base = create_knowledge_base(tmp_path, docs_dir)
+    knowledge_base.reader.chunking_strategy = LineChunking(lines=2)
+    result = await knowledge_base.async_sync()
+
+    assert result.sources_updated == 2
+    assert result.chunks_deleted == 4
+    assert result.chunks_written == 2
+    assert knowledge_base.vector_db.get_count() == 2  # type: ignore
+
+
+def test_sync_rewrites_sources_when_the_collection_was_dropped(tmp_path, docs_dir):
+    create_knowledge_base(tmp_path, docs_dir).sync()
+
+    knowledge_base = create_knowledge_base(tmp_path, docs_dir)
+    knowledge_base.vector_db.drop()  # type: ignore
+    result = knowledge_base.sync()
+
+    assert result.sources_updated == 2
+    assert result.chunks_written == 4
+    assert knowledge_base.vector_db.get_count() == 4  # type: ignore
+
+
+@pytest.mark.asyncio
+async def test_async_sync_rewrites_sources_when_the_collection_is_empty(tmp_path, docs_dir):
+    await create_knowledge_base(tmp_path, docs_dir).async_sync()
+
+    knowledge_base = create_knowledge_base(tmp_path, docs_dir)
+    knowledge_base.vector_db.delete()  # type: ignore
+    result = await knowledge_base.async_sync()
+
+    assert result.sources_unchanged == 0
+    assert result.chunks_written == 4
+    assert knowledge_base.vector_db.get_count() == 4  # type: ignore
@@ -10,6 +10,7 @@ from agno.memory.v2.schema import SessionSummary, UserMemory
 from agno.models.message import Message
 from agno.models.openai.chat import OpenAIChat
 from agno.run.response import RunResponse
+from agno.utils.message import count_history_tokens, get_history_messages
 
 
 @pytest.fixture
@@ -597,6 +598,80 @@ def test_get_messages_from_last_n_runs(memory_with_model):
     assert messages[1].content == "It's expected to rain."
 
 
+def test_deferred_runs_are_loaded_on_demand(memory_with_model):
+    """Test that deferred runs are only deserialized when the loaded runs are not enough."""
+    session_id = "test_session"
+    older_runs = [
+        RunResponse(
+            run_id=f"run-{i}",
+            session_id=session_id,
+            messages=[Message(role="user", content=f"Question {i}"), Message(role="assistant", content=f"Answer {i}")],
+        ).to_dict()
+        for i in range(3)
+    ]
+    loader = Mock(return_value=older_runs)
+    memory_with_model.defer_runs(session_id, loader)
+    memory_with_model.add_run(
+        session_id,
+        RunResponse(
+            run_id="run-3",
+            session_id=session_id,
+            messages=[Message(role="user", content="Question 3"), Message(role="assistant", content="Answer 3")],
+        ),
+    )
+
+    # The loaded run covers the history that is asked for
+    messages = memory_with_model.get_messages_from_last_n_runs(session_id, last_n=1)
+    assert [m.content for m in messages] == ["Question 3", "Answer 3"]
+    loader.assert_not_called()
+
+    # Serialized deferred runs can be read without deserializing them
+    assert memory_with_model.get_deferred_run_dicts(session_id) == older_runs
+
+    # Asking for more history only loads the deferred runs that are needed, before the loaded ones
+    messages = memory_with_model.get_messages_from_last_n_runs(session_id, last_n=2)
+    assert [m.content for m in messages] == ["Question 2", "Answer 2", "Question 3", "Answer 3"]
+    assert memory_with_model.get_deferred_run_dicts(session_id) == older_runs[:2]
+    assert [run.run_id for run in memory_with_model.get_runs(session_id)] == ["run-0", "run-1", "run-2", "run-3"]
+    assert not memory_with_model.has_deferred_runs(session_id)
+
+
+def test_deferred_runs_are_loaded_within_the_token_budget(memory_with_model):
+    """Test that deferred runs stop being loaded once the token budget is spent."""
+    session_id = "test_session"
+    older_runs = [
+        RunResponse(
+            run_id=f"run-{i}",
+            session_id=session_id,
+            messages=[Message(role="user", content=f"Question {i}"), Message(role="assistant", content=f"Answer {i}")],
+        ).to_dict()
+        for i in range(8)
+    ]
+    memory_with_model.defer_runs(session_id, lambda: older_runs)
+    memory_with_model.add_run(
+        session_id,
+        RunResponse(
+            run_id="run-8",
+            session_id=session_id,
+            messages=[Message(role="user", content="Question 8"), Message(role="assistant", content="Answer 8")],
+        ),
+    )
+    run_tokens = count_history_tokens(memory_with_model.get_messages_from_last_n_runs(session_id, last_n=1))
+
+    messages = memory_with_model.get_messages_within_tokens(session_id, max_tokens=2 * run_tokens + 1)
+
+    # Runs are loaded newest first until they cover the budget, the older ones stay deferred
+    assert [m.content for m in messages][-2:] == ["Question 8", "Answer 8"]
+    assert len(messages) == 8
+    assert memory_with_model.get_deferred_run_dicts(session_id) == older_runs[:5]
+    assert len(get_history_messages(messages, max_tokens=2 * run_tokens + 1)) == 4
+
+    # Without a deferred run left, all runs are returned
+    messages = memory_with_model.get_messages_within_tokens(session_id, max_tokens=100 * run_tokens)
+    assert len(messages) == 18
+    assert not memory_with_model.has_deferred_runs(session_id)
+
+
 # Team Context Tests
 def test_add_interaction_to_team_context(memory_with_model):
     """Test adding an interaction to team context."""
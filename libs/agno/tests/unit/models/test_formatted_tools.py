@@ -0,0 +1,21 @@
+from agno.models.openai import OpenAIChat
+
+
+def test_formatted_tools_are_reused_for_the_same_tools_list():
+    model = OpenAIChat(api_key="test")
+    calls = []
+
+    def formatter(tools):
+        calls.append(len(tools))
+        return [tool["function"]["name"] for tool in tools]
+
+    tools = [{"type": "function", "function": {"name": "search"}}]
+    assert model._get_formatted_tools(tools, formatter) == ["search"]
+    assert model._get_formatted_tools(tools, formatter) == ["search"]
+    assert calls == [1]
+
+    # A new or extended tools list is formatted again
+    tools.append({"type": "function", "function": {"name": "fetch"}})
+    assert model._get_formatted_tools(tools, formatter) == ["search", "fetch"]
+    assert model._get_formatted_tools(list(tools), formatter) == ["search", "fetch"]
+    assert calls == [1, 2, 2]
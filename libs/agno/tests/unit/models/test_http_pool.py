@@ -0,0 +1,87 @@
+import asyncio
+from copy import deepcopy
+
+import pytest
+
+from agno.models.openai import OpenAIChat
+from agno.models.openai.like import OpenAILike
+from agno.utils.http_pool import aclose_shared_clients, close_shared_clients, get_shared_client_count
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_clients():
+    close_shared_clients()
+    yield
+    close_shared_clients()
+
+
+def test_clients_are_shared_between_models_with_the_same_params():
+    model = OpenAIChat(api_key="test")
+    client = model.get_client()
+
+    assert model.get_client() is client
+    assert OpenAIChat(id="gpt-4o-mini", api_key="test").get_client() is client
+    assert deepcopy(model).get_client() is client
+    assert OpenAIChat(api_key="other").get_client() is not client
+    assert OpenAILike(api_key="test", base_url="https://example.com/v1").get_client() is not client
+
+
+def test_reuse_client_can_be_disabled():
+    model = OpenAIChat(api_key="test", reuse_client=False)
+    assert model.get_client() is not model.get_client()
+
+
+def test_closed_clients_are_replaced():
+    model = OpenAIChat(api_key="test")
+    client = model.get_client()
+    client.close()
+
+    assert model.get_client() is not client
+
+
+def test_async_clients_are_shared_per_event_loop():
+    model = OpenAIChat(api_key="test")
+
+    async def get_clients():
+        first, second = model.get_async_client(), deepcopy(model).get_async_client()
+        await aclose_shared_clients()
+        return first, second
+
+    first, second = asyncio.run(get_clients())
+    assert first is second
+
+    other_loop_client, _ = asyncio.run(get_clients())
+    assert other_loop_client is not first
+
+
+def test_async_clients_of_closed_event_loops_are_released():
+    model = OpenAIChat(api_key="test")
+    clients = []
+
+    async def get_client():
+        clients.append(model.get_async_client())
+        await asyncio.sleep(0)
+
+    for _ in range(5):
+        asyncio.run(get_client())
+        assert get_shared_client_count() == (0, 1)
+
+    assert len(set(map(id, clients))) == 5
+    assert all(client.is_closed() for client in clients[:-1])
+
+    close_shared_clients()
+    assert clients[-1].is_closed()
+    assert get_shared_client_count() == (0, 0)
+
+
+def test_async_clients_created_outside_of_a_loop_are_closed():
+    model = OpenAIChat(api_key="test")
+    client = model.get_async_client()
+
+    assert get_shared_client_count() == (0, 1)
+    assert model.get_async_client() is client
+    assert model.get_client() is not client
+
+    close_shared_clients()
+    assert client.is_closed()
+    assert get_shared_client_count() == (0, 0)
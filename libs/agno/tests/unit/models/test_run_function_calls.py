@@ -0,0 +1,93 @@
+import threading
+import time
+from typing import List
+
+from agno.models.message import Message
+from agno.models.openai import OpenAIChat
+from agno.models.response import ModelResponse, ModelResponseEvent
+from agno.tools.function import Function, FunctionCall
+
+
+def slow_lookup(query: str) -> str:
+    """Look up a query."""
+    time.sleep(0.2)
+    return f"result for {query}"
+
+
+def make_function_calls(concurrency_safe: bool, count: int = 4) -> List[FunctionCall]:
+    function = Function.from_callable(slow_lookup)
+    function.concurrency_safe = concurrency_safe
+    return [FunctionCall(function=function, arguments={"query": f"q{i}"}, call_id=f"call-{i}") for i in range(count)]
+
+
+def run(model: OpenAIChat, function_calls: List[FunctionCall]):
+    function_call_results: List[Message] = []
+    events = [
+        response.event
+        for response in model.run_function_calls(function_calls, function_call_results)
+        if isinstance(response, ModelResponse)
+    ]
+    return function_call_results, events
+
+
+def test_concurrent_tool_calls_keep_order():
+    model = OpenAIChat(id="gpt-4o", api_key="test", concurrent_tool_calls=True)
+
+    start = time.perf_counter()
+    results, events = run(model, make_function_calls(concurrency_safe=True))
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 0.6
+    assert [r.tool_call_id for r in results] == ["call-0", "call-1", "call-2", "call-3"]
+    assert [r.content for r in results] == ["result for q0", "result for q1", "result for q2", "result for q3"]
+    assert (
+        events == [ModelResponseEvent.tool_call_started.value] * 4 + [ModelResponseEvent.tool_call_completed.value] * 4
+    )
+
+
+def test_tool_calls_not_marked_safe_run_sequentially():
+    model = OpenAIChat(id="gpt-4o", api_key="test", concurrent_tool_calls=True)
+    threads = set()
+
+    def record_thread(query: str) -> str:
+        """Record the thread."""
+        threads.add(threading.current_thread().name)
+        return query
+
+    function_calls = [
+        FunctionCall(function=Function.from_callable(record_thread), arguments={"query": f"q{i}"}, call_id=f"call-{i}")
+        for i in range(3)
+    ]
+    results, events = run(model, function_calls)
+
+    assert threads == {threading.current_thread().name}
+    assert [r.content for r in results] == ["q0", "q1", "q2"]
+    assert events == [ModelResponseEvent.tool_call_started.value, ModelResponseEvent.tool_call_completed.value] * 3
+
+
+def test_concurrent_tool_calls_with_pause_and_limit():
+    model = OpenAIChat(id="gpt-4o", api_key="test", concurrent_tool_calls=True, max_tool_call_workers=2)
+    function_calls = make_function_calls(concurrency_safe=True, count=4)
+    confirm = Function.from_callable(slow_lookup)
+    confirm.requires_confirmation = True
+    function_calls.insert(2, FunctionCall(function=confirm, arguments={"query": "confirm"}, call_id="call-confirm"))
+
+    function_call_results: List[Message] = []
+    events = [
+        response.event
+        for response in model.run_function_calls(function_calls, function_call_results, function_call_limit=4)
+        if isinstance(response, ModelResponse)
+    ]
+
+    # The calls before the pause complete before the pause event, the call over the limit gets an error result
+    assert events == [
+        ModelResponseEvent.tool_call_started.value,
+        ModelResponseEvent.tool_call_started.value,
+        ModelResponseEvent.tool_call_completed.value,
+        ModelResponseEvent.tool_call_completed.value,
+        ModelResponseEvent.tool_call_paused.value,
+        ModelResponseEvent.tool_call_started.value,
+        ModelResponseEvent.tool_call_completed.value,
+    ]
+    assert [r.tool_call_id for r in function_call_results] == ["call-0", "call-1", "call-2", "call-3"]
+    assert function_call_results[-1].tool_call_error
@@ -0,0 +1,77 @@
+"""
+Unit tests for the playground session listing endpoints.
+"""
+
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from agno.agent import Agent
+from agno.models.openai import OpenAIChat
+from agno.playground import Playground
+from agno.storage.session.agent import AgentSession
+from agno.storage.sqlite import SqliteStorage
+
+
+@pytest.fixture
+def agent(tmp_path: Path) -> Agent:
+    storage = SqliteStorage(table_name="agent_sessions", db_file=str(tmp_path / "sessions.db"), mode="agent")
+    for i in range(3):
+        storage.upsert(
+            AgentSession(
+                session_id=f"session-{i}",
+                agent_id="test-agent",
+                user_id="test-user",
+                memory={"runs": [{"message": {"role": "user", "content": f"Question {i}"}, "response": {}}]},
+            )
+        )
+    storage.upsert(
+        AgentSession(
+            session_id="named-session",
+            agent_id="test-agent",
+            user_id="test-user",
+            session_data={"session_name": "Named"},
+        )
+    )
+    return Agent(name="Test Agent", agent_id="test-agent", model=OpenAIChat(id="gpt-4o-mini"), storage=storage)
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+def test_list_agent_sessions(agent: Agent, use_async: bool):
+    client = TestClient(Playground(agents=[agent]).get_app(use_async=use_async))
+
+    response = client.get("/v1/playground/agents/test-agent/sessions", params={"user_id": "test-user"})
+    assert response.status_code == 200
+    sessions = {session["session_id"]: session for session in response.json()}
+    assert len(sessions) == 4
+    assert sessions["session-1"]["title"] == "Question 1"
+    assert sessions["named-session"]["title"] == "Named"
+    assert sessions["named-session"]["session_name"] == "Named"
+
+    # Paging follows the cursor returned in the X-Next-Cursor header
+    response = client.get("/v1/playground/agents/test-agent/sessions", params={"limit": 3})
+    assert len(response.json()) == 3
+    cursor = response.headers["X-Next-Cursor"]
+    response = client.get("/v1/playground/agents/test-agent/sessions", params={"limit": 3, "cursor": cursor})
+    assert len(response.json()) == 1
+    assert "X-Next-Cursor" not in response.headers
+
+    response = client.get("/v1/playground/agents/test-agent/sessions", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
+
+    # Page sizes are capped
+    response = client.get("/v1/playground/agents/test-agent/sessions", params={"limit": 100000})
+    assert response.status_code == 422
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+def test_delete_agent_session(agent: Agent, use_async: bool):
+    client = TestClient(Playground(agents=[agent]).get_app(use_async=use_async))
+
+    response = client.delete("/v1/playground/agents/test-agent/sessions/session-0", params={"user_id": "other-user"})
+    assert response.status_code == 404
+
+    response = client.delete("/v1/playground/agents/test-agent/sessions/session-0", params={"user_id": "test-user"})
+    assert response.status_code == 200
+    assert agent.storage.read("session-0") is None
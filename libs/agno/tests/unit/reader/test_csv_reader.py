@@ -224,3 +224,31 @@ async def test_async_read_url(csv_url_reader):
 
     assert expected_first_row in documents[0].content
     assert expected_second_row in documents[0].content
+
+
+def test_iter_read_yields_pages(temp_dir):
+    file_path = temp_dir / "rows.csv"
+    file_path.write_text("\n".join(f"row{i},{i}" for i in range(25)), encoding="utf-8")
+
+    documents = list(CSVReader(chunk=False).iter_read(file_path, page_size=10))
+
+    assert [doc.meta_data for doc in documents] == [
+        {"page": 1, "start_row": 1, "rows": 10},
+        {"page": 2, "start_row": 11, "rows": 10},
+        {"page": 3, "start_row": 21, "rows": 5},
+    ]
+    assert documents[0].name == "rows"
+    assert documents[2].content == "row20, 20 row21, 21 row22, 22 row23, 23 row24, 24"
+
+
+@pytest.mark.asyncio
+async def test_aiter_read_file_object():
+    file_obj = io.BytesIO(SAMPLE_CSV.encode("utf-8"))
+    file_obj.name = "memory.csv"
+
+    documents = [doc async for doc in CSVReader(chunk=False).aiter_read(file_obj, page_size=2)]
+
+    assert len(documents) == 2
+    assert documents[1].content == "Jane, 25, San Francisco Bob, 40, Chicago"
+    # The file of the caller is left open
+    assert not file_obj.closed
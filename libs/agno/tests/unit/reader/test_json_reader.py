@@ -265,3 +265,51 @@ async def test_async_large_json():
 
     assert len(documents) == 1000
     assert all(doc.name == "large" for doc in documents)
+
+
+@pytest.mark.parametrize("block_size", [4, 1 << 20])
+def test_iter_read_array_and_json_lines(tmp_path, block_size):
+    records = [{"id": i, "text": f"record {i}", "score": i * 1.5} for i in range(5)]
+    array_path = tmp_path / "array.json"
+    array_path.write_text(json.dumps(records, indent=2))
+    lines_path = tmp_path / "lines.jsonl"
+    lines_path.write_text("\n".join(json.dumps(record) for record in records) + "\n")
+
+    reader = JSONReader(chunk=False)
+    for path in (array_path, lines_path):
+        documents = list(reader.iter_read(path, block_size=block_size))
+        assert [json.loads(doc.content) for doc in documents] == records
+        assert [doc.meta_data["page"] for doc in documents] == [1, 2, 3, 4, 5]
+
+
+@pytest.mark.parametrize("block_size", [1, 3, 1 << 20])
+def test_iter_read_json_lines_of_arrays(tmp_path, block_size):
+    lines_path = tmp_path / "arrays.jsonl"
+    lines_path.write_text("[1, 2]\n[3, 4]\n")
+
+    documents = list(JSONReader(chunk=False).iter_read(lines_path, block_size=block_size))
+
+    assert [json.loads(doc.content) for doc in documents] == [1, 2, 3, 4]
+
+
+@pytest.mark.parametrize("block_size", [1, 2, 3, 4, 1 << 20])
+def test_iter_read_numbers_split_by_blocks(tmp_path, block_size):
+    array_path = tmp_path / "numbers.json"
+    array_path.write_text("[1.5e10, -2.25, 7, 1E-3]")
+
+    documents = list(JSONReader(chunk=False).iter_read(array_path, block_size=block_size))
+
+    assert [json.loads(doc.content) for doc in documents] == [1.5e10, -2.25, 7, 1e-3]
+
+
+@pytest.mark.asyncio
+async def test_aiter_read_bytesio():
+    json_bytes = BytesIO(json.dumps({"key": "value"}).encode())
+    json_bytes.name = "test.json"
+
+    documents = [doc async for doc in JSONReader(chunk=False).aiter_read(json_bytes)]
+
+    assert len(documents) == 1
+    assert documents[0].name == "test"
+    assert json.loads(documents[0].content) == {"key": "value"}
+    assert not json_bytes.closed
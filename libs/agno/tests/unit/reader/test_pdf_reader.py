@@ -1,6 +1,7 @@
 import asyncio
 from io import BytesIO
 from pathlib import Path
+from typing import List
 
 import httpx
 import pytest
@@ -156,3 +157,95 @@ def test_pdf_reader_empty_pdf():
     documents = reader.read(empty_pdf)
 
     assert len(documents) == 0
+
+
+def create_text_pdf(path: Path, pages: List[str]) -> Path:
+    """Write a minimal PDF with one line of text per page"""
+    objects = ["<< /Type /Catalog /Pages 2 0 R >>", ""]
+    kids = []
+    for text in pages:
+        stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET"
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream")
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents {len(objects)} 0 R "
+            "/Resources << /Font << /F1 << /Type /Font /Subtype /Type1 /BaseFont /Helvetica >> >> >> >>"
+        )
+        kids.append(f"{len(objects)} 0 R")
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(pages)} >>"
+
+    content = "%PDF-1.4\n"
+    offsets = []
+    for number, obj in enumerate(objects, start=1):
+        offsets.append(len(content))
+        content += f"{number} 0 obj\n{obj}\nendobj\n"
+    xref = len(content)
+    content += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n"
+    content += "".join(f"{offset:010d} 00000 n \n" for offset in offsets)
+    content += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n"
+    path.write_bytes(content.encode("latin-1"))
+    return path
+
+
+def test_pdf_reader_parsing_workers_match_sequential_read(tmp_path):
+    pdf_path = create_text_pdf(tmp_path / "pages.pdf", [f"Page {i} text" for i in range(1, 8)])
+    sequential = PDFReader().read(pdf_path)
+
+    reader = PDFReader(parsing_workers=2, pages_per_shard=2)
+    documents = reader.read(pdf_path)
+
+    assert len(documents) == 7
+    assert [doc.content for doc in documents] == [doc.content for doc in sequential]
+    assert [doc.meta_data for doc in documents] == [doc.meta_data for doc in sequential]
+
+    with open(pdf_path, "rb") as pdf_file:
+        assert [doc.content for doc in reader.read(pdf_file)] == [doc.content for doc in sequential]
+
+
+def test_pdf_reader_parsing_workers_send_a_path_for_pdf_content(tmp_path, monkeypatch):
+    from agno.document.reader import pdf_reader
+
+    pdf_path = create_text_pdf(tmp_path / "pages.pdf", [f"Page {i} text" for i in range(1, 6)])
+    shards = []
+
+    def record_shards(func, args_iter, workers):
+        shards.extend(args_iter)
+        return [func(*args) for args in shards]
+
+    monkeypatch.setattr(pdf_reader, "parse_in_processes", record_shards)
+    documents = PDFReader(chunk=False, parsing_workers=2, pages_per_shard=2).read(BytesIO(pdf_path.read_bytes()))
+
+    assert [doc.content for doc in documents] == [f"Page {i} text" for i in range(1, 6)]
+    assert len(shards) == 3
+    # Every shard gets the path of the same temporary copy, which is removed after reading
+    assert len({shard[0] for shard in shards}) == 1
+    assert isinstance(shards[0][0], str)
+    assert not Path(shards[0][0]).exists()
+
+
+@pytest.mark.asyncio
+async def test_pdf_reader_async_parsing_workers(tmp_path):
+    pdf_path = create_text_pdf(tmp_path / "pages.pdf", [f"Page {i} text" for i in range(1, 8)])
+
+    documents = await PDFReader(chunk=False, parsing_workers=2, pages_per_shard=3).async_read(pdf_path)
+
+    assert [doc.meta_data["page"] for doc in documents] == list(range(1, 8))
+    assert [doc.content for doc in documents] == [f"Page {i} text" for i in range(1, 8)]
+
+
+def test_pdf_reader_iter_read_yields_pages_in_order(tmp_path):
+    pdf_path = create_text_pdf(tmp_path / "pages.pdf", [f"Page {i} text" for i in range(1, 6)])
+
+    documents = PDFReader(chunk=False).iter_read(pdf_path)
+
+    assert next(documents).content == "Page 1 text"
+    assert [doc.meta_data["page"] for doc in documents] == [2, 3, 4, 5]
+
+
+@pytest.mark.asyncio
+async def test_pdf_reader_aiter_read_with_parsing_workers(tmp_path):
+    pdf_path = create_text_pdf(tmp_path / "pages.pdf", [f"Page {i} text" for i in range(1, 8)])
+    reader = PDFReader(chunk=False, parsing_workers=2, pages_per_shard=2)
+
+    documents = [doc async for doc in reader.aiter_read(pdf_path)]
+
+    assert [doc.content for doc in documents] == [f"Page {i} text" for i in range(1, 8)]
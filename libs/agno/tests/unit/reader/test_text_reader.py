@@ -336,3 +336,27 @@ async def test_async_parallel_chunking():
     finally:
         # Restore original processor
         reader._async_chunk_document = original_processor
+
+
+def test_iter_read_blocks_end_on_line_breaks(tmp_path):
+    text = "".join(f"line {i}\n" for i in range(50)) + "last line without break"
+    text_path = tmp_path / "long.txt"
+    text_path.write_text(text)
+
+    documents = list(TextReader(chunk=False).iter_read(text_path, block_size=64))
+
+    assert len(documents) > 1
+    assert "".join(doc.content for doc in documents) == text
+    assert all(doc.content.endswith("\n") for doc in documents[:-1])
+    assert [doc.meta_data["block"] for doc in documents] == list(range(1, len(documents) + 1))
+
+
+@pytest.mark.asyncio
+async def test_aiter_read_bytesio():
+    text_bytes = BytesIO(b"first\nsecond\n")
+    text_bytes.name = "test.txt"
+
+    documents = [doc async for doc in TextReader(chunk=False).aiter_read(text_bytes)]
+
+    assert [doc.content for doc in documents] == ["first\nsecond\n"]
+    assert documents[0].name == "test"
@@ -0,0 +1,134 @@
+import asyncio
+from typing import Dict, List
+
+import httpx
+import pytest
+
+from agno.document.reader.crawler import CrawlStore, WebsiteCrawler
+from agno.document.reader.website_reader import WebsiteReader
+
+PAGES = {
+    "/": '<main>Home</main><a href="/a">A</a><a href="/b#section">B</a><a href="/private/x">X</a>',
+    "/a": '<main>Page A</main><a href="/c">C</a><a href="https://other.org/">Other</a>',
+    "/b": '<main>Page B</main><a href="/">Home</a>',
+    "/c": "<main>Page C</main>",
+    "/orphan": "<main>Only in the sitemap</main>",
+    "/private/x": "<main>Secret</main>",
+}
+
+
+class Site:
+    """A fake website served through an httpx mock transport"""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.requests: List[str] = []
+        self.full_responses = 0
+        self.running = 0
+        self.max_running = 0
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        self.requests.append(path)
+        if path == "/robots.txt":
+            return httpx.Response(200, text="User-agent: *\nDisallow: /private/\n")
+        if path == "/sitemap.xml":
+            return httpx.Response(200, text="<urlset><url><loc>https://example.com/orphan</loc></url></urlset>")
+        if path not in PAGES:
+            return httpx.Response(404)
+
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(self.delay)
+        self.running -= 1
+
+        etag = f'"{path}"'
+        if request.headers.get("if-none-match") == etag:
+            return httpx.Response(304, headers={"etag": etag})
+        self.full_responses += 1
+        return httpx.Response(200, html=f"<html><body>{PAGES[path]}</body></html>", headers={"etag": etag})
+
+    def crawler(self, store: CrawlStore, **kwargs) -> WebsiteCrawler:
+        return WebsiteCrawler(
+            extract_content=WebsiteReader()._extract_main_content,
+            host_delay=0.0,
+            store=store,
+            transport=httpx.MockTransport(self.handle),
+            **kwargs,
+        )
+
+
+@pytest.mark.asyncio
+async def test_crawl_follows_links_sitemaps_and_robots():
+    site = Site()
+    result = await site.crawler(CrawlStore(), max_links=10).crawl("https://example.com/")
+
+    assert result == {
+        "https://example.com/": "Home",
+        "https://example.com/a": "Page A",
+        "https://example.com/b": "Page B",
+        "https://example.com/c": "Page C",
+        "https://example.com/orphan": "Only in the sitemap",
+    }
+    assert "/private/x" not in site.requests
+    assert site.requests.count("/robots.txt") == 1
+
+
+@pytest.mark.asyncio
+async def test_crawl_limits_concurrency_per_host():
+    site = Site(delay=0.02)
+    result = await site.crawler(CrawlStore(), max_concurrency=8, max_concurrency_per_host=2).crawl(
+        "https://example.com/"
+    )
+
+    assert len(result) == 5
+    assert site.max_running == 2
+
+
+@pytest.mark.asyncio
+async def test_recrawl_sends_conditional_requests(tmp_path):
+    site = Site()
+    store_path = str(tmp_path / "crawl.db")
+    first = await site.crawler(CrawlStore(store_path)).crawl("https://example.com/")
+    assert site.full_responses == 5
+
+    second = await site.crawler(CrawlStore(store_path)).crawl("https://example.com/")
+
+    assert second == first
+    assert site.full_responses == 5
+
+
+@pytest.mark.asyncio
+async def test_interrupted_crawl_resumes(tmp_path):
+    store_path = str(tmp_path / "crawl.db")
+    site = Site(delay=0.05)
+    task = asyncio.create_task(
+        site.crawler(CrawlStore(store_path), max_concurrency=1, use_sitemaps=False).crawl("https://example.com/")
+    )
+    while site.full_responses < 2:
+        await asyncio.sleep(0.01)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    crawled_before: Dict[str, str] = CrawlStore(store_path).get_results("https://example.com/")
+
+    resumed_site = Site()
+    result = await resumed_site.crawler(CrawlStore(store_path), use_sitemaps=False).crawl("https://example.com/")
+
+    assert set(result) == {
+        "https://example.com/",
+        "https://example.com/a",
+        "https://example.com/b",
+        "https://example.com/c",
+    }
+    assert not any(f"https://example.com{path}" in crawled_before for path in resumed_site.requests if path in PAGES)
+
+
+def test_website_reader_crawls_with_the_engine(monkeypatch):
+    site = Site()
+    reader = WebsiteReader(max_links=2, host_delay=0.0)
+    monkeypatch.setattr(reader, "_get_crawler", lambda: site.crawler(CrawlStore(), max_links=reader.max_links))
+
+    documents = reader.read("https://example.com/")
+
+    assert len({doc.meta_data["url"] for doc in documents}) == 2
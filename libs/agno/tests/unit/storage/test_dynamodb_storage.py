@@ -380,3 +380,35 @@ def test_serialization_deserialization(agent_storage):
     assert isinstance(deserialized["list_value"][0], int)
     assert isinstance(deserialized["nested_dict"]["nested"]["float"], float)
     assert isinstance(deserialized["nested_dict"]["nested"]["list"][0], int)
+
+
+def test_list_sessions(agent_storage):
+    """Test that list_sessions pages through the entity index with a projection."""
+    storage, mock_table = agent_storage
+    items = [
+        {"session_id": f"session-{i}", "created_at": 100 - i, "memory": {"runs": [{"content": f"run {i}"}]}}
+        for i in range(3)
+    ]
+    mock_table.query.return_value = {"Items": items, "LastEvaluatedKey": {"session_id": "session-2"}}
+
+    page = storage.list_sessions(entity_id="test-agent", limit=2, fields=["session_id", "first_run"])
+
+    assert [session["session_id"] for session in page.sessions] == ["session-0", "session-1"]
+    assert page.sessions[0]["first_run"] == {"content": "run 0"}
+    query = mock_table.query.call_args.kwargs
+    assert query["IndexName"] == "agent_id-index"
+    assert query["ScanIndexForward"] is False
+    assert query["Limit"] == 3
+    assert "#memory.#runs[0]" in query["ProjectionExpression"]
+
+    # The next page continues after the last session of the page
+    mock_table.query.return_value = {"Items": items[2:]}
+    page = storage.list_sessions(entity_id="test-agent", limit=2, cursor=page.next_cursor)
+
+    assert [session["session_id"] for session in page.sessions] == ["session-2"]
+    assert page.next_cursor is None
+    assert mock_table.query.call_args.kwargs["ExclusiveStartKey"] == {
+        "session_id": "session-1",
+        "created_at": 99,
+        "agent_id": "test-agent",
+    }
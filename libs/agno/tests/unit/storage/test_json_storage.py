@@ -174,3 +174,30 @@ def test_workflow_storage_filtering(workflow_storage: JsonStorage):
 
     empty_sessions = workflow_storage.get_all_sessions(entity_id="non-existent")
     assert len(empty_sessions) == 0
+
+
+def test_list_sessions(agent_storage: JsonStorage):
+    for i in range(5):
+        agent_storage.upsert(
+            AgentSession(
+                session_id=f"session-{i}",
+                agent_id="test-agent",
+                user_id="test-user",
+                memory={"runs": [{"content": f"run {i}"}]},
+                created_at=i,
+            )
+        )
+
+    page = agent_storage.list_sessions(user_id="test-user", limit=3, fields=["session_id", "first_run"])
+    assert [session["session_id"] for session in page.sessions] == ["session-4", "session-3", "session-2"]
+    assert page.sessions[0]["first_run"] == {"content": "run 4"}
+
+    page = agent_storage.list_sessions(user_id="test-user", limit=3, cursor=page.next_cursor)
+    assert [session["session_id"] for session in page.sessions] == ["session-1", "session-0"]
+    assert page.next_cursor is None
+
+    # Deleted sessions are dropped from the listing cache
+    agent_storage.delete_session("session-4")
+    page = agent_storage.list_sessions(entity_id="test-agent", limit=None)
+    assert len(page.sessions) == 4
+    assert len(agent_storage._list_rows) == 4
@@ -1,5 +1,5 @@
 from typing import Dict
-from unittest.mock import ANY, MagicMock, patch
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
 from uuid import uuid4
 
 import pytest
@@ -429,3 +429,39 @@ def test_error_handling_with_uuid(agent_storage, mock_redis_client):
     mock_redis_client.get.return_value = "invalid json"
     result = agent_storage.read(str(uuid4()))
     assert result is None
+
+
+@pytest.mark.asyncio
+async def test_async_api_uses_async_client(mock_redis_client):
+    """Test that the async API goes through the redis.asyncio client."""
+    mock_data: Dict[str, str] = {}
+    async_client = MagicMock()
+
+    async def mock_get(key):
+        return mock_data.get(key)
+
+    async def mock_set(key, value):
+        mock_data[key] = value
+
+    async def mock_delete(key):
+        return 1 if mock_data.pop(key, None) is not None else 0
+
+    async_client.get.side_effect = mock_get
+    async_client.set.side_effect = mock_set
+    async_client.delete.side_effect = mock_delete
+    async_client.pipeline.return_value.execute = AsyncMock()
+
+    with patch("agno.storage.redis.AsyncRedis", return_value=async_client):
+        storage = RedisStorage(prefix="test_agent", mode="agent")
+        session = AgentSession(session_id="test-session", agent_id="test-agent", user_id="test-user")
+
+        assert await storage.aupsert(session) == session
+        read_session = await storage.aread("test-session")
+        assert read_session is not None
+        assert read_session.agent_id == "test-agent"
+        assert await storage.aread("test-session", user_id="other-user") is None
+
+        await storage.adelete_session("test-session")
+        assert await storage.aread("test-session") is None
+
+    mock_redis_client.get.assert_not_called()
@@ -4,6 +4,7 @@ from pathlib import Path
 from typing import Generator
 
 import pytest
+from sqlalchemy import select, text
 
 from agno.storage.session.agent import AgentSession
 from agno.storage.session.workflow import WorkflowSession
@@ -193,3 +194,147 @@ def test_workflow_storage_filtering(workflow_storage: SqliteStorage):
 
     empty_sessions = workflow_storage.get_all_sessions(entity_id="non-existent")
     assert len(empty_sessions) == 0
+
+
+def test_incremental_agent_storage(temp_db_path: Path):
+    storage = SqliteStorage(table_name="agent_sessions", db_file=str(temp_db_path), mode="agent", incremental=True)
+    storage.create()
+
+    session = AgentSession(
+        session_id="test-session",
+        agent_id="test-agent",
+        memory={"runs": [{"run_id": "run-1", "content": "first"}], "memories": {}},
+    )
+    storage.upsert(session)
+
+    # Only the new run is sent on the next upsert, the first one is already in the runs table
+    session.memory = {"runs": [{"run_id": "run-2", "content": "second"}], "memories": {}}
+    saved_session = storage.upsert(session)
+    assert saved_session is not None
+    assert [run["run_id"] for run in saved_session.memory["runs"]] == ["run-1", "run-2"]
+    assert storage.is_run_saved("test-session", "run-1")
+
+    # Runs that are sent again are updated in place
+    session.memory = {"runs": [{"run_id": "run-2", "content": "second, updated"}], "memories": {}}
+    storage.upsert(session)
+
+    with storage.SqlSession() as sess:
+        session_row = sess.execute(select(storage.table.c.memory)).fetchone()
+        runs = sess.execute(select(storage.runs_table.c.run_data).order_by(storage.runs_table.c.id)).fetchall()
+    assert "runs" not in session_row[0]
+    assert [row[0]["content"] for row in runs] == ["first", "second, updated"]
+
+    all_sessions = storage.get_all_sessions()
+    assert len(all_sessions[0].memory["runs"]) == 2
+
+    storage.delete_session("test-session")
+    assert storage.read("test-session") is None
+    with storage.SqlSession() as sess:
+        assert sess.execute(select(storage.runs_table)).fetchall() == []
+
+
+@pytest.mark.asyncio
+async def test_async_agent_storage(temp_db_path: Path):
+    storage = SqliteStorage(table_name="agent_sessions", db_file=str(temp_db_path), mode="agent", incremental=True)
+    await storage.acreate()
+
+    session = AgentSession(
+        session_id="test-session",
+        agent_id="test-agent",
+        user_id="test-user",
+        memory={"runs": [{"run_id": "run-1", "content": "first"}], "memories": {}},
+    )
+    saved_session = await storage.aupsert(session)
+    assert saved_session is not None
+    assert storage.async_db_engine is not None
+
+    session.memory = {"runs": [{"run_id": "run-2", "content": "second"}], "memories": {}}
+    await storage.aupsert(session)
+
+    # The async and sync APIs read the same data
+    read_session = await storage.aread("test-session")
+    assert [run["run_id"] for run in read_session.memory["runs"]] == ["run-1", "run-2"]
+    assert storage.read("test-session").memory == read_session.memory
+    assert await storage.aget_all_session_ids(user_id="test-user") == ["test-session"]
+    assert len(await storage.aget_recent_sessions(entity_id="test-agent")) == 1
+
+    await storage.adelete_session("test-session")
+    assert await storage.aread("test-session") is None
+
+
+@pytest.mark.asyncio
+async def test_async_in_memory_storage_falls_back_to_threads():
+    storage = SqliteStorage(table_name="agent_sessions", mode="agent")
+    storage.create()
+
+    await storage.aupsert(AgentSession(session_id="test-session", agent_id="test-agent"))
+
+    assert storage.async_db_engine is None
+    assert (await storage.aread("test-session")).agent_id == "test-agent"
+
+
+def test_read_projected(temp_db_path: Path):
+    storage = SqliteStorage(table_name="agent_sessions", db_file=str(temp_db_path), mode="agent", incremental=True)
+    storage.create()
+    runs = [{"run_id": f"run-{i}", "content": f"run {i}"} for i in range(5)]
+    storage.upsert(AgentSession(session_id="test-session", agent_id="test-agent", memory={"runs": runs}))
+
+    # Only the last runs are read from the runs table
+    session = storage.read_projected("test-session", last_n_runs=2)
+    assert [run["run_id"] for run in session.memory["runs"]] == ["run-3", "run-4"]
+
+    assert storage.read_runs("test-session") == runs
+    assert storage.read_runs("test-session", last_n=1) == runs[-1:]
+    assert storage.read_projected("missing-session", last_n_runs=2) is None
+
+
+@pytest.mark.parametrize("incremental", [False, True])
+def test_list_sessions(temp_db_path: Path, incremental: bool):
+    storage = SqliteStorage(
+        table_name="agent_sessions", db_file=str(temp_db_path), mode="agent", incremental=incremental
+    )
+    storage.create()
+    for i in range(5):
+        runs = [{"run_id": f"run-{i}-{j}", "content": f"run {i} {j}"} for j in range(3)]
+        storage.upsert(AgentSession(session_id=f"session-{i}", agent_id="test-agent", memory={"runs": runs}))
+    storage.upsert(AgentSession(session_id="other-session", agent_id="other-agent"))
+
+    session_ids = []
+    page = storage.list_sessions(entity_id="test-agent", limit=2, fields=["session_id", "first_run"])
+    while True:
+        assert len(page.sessions) <= 2
+        session_ids.extend(session["session_id"] for session in page.sessions)
+        if page.next_cursor is None:
+            break
+        page = storage.list_sessions(entity_id="test-agent", limit=2, cursor=page.next_cursor)
+
+    # Sessions created in the same second are ordered by session_id
+    assert session_ids == [f"session-{i}" for i in reversed(range(5))]
+
+    first = storage.list_sessions(entity_id="test-agent", limit=1, fields=["session_id", "first_run"]).sessions[0]
+    assert first["first_run"] == {"run_id": "run-4-0", "content": "run 4 0"}
+    assert "memory" not in first
+
+    with pytest.raises(ValueError):
+        storage.list_sessions(cursor="not-a-cursor")
+    with pytest.raises(ValueError):
+        storage.list_sessions(fields=["not_a_column"])
+
+
+def test_upgrade_schema_creates_created_at_index(temp_db_path: Path):
+    storage = SqliteStorage(table_name="agent_sessions", db_file=str(temp_db_path), mode="agent")
+    storage.create()
+    index_query = text("SELECT name FROM sqlite_master WHERE type='index' AND sql LIKE '%created_at%'")
+    with storage.SqlSession() as sess:
+        # A table created before the index was added
+        for name in sess.execute(index_query).scalars().all():
+            sess.execute(text(f"DROP INDEX {name}"))
+        sess.commit()
+
+    upgraded = SqliteStorage(
+        table_name="agent_sessions", db_file=str(temp_db_path), mode="agent", auto_upgrade_schema=True
+    )
+    upgraded.upgrade_schema()
+
+    with upgraded.SqlSession() as sess:
+        assert len(sess.execute(index_query).scalars().all()) == 1
@@ -0,0 +1,109 @@
+import asyncio
+import time
+
+import pytest
+
+from agno.agent import Agent
+from agno.memory.v2.memory import Memory
+from agno.run.response import RunResponse, RunResponseContentEvent
+from agno.run.team import TeamRunResponse
+from agno.team.team import Team
+
+
+def make_member(name: str, delay: float) -> Agent:
+    member = Agent(name=name)
+
+    def run(message, *, stream=False, **kwargs):
+        def respond():
+            time.sleep(delay)
+            member.run_response = RunResponse(content=f"{name} done", agent_id=member.agent_id)
+            return member.run_response
+
+        if not stream:
+            return respond()
+
+        def events():
+            yield RunResponseContentEvent(content=f"{name} started", agent_id=member.agent_id)
+            respond()
+            yield RunResponseContentEvent(content=f"{name} done", agent_id=member.agent_id)
+
+        return events()
+
+    async def arun(message, *, stream=False, **kwargs):
+        async def respond():
+            await asyncio.sleep(delay)
+            member.run_response = RunResponse(content=f"{name} done", agent_id=member.agent_id)
+            return member.run_response
+
+        if not stream:
+            return await respond()
+
+        async def events():
+            yield RunResponseContentEvent(content=f"{name} started", agent_id=member.agent_id)
+            await respond()
+            yield RunResponseContentEvent(content=f"{name} done", agent_id=member.agent_id)
+
+        return events()
+
+    member.run = run  # type: ignore
+    member.arun = arun  # type: ignore
+    return member
+
+
+def make_team(**kwargs) -> Team:
+    team = Team(
+        mode="collaborate",
+        members=[make_member("Slow", 0.3), make_member("Fast", 0.1), make_member("Medium", 0.2)],
+        memory=Memory(),
+        **kwargs,
+    )
+    team.run_response = TeamRunResponse(content="")
+    return team
+
+
+def test_sync_members_run_concurrently():
+    team = make_team()
+    function = team.get_run_member_agents_function(session_id="session")
+
+    start = time.perf_counter()
+    results = list(function.entrypoint(task_description="Research"))
+
+    assert time.perf_counter() - start < 0.5
+    assert results == ["Agent Slow: Slow done", "Agent Fast: Fast done", "Agent Medium: Medium done"]
+    assert len(team.run_response.member_responses) == 3
+
+
+def test_sync_members_run_sequentially_with_one_worker():
+    team = make_team(max_concurrent_members=1)
+    function = team.get_run_member_agents_function(session_id="session")
+
+    start = time.perf_counter()
+    results = list(function.entrypoint(task_description="Research"))
+
+    assert time.perf_counter() - start >= 0.6
+    assert len(results) == 3
+
+
+def test_sync_member_streams_are_multiplexed():
+    team = make_team()
+    function = team.get_run_member_agents_function(session_id="session", stream=True)
+
+    events = list(function.entrypoint(task_description="Research"))
+
+    contents = [event.content for event in events]
+    assert contents[-3:] == ["Fast done", "Medium done", "Slow done"]
+    assert {event.agent_id for event in events} == {member.agent_id for member in team.members}
+    assert len(team.run_response.member_responses) == 3
+
+
+@pytest.mark.asyncio
+async def test_async_member_streams_are_multiplexed():
+    team = make_team()
+    function = team.get_run_member_agents_function(session_id="session", stream=True, async_mode=True)
+
+    start = time.perf_counter()
+    events = [event async for event in function.entrypoint(task_description="Research")]
+
+    assert time.perf_counter() - start < 0.5
+    assert [event.content for event in events][-3:] == ["Fast done", "Medium done", "Slow done"]
+    assert len(team.run_response.member_responses) == 3
@@ -209,6 +209,58 @@ def test_function_process_entrypoint_skip_processing():
     assert func.parameters == original_parameters  # Parameters should remain unchanged
 
 
+def test_function_process_entrypoint_is_compiled_once():
+    """Test that processing an already processed entrypoint again is a no-op."""
+
+    def test_func(param1: str, param2: int = 42) -> str:
+        """Test function with parameters."""
+        return f"{param1}-{param2}"
+
+    func = Function(name="test_func", entrypoint=test_func)
+    func.process_entrypoint()
+    entrypoint, parameters = func.entrypoint, func.parameters
+
+    func.process_entrypoint()
+    assert func.entrypoint is entrypoint
+    assert func.parameters is parameters
+
+    # Changing the settings compiles the schema again
+    func.process_entrypoint(strict=True)
+    assert func.parameters["required"] == ["param1", "param2"]
+
+
+def test_function_from_callable_reuses_compiled_schema():
+    """Test that closures created from the same definition share their compiled schema."""
+
+    def make_tool(prefix: str):
+        def search(query: str, limit: int = 5) -> str:
+            """Search for a query.
+
+            Args:
+                query: The query to search for.
+                limit: The maximum number of results.
+            """
+            return f"{prefix}:{query}:{limit}"
+
+        return search
+
+    first = Function.from_callable(make_tool("a"))
+    second = Function.from_callable(make_tool("b"))
+
+    assert first.parameters == second.parameters
+    assert first.parameters is not second.parameters
+    assert first.description == second.description
+    # Only the closure is re-bound
+    assert first.entrypoint(query="q") == "a:q:5"
+    assert second.entrypoint(query="q") == "b:q:5"
+
+    # The same callable reuses its validation wrapper
+    def plain(query: str) -> str:
+        return query
+
+    assert Function.from_callable(plain).entrypoint is Function.from_callable(plain).entrypoint
+
+
 def test_function_process_schema_for_strict():
     """Test processing schema for strict mode."""
     func = Function(
@@ -234,50 +286,46 @@ def test_function_cache_key_generation():
 
     cache_key = func._get_cache_key(entrypoint_args, call_args)
     assert isinstance(cache_key, str)
-    assert cache_key == "12cfb4e42ec8561012d976e2dca0e0c1"
+    assert cache_key == "test_func:e3f9516132af2990b819165ef16931e6068867cd5ea40efad3961d13b32aea5f"
 
+    # Keys are canonical: argument order and the agent/team arguments do not change them
+    reordered = func._get_cache_key({"param2": 42, "param1": "value1", "agent": object()}, call_args)
+    assert reordered == cache_key
 
-def test_function_cache_file_path():
-    """Test generation of cache file paths."""
-    func = Function(name="test_func", cache_results=True, cache_dir="/tmp")
 
-    cache_key = "test_key"
-    cache_file = func._get_cache_file_path(cache_key)
-    assert cache_file.startswith("/tmp/")
-    assert "test_func" in cache_file
-    assert "test_key" in cache_file
+def test_function_default_cache(tmp_path):
+    """Test that functions share the sqlite cache of their cache_dir."""
+    from agno.tools.cache import SqliteToolCache
+
+    func = Function(name="test_func", cache_results=True, cache_dir=str(tmp_path))
+    other_func = Function(name="other_func", cache_results=True, cache_dir=str(tmp_path))
+
+    cache = func.get_cache()
+    assert isinstance(cache, SqliteToolCache)
+    assert cache is other_func.get_cache()
+    assert str(cache.db_file).startswith(str(tmp_path))
 
 
 def test_function_cache_operations(tmp_path):
     """Test caching operations (save and retrieve)."""
-    import json
-    import os
-
     func = Function(name="test_func", cache_results=True, cache_dir=str(tmp_path))
 
     # Test saving to cache
     test_result = {"result": "test_data"}
-    cache_file = os.path.join(str(tmp_path), "test_cache.json")
-    func._save_to_cache(cache_file, test_result)
-
-    # Verify cache file exists and contains correct data
-    assert os.path.exists(cache_file)
-    with open(cache_file, "r") as f:
-        cached_data = json.load(f)
-    assert cached_data["result"] == {"result": "test_data"}
+    cache_key = func._get_cache_key({"param": "value"})
+    func._save_to_cache(cache_key, test_result)
 
     # Test retrieving from cache
-    retrieved_result = func._get_cached_result(cache_file)
-    assert retrieved_result == test_result
+    assert func._get_cached_result(cache_key) == test_result
 
     # Test retrieving non-existent cache
-    non_existent_file = os.path.join(str(tmp_path), "non_existent.json")
-    assert func._get_cached_result(non_existent_file) is None
+    assert func._get_cached_result(func._get_cache_key({"param": "other"})) is None
+    assert func.get_cache().metrics.hits == 1
+    assert func.get_cache().metrics.misses == 1
 
 
 def test_function_cache_ttl(tmp_path):
     """Test cache TTL functionality."""
-    import os
     import time
 
     func = Function(
@@ -289,17 +337,17 @@ def test_function_cache_ttl(tmp_path):
 
     # Save test data to cache
     test_result = {"result": "test_data"}
-    cache_file = os.path.join(str(tmp_path), "test_cache.json")
-    func._save_to_cache(cache_file, test_result)
+    cache_key = func._get_cache_key({"param": "value"})
+    func._save_to_cache(cache_key, test_result)
 
     # Verify cache is valid immediately
-    assert func._get_cached_result(cache_file) == test_result
+    assert func._get_cached_result(cache_key) == test_result
 
     # Wait for cache to expire
     time.sleep(1.1)
 
     # Verify cache is no longer valid
-    assert func._get_cached_result(cache_file) is None
+    assert func._get_cached_result(cache_key) is None
 
 
 def test_function_call_initialization():
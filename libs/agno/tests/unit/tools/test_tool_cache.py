@@ -0,0 +1,178 @@
+from typing import Any, Dict, List, Optional, Tuple
+from unittest.mock import patch
+
+import pytest
+
+from agno.tools.cache import InMemoryToolCache, SqliteToolCache
+from agno.tools.cache.redis import RedisToolCache
+from agno.tools.function import Function, FunctionCall
+
+
+class FakeRedis:
+    """In-memory stand-in for the Redis commands used by RedisToolCache, with a settable clock"""
+
+    def __init__(self):
+        self.now = 0.0
+        self.values: Dict[str, Tuple[str, Optional[float]]] = {}
+        self.zsets: Dict[str, Dict[str, float]] = {}
+
+    def get(self, key: str) -> Optional[str]:
+        value, expires_at = self.values.get(key, (None, None))
+        if expires_at is not None and expires_at <= self.now:
+            del self.values[key]
+            return None
+        return value
+
+    def set(self, key: str, value: str, ex: Optional[int] = None) -> None:
+        self.values[key] = (value, self.now + ex if ex is not None else None)
+
+    def delete(self, *keys: str) -> None:
+        for key in keys:
+            self.values.pop(key, None)
+
+    def zadd(self, name: str, mapping: Dict[str, float]) -> None:
+        self.zsets.setdefault(name, {}).update(mapping)
+
+    def zrem(self, name: str, *members: str) -> None:
+        for member in members:
+            self.zsets.get(name, {}).pop(member, None)
+
+    def zcard(self, name: str) -> int:
+        return len(self.zsets.get(name, {}))
+
+    def zpopmin(self, name: str, count: int) -> List[Tuple[str, float]]:
+        popped = sorted(self.zsets.get(name, {}).items(), key=lambda item: item[1])[:count]
+        self.zrem(name, *[member for member, _ in popped])
+        return popped
+
+    def zrangebyscore(self, name: str, min: Any, max: float) -> List[str]:
+        return [member for member, score in self.zsets.get(name, {}).items() if score <= max]
+
+    def zremrangebyscore(self, name: str, min: Any, max: float) -> None:
+        self.zrem(name, *self.zrangebyscore(name, min, max))
+
+    def pipeline(self) -> "FakePipeline":
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, redis: FakeRedis):
+        self.redis = redis
+        self.commands: List[Any] = []
+
+    def __getattr__(self, name: str):
+        return lambda *args, **kwargs: self.commands.append((getattr(self.redis, name), args, kwargs))
+
+    def execute(self) -> List[Any]:
+        return [command(*args, **kwargs) for command, args, kwargs in self.commands]
+
+
+def test_in_memory_cache_evicts_least_recently_used():
+    cache = InMemoryToolCache(max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+    assert cache.metrics.to_dict()["evictions"] == 1
+    assert cache.metrics.hits == 3
+    assert cache.metrics.misses == 1
+
+
+def test_sqlite_cache_evicts_and_persists(tmp_path):
+    db_file = str(tmp_path / "cache.db")
+    cache = SqliteToolCache(db_file=db_file, max_size=3)
+    for i in range(3):
+        cache.set(f"key_{i}", {"value": i})
+    assert cache.get("key_0") == {"value": 0}
+
+    cache.set("key_3", {"value": 3})
+    cache.set("key_0", {"value": 0})
+
+    assert len(cache) == 3
+    assert cache.get("key_1") is None
+    assert cache.metrics.evictions == 1
+    # Results that are not JSON serializable are skipped
+    cache.set("key_4", object())
+    assert cache.get("key_4") is None
+    cache.close()
+
+    reopened = SqliteToolCache(db_file=db_file, max_size=3)
+    assert reopened.get("key_3") == {"value": 3}
+    reopened.close()
+
+
+def test_sqlite_cache_expires_entries(tmp_path):
+    cache = SqliteToolCache(db_file=str(tmp_path / "cache.db"))
+    cache.set("fresh", "value", ttl=60)
+    cache.set("stale", "value", ttl=-1)
+
+    assert cache.get("fresh") == "value"
+    assert cache.get("stale") is None
+    assert cache.metrics.expirations == 1
+
+
+def test_redis_cache_prunes_expired_entries_from_the_index():
+    redis = FakeRedis()
+    cache = RedisToolCache(redis_client=redis, max_size=2)  # type: ignore[arg-type]
+    with patch("agno.tools.cache.redis.time", lambda: redis.now):
+        cache.set("long", 2, ttl=100)
+        redis.now = 1
+        cache.set("short", 1, ttl=10)
+        redis.now = 50
+
+        # The expired entry no longer counts against max_size, so no live entry is evicted
+        cache.set("new", 3, ttl=100)
+
+    assert cache.get("long") == 2
+    assert cache.get("new") == 3
+    assert set(redis.zsets[cache.index_key]) == {"long", "new"}
+    assert cache.metrics.evictions == 0
+    assert cache.metrics.expirations == 1
+
+
+def test_function_call_uses_cache():
+    calls = []
+
+    def add(a: int, b: int) -> int:
+        calls.append((a, b))
+        return a + b
+
+    cache = InMemoryToolCache()
+    func = Function.from_callable(add)
+    func.cache_results = True
+    func.cache = cache
+
+    for arguments in [{"a": 1, "b": 2}, {"b": 2, "a": 1}, {"a": 2, "b": 2}]:
+        result = FunctionCall(function=func, arguments=arguments).execute()
+        assert result.status == "success"
+
+    assert calls == [(1, 2), (2, 2)]
+    assert cache.metrics.hits == 1
+    assert cache.metrics.misses == 2
+
+
+@pytest.mark.asyncio
+async def test_async_function_call_uses_cache(tmp_path):
+    calls = []
+
+    async def greet(name: str) -> str:
+        calls.append(name)
+        return f"Hello {name}"
+
+    cache = SqliteToolCache(db_file=str(tmp_path / "cache.db"))
+    func = Function.from_callable(greet)
+    func.cache_results = True
+    func.cache = cache
+
+    first = await FunctionCall(function=func, arguments={"name": "agno"}).aexecute()
+    second = await FunctionCall(function=func, arguments={"name": "agno"}).aexecute()
+
+    assert first.result == second.result == "Hello agno"
+    assert calls == ["agno"]
+    assert cache.metrics.hits == 1
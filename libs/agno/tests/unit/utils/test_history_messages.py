@@ -0,0 +1,69 @@
+from agno.models.message import Message
+from agno.utils.message import (
+    MESSAGE_TOKEN_OVERHEAD,
+    count_message_tokens,
+    get_history_messages,
+)
+from agno.utils.tokens import HeuristicTokenizer
+
+tokenizer = HeuristicTokenizer()
+
+
+def make_run(i: int, tool_result: str = "ok") -> list:
+    return [
+        Message(role="user", content=f"question {i}"),
+        Message(role="assistant", tool_calls=[{"id": f"call_{i}", "type": "function", "function": {"name": "f"}}]),
+        Message(role="tool", tool_call_id=f"call_{i}", content=tool_result),
+        Message(role="assistant", content=f"answer {i}"),
+    ]
+
+
+def test_heuristic_tokenizer():
+    assert tokenizer.count("") == 0
+    assert tokenizer.count("abcd") == 1
+    assert tokenizer.count("abcde") == 2
+    assert tokenizer.truncate("abcdefghij", 2) == "abcdefgh"
+
+
+def test_count_message_tokens_is_cached():
+    message = Message(role="user", content="a" * 40)
+
+    assert count_message_tokens(message, tokenizer) == 10 + MESSAGE_TOKEN_OVERHEAD
+    assert message.token_counts == {tokenizer.name: 10 + MESSAGE_TOKEN_OVERHEAD}
+    assert message.to_dict()["token_counts"] == message.token_counts
+
+    message.token_counts[tokenizer.name] = 1
+    assert count_message_tokens(message, tokenizer) == 1
+
+
+def test_history_without_limits_is_copied():
+    history = make_run(0)
+
+    history_copy = get_history_messages(history)
+
+    assert [m.content for m in history_copy] == [m.content for m in history]
+    assert all(copy is not original for copy, original in zip(history_copy, history))
+
+
+def test_history_keeps_most_recent_runs_within_budget():
+    history = make_run(0) + make_run(1) + make_run(2)
+    run_tokens = sum(count_message_tokens(m, tokenizer) for m in make_run(2))
+
+    history_copy = get_history_messages(history, max_tokens=2 * run_tokens + 1, tokenizer=tokenizer)
+
+    # Whole runs are kept, so tool calls keep their results
+    assert [m.content for m in history_copy if m.role == "user"] == ["question 1", "question 2"]
+    assert len(history_copy) == 8
+    assert get_history_messages(history, max_tokens=run_tokens - 1, tokenizer=tokenizer) == []
+
+
+def test_oversized_tool_results_are_truncated():
+    history = make_run(0, tool_result="x" * 4000) + make_run(1)
+
+    history_copy = get_history_messages(history, max_tokens=200, max_tool_result_tokens=50, tokenizer=tokenizer)
+
+    assert len(history_copy) == 8
+    tool_result = history_copy[2].content
+    assert tool_result.startswith("x" * 200) and "1000 tokens" in tool_result
+    # The stored message is not modified
+    assert history[2].content == "x" * 4000
@@ -0,0 +1,63 @@
+import threading
+import time
+
+from agno.utils.model_registry import (
+    get_or_load_model,
+    is_model_loaded,
+    make_model_key,
+    unload_all_models,
+    unload_model,
+)
+
+
+def setup_function():
+    unload_all_models()
+
+
+def test_model_is_loaded_once():
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return object()
+
+    key = make_model_key("test", "model-a")
+    first = get_or_load_model(key, loader)
+    second = get_or_load_model(key, loader)
+
+    assert first is second
+    assert len(calls) == 1
+    assert is_model_loaded(key)
+
+
+def test_concurrent_loads_share_one_model():
+    calls = []
+
+    def loader():
+        calls.append(1)
+        time.sleep(0.05)
+        return object()
+
+    key = make_model_key("test", "model-b")
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(get_or_load_model(key, loader))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+
+
+def test_key_includes_unhashable_params():
+    assert make_model_key("test", "m", {"b": 1, "a": [1]}) == make_model_key("test", "m", {"a": [1], "b": 1})
+    assert make_model_key("test", "m", {"a": 1}) != make_model_key("test", "m", {"a": 2})
+
+
+def test_unload_model():
+    key = make_model_key("test", "model-c")
+    get_or_load_model(key, object)
+    assert unload_model(key) is True
+    assert not is_model_loaded(key)
+    assert unload_model(key) is False
@@ -0,0 +1,163 @@
+from dataclasses import dataclass
+from hashlib import md5
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pytest
+
+from agno.document import Document
+from agno.embedder.base import Embedder
+from agno.vectordb.distance import Distance
+from agno.vectordb.numpydb import NumpyDb
+
+
+@dataclass
+class BagOfWordsEmbedder(Embedder):
+    """Embeds texts as hashed word counts, so texts sharing words are close"""
+
+    dimensions: Optional[int] = 64
+    calls: int = 0
+
+    def get_embedding(self, text: str) -> List[float]:
+        self.calls += 1
+        vector = [0.0] * self.dimensions  # type: ignore[operator]
+        for word in text.lower().split():
+            vector[int(md5(word.encode()).hexdigest(), 16) % self.dimensions] += 1.0  # type: ignore[operator]
+        return vector
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        return self.get_embedding(text), None
+
+
+@pytest.fixture
+def sample_documents() -> List[Document]:
+    return [
+        Document(
+            content="Tom Kha Gai is a Thai coconut soup with chicken", meta_data={"cuisine": "Thai", "type": "soup"}
+        ),
+        Document(content="Pad Thai is a stir-fried rice noodle dish", meta_data={"cuisine": "Thai", "type": "noodles"}),
+        Document(content="Minestrone is an Italian vegetable soup", meta_data={"cuisine": "Italian", "type": "soup"}),
+    ]
+
+
+@pytest.fixture
+def numpy_db(tmp_path):
+    db = NumpyDb(collection="recipes", path=str(tmp_path), embedder=BagOfWordsEmbedder())
+    db.create()
+    return db
+
+
+def test_insert_and_search(numpy_db, sample_documents):
+    numpy_db.insert(sample_documents)
+
+    assert numpy_db.get_count() == 3
+    results = numpy_db.search("coconut soup chicken", limit=2)
+    assert len(results) == 2
+    assert results[0].content.startswith("Tom Kha Gai")
+    assert results[0].meta_data == {"cuisine": "Thai", "type": "soup"}
+    assert len(results[0].embedding) == 64
+
+
+def test_search_with_filters(numpy_db, sample_documents):
+    numpy_db.insert(sample_documents)
+
+    results = numpy_db.search("soup", limit=5, filters={"type": "soup", "cuisine": "Italian"})
+    assert [doc.content for doc in results] == ["Minestrone is an Italian vegetable soup"]
+    assert numpy_db.search("soup", filters={"cuisine": "French"}) == []
+
+    # Bitmaps cached by the filter are extended with rows appended later
+    numpy_db.insert([Document(content="Ribollita is a Tuscan soup", meta_data={"cuisine": "Italian"})])
+    results = numpy_db.search("soup", limit=5, filters={"cuisine": "Italian"})
+    assert len(results) == 2
+
+
+def test_upsert_replaces_rows_and_reuses_embeddings(numpy_db, sample_documents):
+    numpy_db.insert(sample_documents)
+    embedder: BagOfWordsEmbedder = numpy_db.embedder  # type: ignore[assignment]
+    calls = embedder.calls
+
+    numpy_db.upsert([Document(content=sample_documents[0].content, meta_data={"cuisine": "Thai", "type": "curry"})])
+
+    assert embedder.calls == calls
+    assert numpy_db.get_count() == 3
+    assert numpy_db.search("coconut", limit=1, filters={"type": "curry"})[0].content.startswith("Tom Kha Gai")
+    assert numpy_db.search("coconut", limit=5, filters={"type": "soup", "cuisine": "Thai"}) == []
+
+
+def test_collection_persists_deletes_and_compacts(tmp_path, sample_documents):
+    db = NumpyDb(collection="recipes", path=str(tmp_path), embedder=BagOfWordsEmbedder(), dtype="float16")
+    db.create()
+    db.insert(sample_documents)
+    db.insert([Document(name="extra", content="Green curry with coconut milk")])
+    assert db.delete_by_name("extra")
+    assert db.delete_by_metadata({"type": "noodles"})
+
+    reopened = NumpyDb(collection="recipes", path=str(tmp_path), embedder=BagOfWordsEmbedder())
+    assert reopened.get_count() == 2
+    assert reopened.dtype == "float16"
+    assert not reopened.name_exists("extra")
+    assert reopened.doc_exists(sample_documents[0])
+    assert not reopened.doc_exists(sample_documents[1])
+
+    size_before = reopened._vectors_file.stat().st_size
+    reopened.optimize()
+    assert reopened._vectors_file.stat().st_size < size_before
+    assert {doc.content for doc in reopened.search("soup", limit=5)} == {
+        sample_documents[0].content,
+        sample_documents[2].content,
+    }
+
+
+@pytest.mark.parametrize("distance", [Distance.cosine, Distance.l2, Distance.max_inner_product])
+def test_top_k_matches_brute_force(tmp_path, distance):
+    rng = np.random.default_rng(1)
+    vectors = rng.normal(size=(500, 16)).astype(np.float32)
+    db = NumpyDb(collection="random", path=str(tmp_path), embedder=BagOfWordsEmbedder(dimensions=16), distance=distance)
+    db.create()
+    db.insert([Document(id=str(i), content=f"doc {i}", embedding=vector.tolist()) for i, vector in enumerate(vectors)])
+    query = rng.normal(size=16).astype(np.float32)
+
+    if distance == Distance.cosine:
+        scores = vectors @ query / np.linalg.norm(vectors, axis=1)
+    elif distance == Distance.l2:
+        scores = -np.linalg.norm(vectors - query, axis=1)
+    else:
+        scores = vectors @ query
+    expected = [str(i) for i in np.argsort(-scores)[:10]]
+
+    results = db._search_by_embedding("query", query.tolist(), limit=10, filters=None)
+    assert [doc.id for doc in results] == expected
+
+
+def test_ivf_index_finds_nearest_neighbours(tmp_path):
+    rng = np.random.default_rng(2)
+    centers = rng.normal(size=(20, 16)) * 10
+    vectors = (centers[rng.integers(0, 20, size=2000)] + rng.normal(size=(2000, 16))).astype(np.float32)
+    db = NumpyDb(
+        collection="clustered",
+        path=str(tmp_path),
+        embedder=BagOfWordsEmbedder(dimensions=16),
+        ivf=True,
+        ivf_min_rows=1000,
+        nprobe=4,
+    )
+    db.create()
+    db.insert([Document(id=str(i), content=f"doc {i}", embedding=vector.tolist()) for i, vector in enumerate(vectors)])
+    assert db._centroids is not None
+    assert db._ivf_file.exists()
+
+    query = vectors[7]
+    results = db._search_by_embedding("query", query.tolist(), limit=5, filters=None)
+    assert results[0].id == "7"
+
+    reopened = NumpyDb(collection="clustered", path=str(tmp_path), embedder=BagOfWordsEmbedder(dimensions=16))
+    assert reopened._search_by_embedding("query", query.tolist(), limit=1, filters=None)[0].id == "7"
+
+
+@pytest.mark.asyncio
+async def test_async_insert_and_search(numpy_db, sample_documents):
+    await numpy_db.async_insert(sample_documents)
+
+    results = await numpy_db.async_search("rice noodle", limit=1)
+    assert results[0].content.startswith("Pad Thai")
+    assert numpy_db.existing_ids([results[0].id, "missing"]) == {results[0].id}
@@ -1,4 +1,5 @@
 import uuid
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -6,6 +7,7 @@ from sqlalchemy.engine import URL, Engine
 from sqlalchemy.orm import Session
 
 from agno.document import Document
+from agno.utils.string import safe_content_hash
 from agno.vectordb.pgvector import PgVector
 from agno.vectordb.search import SearchType
 
@@ -194,6 +196,31 @@ def test_insert(mock_pgvector):
         mock_pgvector.insert(docs)
 
 
+def test_insert_reuses_stored_embeddings(mock_pgvector, mock_embedder):
+    """Test that insert only embeds the chunks whose content is not stored yet."""
+    stored = ["Tom Kha Gai is a coconut soup.", "Ramen is a noodle soup."]
+    # A line was added at the top of the source, so every chunk got a new id
+    docs = [
+        Document(id=f"recipes_{i}", content=content, meta_data={"chunk": i + 1})
+        for i, content in enumerate(["Pad Thai is a rice noodle dish."] + stored)
+    ]
+    session = mock_pgvector.Session.return_value.__enter__.return_value
+    session.execute.return_value.fetchall.return_value = [
+        SimpleNamespace(content_hash=safe_content_hash(content), embedding=[0.2] * 1024) for content in stored
+    ]
+    mock_embedder.get_embeddings_batch_and_usage.side_effect = lambda texts: (
+        [[0.1] * 1024 for _ in texts],
+        [None] * len(texts),
+    )
+
+    with patch("agno.vectordb.pgvector.pgvector.select"), patch("agno.vectordb.pgvector.pgvector.postgresql"):
+        mock_pgvector.insert(docs)
+
+    assert mock_embedder.get_embeddings_batch_and_usage.call_count == 1
+    mock_embedder.get_embeddings_batch_and_usage.assert_called_with(["Pad Thai is a rice noodle dish."])
+    assert [doc.embedding[0] for doc in docs] == [0.1, 0.2, 0.2]  # type: ignore
+
+
 def test_upsert(mock_pgvector):
     """Test upsert method with patched upsert functionality."""
     docs = create_test_documents()
@@ -0,0 +1,100 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from agno.workflow.v2 import Dag, Step, Workflow
+from agno.workflow.v2.types import StepInput, StepOutput
+
+
+def create_dag(b_executor, c_executor, max_concurrency=None) -> Dag:
+    def a(step_input: StepInput) -> StepOutput:
+        return StepOutput(content=f"a({step_input.message})")
+
+    def d(step_input: StepInput) -> StepOutput:
+        return StepOutput(content=f"d({step_input.get_step_content('b')}, {step_input.get_step_content('c')})")
+
+    return Dag(
+        Step(name="a", executor=a),
+        Step(name="b", executor=b_executor, depends_on=["a"]),
+        Step(name="c", executor=c_executor, depends_on=["a"]),
+        Step(name="d", executor=d, depends_on=["b", "c"]),
+        name="graph",
+        max_concurrency=max_concurrency,
+    )
+
+
+def test_ready_steps_run_concurrently():
+    # b and c only finish if they run at the same time
+    barrier = threading.Barrier(2, timeout=5)
+
+    def b(step_input: StepInput) -> StepOutput:
+        barrier.wait()
+        return StepOutput(content=f"b({step_input.previous_step_content})")
+
+    def c(step_input: StepInput) -> StepOutput:
+        barrier.wait()
+        return StepOutput(content=f"c({step_input.previous_step_content})")
+
+    response = Workflow(steps=[create_dag(b, c)]).run(message="x")
+
+    assert response.content == "d(b(a(x)), c(a(x)))"
+    assert [output.step_name for output in response.step_responses[0]][0] == "a"
+    assert [output.step_name for output in response.step_responses[0]][-1] == "d"
+
+
+def test_max_concurrency_limits_running_steps():
+    running = []
+    max_running = []
+    lock = threading.Lock()
+
+    def slow(name):
+        def executor(step_input: StepInput) -> StepOutput:
+            with lock:
+                running.append(name)
+                max_running.append(len(running))
+            time.sleep(0.05)
+            with lock:
+                running.remove(name)
+            return StepOutput(content=name)
+
+        return executor
+
+    response = Workflow(steps=[create_dag(slow("b"), slow("c"), max_concurrency=1)]).run(message="x")
+
+    assert response.content == "d(b, c)"
+    assert max(max_running) == 1
+
+
+@pytest.mark.asyncio
+async def test_async_stream_yields_outputs_as_steps_complete():
+    barrier = asyncio.Barrier(2)
+
+    async def b(step_input: StepInput) -> StepOutput:
+        await asyncio.wait_for(barrier.wait(), timeout=5)
+        return StepOutput(content="b")
+
+    async def c(step_input: StepInput) -> StepOutput:
+        await asyncio.wait_for(barrier.wait(), timeout=5)
+        return StepOutput(content="c")
+
+    workflow = Workflow(steps=[create_dag(b, c)])
+    events = [event async for event in await workflow.arun(message="x", stream=True, stream_intermediate_steps=True)]
+
+    completed = [event.step_name for event in events if event.event == "StepCompleted"]
+    assert completed[0] == "a"
+    assert sorted(completed[1:3]) == ["b", "c"]
+    assert completed[3] == "d"
+    assert events[-1].content == "d(b, c)"
+
+
+def test_cycle_raises():
+    dag = Dag(
+        Step(name="a", executor=lambda step_input: "a", depends_on=["b"]),
+        Step(name="b", executor=lambda step_input: "b"),
+        dependencies={"b": ["a"]},
+    )
+
+    with pytest.raises(ValueError, match="cycle"):
+        dag.execute(StepInput(message="x"))
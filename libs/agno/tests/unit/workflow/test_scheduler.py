@@ -0,0 +1,167 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from agno.exceptions import ModelRateLimitError
+from agno.workflow.v2 import Parallel, Step, Workflow
+from agno.workflow.v2 import scheduler as scheduler_module
+from agno.workflow.v2.scheduler import StepScheduler, get_scheduler, is_rate_limit_error
+from agno.workflow.v2.types import StepInput, StepOutput
+
+
+class ConcurrencyTracker:
+    def __init__(self):
+        self.running = 0
+        self.max_running = 0
+        self.threads = set()
+        self.lock = threading.Lock()
+
+    def executor(self, name, delay=0.05):
+        def run(step_input: StepInput) -> StepOutput:
+            with self.lock:
+                self.running += 1
+                self.max_running = max(self.max_running, self.running)
+                self.threads.add(threading.get_ident())
+            time.sleep(delay)
+            with self.lock:
+                self.running -= 1
+            return StepOutput(content=name)
+
+        return Step(name=name, executor=run, max_retries=0)
+
+
+def test_nested_parallels_share_bounded_threads():
+    tracker = ConcurrencyTracker()
+    scheduler = StepScheduler(max_workers=2)
+    inner = [
+        Parallel(*[tracker.executor(f"{group}-{i}", delay=0.01) for i in range(4)], name=f"inner-{group}")
+        for group in range(4)
+    ]
+    workflow = Workflow(steps=[Parallel(*inner, name="outer")], scheduler=scheduler)
+
+    response = workflow.run(message="x")
+
+    outer_output = response.step_responses[0]
+    assert list(outer_output.parallel_step_outputs.keys()) == ["inner-0", "inner-1", "inner-2", "inner-3"]
+    assert all(output.success for output in outer_output.parallel_step_outputs.values())
+    # The calling thread and the two workers of the scheduler
+    assert len(tracker.threads) <= 3
+    scheduler.shutdown()
+
+
+def test_global_concurrency_limit_and_queue_wait_time():
+    tracker = ConcurrencyTracker()
+    scheduler = StepScheduler(max_concurrency=2, max_workers=6)
+    workflow = Workflow(
+        steps=[Parallel(*[tracker.executor(f"step-{i}") for i in range(6)], name="fan-out")], scheduler=scheduler
+    )
+
+    response = workflow.run(message="x")
+
+    assert tracker.max_running == 2
+    assert response.workflow_metrics.queue_wait_time > 0
+    assert scheduler.metrics["executions"] == 6
+    assert scheduler.metrics["queued_executions"] >= 4
+    scheduler.shutdown()
+
+
+def test_executor_limits():
+    tracker = ConcurrencyTracker()
+    scheduler = StepScheduler(executor_limits={"limited": 1}, max_workers=4)
+    steps = [tracker.executor("limited") for _ in range(3)]
+    # Steps in a parallel need distinct names in the outputs, the limit applies to the executor name
+    for i, step in enumerate(steps):
+        step.name = f"limited-{i}"
+        step.active_executor.__name__ = "limited"
+
+    Workflow(steps=[Parallel(*steps, name="fan-out")], scheduler=scheduler).run(message="x")
+
+    assert tracker.max_running == 1
+    scheduler.shutdown()
+
+
+def test_rate_limit_pauses_retries():
+    attempts = []
+
+    def flaky(step_input: StepInput) -> StepOutput:
+        attempts.append(time.monotonic())
+        if len(attempts) == 1:
+            raise ModelRateLimitError("Too many requests")
+        return StepOutput(content="done")
+
+    scheduler = StepScheduler(rate_limit_backoff=0.1)
+    workflow = Workflow(steps=[Step(name="flaky", executor=flaky, max_retries=1)], scheduler=scheduler)
+
+    response = workflow.run(message="x")
+
+    assert response.content == "done"
+    assert attempts[1] - attempts[0] >= 0.1
+    assert scheduler.metrics["rate_limited_executions"] == 1
+
+
+@pytest.mark.asyncio
+async def test_async_parallel_respects_concurrency_limit():
+    running = 0
+    max_running = 0
+
+    def create_step(name):
+        async def run(step_input: StepInput) -> StepOutput:
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.02)
+            running -= 1
+            return StepOutput(content=name)
+
+        return Step(name=name, executor=run, max_retries=0)
+
+    scheduler = StepScheduler(max_concurrency=2)
+    workflow = Workflow(
+        steps=[Parallel(*[create_step(f"step-{i}") for i in range(5)], name="fan-out")], scheduler=scheduler
+    )
+
+    response = await workflow.arun(message="x")
+
+    assert max_running == 2
+    assert len(response.step_responses[0].parallel_step_outputs) == 5
+    assert scheduler.metrics["queued_executions"] >= 3
+
+
+class ProviderError(Exception):
+    def __init__(self, message: str, status_code: int):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+def test_is_rate_limit_error():
+    assert is_rate_limit_error(ModelRateLimitError("slow down"))
+    assert is_rate_limit_error(ProviderError("slow down", status_code=429))
+    assert is_rate_limit_error(RuntimeError("Rate limit reached for requests"))
+    assert is_rate_limit_error(RuntimeError("Too Many Requests"))
+    # A 429 in an unrelated error message is not a rate limit
+    assert not is_rate_limit_error(ValueError("Invalid value 4290 for run run_429"))
+    assert not is_rate_limit_error(ProviderError("Bad request: 429 tokens", status_code=400))
+
+
+def test_default_scheduler_is_created_once(monkeypatch):
+    monkeypatch.setattr(scheduler_module, "_default_scheduler", None)
+    created = []
+    original_init = StepScheduler.__init__
+
+    def slow_init(self, *args, **kwargs):
+        created.append(self)
+        time.sleep(0.05)
+        original_init(self, *args, **kwargs)
+
+    monkeypatch.setattr(StepScheduler, "__init__", slow_init)
+    schedulers = []
+    threads = [threading.Thread(target=lambda: schedulers.append(get_scheduler())) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(created) == 1
+    assert all(scheduler is schedulers[0] for scheduler in schedulers)
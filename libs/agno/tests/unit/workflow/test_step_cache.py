@@ -0,0 +1,142 @@
+import pytest
+from pydantic import BaseModel
+
+from agno.agent import Agent
+from agno.tools.cache import InMemoryToolCache, SqliteToolCache
+from agno.workflow.v2 import Step, Workflow
+from agno.workflow.v2.cache import get_executor_fingerprint
+from agno.workflow.v2.types import StepInput, StepOutput
+
+calls = []
+
+
+def summarize(step_input: StepInput) -> StepOutput:
+    calls.append(step_input.message)
+    return StepOutput(content=f"summary of {step_input.message}")
+
+
+def summarize_v2(step_input: StepInput) -> StepOutput:
+    calls.append(step_input.message)
+    return StepOutput(content=f"new summary of {step_input.message}")
+
+
+@pytest.fixture(autouse=True)
+def reset_calls():
+    calls.clear()
+
+
+def create_workflow(cache, executor=summarize) -> Workflow:
+    return Workflow(name="Cached", steps=[Step(name="summarize", executor=executor, cache=cache)])
+
+
+def test_identical_input_is_served_from_cache():
+    cache = InMemoryToolCache()
+
+    first = create_workflow(cache).run(message="report")
+    second = create_workflow(cache).run(message="report")
+
+    assert calls == ["report"]
+    assert second.content == first.content == "summary of report"
+    assert first.workflow_metrics.cache_hits == 0
+    assert second.workflow_metrics.cache_hits == 1
+    assert second.workflow_metrics.steps["summarize"].cache_hit is True
+
+
+def test_different_input_or_executor_misses_cache():
+    cache = InMemoryToolCache()
+
+    create_workflow(cache).run(message="report")
+    create_workflow(cache).run(message="other report")
+    changed = create_workflow(cache, executor=summarize_v2).run(message="report")
+
+    assert calls == ["report", "other report", "report"]
+    assert changed.content == "new summary of report"
+
+
+@pytest.mark.asyncio
+async def test_async_stream_is_served_from_cache():
+    cache = InMemoryToolCache()
+    await create_workflow(cache).arun(message="report")
+
+    events = [event async for event in await create_workflow(cache).arun(message="report", stream=True)]
+
+    assert calls == ["report"]
+    assert events[-1].content == "summary of report"
+
+
+def test_sqlite_cache_is_shared_between_cache_instances(tmp_path):
+    db_file = str(tmp_path / "cache.db")
+
+    first = create_workflow(SqliteToolCache(db_file=db_file)).run(message="report")
+    cache = SqliteToolCache(db_file=db_file)
+    second = create_workflow(cache).run(message="report")
+
+    assert calls == ["report"]
+    assert second.content == first.content == "summary of report"
+    assert cache.metrics.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_async_sqlite_cache_is_served_from_cache(tmp_path):
+    cache = SqliteToolCache(db_file=str(tmp_path / "cache.db"))
+
+    await create_workflow(cache).arun(message="report")
+    second = await create_workflow(cache).arun(message="report")
+
+    assert calls == ["report"]
+    assert second.workflow_metrics.cache_hits == 1
+
+
+class Report(BaseModel):
+    title: str
+    pages: int
+
+
+def write_report(step_input: StepInput) -> StepOutput:
+    calls.append(step_input.message)
+    return StepOutput(content=Report(title=f"{step_input.message}", pages=3))
+
+
+def read_report(step_input: StepInput) -> StepOutput:
+    report = step_input.previous_step_content
+    return StepOutput(content=f"{type(report).__name__}:{getattr(report, 'title', None)}")
+
+
+def test_model_content_keeps_its_type_on_a_cache_hit():
+    cache = InMemoryToolCache()
+
+    def create_report_workflow() -> Workflow:
+        return Workflow(
+            name="Reports",
+            steps=[Step(name="write", executor=write_report, cache=cache), Step(name="read", executor=read_report)],
+        )
+
+    miss = create_report_workflow().run(message="sales")
+    hit = create_report_workflow().run(message="sales")
+
+    assert calls == ["sales"]
+    assert hit.workflow_metrics.cache_hits == 1
+    assert hit.content == miss.content == "Report:sales"
+
+
+def test_contents_that_cant_be_restored_are_not_cached():
+    class LocalReport(BaseModel):
+        title: str
+
+    def write_local_report(step_input: StepInput) -> StepOutput:
+        calls.append(step_input.message)
+        return StepOutput(content=LocalReport(title="sales"))
+
+    cache = InMemoryToolCache()
+    for _ in range(2):
+        create_workflow(cache, executor=write_local_report).run(message="sales")
+
+    assert calls == ["sales", "sales"]
+    assert len(cache) == 0
+
+
+def test_agent_fingerprint_changes_with_configuration():
+    fingerprint = get_executor_fingerprint(Agent(name="Writer", instructions="Be brief"), "agent")
+
+    assert fingerprint == get_executor_fingerprint(Agent(name="Writer", instructions="Be brief"), "agent")
+    assert fingerprint != get_executor_fingerprint(Agent(name="Writer", instructions="Be thorough"), "agent")
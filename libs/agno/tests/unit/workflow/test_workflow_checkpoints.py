@@ -0,0 +1,105 @@
+import pytest
+
+from agno.run.base import RunStatus
+from agno.storage.sqlite import SqliteStorage
+from agno.workflow.v2 import Loop, Parallel, Step, Workflow
+from agno.workflow.v2.types import StepInput, StepOutput
+
+
+class Counter:
+    def __init__(self):
+        self.calls = {}
+        self.fail_once = set()
+
+    def step(self, name: str):
+        def executor(step_input: StepInput) -> StepOutput:
+            self.calls[name] = self.calls.get(name, 0) + 1
+            if name in self.fail_once:
+                self.fail_once.remove(name)
+                raise RuntimeError(f"{name} preempted")
+            return StepOutput(content=f"{name}({step_input.previous_step_content or step_input.message})")
+
+        return Step(name=name, executor=executor, max_retries=0)
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return SqliteStorage(table_name="workflow_sessions", db_file=str(tmp_path / "workflows.db"), mode="workflow_v2")
+
+
+def create_workflow(counter: Counter, storage: SqliteStorage) -> Workflow:
+    return Workflow(
+        name="Research",
+        storage=storage,
+        session_id="session-1",
+        enable_checkpoints=True,
+        steps=[
+            counter.step("research"),
+            Parallel(counter.step("left"), counter.step("right"), name="review"),
+            Loop(steps=[counter.step("refine")], max_iterations=2, name="refine_loop"),
+            counter.step("write"),
+        ],
+    )
+
+
+def test_resume_skips_completed_steps(storage):
+    counter = Counter()
+    counter.fail_once.add("write")
+
+    response = create_workflow(counter, storage).run(message="topic")
+    assert response.status == RunStatus.error
+
+    # Resume from a new workflow, as a restarted worker would
+    resumed = create_workflow(counter, storage).resume(run_id=response.run_id)
+
+    assert resumed.status == RunStatus.completed
+    assert counter.calls == {"research": 1, "left": 1, "right": 1, "refine": 2, "write": 2}
+    assert resumed.content.startswith("write(refine(")
+    assert "left(research(topic))" in resumed.content
+    assert len(resumed.step_responses) == 4
+    assert resumed.workflow_metrics is not None
+
+    stored_run = storage.read(session_id="session-1").runs[0]
+    assert len(storage.read(session_id="session-1").runs) == 1
+    assert stored_run.status == RunStatus.completed
+    assert stored_run.checkpoint is None
+
+
+def test_checkpoint_is_saved_after_each_step(storage):
+    counter = Counter()
+    counter.fail_once.add("refine")
+
+    response = create_workflow(counter, storage).run(message="topic")
+
+    stored_run = storage.read(session_id="session-1").runs[0]
+    assert stored_run.run_id == response.run_id
+    assert stored_run.status == RunStatus.error
+    assert [step.step_name for step in stored_run.checkpoint.steps] == ["research", "review"]
+    assert stored_run.checkpoint.execution_input.message == "topic"
+    assert stored_run.checkpoint.steps[1].outputs[0].parallel_step_outputs["left"].content == "left(research(topic))"
+
+
+@pytest.mark.asyncio
+async def test_aresume_stream(storage):
+    counter = Counter()
+    counter.fail_once.add("refine")
+
+    response = await create_workflow(counter, storage).arun(message="topic")
+    assert response.status == RunStatus.error
+
+    workflow = create_workflow(counter, storage)
+    events = [event async for event in await workflow.aresume(run_id=response.run_id, stream=True)]
+
+    assert events[-1].content.startswith("write(refine(")
+    assert "right(research(topic))" in events[-1].content
+    assert workflow.run_response.status == RunStatus.completed
+    assert counter.calls == {"research": 1, "left": 1, "right": 1, "refine": 3, "write": 1}
+
+
+def test_resume_completed_run_raises(storage):
+    counter = Counter()
+    workflow = create_workflow(counter, storage)
+    response = workflow.run(message="topic")
+
+    with pytest.raises(ValueError):
+        workflow.resume(run_id=response.run_id)